@@ -15,6 +15,7 @@ from asterism.agent.models import AgentResponse
 from asterism.agent.nodes.finalizer.prompts import FINALIZER_SYSTEM_PROMPT
 from asterism.agent.nodes.shared import build_execution_trace, get_user_request
 from asterism.agent.state import AgentState
+from asterism.agent.utils import ResultStore, get_result_store, result_text
 from asterism.llm.providers import BaseLLMProvider
 from asterism.mcp.executor import MCPExecutor
 
@@ -141,6 +142,14 @@ class Agent:
                 - plan_used: The plan that was executed (if any)
                 - session_id: The session ID used
         """
+        result_store = self._hold_results(session_id)
+        try:
+            return self._invoke(session_id, messages)
+        finally:
+            self._release_results(result_store, session_id)
+
+    def _invoke(self, session_id: str, messages: list[BaseMessage]) -> dict[str, Any]:
+        """Run the full graph for invoke()."""
         # Build graph if needed
         graph = self.build()
 
@@ -233,6 +242,17 @@ class Agent:
                 else:
                     print(token, end="")
         """
+        result_store = self._hold_results(session_id)
+        try:
+            async for item in self._astream(session_id, messages):
+                yield item
+        finally:
+            self._release_results(result_store, session_id)
+
+    async def _astream(
+        self, session_id: str, messages: list[BaseMessage]
+    ) -> AsyncGenerator[tuple[str, dict[str, Any] | None]]:
+        """Run the streaming graph and stream the final response for astream()."""
         from langchain_core.messages import SystemMessage
 
         from asterism.agent.utils import load_identity_context
@@ -302,7 +322,7 @@ class Agent:
         # Format execution results as summary
         execution_results = final_state.get("execution_results", [])
         if execution_results:
-            results_summary = "\n".join(f"Task {r.task_id}: {r.result}" for r in execution_results)
+            results_summary = "\n".join(f"Task {r.task_id}: {result_text(r.result)}" for r in execution_results)
         else:
             results_summary = "No execution results."
 
@@ -358,12 +378,36 @@ Create a response for the user."""
                 },
             )
 
+    def _hold_results(self, session_id: str) -> ResultStore | None:
+        """Keep the session's spilled results while a run is in flight.
+
+        Returns:
+            The result store the run spills to, or None if spilling is off.
+        """
+        result_store = get_result_store()
+        if result_store is not None:
+            result_store.start_run(session_id)
+        return result_store
+
+    def _release_results(self, result_store: ResultStore | None, session_id: str) -> None:
+        """Delete the results a run spilled, once no other run on the session is in flight.
+
+        Each run starts with empty execution results, so spilled results are
+        only read within the runs of the session that are in flight.
+        """
+        if result_store is not None:
+            result_store.end_run(session_id)
+
     def clear_session(self, session_id: str) -> None:
         """Clear all state for a session.
 
         Args:
             session_id: The session ID to clear.
         """
+        result_store = get_result_store()
+        if result_store is not None:
+            result_store.delete_session(session_id)
+
         if self.db_path is None:
             # Stateless mode - no session to clear
             return
@@ -6,6 +6,7 @@ from .schemas import (
     EvaluationResult,
     LLMUsage,
     Plan,
+    SpilledResult,
     Task,
     TaskInputResolverResult,
     TaskResult,
@@ -22,4 +23,5 @@ __all__ = [
     "LLMUsage",
     "UsageSummary",
     "TaskInputResolverResult",
+    "SpilledResult",
 ]
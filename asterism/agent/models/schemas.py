@@ -1,10 +1,12 @@
 """Pydantic models for agent state and responses."""
 
+import json
+import mmap
 from datetime import datetime
 from enum import StrEnum
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class EvaluationDecision(StrEnum):
@@ -57,6 +59,42 @@ class UsageSummary(BaseModel):
     calls_by_node: dict[str, int] = Field(default_factory=dict, description="Number of calls per node type")
 
 
+class SpilledResult(BaseModel):
+    """Handle of a task result stored in a spill file, kept in state instead of the result."""
+
+    kind: Literal["spilled_result"] = Field(default="spilled_result", description="Marks a spilled result")
+    path: str = Field(..., description="Spill file holding the payload")
+    offset: int = Field(..., description="Byte offset of the payload in the spill file")
+    size: int = Field(..., description="Payload size in bytes")
+    encoding: Literal["text", "json"] = Field(..., description="How the payload was serialized")
+    preview: str = Field(..., description="Beginning of the payload")
+
+    def read(self, start: int = 0, size: int | None = None) -> str:
+        """Read a slice of the payload through mmap.
+
+        Args:
+            start: Byte offset in the payload to start reading at.
+            size: Maximum bytes to read; None reads to the end.
+
+        Returns:
+            The slice as text; a character cut at either end of the slice is dropped.
+        """
+        end = self.size if size is None else min(self.size, start + size)
+        if start >= end:
+            return ""
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            chunk = data[self.offset + start : self.offset + end]
+        return chunk.decode("utf-8", errors="ignore")
+
+    def load(self) -> Any:
+        """Load the whole payload back into the original result."""
+        text = self.read()
+        return json.loads(text) if self.encoding == "json" else text
+
+    def __str__(self) -> str:
+        return f"{self.preview}... [truncated, {self.size} bytes in total]"
+
+
 class TaskResult(BaseModel):
     """Result of executing a single task."""
 
@@ -67,6 +105,14 @@ class TaskResult(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now, description="When the task completed")
     llm_usage: LLMUsage | None = Field(default=None, description="LLM usage if task used LLM")
 
+    @field_validator("result", mode="before")
+    @classmethod
+    def _restore_spilled_result(cls, value: Any) -> Any:
+        """Turn a spilled result handle restored from a checkpoint back into a SpilledResult."""
+        if isinstance(value, dict) and value.get("kind") == "spilled_result":
+            return SpilledResult.model_validate(value)
+        return value
+
 
 class EvaluationResult(BaseModel):
     """Result of evaluating execution progress."""
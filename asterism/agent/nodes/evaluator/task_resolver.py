@@ -7,6 +7,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from asterism.agent.models import LLMUsage, Task, TaskInputResolverResult
 from asterism.agent.nodes.shared import LLMCaller, get_user_request, has_execution_history
 from asterism.agent.state import AgentState
+from asterism.agent.utils import result_text
 from asterism.llm.providers import BaseLLMProvider
 
 RESOLVER_SYSTEM_PROMPT = """You are a task input resolver.
@@ -67,7 +68,7 @@ def _build_resolver_messages(task: Task, state: AgentState) -> list:
     history_lines = []
     for i, result in enumerate(execution_results):
         status = "✓" if result.success else "✗"
-        result_str = str(result.result) if result.result else "None"
+        result_str = result_text(result.result) if result.result else "None"
         history_lines.append(f"\nTask {i + 1} ({result.task_id}): {status}\nResult: {result_str}")
 
     history = "".join(history_lines)
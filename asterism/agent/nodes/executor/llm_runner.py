@@ -5,6 +5,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from asterism.agent.models import TaskResult
 from asterism.agent.nodes.shared import LLMCaller
 from asterism.agent.state import AgentState
+from asterism.agent.utils import result_text
 from asterism.llm.providers import BaseLLMProvider
 
 # Simple system prompt for LLM tasks
@@ -81,7 +82,7 @@ class LLMRunner:
         for dep_result in dependent_results:
             lines.append(f"\n--- Result from task '{dep_result.task_id}' ---")
             if dep_result.success:
-                lines.append(str(dep_result.result))
+                lines.append(result_text(dep_result.result))
             else:
                 lines.append(f"Task failed: {dep_result.error}")
 
@@ -8,6 +8,7 @@ from asterism.agent.models import TaskResult
 from asterism.agent.nodes.executor.utils import parse_tool_call
 from asterism.agent.state import AgentState
 from asterism.agent.utils import log_mcp_tool_call
+from asterism.agent.utils.result_store import ResultStore, get_result_store, result_preview
 from asterism.mcp.executor import MCPExecutor
 
 
@@ -24,16 +25,30 @@ class MCPResult:
 class MCPRunner:
     """Runner for MCP tool execution tasks."""
 
-    def __init__(self, executor: MCPExecutor):
+    def __init__(self, executor: MCPExecutor, result_store: ResultStore | None = None):
+        """
+        Initialize the runner.
+
+        Args:
+            executor: The MCP executor for tool calls.
+            result_store: Store large results are spilled to; the global result store if None.
+        """
         self.executor = executor
+        self.result_store = result_store if result_store is not None else get_result_store()
         self._logger = __import__("logging").getLogger(__name__)
 
+    def _spill(self, session_id: str | None, data: Any) -> Any:
+        """Replace a large result with a handle to its copy in the result store."""
+        if self.result_store is None:
+            return data
+        return self.result_store.spill(session_id or "default", data)
+
     def execute(self, task, state: AgentState) -> TaskResult:
         """Execute an MCP tool call task.
 
         Args:
             task: Task with tool_call and tool_input.
-            state: Current agent state (unused for MCP tasks).
+            state: Current agent state, used for the session large results are spilled under.
 
         Returns:
             TaskResult with execution outcome.
@@ -43,7 +58,7 @@ class MCPRunner:
 
         self._logger.debug(f"MCP tool call: {server_name}:{tool_name}, input_keys: {list(tool_input.keys())}")
 
-        mcp_result = self._execute_tool(server_name, tool_name, tool_input, task.id)
+        mcp_result = self._execute_tool(server_name, tool_name, tool_input, task.id, state.get("session_id"))
 
         return TaskResult(
             task_id=task.id,
@@ -52,12 +67,57 @@ class MCPRunner:
             error=mcp_result.error if not mcp_result.success else None,
         )
 
+    def execute_batch(self, tasks: list, session_id: str | None = None) -> list[TaskResult]:
+        """Execute independent MCP tool call tasks together.
+
+        The executor groups the calls per server, so tasks hitting the same
+        server share one batched round trip instead of one each.
+
+        Args:
+            tasks: Tasks with tool_call and tool_input.
+            session_id: Session large results are spilled under.
+
+        Returns:
+            TaskResult per task, in task order.
+        """
+        calls = []
+        for task in tasks:
+            server_name, tool_name = parse_tool_call(task.tool_call)
+            calls.append((server_name, tool_name, task.tool_input or {}))
+
+        start_time = time.perf_counter()
+        results = self.executor.execute_batch(calls)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        task_results = []
+        for task, (server_name, tool_name, tool_input), result in zip(tasks, calls, results, strict=True):
+            success = result.get("success", False)
+            data = self._spill(session_id, result.get("result")) if success else None
+            self._log_result(
+                server_name=server_name,
+                tool_name=tool_name,
+                tool_input=tool_input,
+                success=success,
+                duration_ms=duration_ms,
+                data=data,
+            )
+            task_results.append(
+                TaskResult(
+                    task_id=task.id,
+                    success=success,
+                    result=data,
+                    error=result.get("error") if not success else None,
+                )
+            )
+        return task_results
+
     def _execute_tool(
         self,
         server_name: str,
         tool_name: str,
         tool_input: dict,
         task_id: str,
+        session_id: str | None = None,
     ) -> MCPResult:
         """Execute the MCP tool with timing and logging.
 
@@ -66,6 +126,7 @@ class MCPRunner:
             tool_name: Tool name.
             tool_input: Tool parameters.
             task_id: Task ID for logging.
+            session_id: Session large results are spilled under.
 
         Returns:
             MCPResult with execution outcome.
@@ -77,6 +138,7 @@ class MCPRunner:
             duration_ms = (time.perf_counter() - start_time) * 1000
 
             success = result.get("success", False)
+            data = self._spill(session_id, result.get("result")) if success else None
 
             self._log_result(
                 server_name=server_name,
@@ -84,12 +146,12 @@ class MCPRunner:
                 tool_input=tool_input,
                 success=success,
                 duration_ms=duration_ms,
-                result=result,
+                data=data,
             )
 
             return MCPResult(
                 success=success,
-                data=result.get("result") if success else None,
+                data=data,
                 error=result.get("error") if not success else None,
                 duration_ms=duration_ms,
             )
@@ -120,10 +182,10 @@ class MCPRunner:
         tool_input: dict,
         success: bool,
         duration_ms: float,
-        result: dict | None = None,
+        data: Any = None,
         error: str | None = None,
     ) -> None:
-        """Log MCP tool execution result."""
+        """Log MCP tool execution result, previewing at most 500 characters of it."""
         log_mcp_tool_call(
             logger=self._logger,
             server_name=server_name,
@@ -131,6 +193,6 @@ class MCPRunner:
             input_keys=list(tool_input.keys()),
             success=success,
             duration_ms=duration_ms,
-            result_preview=str(result.get("result", ""))[:500] if result else None,
+            result_preview=result_preview(data, 500) if data is not None else None,
             error=error,
         )
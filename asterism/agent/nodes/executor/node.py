@@ -5,7 +5,10 @@ from typing import Any
 
 from langgraph.types import Send
 
+from asterism.agent.models import TaskResult
+from asterism.agent.nodes.executor.mcp_runner import MCPRunner
 from asterism.agent.nodes.executor.task_runner import create_task_runner
+from asterism.agent.nodes.executor.utils import parse_tool_call
 from asterism.agent.nodes.shared import (
     advance_task,
     are_dependencies_satisfied,
@@ -202,23 +205,55 @@ def executor_node_with_parallel(
         # No parallelization possible, use standard execution
         return _execute_single_task(llm, mcp_executor, state)
 
+    # Tool calls sharing a server are sent together; their results ride along with the Send
+    batched = _execute_batched_tool_calls(mcp_executor, independent_tasks, state.get("session_id"))
+
     # Create Send objects for parallel execution
     logger.info(f"[executor] Executing {len(independent_tasks)} tasks in parallel")
     sends = []
     for task in independent_tasks:
-        sends.append(
-            Send(
-                "parallel_execute_task",
-                {
-                    "task": task,
-                    "parent_state": state,
-                },
-            )
-        )
+        data = {
+            "task": task,
+            "parent_state": state,
+        }
+        if task.id in batched:
+            data["result"] = batched[task.id]
+        sends.append(Send("parallel_execute_task", data))
 
     return sends
 
 
+def _execute_batched_tool_calls(
+    mcp_executor: MCPExecutor, tasks: list, session_id: str | None = None
+) -> dict[str, TaskResult]:
+    """Execute the MCP tasks that share a server with another task as one batch.
+
+    Args:
+        mcp_executor: The MCP executor for tool calls.
+        tasks: Independent tasks about to be dispatched in parallel.
+        session_id: Session large results are spilled under.
+
+    Returns:
+        Results of the batched tasks, keyed by task ID.
+    """
+    by_server: dict[str, list] = {}
+    for task in tasks:
+        if not task.tool_call or ":" not in task.tool_call:
+            continue
+        server_name, _ = parse_tool_call(task.tool_call)
+        by_server.setdefault(server_name, []).append(task)
+
+    batch = [task for server_tasks in by_server.values() if len(server_tasks) > 1 for task in server_tasks]
+    if not batch:
+        return {}
+
+    logger.info(
+        f"[executor] Batching {len(batch)} tool calls to {sum(len(t) > 1 for t in by_server.values())} server(s)"
+    )
+    results = MCPRunner(mcp_executor).execute_batch(batch, session_id)
+    return {result.task_id: result for result in results}
+
+
 def parallel_execute_task(
     llm: BaseLLMProvider,
     mcp_executor: MCPExecutor,
@@ -227,12 +262,13 @@ def parallel_execute_task(
     """Execute a single task in parallel.
 
     This node receives task data via Send and executes it, returning
-    the result to be aggregated by the reducer.
+    the result to be aggregated by the reducer. Tool calls that were already
+    executed as part of a batch arrive with their result and are not rerun.
 
     Args:
         llm: The LLM provider for LLM-only tasks.
         mcp_executor: The MCP executor for tool calls.
-        data: Dictionary containing task and parent_state.
+        data: Dictionary containing task, parent_state and, for batched tool calls, result.
 
     Returns:
         Dictionary with execution result to be merged into state.
@@ -243,10 +279,11 @@ def parallel_execute_task(
     if not task:
         return {"parallel_results": []}
 
-    logger.info(f"[executor] Parallel executing task {task.id}: {task.description[:80]}")
-
-    runner = create_task_runner(task, llm, mcp_executor)
-    result = runner.execute(task, parent_state)
+    result = data.get("result")
+    if result is None:
+        logger.info(f"[executor] Parallel executing task {task.id}: {task.description[:80]}")
+        runner = create_task_runner(task, llm, mcp_executor)
+        result = runner.execute(task, parent_state)
 
     log_task_completion(task.id, result.success)
 
@@ -6,7 +6,7 @@ from asterism.agent.models import AgentResponse, LLMUsage
 from asterism.agent.nodes.finalizer.prompts import FINALIZER_SYSTEM_PROMPT
 from asterism.agent.nodes.shared import LLMCaller
 from asterism.agent.state import AgentState
-from asterism.agent.utils import load_identity_context
+from asterism.agent.utils import load_identity_context, result_text
 
 
 def build_error_response(failed_tasks: list, trace: list[dict]) -> AgentResponse:
@@ -119,4 +119,4 @@ def format_results_summary(state: AgentState) -> str:
     if not execution_results:
         return "No execution results."
 
-    return "\n".join(f"Task {r.task_id}: {r.result}" for r in execution_results)
+    return "\n".join(f"Task {r.task_id}: {result_text(r.result)}" for r in execution_results)
@@ -109,7 +109,8 @@ def _build_execution_context(state: AgentState) -> str:
 def _fetch_tools_context(mcp_executor: MCPExecutor) -> str:
     """Fetch and format available tools from MCP."""
     try:
-        tool_schemas = mcp_executor.get_tool_schemas()
+        # Servers behind an open circuit would only fail, so their tools are not offered
+        tool_schemas = mcp_executor.get_tool_schemas(available_only=True)
         return format_tools_context(tool_schemas)
     except Exception as e:
         return f"Error getting tool information: {str(e)}"
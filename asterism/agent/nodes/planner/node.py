@@ -6,6 +6,8 @@ from asterism.agent.models import Plan
 from asterism.agent.nodes.planner.context import build_planner_context
 from asterism.agent.nodes.planner.service import (
     PlanningError,
+    find_invalid_tool_calls,
+    get_plan_servers,
     log_plan_creation,
     validate_and_enrich_plan,
 )
@@ -46,8 +48,17 @@ def planner_node(
     try:
         result = caller.call_structured(context.messages, Plan, "creating plan")
         plan = validate_and_enrich_plan(result.parsed)
+
+        # Tool calls that cannot pass their schema fail now, before any of the plan is executed
+        problems = find_invalid_tool_calls(plan, mcp_executor)
+        if problems:
+            raise PlanningError(f"Plan has {len(problems)} invalid tool call(s):\n" + "\n".join(problems))
+
         log_plan_creation(plan)
 
+        # Start the servers this plan calls while the executor gets ready
+        mcp_executor.prefetch(get_plan_servers(plan))
+
         logger.info(f"[planner] Created plan with {len(plan.tasks)} tasks")
         return set_plan(state, plan, result.usage)
 
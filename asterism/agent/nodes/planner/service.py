@@ -4,6 +4,7 @@ import logging
 
 from asterism.agent.models import Plan
 from asterism.agent.utils import log_plan_created
+from asterism.mcp.executor import MCPExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,46 @@ def validate_and_enrich_plan(plan: Plan) -> Plan:
     return plan
 
 
+def get_plan_servers(plan: Plan) -> set[str]:
+    """Get the MCP servers referenced by a plan's tool calls.
+
+    Args:
+        plan: The validated plan.
+
+    Returns:
+        Server names from tool calls in "server_name:tool_name" format.
+    """
+    return {task.tool_call.split(":", 1)[0] for task in plan.tasks if task.tool_call and ":" in task.tool_call}
+
+
+def find_invalid_tool_calls(plan: Plan, mcp_executor: MCPExecutor) -> list[str]:
+    """Check a plan's tool calls against the discovered tools and their input schemas.
+
+    Tasks that depend on other tasks are only checked for an existing tool,
+    as their inputs are resolved from earlier results during execution.
+
+    Args:
+        plan: The validated plan.
+        mcp_executor: The MCP executor holding the compiled tool schemas.
+
+    Returns:
+        One description per problem; empty if every tool call can run as planned.
+    """
+    problems = []
+    for task in plan.tasks:
+        if not task.tool_call or ":" not in task.tool_call:
+            continue
+        server_name, tool_name = task.tool_call.split(":", 1)
+        if not mcp_executor.validate_tool_call(server_name, tool_name):
+            problems.append(f"- Task '{task.id}': unknown tool '{task.tool_call}'")
+            continue
+        if task.depends_on:
+            continue
+        for error in mcp_executor.validate_arguments(server_name, tool_name, task.tool_input or {}):
+            problems.append(f"- Task '{task.id}' ({task.tool_call}): {error['path']}: {error['message']}")
+    return problems
+
+
 def log_plan_creation(plan: Plan) -> None:
     """Log plan creation with structured context.
 
@@ -6,7 +6,8 @@ from typing import Any, TypeVar
 
 from asterism.agent.models import LLMUsage
 from asterism.agent.utils import log_llm_call, log_llm_call_start
-from asterism.llm.providers import BaseLLMProvider
+from asterism.llm.provider_router import LLMProviderRouter
+from asterism.llm.providers import BaseLLMProvider, LLMResponse
 
 T = TypeVar("T")
 
@@ -39,6 +40,8 @@ class LLMCaller:
     def __init__(self, llm: BaseLLMProvider, node_name: str):
         self.llm = llm
         self.node_name = node_name
+        # The router hedges the calls of nodes configured in models.hedging.nodes
+        self._call_kwargs = {"node": node_name} if isinstance(llm, LLMProviderRouter) else {}
         self._logger = __import__("logging").getLogger(__name__)
 
     def call_structured(self, messages: list, schema: type[T], action: str) -> LLMCallResult:
@@ -55,68 +58,37 @@ class LLMCaller:
         Raises:
             LLMCallError: If the LLM call fails
         """
-        prompt_preview = self._extract_preview(messages)
-
-        log_llm_call_start(
-            logger=self._logger,
-            node_name=self.node_name,
-            model=self.llm.model,
-            action=action,
-            prompt_preview=prompt_preview,
-        )
-
+        prompt_preview = self._start(messages, action)
         start_time = time.perf_counter()
 
         try:
-            response = self.llm.invoke_structured(messages, schema)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            usage = LLMUsage(
-                prompt_tokens=response.prompt_tokens,
-                completion_tokens=response.completion_tokens,
-                total_tokens=response.total_tokens,
-                model=self.llm.model,
-                node_name=self.node_name,
-            )
+            response = self.llm.invoke_structured(messages, schema, **self._call_kwargs)
+        except Exception as e:
+            raise self._failure(e, action, prompt_preview, start_time) from e
+        return self._success(response, response.parsed, prompt_preview, start_time)
 
-            log_llm_call(
-                logger=self._logger,
-                node_name=self.node_name,
-                model=self.llm.model,
-                prompt_tokens=response.prompt_tokens,
-                completion_tokens=response.completion_tokens,
-                duration_ms=duration_ms,
-                prompt_preview=prompt_preview,
-                response_preview=str(response.parsed.model_dump())[:500] if response.parsed else None,
-                success=True,
-            )
+    async def acall_structured(self, messages: list, schema: type[T], action: str) -> LLMCallResult:
+        """Awaitable counterpart of call_structured().
 
-            return LLMCallResult(
-                parsed=response.parsed,
-                usage=usage,
-                duration_ms=duration_ms,
-            )
+        Args:
+            messages: List of messages to send to LLM
+            schema: Pydantic model class for structured output
+            action: Description of the action for logging
 
-        except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Try to extract token counts from partial response if available
-            prompt_tokens = getattr(getattr(e, "response", None), "prompt_tokens", 0)
-            completion_tokens = getattr(getattr(e, "response", None), "completion_tokens", 0)
-
-            log_llm_call(
-                logger=self._logger,
-                node_name=self.node_name,
-                model=self.llm.model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                duration_ms=duration_ms,
-                prompt_preview=prompt_preview,
-                success=False,
-                error=str(e),
-            )
+        Returns:
+            LLMCallResult with parsed data, usage info, and timing
+
+        Raises:
+            LLMCallError: If the LLM call fails
+        """
+        prompt_preview = self._start(messages, action)
+        start_time = time.perf_counter()
 
-            raise LLMCallError(f"LLM call failed for {action}: {e}") from e
+        try:
+            response = await self.llm.ainvoke_structured(messages, schema, **self._call_kwargs)
+        except Exception as e:
+            raise self._failure(e, action, prompt_preview, start_time) from e
+        return self._success(response, response.parsed, prompt_preview, start_time)
 
     def call_text(self, messages: list, action: str) -> LLMCallResult:
         """Make a text-based LLM call with full logging.
@@ -131,6 +103,39 @@ class LLMCaller:
         Raises:
             LLMCallError: If the LLM call fails
         """
+        prompt_preview = self._start(messages, action)
+        start_time = time.perf_counter()
+
+        try:
+            response = self.llm.invoke_with_usage(messages, **self._call_kwargs)
+        except Exception as e:
+            raise self._failure(e, action, prompt_preview, start_time) from e
+        return self._success(response, response.content, prompt_preview, start_time)
+
+    async def acall_text(self, messages: list, action: str) -> LLMCallResult:
+        """Awaitable counterpart of call_text().
+
+        Args:
+            messages: Message or list of messages (can be string for simple prompts)
+            action: Description of the action for logging
+
+        Returns:
+            LLMCallResult with text content, usage info, and timing
+
+        Raises:
+            LLMCallError: If the LLM call fails
+        """
+        prompt_preview = self._start(messages, action)
+        start_time = time.perf_counter()
+
+        try:
+            response = await self.llm.ainvoke_with_usage(messages, **self._call_kwargs)
+        except Exception as e:
+            raise self._failure(e, action, prompt_preview, start_time) from e
+        return self._success(response, response.content, prompt_preview, start_time)
+
+    def _start(self, messages: list | str, action: str) -> str:
+        """Log the start of a call and return the prompt preview used in its logs."""
         # Handle both single string and list of messages
         if isinstance(messages, str):
             prompt_preview = messages[:200]
@@ -144,58 +149,81 @@ class LLMCaller:
             action=action,
             prompt_preview=prompt_preview,
         )
+        return prompt_preview
 
-        start_time = time.perf_counter()
+    def _success(self, response: LLMResponse, parsed: Any, prompt_preview: str, start_time: float) -> LLMCallResult:
+        """Log a successful call and build its result.
 
-        try:
-            response = self.llm.invoke_with_usage(messages)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            usage = LLMUsage(
-                prompt_tokens=response.prompt_tokens,
-                completion_tokens=response.completion_tokens,
-                total_tokens=response.total_tokens,
-                model=self.llm.model,
-                node_name=self.node_name,
-            )
+        Args:
+            response: The provider response with usage metadata
+            parsed: The parsed model (structured calls) or text content (text calls)
+            prompt_preview: Prompt preview returned by _start()
+            start_time: perf_counter() value taken before the call
 
-            log_llm_call(
-                logger=self._logger,
-                node_name=self.node_name,
-                model=self.llm.model,
-                prompt_tokens=response.prompt_tokens,
-                completion_tokens=response.completion_tokens,
-                duration_ms=duration_ms,
-                prompt_preview=prompt_preview,
-                response_preview=response.content[:500] if response.content else None,
-                success=True,
-            )
+        Returns:
+            LLMCallResult with parsed data, usage info, and timing
+        """
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
-            return LLMCallResult(
-                parsed=response.content,
-                usage=usage,
-                duration_ms=duration_ms,
-            )
+        usage = LLMUsage(
+            prompt_tokens=response.prompt_tokens,
+            completion_tokens=response.completion_tokens,
+            total_tokens=response.total_tokens,
+            model=self.llm.model,
+            node_name=self.node_name,
+        )
 
-        except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            prompt_tokens = getattr(getattr(e, "response", None), "prompt_tokens", 0)
-            completion_tokens = getattr(getattr(e, "response", None), "completion_tokens", 0)
-
-            log_llm_call(
-                logger=self._logger,
-                node_name=self.node_name,
-                model=self.llm.model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                duration_ms=duration_ms,
-                prompt_preview=prompt_preview,
-                success=False,
-                error=str(e),
+        retries = getattr(response, "retries", 0)
+        if retries or getattr(response, "repaired", False):
+            self._logger.info(
+                f"[{self.node_name}] Structured output needed {retries} retries"
+                f"{' and local repair' if getattr(response, 'repaired', False) else ''}"
             )
 
-            raise LLMCallError(f"LLM call failed for {action}: {e}") from e
+        if isinstance(parsed, str):
+            response_preview = parsed[:500] if parsed else None
+        else:
+            response_preview = str(parsed.model_dump())[:500] if parsed else None
+
+        log_llm_call(
+            logger=self._logger,
+            node_name=self.node_name,
+            model=self.llm.model,
+            prompt_tokens=response.prompt_tokens,
+            completion_tokens=response.completion_tokens,
+            duration_ms=duration_ms,
+            prompt_preview=prompt_preview,
+            response_preview=response_preview,
+            success=True,
+        )
+
+        return LLMCallResult(
+            parsed=parsed,
+            usage=usage,
+            duration_ms=duration_ms,
+        )
+
+    def _failure(self, error: Exception, action: str, prompt_preview: str, start_time: float) -> LLMCallError:
+        """Log a failed call and build the error to raise."""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        # Try to extract token counts from partial response if available
+        prompt_tokens = getattr(getattr(error, "response", None), "prompt_tokens", 0)
+        completion_tokens = getattr(getattr(error, "response", None), "completion_tokens", 0)
+
+        log_llm_call(
+            logger=self._logger,
+            node_name=self.node_name,
+            model=self.llm.model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            duration_ms=duration_ms,
+            prompt_preview=prompt_preview,
+            success=False,
+            error=str(error),
+        )
+
+        return LLMCallError(f"LLM call failed for {action}: {error}")
 
     def _extract_preview(self, messages: list) -> str:
         """Extract a preview string from messages for logging."""
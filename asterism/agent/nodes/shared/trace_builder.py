@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from asterism.agent.models import SpilledResult
 from asterism.agent.state import AgentState
 
 
@@ -23,7 +24,8 @@ def build_execution_trace(state: AgentState) -> list[dict[str, Any]]:
         trace_entry = {
             "task_id": result.task_id,
             "success": result.success,
-            "result": result.result,
+            # Spilled results are shown by their preview rather than their spill file location
+            "result": str(result.result) if isinstance(result.result, SpilledResult) else result.result,
             "error": result.error,
             "timestamp": result.timestamp.isoformat() if result.timestamp else None,
         }
@@ -11,14 +11,23 @@ from .logging_utils import (
     log_plan_created,
     log_task_execution,
 )
+from .result_store import (
+    ResultStore,
+    get_result_store,
+    result_preview,
+    result_text,
+    set_result_store,
+)
 from .workspace_tree import (
     generate_workspace_tree,
     get_workspace_tree_context,
 )
 
 __all__ = [
+    "ResultStore",
     "generate_workspace_tree",
     "get_logger_context",
+    "get_result_store",
     "get_workspace_tree_context",
     "load_identity_context",
     "log_evaluation_decision",
@@ -28,4 +37,7 @@ __all__ = [
     "log_node_execution",
     "log_plan_created",
     "log_task_execution",
+    "result_preview",
+    "result_text",
+    "set_result_store",
 ]
@@ -0,0 +1,169 @@
+"""Spill store for large task results.
+
+Results over a size threshold are appended to a per-session spill file and
+replaced in agent state by a SpilledResult handle holding the file location
+and a short preview. Consumers read the slices they need through mmap, so
+large outputs are neither copied into every state update nor serialized into
+checkpoints.
+"""
+
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any
+
+from asterism.agent.models import SpilledResult
+
+logger = logging.getLogger(__name__)
+
+# Results larger than this many bytes are spilled
+DEFAULT_SPILL_THRESHOLD = 64 * 1024
+
+# Characters of a spilled result kept in state for logs and short prompt contexts
+DEFAULT_PREVIEW_CHARS = 1000
+
+# Bytes of a spilled result read into a single LLM prompt
+DEFAULT_READ_LIMIT = 128 * 1024
+
+DEFAULT_SPILL_DIR = "sessions/results"
+
+
+class ResultStore:
+    """Writes large task results to per-session spill files."""
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_SPILL_DIR,
+        threshold: int = DEFAULT_SPILL_THRESHOLD,
+        preview_chars: int = DEFAULT_PREVIEW_CHARS,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the spill files, created on first spill.
+            threshold: Results larger than this many bytes are spilled.
+            preview_chars: Characters of a spilled result kept in its handle.
+        """
+        self.directory = Path(directory)
+        self.threshold = threshold
+        self.preview_chars = preview_chars
+        self._lock = threading.Lock()
+        self._active_runs: dict[str, int] = {}
+
+    def _session_path(self, session_id: str) -> Path:
+        """Get the spill file of a session."""
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', session_id)}.spill"
+
+    def spill(self, session_id: str, result: Any) -> Any:
+        """Spill a result if it is over the threshold.
+
+        Args:
+            session_id: Session the result belongs to.
+            result: A task result; strings are stored as text, anything else as JSON.
+
+        Returns:
+            A SpilledResult handle for large results, otherwise the result unchanged.
+        """
+        if result is None or isinstance(result, SpilledResult):
+            return result
+        # Strings too short to pass the threshold even at 4 bytes per character skip encoding
+        if isinstance(result, str) and len(result) * 4 <= self.threshold:
+            return result
+
+        if isinstance(result, str):
+            encoding, text = "text", result
+        else:
+            encoding, text = "json", json.dumps(result, ensure_ascii=False, default=str)
+        payload = text.encode("utf-8")
+        if len(payload) <= self.threshold:
+            return result
+
+        path = self._session_path(session_id)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as f:
+                offset = f.seek(0, 2)
+                f.write(payload)
+
+        logger.debug(f"Spilled {len(payload)} byte result of session '{session_id}' to {path}")
+        return SpilledResult(
+            path=str(path.resolve()),
+            offset=offset,
+            size=len(payload),
+            encoding=encoding,
+            preview=text[: self.preview_chars],
+        )
+
+    def start_run(self, session_id: str) -> None:
+        """Register a run on a session, so its spill file outlives other runs ending meanwhile."""
+        with self._lock:
+            self._active_runs[session_id] = self._active_runs.get(session_id, 0) + 1
+
+    def end_run(self, session_id: str) -> None:
+        """Unregister a run on a session, deleting its spill file once no run on the session is left."""
+        with self._lock:
+            remaining = self._active_runs.get(session_id, 1) - 1
+            if remaining > 0:
+                self._active_runs[session_id] = remaining
+                return
+            self._active_runs.pop(session_id, None)
+            self._session_path(session_id).unlink(missing_ok=True)
+
+    def delete_session(self, session_id: str) -> None:
+        """Delete the spill file of a session."""
+        with self._lock:
+            self._session_path(session_id).unlink(missing_ok=True)
+
+
+def result_text(result: Any, limit: int | None = DEFAULT_READ_LIMIT) -> str:
+    """Get a task result as text for a prompt, reading spilled results from their file.
+
+    Args:
+        result: A task result or SpilledResult handle.
+        limit: Maximum bytes of a spilled result to read; None reads all of it.
+
+    Returns:
+        The result text, marked as truncated when only part of a spilled result was read.
+    """
+    if not isinstance(result, SpilledResult):
+        return str(result)
+    text = result.read(0, limit)
+    if limit is not None and result.size > limit:
+        text += f"... [truncated, {result.size} bytes in total]"
+    return text
+
+
+def result_preview(result: Any, max_chars: int) -> str:
+    """Get the beginning of a task result without converting a spilled result to text.
+
+    Args:
+        result: A task result or SpilledResult handle.
+        max_chars: Maximum characters of the preview.
+
+    Returns:
+        The first max_chars characters of the result's text form.
+    """
+    if isinstance(result, SpilledResult):
+        return result.preview[:max_chars]
+    if isinstance(result, str):
+        return result[:max_chars]
+    # Results that were not spilled are under the threshold, so their text form is small
+    return str(result)[:max_chars]
+
+
+# Spilling is opt-in: the API configures the store from mcp.result_spill_dir at startup
+_result_store: ResultStore | None = None
+
+
+def get_result_store() -> ResultStore | None:
+    """Get the global result store; None while spilling is not configured."""
+    return _result_store
+
+
+def set_result_store(store: ResultStore | None) -> None:
+    """Replace the global result store; None disables spilling."""
+    global _result_store
+    _result_store = store
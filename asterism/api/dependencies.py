@@ -1,10 +1,9 @@
 """FastAPI dependency injection."""
 
-from fastapi import Depends, Header
+from fastapi import Depends, Header, Request
 
 from asterism.config import Config
 from asterism.llm import LLMProviderRouter
-from asterism.mcp.config import MCPConfigLoader
 from asterism.mcp.executor import MCPExecutor
 
 from .exceptions import AuthenticationError
@@ -53,27 +52,31 @@ def get_api_key(
     return api_key
 
 
-def get_llm_router(config: Config = Depends(get_config)) -> LLMProviderRouter:
-    """Get the LLM provider router instance.
+def get_llm_router(request: Request) -> LLMProviderRouter:
+    """Get the app-scoped LLM provider router instance.
+
+    The router is created once in the application lifespan so provider
+    clients are reused across requests.
 
     Args:
-        config: Configuration instance
+        request: The incoming request
 
     Returns:
-        Configured LLMProviderRouter
+        Shared LLMProviderRouter
     """
-    return LLMProviderRouter(config)
+    return request.app.state.llm_router
 
 
-def get_mcp_executor(config: Config = Depends(get_config)) -> MCPExecutor:
-    """Get the MCP executor instance.
+def get_mcp_executor(request: Request) -> MCPExecutor:
+    """Get the app-scoped MCP executor instance.
+
+    The executor is created once in the application lifespan so MCP server
+    processes are reused across requests and shut down on exit.
 
     Args:
-        config: Configuration instance
+        request: The incoming request
 
     Returns:
-        Configured MCPExecutor
+        Shared MCPExecutor
     """
-    servers_file = config.get_mcp_servers_file()
-    mcp_config = MCPConfigLoader.load(servers_file)
-    return MCPExecutor(mcp_config)
+    return request.app.state.mcp_executor
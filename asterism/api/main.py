@@ -1,5 +1,6 @@
 """FastAPI application factory."""
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -7,7 +8,13 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from asterism.agent.utils import ResultStore, set_result_store
 from asterism.config import Config
+from asterism.llm import LLMProviderRouter
+from asterism.mcp.config import MCPConfigLoader
+from asterism.mcp.executor import MCPExecutor
+from asterism.mcp.schema_cache import ToolSchemaCache
+from asterism.mcp.supervisor import ServerSupervisor
 
 from .exceptions import (
     AllProvidersFailedError,
@@ -41,9 +48,37 @@ def create_api_app(config: Config | None = None) -> FastAPI:
         logger.info(f"Workspace: {config.workspace_path}, Working Dir: {os.getcwd()}")
         logger.info(f"Default model: {config.data.models.default}")
         logger.info(f"Configured providers: {[p.name for p in config.data.models.provider]}")
-        yield
-        # Shutdown
-        logger.info("Asterism API shutting down...")
+
+        # App-scoped dependencies, shared by every request
+        app.state.llm_router = LLMProviderRouter(config)
+        schema_cache_file = config.data.mcp.schema_cache_file
+        schema_cache = (
+            ToolSchemaCache(schema_cache_file, config.data.mcp.schema_cache_ttl) if schema_cache_file else None
+        )
+        supervisor = ServerSupervisor(
+            interval=config.data.mcp.health_check_interval,
+            failure_threshold=config.data.mcp.failure_threshold,
+            reset_timeout=config.data.mcp.circuit_reset_timeout,
+            backoff_max=config.data.mcp.restart_backoff_max,
+        )
+        app.state.mcp_executor = MCPExecutor(
+            MCPConfigLoader.load(config.get_mcp_servers_file()),
+            schema_cache=schema_cache,
+            default_timeout=config.data.mcp.timeout,
+            supervisor=supervisor,
+        )
+        supervisor.start()
+        spill_dir = config.data.mcp.result_spill_dir
+        set_result_store(ResultStore(spill_dir, config.data.mcp.result_spill_threshold) if spill_dir else None)
+        if config.data.mcp.warmup:
+            await asyncio.to_thread(app.state.mcp_executor.warm_up, config.data.mcp.warmup_timeout)
+        try:
+            yield
+        finally:
+            # Shutdown
+            logger.info("Asterism API shutting down...")
+            app.state.mcp_executor.shutdown()
+            app.state.llm_router.close()
 
     app = FastAPI(
         title="Asterism API",
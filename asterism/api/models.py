@@ -1,6 +1,6 @@
 """Pydantic models for OpenAI-compatible API."""
 
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -106,6 +106,10 @@ class HealthStatus(BaseModel):
     status: Literal["healthy", "unhealthy"]
     version: str
     providers: dict[str, str]
+    ready: bool = True
+    mcp_servers: dict[str, str] = Field(default_factory=dict)
+    models: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    hedging: dict[str, dict[str, Any]] = Field(default_factory=dict)
 
 
 class ErrorDetail(BaseModel):
@@ -2,12 +2,13 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, status
 
 from asterism.config import Config
 from asterism.llm import LLMProviderRouter
+from asterism.mcp.executor import MCPExecutor
 
-from ..dependencies import get_config, get_llm_router
+from ..dependencies import get_config, get_llm_router, get_mcp_executor
 from ..models import HealthStatus
 
 router = APIRouter()
@@ -15,16 +16,23 @@ router = APIRouter()
 
 @router.get("/health")
 async def health_check(
+    response: Response,
     config: Annotated[Config, Depends(get_config)],
     llm_router: Annotated[LLMProviderRouter, Depends(get_llm_router)],
+    mcp_executor: Annotated[MCPExecutor, Depends(get_mcp_executor)],
 ) -> HealthStatus:
     """Health check endpoint.
 
-    Returns the health status of the API and all configured providers.
+    Returns the health status of the API, all configured providers, the
+    circuit state of every model called so far, hedging counters per agent
+    node and the readiness of every enabled MCP server. Responds with 503 while servers
+    are still warming up, so load balancers hold traffic back until then.
 
     Args:
+        response: Outgoing response, used to set the status code
         config: Configuration instance
         llm_router: LLM provider router
+        mcp_executor: Shared MCP executor
 
     Returns:
         Health status information
@@ -41,8 +49,20 @@ async def health_check(
             providers[provider_config.name] = "unavailable"
             all_healthy = False
 
+    # Check MCP server readiness
+    mcp_servers = mcp_executor.get_server_status()
+    if any(state in ("failed", "unavailable") for state in mcp_servers.values()):
+        all_healthy = False
+    ready = "starting" not in mcp_servers.values()
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
     return HealthStatus(
         status="healthy" if all_healthy else "unhealthy",
         version=config.data.agent.version,
         providers=providers,
+        ready=ready,
+        mcp_servers=mcp_servers,
+        models=llm_router.health.status(),
+        hedging=llm_router.hedger.status(),
     )
@@ -5,6 +5,7 @@ from .config import (
     APIConfig,
     Config,
     ConfigData,
+    HedgingConfig,
     MCPConfig,
     ModelProvider,
     ModelsConfig,
@@ -15,6 +16,7 @@ __all__ = [
     "APIConfig",
     "Config",
     "ConfigData",
+    "HedgingConfig",
     "MCPConfig",
     "ModelProvider",
     "ModelsConfig",
@@ -8,7 +8,7 @@ import logging
 import os
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import BaseModel, Field
@@ -105,6 +105,25 @@ class ModelProvider(BaseModel):
     name: str = Field(..., description="Provider name")
     base_url: str | None = Field(default=None, description="Base URL for API")
     api_key: str | None = Field(default=None, description="API key (supports env. prefix)")
+    structured_output: Literal["none", "json_object", "json_schema"] = Field(
+        default="none",
+        description="Native structured output support: none, json_object (JSON mode) or json_schema (schema mode)",
+    )
+
+
+class HedgingConfig(BaseModel):
+    """Hedged LLM calls of latency-critical agent nodes."""
+
+    nodes: list[str] = Field(
+        default_factory=list,
+        description="Agent nodes whose LLM calls are hedged, e.g. planner_node (empty disables hedging)",
+    )
+    percentile: float = Field(
+        default=95.0,
+        description="Latency percentile of a model after which the next model in the chain is started",
+    )
+    min_samples: int = Field(default=5, description="Successful calls of a model needed before its calls are hedged")
+    max_hedge_rate: float = Field(default=0.1, description="Maximum share of a node's recent calls that are hedged")
 
 
 class ModelsConfig(BaseModel):
@@ -113,13 +132,50 @@ class ModelsConfig(BaseModel):
     provider: list[ModelProvider] = Field(..., description="List of model providers")
     default: str = Field(..., description="Default model to use")
     fallback: list[str] = Field(default_factory=list, description="Fallback models")
+    failure_threshold: int = Field(default=3, description="Consecutive failed calls that open a model's circuit")
+    circuit_reset_timeout: float = Field(
+        default=30.0,
+        description="Seconds a model with an open circuit is skipped before it is probed again",
+    )
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig, description="Hedged LLM calls per agent node")
 
 
 class MCPConfig(BaseModel):
     """MCP server configuration."""
 
     servers_file: str = Field(default="mcp_servers.json", description="Path to MCP servers JSON file")
-    timeout: int = Field(default=30, description="MCP server timeout in seconds")
+    timeout: int = Field(default=30, description="Default MCP tool call timeout in seconds")
+    schema_cache_file: str | None = Field(
+        default="sessions/mcp_schema_cache.json",
+        description="Path to persistent tool schema cache (None to disable)",
+    )
+    schema_cache_ttl: int = Field(
+        default=86400,
+        description="Seconds before cached tool schemas are revalidated in the background",
+    )
+    health_check_interval: float = Field(
+        default=30.0,
+        description="Seconds between pings of started MCP servers (0 disables health checks)",
+    )
+    failure_threshold: int = Field(default=3, description="Failures within a minute that open a server's circuit")
+    circuit_reset_timeout: float = Field(
+        default=30.0,
+        description="Seconds an open circuit fails fast before the server is probed again",
+    )
+    restart_backoff_max: float = Field(default=60.0, description="Maximum delay in seconds between server restarts")
+    result_spill_dir: str | None = Field(
+        default=None,
+        description="Directory large tool results are spilled to during a run, e.g. sessions/results (None disables)",
+    )
+    result_spill_threshold: int = Field(
+        default=65536,
+        description="Tool results larger than this many bytes are spilled and kept in state as a preview",
+    )
+    warmup: bool = Field(default=False, description="Start all enabled MCP servers in parallel at API startup")
+    warmup_timeout: float = Field(
+        default=30.0,
+        description="Seconds API startup waits for the warm-up; slower servers keep starting in the background",
+    )
 
 
 class ConfigData(BaseModel):
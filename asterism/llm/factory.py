@@ -41,6 +41,7 @@ class LLMProviderFactory:
                 base_url=provider_config.base_url,
                 api_key=api_key,
                 prompt_loader=None,  # API mode doesn't use SOUL/AGENT prompts
+                structured_output=provider_config.structured_output,
             )
 
         raise ValueError(f"Unsupported provider type: {provider_config.type}")
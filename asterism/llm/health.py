@@ -0,0 +1,225 @@
+"""Health tracking and circuit breaking of LLM models.
+
+The router records the outcome and latency of every call per model. A model
+that fails several calls in a row gets an open circuit and is skipped for a
+cooldown, after which a single probe call decides whether it is closed again.
+Models that recently failed are tried after healthy ones, so an outage of the
+primary model does not add its timeout to every call.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Calls per model kept for the error rate and latency statistics
+DEFAULT_HEALTH_WINDOW = 20
+
+# Error rate over the window from which a model is tried after healthy ones
+DEGRADED_ERROR_RATE = 0.5
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states of a model."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class ModelHealth:
+    """Call outcomes and circuit state of one model."""
+
+    state: CircuitState = CircuitState.CLOSED
+    outcomes: deque[bool] = field(default_factory=lambda: deque(maxlen=DEFAULT_HEALTH_WINDOW))
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=DEFAULT_HEALTH_WINDOW))
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+    last_error: str | None = None
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed calls in the window; 0.0 before the first call."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def degraded(self) -> bool:
+        """Whether the model should be tried after healthy ones."""
+        return (
+            self.state != CircuitState.CLOSED or self.consecutive_failures > 0 or self.error_rate >= DEGRADED_ERROR_RATE
+        )
+
+
+class ModelHealthTracker:
+    """Tracks error rate, consecutive failures and latency per model and circuit-breaks failing models."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        window: int = DEFAULT_HEALTH_WINDOW,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a model's circuit.
+            reset_timeout: Seconds an open circuit skips the model before a probe is let through.
+            window: Calls per model kept for the error rate and latency statistics.
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self.window = max(1, int(window))
+        self._health: dict[str, ModelHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get_health(self, model: str) -> ModelHealth:
+        """Get the health entry of a model; the lock must be held."""
+        health = self._health.get(model)
+        if health is None:
+            health = ModelHealth(outcomes=deque(maxlen=self.window), latencies=deque(maxlen=self.window))
+            self._health[model] = health
+        return health
+
+    def order(self, models: list[str]) -> list[str]:
+        """Order a model chain so healthy models come first.
+
+        Healthy models keep their configured order, followed by degraded ones
+        (recent failures, a high error rate or a circuit that is not closed)
+        in configured order.
+
+        Args:
+            models: Model identifiers in configured priority order.
+
+        Returns:
+            The same models, healthy ones first.
+        """
+        with self._lock:
+            degraded = {model for model in models if model in self._health and self._health[model].degraded}
+        return [model for model in models if model not in degraded] + [model for model in models if model in degraded]
+
+    def allow(self, model: str) -> bool:
+        """Check whether a call to a model may go through.
+
+        An open circuit becomes half-open once reset_timeout has passed and lets
+        one probe call through; other calls skip the model until the probe
+        has been recorded.
+
+        Args:
+            model: Model identifier.
+
+        Returns:
+            False while the model's circuit is open or its probe is in flight.
+        """
+        with self._lock:
+            health = self._health.get(model)
+            if health is None or health.state == CircuitState.CLOSED:
+                return True
+            if health.state == CircuitState.OPEN:
+                if time.monotonic() - health.opened_at < self.reset_timeout:
+                    return False
+                health.state = CircuitState.HALF_OPEN
+            elif health.probing:
+                return False
+            health.probing = True
+        logger.info(f"Circuit of model '{model}' is half-open, probing")
+        return True
+
+    def record_success(self, model: str, latency: float) -> None:
+        """Record a successful call, closing a half-open circuit.
+
+        Args:
+            model: Model identifier.
+            latency: Seconds the call took.
+        """
+        with self._lock:
+            health = self._get_health(model)
+            health.outcomes.append(True)
+            health.latencies.append(latency)
+            health.consecutive_failures = 0
+            closed = health.state != CircuitState.CLOSED
+            health.state = CircuitState.CLOSED
+            health.probing = False
+        if closed:
+            logger.info(f"Circuit of model '{model}' closed")
+
+    def record_failure(self, model: str, error: str) -> None:
+        """Record a failed call, opening the circuit after failure_threshold failures in a row.
+
+        A failed probe reopens the circuit right away.
+
+        Args:
+            model: Model identifier.
+            error: Description of the failure.
+        """
+        with self._lock:
+            health = self._get_health(model)
+            health.outcomes.append(False)
+            health.consecutive_failures += 1
+            health.last_error = error
+            trip = health.state == CircuitState.HALF_OPEN or (
+                health.state == CircuitState.CLOSED and health.consecutive_failures >= self.failure_threshold
+            )
+            if trip:
+                health.state = CircuitState.OPEN
+                health.opened_at = time.monotonic()
+            health.probing = False
+        if trip:
+            logger.warning(f"Circuit of model '{model}' opened: {error}")
+
+    def latency_percentile(self, model: str, percentile: float, min_samples: int = 1) -> float | None:
+        """Get a percentile of a model's successful call latencies over the window.
+
+        Args:
+            model: Model identifier.
+            percentile: Percentile between 0 and 100, by the nearest-rank method.
+            min_samples: Latencies needed for the percentile to be meaningful.
+
+        Returns:
+            Latency in seconds, or None while fewer than min_samples calls succeeded.
+        """
+        with self._lock:
+            health = self._health.get(model)
+            latencies = sorted(health.latencies) if health is not None else []
+        if not latencies or len(latencies) < min_samples:
+            return None
+        rank = math.ceil(min(max(percentile, 0.0), 100.0) / 100 * len(latencies))
+        return latencies[max(rank, 1) - 1]
+
+    def release(self, model: str) -> None:
+        """Give back a probe slot taken by allow() for a call that ended without an outcome, e.g. cancelled."""
+        with self._lock:
+            health = self._health.get(model)
+            if health is not None:
+                health.probing = False
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        """Get the health of every model that has been called.
+
+        Returns:
+            Dictionary mapping model identifiers to circuit state, error rate,
+            consecutive failures, mean latency over the window and last error.
+        """
+        with self._lock:
+            return {
+                model: {
+                    "state": str(health.state),
+                    "error_rate": round(health.error_rate, 3),
+                    "consecutive_failures": health.consecutive_failures,
+                    "latency_ms": (
+                        round(sum(health.latencies) / len(health.latencies) * 1000, 1) if health.latencies else None
+                    ),
+                    "last_error": health.last_error,
+                }
+                for model, health in self._health.items()
+            }
@@ -0,0 +1,146 @@
+"""Hedged LLM calls for latency-critical agent nodes.
+
+When a model has not answered within a high percentile of its usual latency,
+the router starts the next model in the chain and keeps whichever answer
+arrives first. A budget caps the share of a node's calls that are hedged,
+and the tokens spent on discarded calls are accounted per node.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+# Calls per node the hedge rate is measured over
+DEFAULT_HEDGE_WINDOW = 100
+
+
+@dataclass
+class HedgeSample:
+    """One call in a node's hedge rate window."""
+
+    hedged: bool = False
+
+
+@dataclass
+class NodeHedgeStats:
+    """Hedging counters of one agent node."""
+
+    calls: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    extra_tokens: int = 0
+    recent: deque[HedgeSample] = field(default_factory=lambda: deque(maxlen=DEFAULT_HEDGE_WINDOW))
+
+
+class RequestHedger:
+    """Decides which calls may be hedged and accounts their cost, per agent node."""
+
+    def __init__(
+        self,
+        nodes: list[str] | None = None,
+        percentile: float = 95.0,
+        min_samples: int = 5,
+        max_hedge_rate: float = 0.1,
+        window: int = DEFAULT_HEDGE_WINDOW,
+    ):
+        """
+        Initialize the hedger.
+
+        Args:
+            nodes: Agent nodes whose calls are hedged; no other calls are.
+            percentile: Latency percentile of a model after which a hedge is started.
+            min_samples: Successful calls of a model needed before its calls are hedged.
+            max_hedge_rate: Maximum share of a node's recent calls that are hedged.
+            window: Calls per node the hedge rate is measured over.
+        """
+        self.nodes = set(nodes or [])
+        self.percentile = percentile
+        self.min_samples = max(1, int(min_samples))
+        self.max_hedge_rate = max_hedge_rate
+        self.window = max(1, int(window))
+        self._stats: dict[str, NodeHedgeStats] = {}
+        self._lock = threading.Lock()
+
+    def enabled(self, node: str | None) -> bool:
+        """Check whether the calls of a node are hedged."""
+        return node is not None and node in self.nodes and self.max_hedge_rate > 0
+
+    def start_call(self, node: str) -> HedgeSample:
+        """Count a call of a hedged node towards its hedge rate.
+
+        Args:
+            node: Agent node making the call.
+
+        Returns:
+            The call's sample in the window, to pass to try_hedge().
+        """
+        sample = HedgeSample()
+        with self._lock:
+            stats = self._get_stats(node)
+            stats.calls += 1
+            stats.recent.append(sample)
+        return sample
+
+    def try_hedge(self, node: str, sample: HedgeSample) -> bool:
+        """Take a hedge from the node's budget for a call.
+
+        Args:
+            node: Agent node making the call.
+            sample: The call's sample returned by start_call().
+
+        Returns:
+            False if the call was hedged already, or max_hedge_rate of the node's recent calls were.
+        """
+        with self._lock:
+            stats = self._get_stats(node)
+            hedged = sum(1 for recent in stats.recent if recent.hedged)
+            if sample.hedged or hedged >= self.max_hedge_rate * max(len(stats.recent), 1):
+                return False
+            sample.hedged = True
+            stats.hedges += 1
+            return True
+
+    def record_outcome(self, node: str, hedge_won: bool, extra_tokens: int) -> None:
+        """Record how a hedged call ended.
+
+        Args:
+            node: Agent node that made the call.
+            hedge_won: Whether the hedge answered before the model it hedged.
+            extra_tokens: Tokens spent on the call whose answer was discarded.
+        """
+        with self._lock:
+            stats = self._get_stats(node)
+            stats.hedge_wins += int(hedge_won)
+            stats.extra_tokens += extra_tokens
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        """Get the hedging counters of every node that made a hedged-policy call.
+
+        Returns:
+            Dictionary mapping node names to calls, hedges, hedges that won
+            and extra tokens spent on discarded answers.
+        """
+        with self._lock:
+            return {
+                node: {
+                    "calls": stats.calls,
+                    "hedges": stats.hedges,
+                    "hedge_wins": stats.hedge_wins,
+                    "extra_tokens": stats.extra_tokens,
+                }
+                for node, stats in self._stats.items()
+            }
+
+    def _get_stats(self, node: str) -> NodeHedgeStats:
+        """Get the counters of a node; the lock must be held."""
+        stats = self._stats.get(node)
+        if stats is None:
+            stats = NodeHedgeStats(recent=deque(maxlen=self.window))
+            self._stats[node] = stats
+        return stats
+
+
+def response_tokens(response: Any) -> int:
+    """Get the total tokens of a provider response, 0 for plain text responses."""
+    return getattr(response, "total_tokens", 0) or 0
@@ -1,7 +1,13 @@
-"""LLM Provider Router with primary-first fallback."""
+"""LLM Provider Router with health-ordered fallback."""
 
+import asyncio
 import logging
-from collections.abc import AsyncGenerator, Callable
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from typing import Any, TypeVar
 
 from langchain_core.messages import BaseMessage
@@ -10,6 +16,8 @@ from asterism.config import Config
 
 from .exceptions import AllProvidersFailedError
 from .factory import LLMProviderFactory
+from .health import ModelHealthTracker
+from .hedging import RequestHedger, response_tokens
 from .providers import BaseLLMProvider, LLMResponse, StructuredLLMResponse
 
 logger = logging.getLogger(__name__)
@@ -25,6 +33,17 @@ class LLMProviderRouter(BaseLLMProvider):
     2. On failure, each fallback model is tried in order
     3. If all models fail, an AllProvidersFailedError is raised
 
+    Every call's outcome and latency is recorded per model. Models with recent
+    failures move behind healthy ones, and a model that fails
+    models.failure_threshold calls in a row is skipped for
+    models.circuit_reset_timeout seconds before a single probe call may close
+    its circuit again.
+
+    Calls of the agent nodes listed in models.hedging.nodes are hedged: when
+    a model has not answered within models.hedging.percentile of its observed
+    latency, the next model in the chain is started as well and the first
+    answer wins.
+
     Model format: "provider_name/model_path" or just "model_path" (uses default provider)
 
     The fallback chain is built from models, not providers, allowing multiple
@@ -33,6 +52,8 @@ class LLMProviderRouter(BaseLLMProvider):
     Attributes:
         config: Configuration object with provider and fallback settings
         providers: Dictionary of provider name -> provider instance
+        health: Per-model health and circuit state
+        hedger: Per-node hedging budget and accounting
     """
 
     def __init__(self, config: Config | None = None):
@@ -44,6 +65,19 @@ class LLMProviderRouter(BaseLLMProvider):
         super().__init__(prompt_loader=None)
         self.config = config or Config()
         self.providers: dict[str, BaseLLMProvider] = {}
+        self.health = ModelHealthTracker(
+            failure_threshold=self.config.data.models.failure_threshold,
+            reset_timeout=self.config.data.models.circuit_reset_timeout,
+        )
+        hedging = self.config.data.models.hedging
+        self.hedger = RequestHedger(
+            nodes=hedging.nodes,
+            percentile=hedging.percentile,
+            min_samples=hedging.min_samples,
+            max_hedge_rate=hedging.max_hedge_rate,
+        )
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_executor_lock = threading.Lock()
         self._initialize_providers()
 
     def _initialize_providers(self) -> None:
@@ -60,6 +94,7 @@ class LLMProviderRouter(BaseLLMProvider):
         self,
         execute_fn: Callable[[BaseLLMProvider, str], T],
         prompt: str | list[BaseMessage],
+        node: str | None = None,
         **kwargs: Any,
     ) -> T:
         """Execute a provider method with primary-first fallback.
@@ -69,6 +104,7 @@ class LLMProviderRouter(BaseLLMProvider):
         Args:
             execute_fn: Function to execute on each provider (provider, model_name) -> result
             prompt: Text or messages to send to the LLM
+            node: Agent node making the call; calls of nodes in models.hedging.nodes are hedged
             **kwargs: Additional parameters including:
                 - model: Model identifier (provider/model or just model)
 
@@ -78,34 +114,270 @@ class LLMProviderRouter(BaseLLMProvider):
         Raises:
             AllProvidersFailedError: If all models in the chain fail
         """
-        model = kwargs.get("model", self.config.data.models.default)
-        model_chain = self._build_model_chain(primary_model=model)
-        model_names = [f"{p.name}/{m}" for p, m in model_chain]
-
-        if not model_chain:
-            raise AllProvidersFailedError(
-                "No providers available in the chain",
-                provider_chain=model_names,
-            )
+        model_chain, model_names = self._resolve_model_chain(**kwargs)
+        if self.hedger.enabled(node):
+            return self._execute_hedged(execute_fn, model_chain, model_names, node)
 
         last_error: Exception | None = None
 
-        for provider, model_name in model_chain:
+        for provider, model_name in self._order_by_health(model_chain):
+            key = f"{provider.name}/{model_name}"
+            if not self.health.allow(key):
+                logger.debug(f"Skipping model {key}: circuit open")
+                continue
+            start = time.perf_counter()
             try:
                 result = execute_fn(provider, model_name)
-                logger.debug(f"Model succeeded: {provider.name}/{model_name}")
-                return result
             except Exception as e:
+                self.health.record_failure(key, str(e))
                 last_error = e
-                logger.warning(f"Model {provider.name}/{model_name} failed: {e}")
+                logger.warning(f"Model {key} failed: {e}")
                 continue
+            except BaseException:
+                self.health.release(key)
+                raise
+            self.health.record_success(key, time.perf_counter() - start)
+            logger.debug(f"Model succeeded: {key}")
+            return result
 
-        raise AllProvidersFailedError(
+        raise self._all_failed(model_chain, model_names, last_error)
+
+    async def _aexecute_with_fallback(
+        self,
+        execute_fn: Callable[[BaseLLMProvider, str], Awaitable[T]],
+        prompt: str | list[BaseMessage],
+        node: str | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Awaitable counterpart of _execute_with_fallback().
+
+        Args:
+            execute_fn: Coroutine function to await on each provider (provider, model_name) -> result
+            prompt: Text or messages to send to the LLM
+            node: Agent node making the call; calls of nodes in models.hedging.nodes are hedged
+            **kwargs: Additional parameters including:
+                - model: Model identifier (provider/model or just model)
+
+        Returns:
+            Result from the first successful provider execution
+
+        Raises:
+            AllProvidersFailedError: If all models in the chain fail
+        """
+        model_chain, model_names = self._resolve_model_chain(**kwargs)
+        if self.hedger.enabled(node):
+            return await self._aexecute_hedged(execute_fn, model_chain, model_names, node)
+
+        last_error: Exception | None = None
+
+        for provider, model_name in self._order_by_health(model_chain):
+            key = f"{provider.name}/{model_name}"
+            if not self.health.allow(key):
+                logger.debug(f"Skipping model {key}: circuit open")
+                continue
+            start = time.perf_counter()
+            try:
+                result = await execute_fn(provider, model_name)
+            except Exception as e:
+                self.health.record_failure(key, str(e))
+                last_error = e
+                logger.warning(f"Model {key} failed: {e}")
+                continue
+            except BaseException:
+                self.health.release(key)
+                raise
+            self.health.record_success(key, time.perf_counter() - start)
+            logger.debug(f"Model succeeded: {key}")
+            return result
+
+        raise self._all_failed(model_chain, model_names, last_error)
+
+    def _execute_hedged(
+        self,
+        execute_fn: Callable[[BaseLLMProvider, str], T],
+        model_chain: list[tuple[BaseLLMProvider, str]],
+        model_names: list[str],
+        node: str,
+    ) -> T:
+        """Walk the model chain like _execute_with_fallback(), hedging a slow model with the next one.
+
+        Calls run on a worker pool so a slow call can be raced. A losing call
+        that already started cannot be interrupted; its answer is discarded and
+        its tokens are accounted once it arrives.
+
+        Args:
+            execute_fn: Function to execute on each provider (provider, model_name) -> result
+            model_chain: (provider, model_name) chain of the request
+            model_names: "provider/model" names of the chain
+            node: Agent node making the call
+
+        Returns:
+            Result of the first model that answered successfully
+
+        Raises:
+            AllProvidersFailedError: If all models in the chain fail
+        """
+        executor = self._get_hedge_executor()
+        call = _HedgedCall(self, model_chain, node)
+        running: dict[Future, tuple[str, float]] = {}
+
+        def start(model: tuple[BaseLLMProvider, str, str]) -> None:
+            provider, model_name, key = model
+            running[executor.submit(execute_fn, provider, model_name)] = (key, time.perf_counter())
+
+        try:
+            while True:
+                if not running:
+                    model = call.next_model()
+                    if model is None:
+                        break
+                    start(model)
+                done, _ = wait_futures(running, timeout=call.hedge_delay(running.values()), return_when=FIRST_COMPLETED)
+                if not done:
+                    model = call.hedge()
+                    if model is not None:
+                        start(model)
+                    continue
+                for future in done:
+                    key, started = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        call.succeeded(key, time.perf_counter() - started)
+                        self._discard_futures(running, node)
+                        return future.result()
+                    if not isinstance(error, Exception):
+                        raise error
+                    call.failed(key, error)
+        finally:
+            self._discard_futures(running, node)
+
+        raise self._all_failed(model_chain, model_names, call.last_error)
+
+    def _discard_futures(self, running: dict[Future, tuple[str, float]], node: str) -> None:
+        """Drop the calls that lost a hedged race, accounting the tokens of those already started."""
+        for future, (key, _) in list(running.items()):
+            self.health.release(key)
+            if not future.cancel():
+                future.add_done_callback(
+                    lambda f: self.hedger.record_outcome(
+                        node, hedge_won=False, extra_tokens=0 if f.exception() else response_tokens(f.result())
+                    )
+                )
+        running.clear()
+
+    async def _aexecute_hedged(
+        self,
+        execute_fn: Callable[[BaseLLMProvider, str], Awaitable[T]],
+        model_chain: list[tuple[BaseLLMProvider, str]],
+        model_names: list[str],
+        node: str,
+    ) -> T:
+        """Awaitable counterpart of _execute_hedged().
+
+        The losing call is cancelled. Providers usually bill the prompt of a
+        request cancelled mid-generation, so its prompt is accounted at the
+        winner's prompt token count.
+
+        Args:
+            execute_fn: Coroutine function to await on each provider (provider, model_name) -> result
+            model_chain: (provider, model_name) chain of the request
+            model_names: "provider/model" names of the chain
+            node: Agent node making the call
+
+        Returns:
+            Result of the first model that answered successfully
+
+        Raises:
+            AllProvidersFailedError: If all models in the chain fail
+        """
+        call = _HedgedCall(self, model_chain, node)
+        running: dict[asyncio.Task, tuple[str, float]] = {}
+
+        def start(model: tuple[BaseLLMProvider, str, str]) -> None:
+            provider, model_name, key = model
+            running[asyncio.ensure_future(execute_fn(provider, model_name))] = (key, time.perf_counter())
+
+        try:
+            while True:
+                if not running:
+                    model = call.next_model()
+                    if model is None:
+                        break
+                    start(model)
+                done, _ = await asyncio.wait(
+                    running, timeout=call.hedge_delay(running.values()), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    model = call.hedge()
+                    if model is not None:
+                        start(model)
+                    continue
+                winner = None
+                for task in done:
+                    key, started = running.pop(task)
+                    error = task.exception()
+                    if error is None and winner is None:
+                        call.succeeded(key, time.perf_counter() - started)
+                        winner = task
+                    elif error is None:
+                        # Both answered in the same instant, the second answer is discarded
+                        self.health.record_success(key, time.perf_counter() - started)
+                        self.hedger.record_outcome(node, hedge_won=False, extra_tokens=response_tokens(task.result()))
+                    elif not isinstance(error, Exception):
+                        raise error
+                    else:
+                        call.failed(key, error)
+                if winner is not None:
+                    prompt_tokens = getattr(winner.result(), "prompt_tokens", 0) or 0
+                    self.hedger.record_outcome(node, hedge_won=False, extra_tokens=prompt_tokens * len(running))
+                    return winner.result()
+        finally:
+            for task, (key, _) in running.items():
+                task.cancel()
+                self.health.release(key)
+
+        raise self._all_failed(model_chain, model_names, call.last_error)
+
+    def _order_by_health(self, model_chain: list[tuple[BaseLLMProvider, str]]) -> list[tuple[BaseLLMProvider, str]]:
+        """Reorder a model chain so models without recent failures are tried first."""
+        by_key = {f"{provider.name}/{model_name}": (provider, model_name) for provider, model_name in model_chain}
+        return [by_key[key] for key in self.health.order(list(by_key))]
+
+    def _all_failed(
+        self, model_chain: list[tuple[BaseLLMProvider, str]], model_names: list[str], last_error: Exception | None
+    ) -> AllProvidersFailedError:
+        """Build the error raised when no model in the chain answered."""
+        if last_error is None:
+            return AllProvidersFailedError(
+                f"All {len(model_chain)} model(s) are unavailable (circuit open).",
+                provider_chain=model_names,
+            )
+        return AllProvidersFailedError(
             f"All models failed after trying {len(model_chain)} model(s).",
             last_error=last_error,
             provider_chain=model_names,
         )
 
+    def _resolve_model_chain(self, **kwargs: Any) -> tuple[list[tuple[BaseLLMProvider, str]], list[str]]:
+        """Build the model chain for a request's "model" parameter.
+
+        Returns:
+            Tuple of ((provider, model_name) chain, "provider/model" names)
+
+        Raises:
+            AllProvidersFailedError: If no model in the chain has a provider
+        """
+        model = kwargs.get("model", self.config.data.models.default)
+        model_chain = self._build_model_chain(primary_model=model)
+        model_names = [f"{p.name}/{m}" for p, m in model_chain]
+
+        if not model_chain:
+            raise AllProvidersFailedError(
+                "No providers available in the chain",
+                provider_chain=model_names,
+            )
+        return model_chain, model_names
+
     def invoke(self, prompt: str | list[BaseMessage], **kwargs: Any) -> str:
         """Invoke LLM with primary-first fallback.
 
@@ -113,6 +385,7 @@ class LLMProviderRouter(BaseLLMProvider):
             prompt: Text or messages to send to the LLM
             **kwargs: Additional parameters including:
                 - model: Model identifier (provider/model or just model)
+                - node: Agent node making the call, for hedging
                 - Other provider-specific parameters
 
         Returns:
@@ -121,9 +394,11 @@ class LLMProviderRouter(BaseLLMProvider):
         Raises:
             AllProvidersFailedError: If all models in the chain fail
         """
+        node = kwargs.pop("node", None)
         return self._execute_with_fallback(
             lambda provider, model_name: provider.invoke(prompt, **{**kwargs, "model": model_name}),
             prompt,
+            node=node,
             **kwargs,
         )
 
@@ -138,6 +413,7 @@ class LLMProviderRouter(BaseLLMProvider):
             prompt: Text or messages to send to the LLM
             **kwargs: Additional parameters including:
                 - model: Model identifier (provider/model or just model)
+                - node: Agent node making the call, for hedging
 
         Returns:
             LLMResponse containing content and usage metadata
@@ -145,9 +421,11 @@ class LLMProviderRouter(BaseLLMProvider):
         Raises:
             AllProvidersFailedError: If all models in the chain fail
         """
+        node = kwargs.pop("node", None)
         return self._execute_with_fallback(
             lambda provider, model_name: provider.invoke_with_usage(prompt, **{**kwargs, "model": model_name}),
             prompt,
+            node=node,
             **kwargs,
         )
 
@@ -164,6 +442,7 @@ class LLMProviderRouter(BaseLLMProvider):
             schema: Pydantic model for structured output
             **kwargs: Additional parameters including:
                 - model: Model identifier (provider/model or just model)
+                - node: Agent node making the call, for hedging
 
         Returns:
             StructuredLLMResponse containing parsed model and usage metadata
@@ -171,9 +450,93 @@ class LLMProviderRouter(BaseLLMProvider):
         Raises:
             AllProvidersFailedError: If all models in the chain fail
         """
-        return self._execute_with_fallback(
-            lambda provider, model_name: provider.invoke_structured(prompt, schema, **{**kwargs, "model": model_name}),
+        node = kwargs.pop("node", None)
+        cancel = threading.Event()
+        try:
+            return self._execute_with_fallback(
+                lambda provider, model_name: provider.invoke_structured(
+                    prompt, schema, **{**kwargs, "model": model_name, "cancel": cancel}
+                ),
+                prompt,
+                node=node,
+                **kwargs,
+            )
+        finally:
+            # Hedged calls that lost the race stop retrying instead of sleeping out their backoff
+            cancel.set()
+
+    async def ainvoke(self, prompt: str | list[BaseMessage], **kwargs: Any) -> str:
+        """Awaitable counterpart of invoke(), with the same fallback.
+
+        Args:
+            prompt: Text or messages to send to the LLM
+            **kwargs: Additional parameters including:
+                - model: Model identifier (provider/model or just model)
+                - node: Agent node making the call, for hedging
+
+        Returns:
+            LLM response string
+
+        Raises:
+            AllProvidersFailedError: If all models in the chain fail
+        """
+        node = kwargs.pop("node", None)
+        return await self._aexecute_with_fallback(
+            lambda provider, model_name: provider.ainvoke(prompt, **{**kwargs, "model": model_name}),
+            prompt,
+            node=node,
+            **kwargs,
+        )
+
+    async def ainvoke_with_usage(self, prompt: str | list[BaseMessage], **kwargs: Any) -> LLMResponse:
+        """Awaitable counterpart of invoke_with_usage(), with the same fallback.
+
+        Args:
+            prompt: Text or messages to send to the LLM
+            **kwargs: Additional parameters including:
+                - model: Model identifier (provider/model or just model)
+                - node: Agent node making the call, for hedging
+
+        Returns:
+            LLMResponse containing content and usage metadata
+
+        Raises:
+            AllProvidersFailedError: If all models in the chain fail
+        """
+        node = kwargs.pop("node", None)
+        return await self._aexecute_with_fallback(
+            lambda provider, model_name: provider.ainvoke_with_usage(prompt, **{**kwargs, "model": model_name}),
             prompt,
+            node=node,
+            **kwargs,
+        )
+
+    async def ainvoke_structured(
+        self,
+        prompt: str | list[BaseMessage],
+        schema: type,
+        **kwargs: Any,
+    ) -> StructuredLLMResponse:
+        """Awaitable counterpart of invoke_structured(), with the same fallback.
+
+        Args:
+            prompt: Text or messages to send to the LLM
+            schema: Pydantic model for structured output
+            **kwargs: Additional parameters including:
+                - model: Model identifier (provider/model or just model)
+                - node: Agent node making the call, for hedging
+
+        Returns:
+            StructuredLLMResponse containing parsed model and usage metadata
+
+        Raises:
+            AllProvidersFailedError: If all models in the chain fail
+        """
+        node = kwargs.pop("node", None)
+        return await self._aexecute_with_fallback(
+            lambda provider, model_name: provider.ainvoke_structured(prompt, schema, **{**kwargs, "model": model_name}),
+            prompt,
+            node=node,
             **kwargs,
         )
 
@@ -260,36 +623,56 @@ class LLMProviderRouter(BaseLLMProvider):
         Raises:
             AllProvidersFailedError: If all models in the chain fail
         """
-        model = kwargs.get("model", self.config.data.models.default)
-        model_chain = self._build_model_chain(model)
-        model_names = [f"{p.name}/{m}" for p, m in model_chain]
-
-        if not model_chain:
-            raise AllProvidersFailedError(
-                "No providers available in the chain",
-                provider_chain=model_names,
-            )
+        model_chain, model_names = self._resolve_model_chain(**kwargs)
 
         last_error: Exception | None = None
 
-        for provider, model_name in model_chain:
+        for provider, model_name in self._order_by_health(model_chain):
+            key = f"{provider.name}/{model_name}"
+            if not self.health.allow(key):
+                logger.debug(f"Skipping model {key}: circuit open")
+                continue
+            start = time.perf_counter()
             try:
-                logger.debug(f"Streaming with model: {provider.name}/{model_name}")
+                logger.debug(f"Streaming with model: {key}")
                 async for token in provider.astream(prompt, **{**kwargs, "model": model_name}):
                     yield token
-                return  # Successfully streamed, exit
-
             except Exception as e:
+                self.health.record_failure(key, str(e))
                 last_error = e
-                logger.warning(f"Model {provider.name}/{model_name} failed during streaming: {e}")
+                logger.warning(f"Model {key} failed during streaming: {e}")
                 continue
-
+            except BaseException:
+                self.health.release(key)
+                raise
+            self.health.record_success(key, time.perf_counter() - start)
+            return  # Successfully streamed, exit
+
+        if last_error is None:
+            raise self._all_failed(model_chain, model_names, last_error)
         raise AllProvidersFailedError(
             f"All models failed during streaming after trying {len(model_chain)} model(s).",
             last_error=last_error,
             provider_chain=model_names,
         )
 
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool of hedged sync calls, created on first use."""
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(thread_name_prefix="llm-hedge")
+            return self._hedge_executor
+
+    def close(self) -> None:
+        """Shut down the worker pool of hedged sync calls.
+
+        Losing calls still running are not interrupted; shutdown does not wait for them.
+        """
+        with self._hedge_executor_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def set_model(self, model: str) -> None:
         """Set the model is not applicable for router (model is per-request).
 
@@ -308,3 +691,80 @@ class LLMProviderRouter(BaseLLMProvider):
     def model(self) -> str:
         """Model name being used (returns default from config)."""
         return self.config.data.models.default
+
+
+class _HedgedCall:
+    """Walk of one hedged call along its model chain: the next model, when to hedge and the bookkeeping."""
+
+    def __init__(self, router: LLMProviderRouter, model_chain: list[tuple[BaseLLMProvider, str]], node: str):
+        self.router = router
+        self.node = node
+        self.candidates = deque(router._order_by_health(model_chain))
+        self.hedge_key: str | None = None
+        self.hedged = False
+        self.last_error: Exception | None = None
+        self.sample = router.hedger.start_call(node)
+
+    def next_model(self) -> tuple[BaseLLMProvider, str, str] | None:
+        """Take the next model in the chain whose circuit lets the call through.
+
+        Returns:
+            Tuple of (provider, model_name, "provider/model" key), or None when the chain is exhausted
+        """
+        while self.candidates:
+            provider, model_name = self.candidates.popleft()
+            key = f"{provider.name}/{model_name}"
+            if self.router.health.allow(key):
+                return provider, model_name, key
+            logger.debug(f"Skipping model {key}: circuit open")
+        return None
+
+    def hedge_delay(self, running: Iterable[tuple[str, float]]) -> float | None:
+        """Seconds to wait for the running model before hedging it.
+
+        Args:
+            running: ("provider/model" key, start time) of the calls in flight
+
+        Returns:
+            Time left until the model's latency percentile, or None to wait without
+            hedging: a call is hedged once, and only while a single model runs
+            that has enough latency samples.
+        """
+        running = list(running)
+        if self.hedged or len(running) != 1 or not self.candidates:
+            return None
+        key, started = running[0]
+        hedger = self.router.hedger
+        threshold = self.router.health.latency_percentile(key, hedger.percentile, hedger.min_samples)
+        if threshold is None:
+            return None
+        return max(0.0, threshold - (time.perf_counter() - started))
+
+    def hedge(self) -> tuple[BaseLLMProvider, str, str] | None:
+        """Take the model that hedges the slow one, if the node's hedge budget allows.
+
+        Returns:
+            Tuple of (provider, model_name, "provider/model" key), or None to keep waiting
+        """
+        self.hedged = True
+        if not self.router.hedger.try_hedge(self.node, self.sample):
+            logger.debug(f"Hedge budget of node {self.node} exhausted, waiting for the slow model")
+            return None
+        model = self.next_model()
+        if model is not None:
+            self.hedge_key = model[2]
+            logger.info(f"Hedging slow LLM call of node {self.node} with model {self.hedge_key}")
+        return model
+
+    def succeeded(self, key: str, latency: float) -> None:
+        """Record the model whose answer is used."""
+        self.router.health.record_success(key, latency)
+        logger.debug(f"Model succeeded: {key}")
+        if self.hedge_key is not None:
+            self.router.hedger.record_outcome(self.node, hedge_won=key == self.hedge_key, extra_tokens=0)
+
+    def failed(self, key: str, error: Exception) -> None:
+        """Record a model that failed, the call moves on to the next one."""
+        self.router.health.record_failure(key, str(error))
+        self.last_error = error
+        logger.warning(f"Model {key} failed: {error}")
@@ -1,5 +1,6 @@
 """Base LLM provider interface for the agent framework."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
@@ -27,6 +28,12 @@ class StructuredLLMResponse(LLMResponse):
     parsed: Any = None
     """The parsed Pydantic model instance."""
 
+    retries: int = 0
+    """LLM calls made after the first one, for API errors or output that could not be parsed."""
+
+    repaired: bool = False
+    """True if the output only parsed after local JSON repair, which saved a retry."""
+
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers.
@@ -126,6 +133,67 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def ainvoke(
+        self,
+        prompt: str | list[BaseMessage],
+        **kwargs,
+    ) -> str:
+        """
+        Awaitable counterpart of invoke().
+
+        This base implementation runs invoke() in a worker thread so the
+        caller's event loop is not blocked. Subclasses should override this
+        with a native async client call.
+
+        Args:
+            prompt: Either a text prompt (str) or a list of messages.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            The LLM's text response.
+        """
+        return await asyncio.to_thread(self.invoke, prompt, **kwargs)
+
+    async def ainvoke_with_usage(
+        self,
+        prompt: str | list[BaseMessage],
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Awaitable counterpart of invoke_with_usage().
+
+        Runs invoke_with_usage() in a worker thread unless overridden.
+
+        Args:
+            prompt: Either a text prompt (str) or a list of messages.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            LLMResponse containing content and usage metadata.
+        """
+        return await asyncio.to_thread(self.invoke_with_usage, prompt, **kwargs)
+
+    async def ainvoke_structured(
+        self,
+        prompt: str | list[BaseMessage],
+        schema: type,
+        **kwargs,
+    ) -> StructuredLLMResponse:
+        """
+        Awaitable counterpart of invoke_structured().
+
+        Runs invoke_structured() in a worker thread unless overridden.
+
+        Args:
+            prompt: Either a text prompt (str) or a list of messages.
+            schema: Pydantic model or type for structured output.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            StructuredLLMResponse containing parsed model and usage metadata.
+        """
+        return await asyncio.to_thread(self.invoke_structured, prompt, schema, **kwargs)
+
     async def astream(
         self,
         prompt: str | list[BaseMessage],
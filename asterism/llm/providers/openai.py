@@ -1,18 +1,26 @@
 """OpenAI LLM provider implementation."""
 
+import asyncio
+import json
+import logging
 import os
-import re
-import time
+import threading
 from collections.abc import AsyncGenerator
 from typing import Any
 
-from langchain_core.messages import BaseMessage
-from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
+from pydantic import TypeAdapter
 
 from asterism.core.prompt_loader import SystemPromptLoader
 
 from .base import BaseLLMProvider, LLMResponse, StructuredLLMResponse
+from .structured_output import StructuredOutputError, build_correction_prompt, parse_structured_output
+
+logger = logging.getLogger(__name__)
+
+# Structured output modes of OpenAI-compatible APIs, from no native support to schema-constrained replies
+STRUCTURED_OUTPUT_MODES = ("none", "json_object", "json_schema")
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -30,6 +38,7 @@ class OpenAIProvider(BaseLLMProvider):
         base_url: str | None = None,
         api_key: str | None = None,
         prompt_loader: SystemPromptLoader | None = None,
+        structured_output: str = "none",
         **kwargs,
     ):
         """
@@ -41,6 +50,8 @@ class OpenAIProvider(BaseLLMProvider):
             api_key: OpenAI API key (if None, uses OPENAI_API_KEY env var)
             prompt_loader: Optional SystemPromptLoader for loading SOUL.md and AGENT.md.
                           If provided, these files' content will be prepended to all LLM calls.
+            structured_output: Native structured output support of the API: "none",
+                          "json_object" (JSON mode) or "json_schema" (schema mode)
             **kwargs: Additional LangChain ChatOpenAI parameters
         """
         super().__init__(prompt_loader=prompt_loader)
@@ -51,6 +62,9 @@ class OpenAIProvider(BaseLLMProvider):
 
         if not self._api_key:
             raise ValueError("OpenAI API key must be provided or set in OPENAI_API_KEY environment variable")
+        if structured_output not in STRUCTURED_OUTPUT_MODES:
+            raise ValueError(f"Unknown structured output mode: {structured_output}")
+        self.structured_output = structured_output
 
         # Initialize LangChain OpenAI client
         self.client = ChatOpenAI(model=model, base_url=self._base_url, api_key=self._api_key, **kwargs)
@@ -83,6 +97,29 @@ class OpenAIProvider(BaseLLMProvider):
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}")
 
+    async def ainvoke(
+        self,
+        prompt: str | list[BaseMessage],
+        **kwargs,
+    ) -> str:
+        """
+        Awaitable counterpart of invoke(), using LangChain's native async client.
+
+        Args:
+            prompt: Either a text prompt (str) or a list of messages.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            The LLM's text response.
+        """
+        messages = self._build_messages(prompt, **kwargs)
+
+        try:
+            response = await self.client.ainvoke(messages, **kwargs)
+            return response.content
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+
     def invoke_with_usage(
         self,
         prompt: str | list[BaseMessage],
@@ -103,60 +140,103 @@ class OpenAIProvider(BaseLLMProvider):
 
         try:
             response = self.client.invoke(messages, **kwargs)
-
-            # Extract usage information if available
-            usage = getattr(response, "usage_metadata", None)
-            if usage:
-                prompt_tokens = usage.get("input_tokens", 0)
-                completion_tokens = usage.get("output_tokens", 0)
-                total_tokens = usage.get("total_tokens", prompt_tokens + completion_tokens)
-            else:
-                # Fallback: estimate tokens (rough approximation)
-                prompt_tokens = 0
-                completion_tokens = 0
-                total_tokens = 0
-
-            return LLMResponse(
-                content=response.content,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens,
-            )
+            return self._to_llm_response(response)
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}")
 
-    def _extract_json_from_text(self, text: str) -> str | None:
+    async def ainvoke_with_usage(
+        self,
+        prompt: str | list[BaseMessage],
+        **kwargs,
+    ) -> LLMResponse:
         """
-        Extract JSON from text that may contain markdown code blocks or other content.
+        Awaitable counterpart of invoke_with_usage(), using LangChain's native async client.
 
         Args:
-            text: Raw text that may contain JSON.
+            prompt: Either a text prompt (str) or a list of messages.
+            **kwargs: Additional provider-specific parameters.
 
         Returns:
-            Extracted JSON string or None if extraction fails.
+            LLMResponse containing content and usage metadata.
         """
-        # Try to find JSON in markdown code blocks
-        json_pattern = r"```(?:json)?\s*([\s\S]*?)\s*```"
-        matches = re.findall(json_pattern, text)
-        if matches:
-            return matches[0].strip()
+        messages = self._build_messages(prompt, **kwargs)
 
-        # Try to find JSON between curly braces
         try:
-            start = text.find("{")
-            end = text.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                return text[start : end + 1]
-        except Exception:
-            pass
+            response = await self.client.ainvoke(messages, **kwargs)
+            return self._to_llm_response(response)
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+
+    def _usage_tokens(self, response: Any) -> tuple[int, int, int]:
+        """
+        Extract token usage from a LangChain response.
+
+        Args:
+            response: The AIMessage returned by the client.
+
+        Returns:
+            Tuple of (prompt_tokens, completion_tokens, total_tokens); zeros if the
+            response carries no usage metadata.
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return 0, 0, 0
+        prompt_tokens = usage.get("input_tokens", 0)
+        completion_tokens = usage.get("output_tokens", 0)
+        total_tokens = usage.get("total_tokens", prompt_tokens + completion_tokens)
+        return prompt_tokens, completion_tokens, total_tokens
+
+    def _to_llm_response(self, response: Any) -> LLMResponse:
+        """Build an LLMResponse from a LangChain response."""
+        prompt_tokens, completion_tokens, total_tokens = self._usage_tokens(response)
+        return LLMResponse(
+            content=response.content,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+        )
+
+    def _structured_request(
+        self, messages: list[BaseMessage], schema: type, kwargs: dict[str, Any]
+    ) -> tuple[list[BaseMessage], dict[str, Any]]:
+        """
+        Prepare a structured output request for the provider's structured output mode.
+
+        In json_schema mode the schema is sent as the response format, so the API
+        constrains the reply to it. In json_object mode the API only guarantees
+        valid JSON, and the schema is added to the messages.
+
+        Args:
+            messages: Messages built by _build_messages().
+            schema: Pydantic model or type for structured output.
+            kwargs: Request parameters passed by the caller.
 
-        return None
+        Returns:
+            Tuple of (messages, request parameters) to send.
+        """
+        if self.structured_output == "none" or "response_format" in kwargs:
+            return messages, kwargs
+
+        json_schema = TypeAdapter(schema).json_schema()
+        if self.structured_output == "json_schema":
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {"name": getattr(schema, "__name__", "response"), "schema": json_schema},
+            }
+            return messages, {**kwargs, "response_format": response_format}
+
+        # JSON mode requires the word JSON in the prompt, and the schema tells the model what to fill in
+        instruction = SystemMessage(
+            content=f"Respond with a JSON object that matches this JSON schema:\n{json.dumps(json_schema)}"
+        )
+        return messages + [instruction], {**kwargs, "response_format": {"type": "json_object"}}
 
     def invoke_structured(
         self,
         prompt: str | list[BaseMessage],
         schema: type,
         max_retries: int = 3,
+        cancel: threading.Event | None = None,
         **kwargs,
     ) -> StructuredLLMResponse:
         """
@@ -166,85 +246,77 @@ class OpenAIProvider(BaseLLMProvider):
         If a prompt_loader is configured, SOUL.md and AGENT.md content
         will be prepended as a SystemMessage.
 
+        Output that does not parse is first repaired locally. Only if that fails
+        is the model asked to correct its reply; API errors are retried after an
+        exponential backoff, which setting cancel cuts short.
+
         Args:
             prompt: Either a text prompt (str) or a list of messages.
             schema: Pydantic model or type for structured output.
-            max_retries: Maximum number of retry attempts for parsing failures.
+            max_retries: Maximum number of LLM calls, including the first one.
+            cancel: Event set by a caller that no longer needs the result, e.g. a
+                router whose hedge answered first; no retry is made once it is set.
             **kwargs: Additional provider-specific parameters.
 
         Returns:
-            StructuredLLMResponse containing parsed model and usage metadata.
+            StructuredLLMResponse containing parsed model, usage metadata summed over
+            all calls, and retry and repair counts.
+
+        Raises:
+            RuntimeError: If no attempts are left, or cancel was set during a backoff
         """
         # Build full message list with system prompts (SOUL + AGENT)
         messages = self._build_messages(prompt, **kwargs)
+        messages, kwargs = self._structured_request(messages, schema, kwargs)
+        attempts = _StructuredAttempts(self, schema, max_retries)
+        cancel = cancel or threading.Event()
 
-        # Create output parser for the schema
-        parser = PydanticOutputParser(pydantic_object=schema)
-
-        last_error = None
-        for attempt in range(max_retries):
+        while True:
             try:
-                # Use JSON mode for structured output (OpenAI-specific)
-                response_format = {"type": "json_object"}
-
-                # Invoke with JSON mode
-                raw_response = self.client.invoke(
-                    messages,
-                    # response_format=response_format,
-                    **kwargs,
-                )
-
-                # Extract usage information from raw response
-                usage = getattr(raw_response, "usage_metadata", None)
-                if usage:
-                    prompt_tokens = usage.get("input_tokens", 0)
-                    completion_tokens = usage.get("output_tokens", 0)
-                    total_tokens = usage.get("total_tokens", prompt_tokens + completion_tokens)
-                else:
-                    prompt_tokens = 0
-                    completion_tokens = 0
-                    total_tokens = 0
-
-                # Parse the content using the parser
-                content = raw_response.content
-
-                try:
-                    parsed_result = parser.parse(content)
-                except Exception as parse_error:
-                    # Try to extract JSON from markdown or other formatting
-                    extracted_json = self._extract_json_from_text(content)
-                    if extracted_json:
-                        try:
-                            # Parse the extracted JSON
-                            parsed_result = parser.parse(extracted_json)
-                            content = extracted_json  # Use the cleaned content
-                        except Exception:
-                            # If extraction still fails, raise original error
-                            raise parse_error
-                    else:
-                        raise parse_error
-
-                return StructuredLLMResponse(
-                    content=content,
-                    parsed=parsed_result,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    total_tokens=total_tokens,
-                )
+                raw_response = self.client.invoke(messages, **kwargs)
+            except Exception as e:
+                if cancel.wait(attempts.api_error(e)):
+                    raise RuntimeError("OpenAI structured output call cancelled during retry backoff") from e
+                continue
+            result = attempts.reply(raw_response, messages)
+            if result is not None:
+                return result
+
+    async def ainvoke_structured(
+        self,
+        prompt: str | list[BaseMessage],
+        schema: type,
+        max_retries: int = 3,
+        **kwargs,
+    ) -> StructuredLLMResponse:
+        """
+        Awaitable counterpart of invoke_structured(), using LangChain's native async client.
+
+        Backoff between attempts is awaited, so retries do not block the event loop.
+
+        Args:
+            prompt: Either a text prompt (str) or a list of messages.
+            schema: Pydantic model or type for structured output.
+            max_retries: Maximum number of LLM calls, including the first one.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            StructuredLLMResponse containing parsed model, usage metadata summed over
+            all calls, and retry and repair counts.
+        """
+        messages = self._build_messages(prompt, **kwargs)
+        messages, kwargs = self._structured_request(messages, schema, kwargs)
+        attempts = _StructuredAttempts(self, schema, max_retries)
 
+        while True:
+            try:
+                raw_response = await self.client.ainvoke(messages, **kwargs)
             except Exception as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
-                    wait_time = 2**attempt
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    # Final attempt failed, include raw content in error if available
-                    error_msg = f"OpenAI structured output error after {max_retries} attempts: {str(e)}"
-                    if "content" in locals():
-                        error_msg += f"\n\nRaw LLM output:\n{content[:2000]}"
-                    raise RuntimeError(error_msg)
+                await asyncio.sleep(attempts.api_error(e))
+                continue
+            result = attempts.reply(raw_response, messages)
+            if result is not None:
+                return result
 
     async def astream(
         self,
@@ -331,3 +403,83 @@ class OpenAIProvider(BaseLLMProvider):
     def model(self) -> str:
         """Model name/version being used."""
         return self._model
+
+
+class _StructuredAttempts:
+    """Attempt bookkeeping of one structured output call, shared by the sync and async paths."""
+
+    def __init__(self, provider: OpenAIProvider, schema: type, max_retries: int):
+        self.provider = provider
+        self.schema = schema
+        self.max_retries = max(1, max_retries)
+        self.calls = 0
+        self.api_errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+        self.content: str | None = None
+
+    def api_error(self, error: Exception) -> float:
+        """Record a failed LLM call.
+
+        Returns:
+            Seconds to wait before the next call: 1s, 2s, 4s, ...
+
+        Raises:
+            RuntimeError: If no attempts are left
+        """
+        self.calls += 1
+        self.api_errors += 1
+        self._check_attempts_left(error)
+        logger.warning(f"Structured output call failed, retrying: {error}")
+        return float(2 ** (self.api_errors - 1))
+
+    def reply(self, response: Any, messages: list[BaseMessage]) -> StructuredLLMResponse | None:
+        """Parse a reply, asking for a correction if it does not fit the schema.
+
+        Args:
+            response: The AIMessage returned by the client.
+            messages: The conversation sent; the reply and a correction request are appended to it.
+
+        Returns:
+            The structured response, or None if the model was asked to correct its reply.
+
+        Raises:
+            RuntimeError: If the reply does not parse and no attempts are left
+        """
+        self.calls += 1
+        prompt_tokens, completion_tokens, total_tokens = self.provider._usage_tokens(response)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.total_tokens += total_tokens
+        self.content = response.content
+
+        try:
+            parsed, content, repaired = parse_structured_output(self.content, self.schema)
+        except StructuredOutputError as e:
+            self._check_attempts_left(e)
+            logger.warning(f"Structured output did not parse, asking for a correction: {e}")
+            messages.append(AIMessage(content=self.content))
+            messages.append(HumanMessage(content=build_correction_prompt(e)))
+            return None
+
+        if repaired:
+            logger.debug("Structured output parsed after local repair")
+        return StructuredLLMResponse(
+            content=content,
+            parsed=parsed,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            total_tokens=self.total_tokens,
+            retries=self.calls - 1,
+            repaired=repaired,
+        )
+
+    def _check_attempts_left(self, error: Exception) -> None:
+        """Raise the final error, with the raw output of the last reply, once every attempt is used."""
+        if self.calls < self.max_retries:
+            return
+        error_msg = f"OpenAI structured output error after {self.max_retries} attempts: {str(error)}"
+        if self.content is not None:
+            error_msg += f"\n\nRaw LLM output:\n{self.content[:2000]}"
+        raise RuntimeError(error_msg) from error
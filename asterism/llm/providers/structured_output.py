@@ -0,0 +1,202 @@
+"""Parsing and local repair of structured LLM output.
+
+Models asked for JSON often wrap it in a markdown fence, leave a trailing
+comma, use Python literals or single quotes, or stop before the last closing
+bracket. Those defects are repaired locally, so only output that is wrong
+in substance costs another LLM call.
+"""
+
+import re
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+STRUCTURED_CORRECTION_PROMPT = """Your previous reply could not be used:
+{errors}
+
+Reply with the corrected JSON only. Keep every valid part of your previous reply unchanged and fix only what the \
+errors above point to."""
+
+_FENCE_PATTERN = re.compile(r"```(?:json|JSON)?\s*([\s\S]*?)\s*```")
+
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class StructuredOutputError(ValueError):
+    """Raised when LLM output cannot be parsed into the requested schema, even after repair.
+
+    Attributes:
+        errors: One line per problem, with the location it was found at
+    """
+
+    def __init__(self, errors: list[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def extract_json_candidates(text: str) -> list[str]:
+    """Find the pieces of a reply that may hold the JSON document, most likely first.
+
+    Args:
+        text: Raw LLM output.
+
+    Returns:
+        The stripped text itself, the contents of markdown code fences, then
+        the span from the first opening to the last closing brace or bracket.
+    """
+    candidates = [text.strip()]
+    candidates.extend(match.strip() for match in _FENCE_PATTERN.findall(text))
+
+    for opener, closer in _CLOSERS.items():
+        start = text.find(opener)
+        if start == -1:
+            continue
+        end = text.rfind(closer)
+        # A reply cut off before its closing bracket is kept to the end, for repair to close it
+        candidates.append(text[start : end + 1] if end > start else text[start:].rstrip())
+
+    unique = []
+    for candidate in candidates:
+        if candidate and candidate not in unique:
+            unique.append(candidate)
+    return unique
+
+
+def repair_json(text: str) -> str:
+    """Repair common syntax defects of LLM-written JSON.
+
+    Outside of strings, trailing commas are dropped and the Python literals
+    True, False and None are replaced by their JSON spelling. Single-quoted
+    strings and typographic quotes become double-quoted strings. A document
+    that ends early gets its open string and brackets closed.
+
+    Args:
+        text: JSON text, possibly malformed.
+
+    Returns:
+        The repaired text; valid JSON passes through unchanged.
+    """
+    text = text.strip().translate(_SMART_QUOTES)
+    out: list[str] = []
+    stack: list[str] = []
+    quote: str | None = None
+    i = 0
+    length = len(text)
+
+    while i < length:
+        char = text[i]
+
+        if quote is not None:
+            if char == "\\" and i + 1 < length:
+                escaped = text[i + 1]
+                # \' is not a JSON escape; inside a double-quoted string it is just a quote
+                out.append("'" if escaped == "'" else char + escaped)
+                i += 2
+                continue
+            if char == quote:
+                out.append('"')
+                quote = None
+            elif char == '"':
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            else:
+                out.append(char)
+            i += 1
+            continue
+
+        if char in ('"', "'"):
+            out.append('"')
+            quote = char
+        elif char in _CLOSERS:
+            stack.append(_CLOSERS[char])
+            out.append(char)
+        elif char in ("}", "]"):
+            _drop_trailing_comma(out)
+            if stack and stack[-1] == char:
+                stack.pop()
+            out.append(char)
+        elif char.isalpha():
+            end = i
+            while end < length and (text[end].isalnum() or text[end] == "_"):
+                end += 1
+            word = text[i:end]
+            out.append(_PYTHON_LITERALS.get(word, word))
+            i = end
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    if quote is not None:
+        out.append('"')
+    _drop_trailing_comma(out)
+    out.extend(reversed(stack))
+    return "".join(out)
+
+
+def _drop_trailing_comma(out: list[str]) -> None:
+    """Remove a comma, and the whitespace after it, from the end of the output."""
+    end = len(out)
+    while end and out[end - 1].isspace():
+        end -= 1
+    if end and out[end - 1] == ",":
+        del out[end - 1 :]
+
+
+def parse_structured_output(text: str, schema: type) -> tuple[Any, str, bool]:
+    """Parse LLM output into a schema, repairing it locally when needed.
+
+    Each candidate from extract_json_candidates() is validated directly, then
+    again after repair_json(); the first that validates wins.
+
+    Args:
+        text: Raw LLM output.
+        schema: Pydantic model or type to validate against.
+
+    Returns:
+        Tuple of (parsed value, JSON text it was parsed from, whether it needed repair).
+
+    Raises:
+        StructuredOutputError: If no candidate validates, with the schema errors of the first
+            candidate that is valid JSON, or else the syntax error of the first candidate.
+    """
+    adapter = TypeAdapter(schema)
+    syntax_errors: list[str] | None = None
+    schema_errors: list[str] | None = None
+
+    for repaired in (False, True):
+        for candidate in extract_json_candidates(text):
+            if repaired:
+                candidate = repair_json(candidate)
+            try:
+                return adapter.validate_json(candidate), candidate, repaired
+            except ValidationError as e:
+                # Errors of a candidate that is valid JSON say what to fix; syntax errors only matter if none is
+                if any(detail["type"] == "json_invalid" for detail in e.errors()):
+                    syntax_errors = syntax_errors or _describe_errors(e)
+                else:
+                    schema_errors = schema_errors or _describe_errors(e)
+
+    raise StructuredOutputError(schema_errors or syntax_errors or ["The reply is empty"])
+
+
+def _describe_errors(error: ValidationError) -> list[str]:
+    """Describe validation errors with their location, for logs and correction prompts."""
+    lines = []
+    for detail in error.errors():
+        if detail["type"] == "json_invalid":
+            lines.append(f"Invalid JSON: {detail['msg']}")
+            continue
+        location = ".".join(str(part) for part in detail["loc"]) or "(root)"
+        lines.append(f"{location}: {detail['msg']}")
+    return lines
+
+
+def build_correction_prompt(error: StructuredOutputError) -> str:
+    """Build the message asking the model to fix only the invalid part of its reply."""
+    return STRUCTURED_CORRECTION_PROMPT.format(errors="\n".join(f"- {line}" for line in error.errors))
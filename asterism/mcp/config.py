@@ -5,11 +5,38 @@ from a JSON file, enabling flexible and dynamic MCP server management.
 """
 
 import json
+import logging
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 MCP_SERVERS_KEY = "mcpServers"
 
+# Runtime settings a server entry may override, with their defaults
+SERVER_SETTING_DEFAULTS: dict[str, Any] = {
+    "replicas": 1,
+    "max_concurrency": 1,
+    "transport_options": {},
+    "prefetch": True,
+    "timeout": None,
+    "restart_on_timeout": False,
+    "idle_timeout": None,
+    "concurrency_limit": None,
+    "queue_size": None,
+    "queue_timeout": None,
+}
+
+# Per-tool settings from a server's "tool_settings" section, with their defaults
+TOOL_SETTING_DEFAULTS: dict[str, Any] = {
+    "cacheable": False,
+    "ttl_seconds": 60,
+    "max_entries": 128,
+    "max_result_bytes": 65536,
+    "timeout": None,
+    "concurrency_limit": None,
+}
+
 
 class MCPConfig:
     """MCP server configuration manager."""
@@ -163,6 +190,67 @@ class MCPConfig:
             "cwd": server_config.get("cwd", "."),
         }
 
+    def get_server_settings(self, server_name: str) -> dict[str, Any]:
+        """
+        Get runtime settings for a server, filled with defaults.
+
+        Args:
+            server_name: Name of the MCP server.
+
+        Returns:
+            Dictionary containing every key of SERVER_SETTING_DEFAULTS.
+        """
+        server_config = self.get_server_config(server_name) or {}
+        return {key: server_config.get(key, default) for key, default in SERVER_SETTING_DEFAULTS.items()}
+
+    def get_tool_settings(self, server_name: str, tool_name: str) -> dict[str, Any]:
+        """
+        Get settings for a single tool, filled with defaults.
+
+        Args:
+            server_name: Name of the MCP server.
+            tool_name: Name of the tool.
+
+        Returns:
+            Dictionary containing every key of TOOL_SETTING_DEFAULTS.
+        """
+        server_config = self.get_server_config(server_name) or {}
+        tool_config = server_config.get("tool_settings", {}).get(tool_name, {})
+        return {key: tool_config.get(key, default) for key, default in TOOL_SETTING_DEFAULTS.items()}
+
+    def get_tool_manifest(self, server_name: str) -> list[dict[str, Any]] | None:
+        """
+        Get the tool schemas declared for a server in its ``tools`` field.
+
+        A manifest lets tools be discovered without starting the server. Every
+        entry must be a full tool schema with a name and an ``inputSchema``: the
+        planner describes tools from it and calls are validated against it. A
+        manifest with other entries, such as plain tool names, is ignored with a
+        warning, so the schemas are discovered from the cache or the server.
+
+        Args:
+            server_name: Name of the MCP server.
+
+        Returns:
+            List of tool schema dictionaries, or None if no usable manifest is declared.
+        """
+        server_config = self.get_server_config(server_name) or {}
+        tools = server_config.get("tools") or []
+        if not tools:
+            return None
+        incomplete = [
+            tool.get("name", "?") if isinstance(tool, dict) else str(tool)
+            for tool in tools
+            if not isinstance(tool, dict) or "name" not in tool or "inputSchema" not in tool
+        ]
+        if incomplete:
+            logger.warning(
+                f"Ignoring tool manifest of MCP server '{server_name}': entries without a name and inputSchema: "
+                f"{', '.join(incomplete)}"
+            )
+            return None
+        return tools
+
 
 # Global MCP configuration instance
 _mcp_config: MCPConfig | None = None
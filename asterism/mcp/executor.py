@@ -4,26 +4,54 @@ This module provides a dynamic interface for executing MCP tools based on
 configuration, replacing the hardcoded implementations in the executor node.
 """
 
+import asyncio
 import logging
-from collections.abc import Generator
-from contextlib import contextmanager
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
+from asterism.mcp.transport_executor.async_base import AsyncTransport
 from asterism.mcp.transport_executor.base import BaseTransport
 
 from .config import MCPConfig, get_mcp_config
+from .limiter import ConcurrencyLimiter, ConcurrencyLimitError
+from .pool import TransportPool
+from .result_cache import ToolResultCache
+from .routing import ToolRoute, ToolRouteIndex
+from .schema_cache import ToolSchemaCache
+from .supervisor import ServerSupervisor
 from .transport_executor import create_transport
+from .validation import ToolValidatorCache, format_validation_errors
+
+# Lines of server stderr attached to the error of a failed tool call
+STDERR_ERROR_LINES = 20
+
+# Seconds between checks for servers idle longer than their idle_timeout
+IDLE_CHECK_INTERVAL = 10.0
 
 
 class MCPExecutor:
     """Dynamic MCP tool executor that uses configuration-based tool routing."""
 
-    def __init__(self, config_path: str | MCPConfig | None = None):
+    def __init__(
+        self,
+        config_path: str | MCPConfig | None = None,
+        schema_cache: ToolSchemaCache | None = None,
+        default_timeout: float | None = None,
+        supervisor: ServerSupervisor | None = None,
+    ):
         """
         Initialize the MCP executor.
 
         Args:
             config_path: Path to the MCP configuration file. If None, uses default location.
+            schema_cache: Optional persistent tool schema cache, so tool discovery does not start servers.
+            default_timeout: Seconds a tool call may take when neither the tool nor its server sets a timeout.
+                None leaves the deadline to the transport.
+            supervisor: Health supervisor of the started servers; a default one (not started) is created if None.
         """
         if isinstance(config_path, str):
             self.config = MCPConfig(config_path)
@@ -33,30 +61,419 @@ class MCPExecutor:
         else:
             self.config = get_mcp_config()
 
-        self.transports: dict[str, BaseTransport | None] = {}
+        self.pools: dict[str, TransportPool] = {}
         self.tool_cache: dict[str, list] = {}
         self.tool_schema_cache: dict[str, list[dict[str, Any]]] = {}
+        self.schema_cache = schema_cache
+        self.result_cache = ToolResultCache()
+        self.validators = ToolValidatorCache()
+        self.default_timeout = default_timeout
+        self.supervisor = supervisor or ServerSupervisor()
+        self.supervisor.bind(lambda: self.pools)
+
+        # Guards lazy pool creation so concurrent tasks never spawn a server twice
+        self._lock = threading.Lock()
+        self._server_locks: dict[str, threading.Lock] = {}
+        self._background_jobs: set[tuple[str, str]] = set()
+        self._start_errors: dict[str, str] = {}
+        # Concurrency limiters keyed by (server, None) and, for tools with their own limit, (server, tool)
+        self._limiters: dict[tuple[str, str | None], ConcurrencyLimiter] = {}
+        # Routes of the tools of started servers, so calls do not re-read the configuration
+        self.routes = ToolRouteIndex()
+        # What each started pool was built from, so reload_config() knows which servers to restart
+        self._pool_specs: dict[str, dict[str, Any]] = {}
+
+        # Stops servers idle longer than their idle_timeout; started with the first such server
+        self.idle_check_interval = IDLE_CHECK_INTERVAL
+        self._reaper: threading.Thread | None = None
+        self._reaper_stop = threading.Event()
 
         self._log = logging.getLogger(self.__class__.__name__)
 
-    def _get_transport(self, server_name: str) -> BaseTransport:
-        """Get or create transport for a server."""
-        if server_name not in self.transports:
+    def _get_server_lock(self, server_name: str) -> threading.Lock:
+        """Get the lock serializing transport creation for a server."""
+        with self._lock:
+            return self._server_locks.setdefault(server_name, threading.Lock())
+
+    @property
+    def transports(self) -> dict[str, BaseTransport]:
+        """Primary transport of every started server."""
+        return {name: pool.primary for name, pool in self.pools.items()}
+
+    def _start_transport(self, metadata: dict[str, Any], options: dict[str, Any]) -> BaseTransport:
+        """Create and start a transport from server metadata and transport options."""
+        transport = create_transport(metadata["transport"], **options)
+        cwd = metadata.get("cwd")
+        if cwd:
+            transport.start(metadata["command"], metadata["args"], cwd)
+        else:
+            transport.start(metadata["command"], metadata["args"])
+        return transport
+
+    def _get_pool(self, server_name: str) -> TransportPool:
+        """Get or create the replica pool for a server, restarting it if it was stopped as idle."""
+        pool = self.pools.get(server_name)
+        if pool is not None and not pool.closed:
+            return pool
+
+        with self._get_server_lock(server_name):
+            pool = self.pools.get(server_name)
+            if pool is not None and not pool.closed:
+                return pool
+
             metadata = self.config.get_server_metadata(server_name)
             if not metadata:
                 raise ValueError(f"No metadata found for server: {server_name}")
 
-            transport = create_transport(metadata["transport"])
-            cwd = metadata.get("cwd")
-            if cwd:
-                transport.start(metadata["command"], metadata["args"], cwd)
+            settings = self.config.get_server_settings(server_name)
+            try:
+                pool = TransportPool(
+                    lambda: self._start_transport(metadata, settings["transport_options"]),
+                    max_replicas=settings["replicas"],
+                    max_concurrency=settings["max_concurrency"],
+                    name=server_name,
+                )
+                # Cache tools for this server before publishing the pool
+                try:
+                    self._store_schemas(server_name, metadata, pool.primary.get_tool_schemas())
+                except Exception:
+                    pool.stop()
+                    raise
+            except Exception as e:
+                self._start_errors[server_name] = str(e)
+                raise
+
+            self.pools[server_name] = pool
+            self._pool_specs[server_name] = self._pool_spec(server_name)
+            self._start_errors.pop(server_name, None)
+            self._index_server(server_name, pool)
+
+        if settings["idle_timeout"] or settings["replicas"] > 1:
+            self._start_reaper()
+        return pool
+
+    def _pool_spec(self, server_name: str) -> dict[str, Any]:
+        """Get the configuration a server's pool is built from; pools are restarted when it changes."""
+        settings = self.config.get_server_settings(server_name)
+        return {
+            "metadata": self.config.get_server_metadata(server_name),
+            "transport_options": settings["transport_options"],
+            "replicas": settings["replicas"],
+            "max_concurrency": settings["max_concurrency"],
+        }
+
+    def _build_routes(self, server_name: str, pool: TransportPool) -> list[ToolRoute]:
+        """Build the routes of every tool of a started server from the current configuration."""
+        server_settings = self.config.get_server_settings(server_name)
+        routes = []
+        for schema in self.tool_schema_cache.get(server_name, []):
+            tool_name = schema["name"]
+            routes.append(
+                ToolRoute(
+                    server_name=server_name,
+                    tool_name=tool_name,
+                    pool=pool,
+                    schema=schema,
+                    server_settings=server_settings,
+                    tool_settings=self.config.get_tool_settings(server_name, tool_name),
+                    validator=self.validators.get(server_name, tool_name),
+                    timeout=self._resolve_timeout(server_name, tool_name),
+                    limiters=tuple(self._get_limiters(server_name, tool_name)),
+                )
+            )
+        return routes
+
+    def _index_server(self, server_name: str, pool: TransportPool) -> None:
+        """Publish the routes of a started server."""
+        self.routes.set_server(server_name, self._build_routes(server_name, pool))
+
+    def reload_config(self) -> list[str]:
+        """
+        Reload the MCP configuration file and rebuild the routing index.
+
+        Started servers that were disabled or removed, or whose command, transport,
+        replicas or transport options changed, are stopped; changed servers start
+        again on their next call. Routes of the other servers pick up the new
+        timeouts, cache and concurrency settings. The new index replaces the old
+        one in a single swap, so calls in flight finish on the route they started
+        with and no call sees a partly rebuilt index.
+
+        Returns:
+            Names of the servers that were stopped.
+        """
+        self.config.load_config()
+        with self._lock:
+            self._limiters = {}
+
+        enabled = set(self.config.get_enabled_servers())
+        routes: list[ToolRoute] = []
+        stopped: list[tuple[str, TransportPool]] = []
+        for server_name, pool in list(self.pools.items()):
+            with self._get_server_lock(server_name):
+                if self.pools.get(server_name) is not pool:
+                    continue
+                if server_name in enabled and self._pool_spec(server_name) == self._pool_specs.get(server_name):
+                    routes.extend(self._build_routes(server_name, pool))
+                    continue
+                del self.pools[server_name]
+                self._pool_specs.pop(server_name, None)
+            stopped.append((server_name, pool))
+
+        # Schemas of servers that are not running are rediscovered, as their manifest may have changed
+        for server_name in list(self.tool_schema_cache):
+            if server_name not in self.pools:
+                self.tool_schema_cache.pop(server_name, None)
+                self.tool_cache.pop(server_name, None)
+
+        self.routes.replace(routes)
+        self.result_cache.clear()
+        for server_name, pool in stopped:
+            pool.stop()
+            self._log.info(f"Stopped MCP server '{server_name}' after its configuration changed")
+        return [server_name for server_name, _ in stopped]
+
+    def _start_reaper(self) -> None:
+        """Start the idle server reaper thread unless it is already running."""
+        with self._lock:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._reaper_stop.clear()
+            self._reaper = threading.Thread(target=self._reap_loop, name="mcp-idle-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        """Stop idle servers and idle extra replicas periodically until the executor shuts down."""
+        while not self._reaper_stop.wait(self.idle_check_interval):
+            try:
+                self.reap_idle_servers()
+            except Exception as e:
+                self._log.warning(f"Failed to stop idle MCP servers: {e}")
+
+    def reap_idle_servers(self) -> list[str]:
+        """
+        Stop servers that have not been called for longer than their ``idle_timeout``.
+
+        Stopped servers keep their cached tool schemas, so planning is unaffected,
+        and the next tool call starts them again. Servers that keep running stop
+        the extra replicas that have gone idle since the last call.
+
+        Returns:
+            Names of the servers that were stopped.
+        """
+        reaped = []
+        for server_name, pool in list(self.pools.items()):
+            pool.scale_down()
+            idle_timeout = self.config.get_server_settings(server_name)["idle_timeout"]
+            if not idle_timeout:
+                continue
+            with self._get_server_lock(server_name):
+                if self.pools.get(server_name) is not pool or not pool.close_if_idle(idle_timeout):
+                    continue
+                del self.pools[server_name]
+                self._pool_specs.pop(server_name, None)
+            self._log.info(f"Stopped MCP server '{server_name}' after {idle_timeout}s idle")
+            reaped.append(server_name)
+        return reaped
+
+    def _store_schemas(self, server_name: str, metadata: dict[str, Any], schemas: list[dict[str, Any]]) -> None:
+        """Cache freshly fetched tool schemas in memory and on disk."""
+        self.tool_schema_cache[server_name] = schemas
+        self.tool_cache[server_name] = [tool["name"] for tool in schemas]
+        self.validators.compile(server_name, schemas)
+        if self.schema_cache is not None:
+            self.schema_cache.put(server_name, ToolSchemaCache.fingerprint(metadata), schemas)
+
+    def _discover_schemas(self, server_name: str) -> list[dict[str, Any]]:
+        """Get tool schemas for a server without activating it.
+
+        Schemas come from the server's tool manifest, then the persistent cache;
+        only when neither has them is the server started to fetch them. It then
+        stays running for the tool calls that follow, so the first call does not
+        pay a second cold start.
+        """
+        manifest = self.config.get_tool_manifest(server_name)
+        if manifest is not None:
+            self.tool_schema_cache[server_name] = manifest
+            self.tool_cache.setdefault(server_name, [tool["name"] for tool in manifest])
+            self.validators.compile(server_name, manifest)
+            return manifest
+
+        schemas = self._load_cached_schemas(server_name)
+        if schemas is None:
+            schemas = self._fetch_schemas(server_name)
+        return schemas
+
+    def _load_cached_schemas(self, server_name: str) -> list[dict[str, Any]] | None:
+        """Serve schemas from the persistent cache without starting the server.
+
+        Stale entries are still returned and revalidated in the background.
+        """
+        if self.schema_cache is None:
+            return None
+
+        metadata = self.config.get_server_metadata(server_name)
+        if not metadata:
+            return None
+
+        cached = self.schema_cache.get(server_name, ToolSchemaCache.fingerprint(metadata))
+        if cached is None:
+            return None
+
+        self.tool_schema_cache[server_name] = cached.tools
+        self.tool_cache.setdefault(server_name, [tool["name"] for tool in cached.tools])
+        self.validators.compile(server_name, cached.tools)
+        if cached.stale:
+            self._run_in_background("revalidate", server_name, self._revalidate_schemas)
+        return cached.tools
+
+    def _fetch_schemas(self, server_name: str, activate: bool = True) -> list[dict[str, Any]]:
+        """Fetch and store current schemas from the running server.
+
+        Args:
+            server_name: Server to fetch schemas from.
+            activate: Start the server's replica pool when it is not running, which
+                caches its schemas; otherwise a temporary server is started and stopped.
+        """
+        metadata = self.config.get_server_metadata(server_name)
+        if not metadata:
+            raise ValueError(f"No metadata found for server: {server_name}")
+
+        pool = self.pools.get(server_name)
+        if pool is None and activate:
+            self._get_pool(server_name)
+            return self.tool_schema_cache[server_name]
+        if pool is not None:
+            schemas = pool.primary.get_tool_schemas()
+        else:
+            settings = self.config.get_server_settings(server_name)
+            transport = self._start_transport(metadata, settings["transport_options"])
+            try:
+                schemas = transport.get_tool_schemas()
+            finally:
+                transport.stop()
+
+        self._store_schemas(server_name, metadata, schemas)
+        if pool is not None:
+            self._index_server(server_name, pool)
+        return schemas
+
+    def _revalidate_schemas(self, server_name: str) -> None:
+        """Refresh a stale persistent cache entry."""
+        try:
+            self._fetch_schemas(server_name, activate=False)
+            self._log.info(f"Revalidated cached tool schemas for MCP server '{server_name}'")
+        except Exception as e:
+            self._log.warning(f"Failed to revalidate tool schemas for MCP server '{server_name}': {e}")
+
+    def _run_in_background(self, kind: str, server_name: str, target: Callable[[str], Any]) -> threading.Thread | None:
+        """Run target(server_name) in a daemon thread unless the same job is already running.
+
+        Returns:
+            The started thread, or None if the job was already running.
+        """
+        key = (kind, server_name)
+        with self._lock:
+            if key in self._background_jobs:
+                return None
+            self._background_jobs.add(key)
+
+        def run() -> None:
+            try:
+                target(server_name)
+            finally:
+                with self._lock:
+                    self._background_jobs.discard(key)
+
+        thread = threading.Thread(target=run, name=f"mcp-{kind}-{server_name}", daemon=True)
+        thread.start()
+        return thread
+
+    def prefetch(self, server_names: Iterable[str]) -> None:
+        """Start servers in the background ahead of their first tool call.
+
+        Servers that are disabled, already active, or have ``prefetch`` turned
+        off in their settings are skipped.
+
+        Args:
+            server_names: Servers an upcoming plan is going to call.
+        """
+        for server_name in server_names:
+            if server_name in self.pools or not self.config.is_server_enabled(server_name):
+                continue
+            if not self.config.get_server_settings(server_name)["prefetch"]:
+                continue
+            self._run_in_background("prefetch", server_name, self._prefetch_server)
+
+    def warm_up(self, timeout: float | None = None) -> dict[str, str]:
+        """Start every enabled server in parallel and wait for them up to a deadline.
+
+        Servers with ``prefetch`` turned off stay lazy. Servers still starting
+        when the deadline passes keep starting in the background.
+
+        Args:
+            timeout: Seconds to wait for all servers; None waits until every server has started or failed.
+
+        Returns:
+            Status of every enabled server, as returned by get_server_status().
+        """
+        started = time.monotonic()
+        threads = []
+        for server_name in self.config.get_enabled_servers():
+            if server_name in self.pools or not self.config.get_server_settings(server_name)["prefetch"]:
+                continue
+            # Warm-up jobs have their own kind, readiness is judged on them alone
+            thread = self._run_in_background("warmup", server_name, self._prefetch_server)
+            if thread is not None:
+                threads.append(thread)
+
+        for thread in threads:
+            remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - started))
+            thread.join(remaining)
+
+        status = self.get_server_status()
+        ready = sum(1 for state in status.values() if state == "ready")
+        self._log.info(f"Warmed up {ready}/{len(status)} MCP server(s) in {time.monotonic() - started:.1f}s: {status}")
+        return status
+
+    def get_server_status(self) -> dict[str, str]:
+        """
+        Get the readiness of every enabled server.
+
+        Returns:
+            Dictionary mapping server names to one of "ready" (started), "starting"
+            (warm-up in progress), "failed" (last start failed), "unavailable"
+            (circuit open) or "idle" (not started yet). Servers prefetched for a
+            plan are not reported as starting, so ordinary traffic does not make
+            the API unready.
+        """
+        with self._lock:
+            starting = {name for kind, name in self._background_jobs if kind == "warmup"}
+
+        status = {}
+        for server_name in self.config.get_enabled_servers():
+            if not self.supervisor.is_available(server_name):
+                status[server_name] = "unavailable"
+            elif server_name in self.pools:
+                status[server_name] = "ready"
+            elif server_name in starting:
+                status[server_name] = "starting"
+            elif server_name in self._start_errors:
+                status[server_name] = "failed"
             else:
-                transport.start(metadata["command"], metadata["args"])
-            self.transports[server_name] = transport
+                status[server_name] = "idle"
+        return status
+
+    def _prefetch_server(self, server_name: str) -> None:
+        """Activate a server, logging instead of raising on failure."""
+        try:
+            self._get_pool(server_name)
+            self._log.info(f"Prefetched MCP server '{server_name}'")
+        except Exception as e:
+            self._log.warning(f"Failed to prefetch MCP server '{server_name}': {e}")
 
-            # Cache tools for this server
-            self.tool_cache[server_name] = transport.list_tools()
-        return self.transports[server_name]
+    def _get_transport(self, server_name: str) -> BaseTransport:
+        """Get or create the primary transport for a server."""
+        return self._get_pool(server_name).primary
 
     def execute_tool(self, server_name: str, tool_name: str, **kwargs) -> dict[str, Any]:
         """
@@ -74,47 +491,535 @@ class MCPExecutor:
                 - error: Error message if failed, None if succeeded
                 - tool: The tool identifier used
                 - tool_call: The original tool call string
+                - validation_errors: Argument violations if the arguments did not match
+                  the tool's inputSchema, None otherwise
         """
         try:
-            # Validate server is enabled
-            if not self.config.is_server_enabled(server_name):
-                return {
-                    "success": False,
-                    "error": f"MCP server '{server_name}' is not enabled",
-                    "result": None,
-                    "tool": f"{server_name}:{tool_name}",
-                    "tool_call": f"{server_name}:{tool_name}",
-                }
+            # Arguments that do not match the tool's schema are rejected without calling the server
+            route = self.routes.get(server_name, tool_name)
+            invalid = self._check_arguments(server_name, tool_name, kwargs, route)
+            if invalid is not None:
+                return invalid
 
-            # Get transport and validate tool
-            transport = self._get_transport(server_name)
-            if tool_name not in self.tool_cache.get(server_name, []):
-                return {
-                    "success": False,
-                    "error": f"Tool '{tool_name}' not found on server '{server_name}'",
-                    "result": None,
-                    "tool": f"{server_name}:{tool_name}",
-                    "tool_call": f"{server_name}:{tool_name}",
-                }
+            # Cached results of idempotent tools skip the server entirely
+            cache_key = self._result_cache_key(route, kwargs)
+            if cache_key is not None:
+                hit, cached = self.result_cache.get(server_name, tool_name, cache_key)
+                if hit:
+                    return self._build_result(server_name, tool_name, result=cached)
 
-            # Execute the tool via transport
-            result = transport.execute_tool(tool_name, **kwargs)
-            return {
-                "success": True,
-                "result": result,
-                "error": None,
-                "tool": f"{server_name}:{tool_name}",
-                "tool_call": f"{server_name}:{tool_name}",
-            }
+            route, error = self._prepare_call(server_name, tool_name, route)
+            if error:
+                return self._build_result(server_name, tool_name, error=error)
+            if cache_key is None:
+                cache_key = self._result_cache_key(route, kwargs)
+
+            # Execute the tool on the least-busy replica once the concurrency limits admit it
+            pool, timeout = route.pool, route.timeout
+            with self._limit(route), pool.acquire() as transport:
+                try:
+                    result = transport.call_tool(tool_name, kwargs, timeout=timeout)
+                except TimeoutError as e:
+                    return self._handle_timeout(server_name, tool_name, pool, transport, timeout, e)
+                except Exception as e:
+                    return self._build_failure(server_name, tool_name, pool, transport, e)
+            self.supervisor.record_success(server_name)
+            self._cache_result(route, cache_key, result)
+            return self._build_result(server_name, tool_name, result=result)
 
+        except ConcurrencyLimitError as e:
+            return self._build_result(server_name, tool_name, error=str(e))
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error executing tool: {str(e)}",
-                "result": None,
-                "tool": f"{server_name}:{tool_name}",
-                "tool_call": f"{server_name}:{tool_name}",
+            return self._build_result(server_name, tool_name, error=f"Error executing tool: {str(e)}")
+
+    async def aexecute_tool(self, server_name: str, tool_name: str, **kwargs) -> dict[str, Any]:
+        """
+        Awaitable counterpart of execute_tool().
+
+        Async transports are awaited directly on their shared event loop; other
+        transports run in a worker thread so the caller's loop is never blocked.
+
+        Args:
+            server_name: Name of the MCP server.
+            tool_name: Name of the tool to execute.
+            **kwargs: Additional arguments for the tool.
+
+        Returns:
+            Dictionary with the same keys as execute_tool().
+        """
+        try:
+            route = self.routes.get(server_name, tool_name)
+            invalid = self._check_arguments(server_name, tool_name, kwargs, route)
+            if invalid is not None:
+                return invalid
+
+            cache_key = self._result_cache_key(route, kwargs)
+            if cache_key is not None:
+                hit, cached = self.result_cache.get(server_name, tool_name, cache_key)
+                if hit:
+                    return self._build_result(server_name, tool_name, result=cached)
+
+            # Starting a server blocks, so calls to servers that are not running prepare off the event loop
+            if route is None or route.pool.closed:
+                route, error = await asyncio.to_thread(self._prepare_call, server_name, tool_name, route)
+            else:
+                route, error = self._prepare_call(server_name, tool_name, route)
+            if error:
+                return self._build_result(server_name, tool_name, error=error)
+            if cache_key is None:
+                cache_key = self._result_cache_key(route, kwargs)
+
+            pool, timeout = route.pool, route.timeout
+            async with self._alimit(route):
+                with pool.acquire() as transport:
+                    try:
+                        if isinstance(transport, AsyncTransport):
+                            result = await transport.acall_tool(tool_name, kwargs, timeout=timeout)
+                        else:
+                            result = await asyncio.to_thread(transport.call_tool, tool_name, kwargs, timeout=timeout)
+                    except TimeoutError as e:
+                        return self._handle_timeout(server_name, tool_name, pool, transport, timeout, e)
+                    except Exception as e:
+                        return self._build_failure(server_name, tool_name, pool, transport, e)
+            self.supervisor.record_success(server_name)
+            self._cache_result(route, cache_key, result)
+            return self._build_result(server_name, tool_name, result=result)
+
+        except ConcurrencyLimitError as e:
+            return self._build_result(server_name, tool_name, error=str(e))
+        except Exception as e:
+            return self._build_result(server_name, tool_name, error=f"Error executing tool: {str(e)}")
+
+    def execute_batch(self, calls: Sequence[tuple[str, str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """
+        Execute independent tool calls together, batching the calls to each server.
+
+        Calls are grouped per server and the groups run concurrently. Each
+        group is sent with the transport's call_tools(): one JSON-RPC batch on
+        transports that support it, pipelined requests otherwise. Calls that
+        the server's concurrency limits do not admit right away run on their
+        own, waiting in the queue as usual.
+
+        Args:
+            calls: (server name, tool name, arguments) triples.
+
+        Returns:
+            One result per call, in call order, with the same keys as execute_tool().
+        """
+        groups: dict[str, list[int]] = {}
+        for index, (server_name, _, _) in enumerate(calls):
+            groups.setdefault(server_name, []).append(index)
+
+        results: list[dict[str, Any]] = [{} for _ in calls]
+        with ThreadPoolExecutor(max_workers=max(1, len(groups)), thread_name_prefix="mcp-batch") as batches:
+            futures = {
+                batches.submit(self._execute_server_batch, server_name, [calls[i][1:] for i in indexes]): indexes
+                for server_name, indexes in groups.items()
             }
+        for future, indexes in futures.items():
+            for index, result in zip(indexes, future.result(), strict=True):
+                results[index] = result
+        return results
+
+    def _execute_server_batch(self, server_name: str, calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Execute the calls of one server as a single batch; see execute_batch().
+
+        Like execute_tool(), every call gets a result: calls left without one
+        by an unexpected error get a failed result carrying that error.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(calls)
+        try:
+            self._dispatch_server_batch(server_name, calls, results)
+        except Exception as e:
+            for index, (tool_name, _) in enumerate(calls):
+                if results[index] is None:
+                    results[index] = self._build_result(server_name, tool_name, error=f"Error executing tool: {str(e)}")
+        return results
+
+    def _dispatch_server_batch(
+        self, server_name: str, calls: list[tuple[str, dict[str, Any]]], results: list[dict[str, Any] | None]
+    ) -> None:
+        """Run the calls of one server batch and store their results as they complete."""
+        if len(calls) == 1:
+            tool_name, arguments = calls[0]
+            results[0] = self.execute_tool(server_name, tool_name, **arguments)
+            return
+
+        admitted: list[tuple[int, ToolRoute, str | None, list[ConcurrencyLimiter]]] = []
+        deferred: list[int] = []
+        try:
+            for index, (tool_name, arguments) in enumerate(calls):
+                route = self.routes.get(server_name, tool_name)
+                results[index] = self._check_arguments(server_name, tool_name, arguments, route)
+                if results[index] is not None:
+                    continue
+
+                cache_key = self._result_cache_key(route, arguments)
+                if cache_key is not None:
+                    hit, cached = self.result_cache.get(server_name, tool_name, cache_key)
+                    if hit:
+                        results[index] = self._build_result(server_name, tool_name, result=cached)
+                        continue
+
+                try:
+                    route, error = self._prepare_call(server_name, tool_name, route)
+                except Exception as e:
+                    route, error = None, f"Error executing tool: {str(e)}"
+                if error:
+                    results[index] = self._build_result(server_name, tool_name, error=error)
+                    continue
+                if cache_key is None:
+                    cache_key = self._result_cache_key(route, arguments)
+
+                limiters = self._try_limit(route)
+                if limiters is None:
+                    deferred.append(index)
+                else:
+                    admitted.append((index, route, cache_key, limiters))
+
+            if admitted:
+                self._run_batch(server_name, calls, admitted, results)
+        finally:
+            for _, _, _, limiters in admitted:
+                for limiter in reversed(limiters):
+                    limiter.release()
+
+        if deferred:
+            with ThreadPoolExecutor(max_workers=len(deferred), thread_name_prefix="mcp-batch") as overflow:
+                futures = {
+                    index: overflow.submit(self.execute_tool, server_name, calls[index][0], **calls[index][1])
+                    for index in deferred
+                }
+            for index, future in futures.items():
+                results[index] = future.result()
+
+    def _run_batch(
+        self,
+        server_name: str,
+        calls: list[tuple[str, dict[str, Any]]],
+        admitted: list[tuple[int, ToolRoute, str | None, list[ConcurrencyLimiter]]],
+        results: list[dict[str, Any] | None],
+    ) -> None:
+        """Send the admitted calls of a server batch on one replica and store their results."""
+        timeouts = [route.timeout for _, route, _, _ in admitted]
+        timeout = None if None in timeouts else max(timeouts)
+        # Every route of a server shares its pool; the last one is the most recently started
+        pool = admitted[-1][1].pool
+
+        try:
+            with pool.acquire() as transport:
+                try:
+                    outcomes = transport.call_tools([calls[index] for index, _, _, _ in admitted], timeout=timeout)
+                except Exception as e:
+                    outcomes = [e] * len(admitted)
+
+                for (index, route, cache_key, _), outcome in zip(admitted, outcomes, strict=True):
+                    tool_name = calls[index][0]
+                    if isinstance(outcome, TimeoutError):
+                        results[index] = self._handle_timeout(server_name, tool_name, pool, transport, timeout, outcome)
+                    elif isinstance(outcome, Exception):
+                        results[index] = self._build_failure(server_name, tool_name, pool, transport, outcome)
+                    else:
+                        self.supervisor.record_success(server_name)
+                        self._cache_result(route, cache_key, outcome)
+                        results[index] = self._build_result(server_name, tool_name, result=outcome)
+        except Exception as e:
+            # No replica could be acquired, e.g. the pool was closed or reaped
+            for index, _, _, _ in admitted:
+                if results[index] is None:
+                    results[index] = self._build_result(
+                        server_name, calls[index][0], error=f"Error executing tool: {str(e)}"
+                    )
+
+    def _check_arguments(
+        self, server_name: str, tool_name: str, arguments: dict[str, Any], route: ToolRoute | None
+    ) -> dict[str, Any] | None:
+        """Validate call arguments against the tool's compiled schema.
+
+        Returns:
+            The failed result of the call if the arguments are invalid, None otherwise.
+        """
+        validator = route.validator if route is not None else self.validators.get(server_name, tool_name)
+        if validator is None:
+            return None
+        errors = validator.validate(arguments)
+        if not errors:
+            return None
+        return self._build_result(
+            server_name,
+            tool_name,
+            error=format_validation_errors(server_name, tool_name, errors),
+            validation_errors=errors,
+        )
+
+    def validate_arguments(self, server_name: str, tool_name: str, arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Validate tool arguments against the tool's inputSchema without calling the server.
+
+        Uses the validators compiled when the server's schemas were discovered, so
+        plans can be checked before execution starts.
+
+        Args:
+            server_name: Name of the MCP server.
+            tool_name: Name of the tool.
+            arguments: The arguments of the tool call.
+
+        Returns:
+            One entry per violation with its "path", "message" and "keyword"; empty if
+            the arguments are valid or the tool has no discovered schema.
+        """
+        return self.validators.validate(server_name, tool_name, arguments)
+
+    def _try_limit(self, route: ToolRoute) -> list[ConcurrencyLimiter] | None:
+        """Take a slot of every limiter of a call without waiting.
+
+        Returns:
+            The limiters holding a slot, or None if one of them was full.
+        """
+        acquired = []
+        for limiter in route.limiters:
+            if not limiter.try_acquire():
+                for held in reversed(acquired):
+                    held.release()
+                return None
+            acquired.append(limiter)
+        return acquired
+
+    def _prepare_call(
+        self, server_name: str, tool_name: str, route: ToolRoute | None = None
+    ) -> tuple[ToolRoute | None, str | None]:
+        """Validate a tool call and get the route to run it on.
+
+        A call to a running server only checks the server's circuit. Otherwise
+        the server is validated against the configuration and started, and the
+        route is looked up again.
+
+        Args:
+            server_name: Name of the MCP server.
+            tool_name: Name of the tool.
+            route: The call's route from the index, if it has one.
+
+        Returns:
+            Tuple of (route, error message); the route is None when validation failed.
+        """
+        if route is not None and not route.pool.closed:
+            # Fail fast while the server's circuit is open
+            if not self.supervisor.allow(server_name):
+                return None, f"MCP server '{server_name}' is unavailable (circuit open)"
+        else:
+            route, error = self._activate_route(server_name, tool_name)
+            if error:
+                return None, error
+
+        # Keep the idle reaper from stopping the server before the call checks out a replica
+        route.pool.touch()
+        if route.pool.closed:
+            return self._activate_route(server_name, tool_name)
+        return route, None
+
+    def _activate_route(self, server_name: str, tool_name: str) -> tuple[ToolRoute | None, str | None]:
+        """Validate a call to a server that is not running, start the server and get the call's route."""
+        # Validate server is enabled
+        if not self.config.is_server_enabled(server_name):
+            return None, f"MCP server '{server_name}' is not enabled"
+
+        # Fail fast while the server's circuit is open
+        if not self.supervisor.allow(server_name):
+            return None, f"MCP server '{server_name}' is unavailable (circuit open)"
+
+        try:
+            pool = self._get_pool(server_name)
+        except Exception as e:
+            self.supervisor.record_failure(server_name, f"Failed to start: {e}")
+            raise
+        pool.touch()
+
+        route = self.routes.get(server_name, tool_name)
+        if route is None and server_name not in self.routes.servers():
+            # A concurrent reload_config() swapped in an index built before the server started
+            self._index_server(server_name, pool)
+            route = self.routes.get(server_name, tool_name)
+        if route is None:
+            return None, f"Tool '{tool_name}' not found on server '{server_name}'"
+        return route, None
+
+    def _get_limiters(self, server_name: str, tool_name: str) -> list[ConcurrencyLimiter]:
+        """Get the limiters a call must pass: the tool's, if it has its own limit, then the server's."""
+        settings = self.config.get_server_settings(server_name)
+        tool_limit = self.config.get_tool_settings(server_name, tool_name)["concurrency_limit"]
+
+        with self._lock:
+            limiters = []
+            if tool_limit is not None:
+                limiters.append(
+                    self._limiters.setdefault(
+                        (server_name, tool_name),
+                        ConcurrencyLimiter(f"{server_name}:{tool_name}", tool_limit, settings["queue_size"]),
+                    )
+                )
+            limiters.append(
+                self._limiters.setdefault(
+                    (server_name, None),
+                    ConcurrencyLimiter(server_name, settings["concurrency_limit"], settings["queue_size"]),
+                )
+            )
+        return limiters
+
+    @contextmanager
+    def _limit(self, route: ToolRoute) -> Generator[None]:
+        """Hold a slot of every limiter of a call, waiting up to the server's queue_timeout in total."""
+        queue_timeout = route.server_settings["queue_timeout"]
+        started = time.monotonic()
+        acquired = []
+        try:
+            for limiter in route.limiters:
+                limiter.acquire(self._remaining(queue_timeout, started))
+                acquired.append(limiter)
+            yield
+        finally:
+            for limiter in reversed(acquired):
+                limiter.release()
+
+    @asynccontextmanager
+    async def _alimit(self, route: ToolRoute) -> AsyncGenerator[None]:
+        """Awaitable counterpart of _limit()."""
+        queue_timeout = route.server_settings["queue_timeout"]
+        started = time.monotonic()
+        acquired = []
+        try:
+            for limiter in route.limiters:
+                await limiter.aacquire(self._remaining(queue_timeout, started))
+                acquired.append(limiter)
+            yield
+        finally:
+            for limiter in reversed(acquired):
+                limiter.release()
+
+    @staticmethod
+    def _remaining(timeout: float | None, started: float) -> float | None:
+        """Get what is left of a timeout that started at the given time.monotonic() value."""
+        return None if timeout is None else max(0.0, timeout - (time.monotonic() - started))
+
+    def get_concurrency_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get in-flight, queued and rejected call counts of every server that has been called.
+
+        Returns:
+            Dictionary mapping server names to their limiter counters, current replica
+            count and a "tools" breakdown for tools with their own concurrency limit.
+        """
+        with self._lock:
+            limiters = dict(self._limiters)
+
+        stats: dict[str, dict[str, Any]] = {}
+        for (server_name, tool_name), limiter in limiters.items():
+            if tool_name is None:
+                pool = self.pools.get(server_name)
+                entry = stats.setdefault(server_name, {"tools": {}})
+                entry.update(limiter.stats(), replicas=pool.stats()["replicas"] if pool else 0)
+            else:
+                stats.setdefault(server_name, {"tools": {}})["tools"][tool_name] = limiter.stats()
+        return stats
+
+    def _resolve_timeout(self, server_name: str, tool_name: str) -> float | None:
+        """Get the deadline of a call: the tool's timeout, else the server's, else the executor default."""
+        timeout = self.config.get_tool_settings(server_name, tool_name)["timeout"]
+        if timeout is None:
+            timeout = self.config.get_server_settings(server_name)["timeout"]
+        return self.default_timeout if timeout is None else timeout
+
+    def _handle_timeout(
+        self,
+        server_name: str,
+        tool_name: str,
+        pool: TransportPool,
+        transport: BaseTransport,
+        timeout: float | None,
+        error: TimeoutError,
+    ) -> dict[str, Any]:
+        """Build the failed result of a timed out call, restarting the replica if configured."""
+        self._log.warning(f"Tool '{server_name}:{tool_name}' timed out: {error}")
+        if self.config.get_server_settings(server_name)["restart_on_timeout"]:
+            self.supervisor.handle_unhealthy(server_name, pool, transport, f"Tool '{tool_name}' timed out")
+        else:
+            self.supervisor.record_failure(server_name, f"Tool '{tool_name}' timed out")
+
+        message = f"Tool call timed out after {timeout}s" if timeout is not None else f"Tool call timed out: {error}"
+        return self._build_result(server_name, tool_name, error=self._with_stderr(message, transport))
+
+    def _build_failure(
+        self, server_name: str, tool_name: str, pool: TransportPool, transport: BaseTransport, error: Exception
+    ) -> dict[str, Any]:
+        """Build the failed result of a call the transport raised on, restarting the replica if it died."""
+        if not transport.is_alive():
+            self.supervisor.handle_unhealthy(server_name, pool, transport, str(error))
+        message = self._with_stderr(f"Error executing tool: {str(error)}", transport)
+        return self._build_result(server_name, tool_name, error=message)
+
+    def _with_stderr(self, message: str, transport: BaseTransport) -> str:
+        """Append the server's recent stderr output to an error message."""
+        stderr = transport.get_stderr(STDERR_ERROR_LINES)
+        if not stderr:
+            return message
+        return f"{message}\nServer stderr (last {STDERR_ERROR_LINES} lines):\n{stderr}"
+
+    def get_server_stderr(self, server_name: str, max_lines: int | None = None) -> str:
+        """
+        Get the recent stderr output of a started server.
+
+        Args:
+            server_name: Name of the MCP server.
+            max_lines: Only return the last max_lines lines of each replica (optional).
+
+        Returns:
+            Buffered stderr of every replica, or an empty string if the server is not started.
+        """
+        pool = self.pools.get(server_name)
+        if pool is None:
+            return ""
+        outputs = [replica.transport.get_stderr(max_lines) for replica in pool.replicas]
+        return "\n".join(output for output in outputs if output)
+
+    @staticmethod
+    def _result_cache_key(route: ToolRoute | None, arguments: dict[str, Any]) -> str | None:
+        """Get the result cache key for a call, or None if it has no route or the tool is not cacheable."""
+        if route is None or not route.tool_settings["cacheable"]:
+            return None
+        return ToolResultCache.make_key(arguments)
+
+    def _cache_result(self, route: ToolRoute, cache_key: str | None, result: Any) -> None:
+        """Cache a successful result of a cacheable tool."""
+        if cache_key is None:
+            return
+
+        settings = route.tool_settings
+        self.result_cache.put(
+            route.server_name,
+            route.tool_name,
+            cache_key,
+            result,
+            ttl_seconds=settings["ttl_seconds"],
+            max_entries=settings["max_entries"],
+            max_result_bytes=settings["max_result_bytes"],
+        )
+
+    def _build_result(
+        self,
+        server_name: str,
+        tool_name: str,
+        result: Any = None,
+        error: str | None = None,
+        validation_errors: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Build the execution result dictionary returned by execute_tool()."""
+        return {
+            "success": error is None,
+            "result": result,
+            "error": error,
+            "tool": f"{server_name}:{tool_name}",
+            "tool_call": f"{server_name}:{tool_name}",
+            "validation_errors": validation_errors,
+        }
 
     def get_available_tools(self) -> dict[str, list]:
         """
@@ -123,47 +1028,48 @@ class MCPExecutor:
         Returns:
             Dictionary mapping server names to lists of available tool names.
         """
-        available_tools = {}
-        enabled_servers = self.config.get_enabled_servers()
-
-        for server_name in enabled_servers:
-            # Initialize transport to populate tool cache
-            try:
-                self._get_transport(server_name)
-                available_tools[server_name] = self.tool_cache.get(server_name, [])
-            except Exception:
-                available_tools[server_name] = []
+        return {
+            server_name: [tool["name"] for tool in schemas] for server_name, schemas in self.get_tool_schemas().items()
+        }
 
-        return available_tools
-
-    def get_tool_schemas(self) -> dict[str, list[dict[str, Any]]]:
+    def get_tool_schemas(self, available_only: bool = False) -> dict[str, list[dict[str, Any]]]:
         """
         Get detailed tool information for all enabled servers.
 
+        Schemas come from memory, the tool manifest or the persistent cache
+        without activating servers. Servers missing from all of them are started
+        concurrently to fetch their schemas and kept running for their first call.
+
+        Args:
+            available_only: Leave out servers whose circuit is open, so their tools are not planned.
+
         Returns:
             Dictionary mapping server names to lists of tool schema objects.
             Each tool object contains: name, description, inputSchema.
         """
         tool_schemas = {}
         enabled_servers = self.config.get_enabled_servers()
+        if available_only:
+            enabled_servers = [name for name in enabled_servers if self.supervisor.is_available(name)]
 
+        # Check if we already have schemas cached
+        missing = [name for name in enabled_servers if name not in self.tool_schema_cache]
         for server_name in enabled_servers:
-            # Check if we already have schemas cached
-            if server_name in self.tool_schema_cache:
+            if server_name not in missing:
                 tool_schemas[server_name] = self.tool_schema_cache[server_name]
-                continue
 
-            # Initialize transport to get tool schemas
-            try:
-                transport = self._get_transport(server_name)
-                schemas = transport.get_tool_schemas()
-                self.tool_schema_cache[server_name] = schemas
-                tool_schemas[server_name] = schemas
-            except Exception as e:
-                self._log.error(f"Fail to get tool schemes: {e}")
-                tool_schemas[server_name] = []
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix="mcp-discover") as discovery:
+                futures = {name: discovery.submit(self._discover_schemas, name) for name in missing}
+
+            for server_name, future in futures.items():
+                try:
+                    tool_schemas[server_name] = future.result()
+                except Exception as e:
+                    self._log.error(f"Fail to get tool schemes: {e}")
+                    tool_schemas[server_name] = []
 
-        return tool_schemas
+        return {server_name: tool_schemas[server_name] for server_name in enabled_servers}
 
     def validate_tool_call(self, server_name: str, tool_name: str) -> bool:
         """
@@ -177,18 +1083,26 @@ class MCPExecutor:
             True if the tool call is valid, False otherwise.
         """
         try:
+            if f"{server_name}:{tool_name}" in self.routes:
+                return True
+            # Servers that are not running have no routes yet; check their discovered tools
             return tool_name in self.tool_cache.get(server_name, [])
         except Exception:
             return False
 
     def shutdown(self):
         """Clean up all transport connections."""
-        for name, transport in self.transports.items():
-            if transport:
-                transport.stop()
-        self.transports = {}
+        self.supervisor.stop()
+        self._reaper_stop.set()
+        for pool in self.pools.values():
+            pool.stop()
+        self.pools = {}
+        self._pool_specs = {}
+        self.routes.replace([])
         self.tool_cache = {}
         self.tool_schema_cache = {}
+        self.result_cache.clear()
+        self.validators.clear()
 
 
 # Global MCP executor instance
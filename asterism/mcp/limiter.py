@@ -0,0 +1,129 @@
+"""Concurrency limits for MCP tool calls.
+
+A limiter admits up to ``limit`` calls at a time; further calls wait in a
+bounded queue for a free slot, and are rejected when the queue is full or
+their wait times out. Counters of admitted, queued and rejected calls are
+kept so replicas and limits can be sized from real traffic.
+"""
+
+import asyncio
+import threading
+from typing import Any
+
+
+class ConcurrencyLimitError(RuntimeError):
+    """Raised when a call is rejected by a concurrency limiter."""
+
+
+class ConcurrencyLimiter:
+    """Thread-safe counting semaphore with a bounded wait queue."""
+
+    def __init__(self, name: str, limit: int | None = None, max_queue: int | None = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Server or "server:tool" name, used in error messages.
+            limit: Maximum concurrent calls; None only counts calls without limiting them.
+            max_queue: Maximum calls waiting for a slot; None lets every call wait.
+        """
+        self.name = name
+        self.limit = None if limit is None else max(1, int(limit))
+        self.max_queue = None if max_queue is None else max(0, int(max_queue))
+
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._queued = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    def _has_slot(self) -> bool:
+        """Check whether a call may start now; the lock must be held."""
+        return self.limit is None or self._in_flight < self.limit
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now, without queueing or counting a rejection.
+
+        Returns:
+            True if a slot was taken.
+        """
+        with self._condition:
+            if not self._has_slot():
+                return False
+            self._in_flight += 1
+            return True
+
+    def acquire(self, timeout: float | None = None) -> None:
+        """Take a slot, waiting in the queue while the limit is reached.
+
+        Args:
+            timeout: Seconds to wait for a slot; None waits indefinitely.
+
+        Raises:
+            ConcurrencyLimitError: If the queue is full or no slot freed up in time.
+        """
+        with self._condition:
+            if self._has_slot():
+                self._in_flight += 1
+                return
+
+            if self.max_queue is not None and self._queued >= self.max_queue:
+                self._rejected += 1
+                raise ConcurrencyLimitError(
+                    f"'{self.name}' is at its concurrency limit of {self.limit} and its queue is full"
+                )
+
+            self._queued += 1
+            try:
+                admitted = self._condition.wait_for(self._has_slot, timeout)
+            finally:
+                self._queued -= 1
+
+            if not admitted:
+                self._rejected += 1
+                self._timed_out += 1
+                raise ConcurrencyLimitError(f"Timed out after {timeout}s waiting for a free slot on '{self.name}'")
+            self._in_flight += 1
+
+    async def aacquire(self, timeout: float | None = None) -> None:
+        """Awaitable counterpart of acquire(); waiting happens in a worker thread.
+
+        Args:
+            timeout: Seconds to wait for a slot; None waits indefinitely.
+
+        Raises:
+            ConcurrencyLimitError: If the queue is full or no slot freed up in time.
+        """
+        with self._condition:
+            if self._has_slot():
+                self._in_flight += 1
+                return
+
+        waiter = asyncio.ensure_future(asyncio.to_thread(self.acquire, timeout))
+        try:
+            await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            # The waiting thread cannot be interrupted; give its slot back once it gets one
+            waiter.add_done_callback(lambda done: done.exception() is None and self.release())
+            raise
+
+    def release(self) -> None:
+        """Give a slot back and wake the next waiting call."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def stats(self) -> dict[str, Any]:
+        """Get the limiter's counters.
+
+        Returns:
+            Dictionary with the limit, current in-flight and queued calls, and rejected calls so far.
+        """
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+            }
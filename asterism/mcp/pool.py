@@ -0,0 +1,272 @@
+"""Replica pool for MCP server transports.
+
+This module keeps several initialized transports for one MCP server and
+dispatches each call to the least-busy replica, starting extra replicas
+when every replica is saturated and stopping them again once idle. A whole
+pool can be closed once it has been idle for long enough.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from asterism.mcp.transport_executor.base import BaseTransport
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TransportReplica:
+    """A single started transport and its load bookkeeping."""
+
+    transport: BaseTransport
+    in_flight: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    restarting: bool = False
+
+
+class TransportPool:
+    """Pool of initialized transport replicas for a single MCP server."""
+
+    def __init__(
+        self,
+        factory: Callable[[], BaseTransport],
+        max_replicas: int = 1,
+        max_concurrency: int = 1,
+        scale_down_after: float = 60.0,
+        name: str = "",
+    ):
+        """
+        Initialize the pool and start its primary replica.
+
+        Args:
+            factory: Callable that starts and returns a new initialized transport.
+            max_replicas: Maximum number of replicas kept alive for the server.
+            max_concurrency: In-flight calls per replica before another replica is started.
+            scale_down_after: Seconds an extra replica may stay idle before it is stopped.
+            name: Server name, used for logging.
+        """
+        self.name = name
+        self.max_replicas = max(1, int(max_replicas))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.scale_down_after = scale_down_after
+
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._spawning = 0
+        self._restarts = 0
+        self._closed = False
+        self._last_used = time.monotonic()
+        self._replicas: list[TransportReplica] = [TransportReplica(factory())]
+
+    @property
+    def primary(self) -> BaseTransport:
+        """The first replica, used for discovery calls such as tools/list."""
+        return self._replicas[0].transport
+
+    @property
+    def replicas(self) -> list[TransportReplica]:
+        """Snapshot of the current replicas."""
+        with self._lock:
+            return list(self._replicas)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool has been stopped."""
+        return self._closed
+
+    def touch(self) -> None:
+        """Mark the pool as used now, so it is not closed as idle before the caller checks out a replica."""
+        with self._lock:
+            self._last_used = time.monotonic()
+
+    @contextmanager
+    def acquire(self) -> Generator[BaseTransport]:
+        """Check out the least-busy replica for the duration of one call.
+
+        Yields:
+            BaseTransport: The transport to execute the call on.
+
+        Raises:
+            RuntimeError: If the pool has been stopped.
+        """
+        replica = self._checkout()
+        try:
+            yield replica.transport
+        finally:
+            self._release(replica)
+
+    def _checkout(self) -> TransportReplica:
+        """Pick the least-busy replica, scaling up in the background when saturated."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"MCP server '{self.name}' has been stopped")
+            replica = min(self._replicas, key=lambda r: r.in_flight)
+            replica.in_flight += 1
+            replica.last_used = self._last_used = time.monotonic()
+
+            saturated = all(r.in_flight >= self.max_concurrency for r in self._replicas)
+            if saturated and len(self._replicas) + self._spawning < self.max_replicas:
+                self._spawning += 1
+                threading.Thread(target=self._spawn_replica, name=f"mcp-pool-{self.name}", daemon=True).start()
+
+        return replica
+
+    def _spawn_replica(self) -> None:
+        """Start a new replica and add it to the pool."""
+        try:
+            replica = TransportReplica(self._factory())
+        except Exception as e:
+            logger.warning(f"Failed to start replica for MCP server '{self.name}': {e}")
+            with self._lock:
+                self._spawning -= 1
+            return
+
+        with self._lock:
+            self._spawning -= 1
+            closed = self._closed
+            if not closed:
+                self._replicas.append(replica)
+            count = len(self._replicas)
+
+        if closed:
+            self._stop_replica(replica)
+            return
+        logger.info(f"Scaled MCP server '{self.name}' up to {count} replica(s)")
+
+    def _release(self, replica: TransportReplica) -> None:
+        """Return a replica to the pool and stop extra replicas that went idle."""
+        with self._lock:
+            replica.in_flight -= 1
+            replica.last_used = self._last_used = time.monotonic()
+        self.scale_down()
+
+    def scale_down(self) -> int:
+        """Stop extra replicas that have been idle for scale_down_after seconds.
+
+        Called whenever a replica is returned, and periodically by the executor
+        so a pool that went quiet after a burst does not keep its extra replicas.
+
+        Returns:
+            Number of replicas stopped.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                return 0
+            # The primary replica is never scaled down
+            idle = [r for r in self._replicas[1:] if r.in_flight == 0 and now - r.last_used >= self.scale_down_after]
+            for r in idle:
+                self._replicas.remove(r)
+            count = len(self._replicas)
+
+        for r in idle:
+            self._stop_replica(r)
+        if idle:
+            logger.info(f"Scaled MCP server '{self.name}' down to {count} replica(s)")
+        return len(idle)
+
+    def restart(self, transport: BaseTransport) -> None:
+        """Replace a replica's transport with a freshly started one in the background.
+
+        The new transport is started before the old one is stopped, so the
+        replica keeps its place in the pool. Calls still running on the old
+        transport fail when it stops.
+
+        Args:
+            transport: Transport of the replica to restart, e.g. one that stopped responding.
+        """
+        with self._lock:
+            replica = next((r for r in self._replicas if r.transport is transport), None)
+            if replica is None or replica.restarting or self._closed:
+                return
+            replica.restarting = True
+
+        threading.Thread(
+            target=self._restart_replica, args=(replica,), name=f"mcp-restart-{self.name}", daemon=True
+        ).start()
+
+    def _restart_replica(self, replica: TransportReplica) -> None:
+        """Start a replacement transport and swap it into the replica."""
+        try:
+            transport = self._factory()
+        except Exception as e:
+            logger.warning(f"Failed to restart replica for MCP server '{self.name}': {e}")
+            with self._lock:
+                replica.restarting = False
+            return
+
+        with self._lock:
+            old, closed = replica.transport, self._closed
+            if not closed:
+                replica.transport = transport
+                self._restarts += 1
+            replica.restarting = False
+
+        self._stop_transport(transport if closed else old)
+        if not closed:
+            logger.info(f"Restarted replica of MCP server '{self.name}'")
+
+    def _stop_replica(self, replica: TransportReplica) -> None:
+        """Stop a replica, ignoring errors from an already dead transport."""
+        self._stop_transport(replica.transport)
+
+    def _stop_transport(self, transport: BaseTransport) -> None:
+        """Stop a transport, ignoring errors from an already dead one."""
+        try:
+            transport.stop()
+        except Exception as e:
+            logger.debug(f"Error stopping replica for MCP server '{self.name}': {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Get load statistics for the pool.
+
+        Returns:
+            Dictionary with replica count, in-flight calls per replica and restarts.
+        """
+        with self._lock:
+            in_flight = [r.in_flight for r in self._replicas]
+            restarts = self._restarts
+        return {
+            "replicas": len(in_flight),
+            "max_replicas": self.max_replicas,
+            "in_flight": sum(in_flight),
+            "in_flight_per_replica": in_flight,
+            "restarts": restarts,
+        }
+
+    def close_if_idle(self, idle_timeout: float) -> bool:
+        """Stop the pool if no call has used it for idle_timeout seconds.
+
+        Pools with calls in flight, or replicas being started or restarted,
+        are never closed.
+
+        Args:
+            idle_timeout: Seconds since the last call after which the pool is stopped.
+
+        Returns:
+            True if the pool was stopped.
+        """
+        with self._lock:
+            if self._closed or self._spawning or time.monotonic() - self._last_used < idle_timeout:
+                return False
+            if any(r.in_flight or r.restarting for r in self._replicas):
+                return False
+            self._closed = True
+            replicas = list(self._replicas)
+
+        for replica in replicas:
+            self._stop_replica(replica)
+        return True
+
+    def stop(self) -> None:
+        """Stop every replica in the pool."""
+        with self._lock:
+            self._closed = True
+            replicas = list(self._replicas)
+        for replica in replicas:
+            self._stop_replica(replica)
@@ -0,0 +1,159 @@
+"""Result cache for idempotent MCP tool calls.
+
+Results are keyed by server, tool and canonical JSON arguments. Each tool
+has its own LRU with a TTL and entry limit taken from its tool settings,
+and all operations are guarded by one lock so the cache can be shared by
+concurrent sessions.
+"""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CachedResult:
+    """A cached tool result and its expiry time."""
+
+    result: Any
+    expires_at: float
+
+
+@dataclass
+class ToolCacheStats:
+    """Hit/miss counters for one tool."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    skipped: int = 0
+
+
+class ToolResultCache:
+    """Thread-safe TTL/LRU cache of tool results."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], OrderedDict[str, CachedResult]] = {}
+        self._stats: dict[tuple[str, str], ToolCacheStats] = {}
+
+    @staticmethod
+    def make_key(arguments: dict[str, Any]) -> str | None:
+        """Canonicalize tool arguments into a cache key.
+
+        Args:
+            arguments: Tool arguments.
+
+        Returns:
+            Canonical JSON of the arguments, or None if they are not JSON serializable.
+        """
+        try:
+            return json.dumps(arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, server_name: str, tool_name: str, key: str) -> tuple[bool, Any]:
+        """Look up a cached result.
+
+        Args:
+            server_name: Name of the MCP server.
+            tool_name: Name of the tool.
+            key: Cache key from make_key().
+
+        Returns:
+            Tuple of (hit, result); result is a copy the caller may modify.
+        """
+        tool = (server_name, tool_name)
+        now = time.monotonic()
+        with self._lock:
+            stats = self._stats.setdefault(tool, ToolCacheStats())
+            entries = self._entries.get(tool)
+            entry = entries.get(key) if entries else None
+
+            if entry is None or entry.expires_at <= now:
+                if entry is not None:
+                    del entries[key]
+                stats.misses += 1
+                return False, None
+
+            entries.move_to_end(key)
+            stats.hits += 1
+            result = entry.result
+
+        return True, copy.deepcopy(result)
+
+    def put(
+        self,
+        server_name: str,
+        tool_name: str,
+        key: str,
+        result: Any,
+        ttl_seconds: float,
+        max_entries: int,
+        max_result_bytes: int,
+    ) -> bool:
+        """Store a result, evicting the least recently used entries of the tool.
+
+        Args:
+            server_name: Name of the MCP server.
+            tool_name: Name of the tool.
+            key: Cache key from make_key().
+            result: Tool result to cache.
+            ttl_seconds: Seconds the result stays valid.
+            max_entries: Maximum cached results for this tool.
+            max_result_bytes: Results whose JSON size exceeds this are not cached.
+
+        Returns:
+            True if the result was cached.
+        """
+        tool = (server_name, tool_name)
+        try:
+            size = len(json.dumps(result, default=str).encode("utf-8"))
+        except (TypeError, ValueError):
+            size = None
+
+        with self._lock:
+            stats = self._stats.setdefault(tool, ToolCacheStats())
+            if size is None or size > max_result_bytes or max_entries < 1 or ttl_seconds <= 0:
+                stats.skipped += 1
+                return False
+
+            entries = self._entries.setdefault(tool, OrderedDict())
+            entries[key] = CachedResult(copy.deepcopy(result), time.monotonic() + ttl_seconds)
+            entries.move_to_end(key)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+                stats.evictions += 1
+
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters.
+
+        Returns:
+            Dictionary with totals and a per-tool breakdown keyed by "server:tool".
+        """
+        with self._lock:
+            tools = {
+                f"{server}:{tool}": {
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                    "evictions": stats.evictions,
+                    "skipped": stats.skipped,
+                    "entries": len(self._entries.get((server, tool), ())),
+                }
+                for (server, tool), stats in self._stats.items()
+            }
+
+        totals = {name: sum(tool[name] for tool in tools.values()) for name in ("hits", "misses", "entries")}
+        return {**totals, "tools": tools}
+
+    def clear(self) -> None:
+        """Drop every cached result; counters are kept."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,78 @@
+"""Routing index for MCP tool calls.
+
+Each active tool gets a route keyed by ``"server:tool"`` holding everything
+a call needs: the server's replica pool, the tool schema and its compiled
+argument validator, resolved timeout, cache and queue settings, and its
+concurrency limiters. A call resolves its
+route with one dict lookup instead of re-reading the server configuration.
+The index is copy-on-write, so readers never see a half-built table.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from .limiter import ConcurrencyLimiter
+from .pool import TransportPool
+from .validation import ToolArgumentValidator
+
+
+@dataclass(frozen=True)
+class ToolRoute:
+    """Everything needed to execute one tool of an active server."""
+
+    server_name: str
+    tool_name: str
+    pool: TransportPool
+    schema: dict[str, Any]
+    server_settings: dict[str, Any]
+    tool_settings: dict[str, Any]
+    validator: ToolArgumentValidator | None
+    timeout: float | None
+    limiters: tuple[ConcurrencyLimiter, ...]
+
+    @property
+    def key(self) -> str:
+        """The "server:tool" key of the route."""
+        return f"{self.server_name}:{self.tool_name}"
+
+
+class ToolRouteIndex:
+    """Copy-on-write map from "server:tool" to ToolRoute."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._routes: dict[str, ToolRoute] = {}
+        self._lock = threading.Lock()
+
+    def get(self, server_name: str, tool_name: str) -> ToolRoute | None:
+        """Look up the route of a tool; None if the server is not active or has no such tool."""
+        return self._routes.get(f"{server_name}:{tool_name}")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._routes
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def set_server(self, server_name: str, routes: list[ToolRoute]) -> None:
+        """Replace every route of a server in one swap.
+
+        Args:
+            server_name: Name of the MCP server.
+            routes: The server's new routes; an empty list removes the server.
+        """
+        with self._lock:
+            table = {key: route for key, route in self._routes.items() if route.server_name != server_name}
+            table.update((route.key, route) for route in routes)
+            self._routes = table
+
+    def replace(self, routes: list[ToolRoute]) -> None:
+        """Replace the whole index in one swap."""
+        table = {route.key: route for route in routes}
+        with self._lock:
+            self._routes = table
+
+    def servers(self) -> set[str]:
+        """Names of the servers that have routes."""
+        return {route.server_name for route in self._routes.values()}
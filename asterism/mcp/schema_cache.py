@@ -0,0 +1,119 @@
+"""Persistent tool schema cache for MCP servers.
+
+Tool schemas are stored on disk per server together with a fingerprint of
+the server's launch settings, so tool discovery can be answered without
+starting the server, and a changed command, args or cwd invalidates the
+cached entry.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedSchemas:
+    """Tool schemas read from the cache."""
+
+    tools: list[dict[str, Any]]
+    fetched_at: float
+    stale: bool
+
+
+class ToolSchemaCache:
+    """JSON file cache of tool schemas keyed by server name and launch fingerprint."""
+
+    def __init__(self, path: str | Path, ttl_seconds: float = 86400.0):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path to the JSON cache file. Created on first write.
+            ttl_seconds: Age after which an entry is stale and should be revalidated.
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    @staticmethod
+    def fingerprint(metadata: dict[str, Any]) -> str:
+        """Hash the launch settings that determine which tools a server exposes.
+
+        Args:
+            metadata: Server metadata from MCPConfig.get_server_metadata().
+
+        Returns:
+            Hex digest of transport, command, args and cwd.
+        """
+        key = {name: metadata.get(name) for name in ("transport", "command", "args", "cwd")}
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, server_name: str, fingerprint: str) -> CachedSchemas | None:
+        """Get cached schemas for a server.
+
+        Args:
+            server_name: Name of the MCP server.
+            fingerprint: Current launch fingerprint of the server.
+
+        Returns:
+            Cached schemas, or None when missing or cached for other launch settings.
+        """
+        with self._lock:
+            entry = self._load().get(server_name)
+
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+
+        fetched_at = entry.get("fetched_at", 0.0)
+        return CachedSchemas(
+            tools=entry.get("tools", []),
+            fetched_at=fetched_at,
+            stale=time.time() - fetched_at >= self.ttl_seconds,
+        )
+
+    def put(self, server_name: str, fingerprint: str, tools: list[dict[str, Any]]) -> None:
+        """Store schemas for a server and write the cache file.
+
+        Args:
+            server_name: Name of the MCP server.
+            fingerprint: Launch fingerprint the schemas were fetched with.
+            tools: Tool schemas returned by tools/list.
+        """
+        with self._lock:
+            entries = self._load()
+            entries[server_name] = {"fingerprint": fingerprint, "fetched_at": time.time(), "tools": tools}
+            self._save(entries)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read the cache file once; a missing or corrupt file gives an empty cache."""
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+                self._entries = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable tool schema cache {self.path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Atomically replace the cache file."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write tool schema cache {self.path}: {e}")
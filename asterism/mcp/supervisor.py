@@ -0,0 +1,244 @@
+"""Health supervision for MCP servers.
+
+The supervisor pings every started replica periodically, restarts dead or
+unresponsive replicas with exponential backoff, and keeps a circuit breaker
+per server: after too many failures in a short window the circuit opens and
+calls fail fast until a probe succeeds again.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from asterism.mcp.pool import TransportPool
+from asterism.mcp.transport_executor.base import BaseTransport
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states of a server."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class ServerHealth:
+    """Failure and restart bookkeeping for one server."""
+
+    state: CircuitState = CircuitState.CLOSED
+    failures: deque[float] = field(default_factory=deque)
+    opened_at: float = 0.0
+    restart_attempts: int = 0
+    next_restart_at: float = 0.0
+    restarts: int = 0
+    last_error: str | None = None
+
+
+class ServerSupervisor:
+    """Pings MCP servers, restarts crashed replicas and circuit-breaks flapping servers."""
+
+    def __init__(
+        self,
+        interval: float = 30.0,
+        ping_timeout: float = 5.0,
+        failure_threshold: int = 3,
+        failure_window: float = 60.0,
+        reset_timeout: float = 30.0,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        """
+        Initialize the supervisor.
+
+        Args:
+            interval: Seconds between health checks; 0 disables the background checks.
+            ping_timeout: Seconds a replica may take to answer a ping.
+            failure_threshold: Failures within failure_window that open the circuit.
+            failure_window: Seconds over which failures are counted.
+            reset_timeout: Seconds an open circuit fails fast before a probe is let through.
+            backoff_base: Delay in seconds before the second restart of a server; doubles per attempt.
+            backoff_max: Upper bound of the restart delay in seconds.
+        """
+        self.interval = interval
+        self.ping_timeout = ping_timeout
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.failure_window = failure_window
+        self.reset_timeout = reset_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._pools: Callable[[], dict[str, TransportPool]] = dict
+        self._health: dict[str, ServerHealth] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def bind(self, pools: Callable[[], dict[str, TransportPool]]) -> None:
+        """Set the callable returning the started server pools to supervise."""
+        self._pools = pools
+
+    def start(self) -> None:
+        """Start periodic health checks in a daemon thread, unless disabled."""
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="mcp-supervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the health check thread."""
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.ping_timeout + 1)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Run health checks until stopped."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check_now()
+            except Exception as e:
+                logger.warning(f"MCP health check failed: {e}")
+
+    def check_now(self) -> None:
+        """Ping every replica of every started server whose circuit lets traffic through."""
+        for server_name, pool in list(self._pools().items()):
+            if not self.allow(server_name):
+                continue
+
+            healthy = True
+            for replica in pool.replicas:
+                transport = replica.transport
+                if replica.restarting:
+                    continue
+                if not transport.is_alive():
+                    healthy = False
+                    self.handle_unhealthy(server_name, pool, transport, "Server process is not running")
+                elif not transport.ping(self.ping_timeout):
+                    healthy = False
+                    self.handle_unhealthy(server_name, pool, transport, "Server did not answer ping")
+
+            if healthy:
+                self.record_success(server_name)
+
+    def _get_health(self, server_name: str) -> ServerHealth:
+        """Get the health entry of a server; the lock must be held."""
+        return self._health.setdefault(server_name, ServerHealth())
+
+    def allow(self, server_name: str) -> bool:
+        """Check whether a call to a server may go through.
+
+        An open circuit becomes half-open once reset_timeout has passed, letting
+        calls through until the next success or failure decides its state.
+
+        Args:
+            server_name: Name of the MCP server.
+
+        Returns:
+            False while the server's circuit is open.
+        """
+        with self._lock:
+            health = self._health.get(server_name)
+            if health is None or health.state != CircuitState.OPEN:
+                return True
+            if time.monotonic() - health.opened_at < self.reset_timeout:
+                return False
+            health.state = CircuitState.HALF_OPEN
+        logger.info(f"Circuit of MCP server '{server_name}' is half-open, probing")
+        return True
+
+    def is_available(self, server_name: str) -> bool:
+        """Check whether a server's tools should be offered, without changing its state."""
+        with self._lock:
+            health = self._health.get(server_name)
+            if health is None or health.state != CircuitState.OPEN:
+                return True
+            return time.monotonic() - health.opened_at >= self.reset_timeout
+
+    def record_success(self, server_name: str) -> None:
+        """Record a successful call or health check, closing a half-open circuit."""
+        with self._lock:
+            health = self._health.get(server_name)
+            if health is None:
+                return
+            closed = health.state == CircuitState.HALF_OPEN
+            if closed:
+                health.state = CircuitState.CLOSED
+                health.failures.clear()
+            health.restart_attempts = 0
+            health.next_restart_at = 0.0
+        if closed:
+            logger.info(f"Circuit of MCP server '{server_name}' closed")
+
+    def record_failure(self, server_name: str, error: str) -> None:
+        """Record a failed call or health check, opening the circuit when the server flaps.
+
+        Args:
+            server_name: Name of the MCP server.
+            error: Description of the failure.
+        """
+        now = time.monotonic()
+        with self._lock:
+            health = self._get_health(server_name)
+            health.last_error = error
+            health.failures.append(now)
+            while health.failures and now - health.failures[0] > self.failure_window:
+                health.failures.popleft()
+
+            trip = health.state == CircuitState.HALF_OPEN or (
+                health.state == CircuitState.CLOSED and len(health.failures) >= self.failure_threshold
+            )
+            if trip:
+                health.state = CircuitState.OPEN
+                health.opened_at = now
+        if trip:
+            logger.warning(f"Circuit of MCP server '{server_name}' opened: {error}")
+
+    def handle_unhealthy(self, server_name: str, pool: TransportPool, transport: BaseTransport, error: str) -> None:
+        """Record a failure and restart the replica, unless its restart is still backing off.
+
+        Args:
+            server_name: Name of the MCP server.
+            pool: Pool the replica belongs to.
+            transport: Transport of the dead or unresponsive replica.
+            error: Description of the failure.
+        """
+        self.record_failure(server_name, error)
+
+        now = time.monotonic()
+        with self._lock:
+            health = self._get_health(server_name)
+            if now < health.next_restart_at:
+                return
+            health.restart_attempts += 1
+            health.restarts += 1
+            delay = min(self.backoff_base * 2 ** (health.restart_attempts - 1), self.backoff_max)
+            health.next_restart_at = now + delay
+
+        logger.warning(f"Restarting replica of MCP server '{server_name}': {error}")
+        pool.restart(transport)
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        """Get the circuit state of every server that has failed at least once.
+
+        Returns:
+            Dictionary mapping server names to state, recent failures, restarts and last error.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "state": str(health.state),
+                    "recent_failures": len(health.failures),
+                    "restarts": health.restarts,
+                    "last_error": health.last_error,
+                }
+                for name, health in self._health.items()
+            }
@@ -1,20 +1,47 @@
-from typing import Literal
+from typing import Any, Literal
 
+from .async_base import AsyncTransport
+from .async_http_stream import AsyncHTTPStreamTransport
+from .async_sse import AsyncSSETransport
 from .base import BaseTransport
 from .http_stream import HTTPStreamTransport
+from .inprocess import InProcessTransport
 from .sse import SSETransport
 from .stdio import StdioTransport
 
-__all__ = ["BaseTransport", "StdioTransport", "SSETransport", "HTTPStreamTransport"]
+__all__ = [
+    "BaseTransport",
+    "AsyncTransport",
+    "StdioTransport",
+    "SSETransport",
+    "HTTPStreamTransport",
+    "AsyncSSETransport",
+    "AsyncHTTPStreamTransport",
+    "InProcessTransport",
+]
 
 
-def create_transport(transport_type: Literal["stdio", "sse", "http_stream"]) -> BaseTransport:
-    """Factory function to create transport instances."""
+def create_transport(
+    transport_type: Literal["stdio", "sse", "http_stream", "async_sse", "async_http_stream", "inprocess"],
+    **options: Any,
+) -> BaseTransport:
+    """Factory function to create transport instances.
+
+    Args:
+        transport_type: Transport name from the server configuration.
+        **options: Constructor options, e.g. timeouts and pool limits for the async transports.
+    """
     if transport_type == "stdio":
-        return StdioTransport()
+        return StdioTransport(**options)
     elif transport_type == "sse":
-        return SSETransport()
+        return SSETransport(**options)
     elif transport_type == "http_stream":
-        return HTTPStreamTransport()
+        return HTTPStreamTransport(**options)
+    elif transport_type == "async_sse":
+        return AsyncSSETransport(**options)
+    elif transport_type == "async_http_stream":
+        return AsyncHTTPStreamTransport(**options)
+    elif transport_type == "inprocess":
+        return InProcessTransport(**options)
     else:
         raise ValueError(f"Unsupported transport type: {transport_type}")
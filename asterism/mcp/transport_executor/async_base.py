@@ -0,0 +1,168 @@
+import abc
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from .base import BaseTransport
+
+T = TypeVar("T")
+
+_transport_loop: asyncio.AbstractEventLoop | None = None
+_transport_loop_lock = threading.Lock()
+
+
+def get_transport_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop shared by all async transports.
+
+    The loop runs forever in a daemon thread and is started on first use.
+
+    Returns:
+        The shared event loop.
+    """
+    global _transport_loop
+    with _transport_loop_lock:
+        if _transport_loop is None or _transport_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="mcp-async-transports", daemon=True).start()
+            _transport_loop = loop
+        return _transport_loop
+
+
+class AsyncTransport(BaseTransport):
+    """Base class for MCP transports implemented with asyncio.
+
+    Subclasses implement the coroutine hooks. Every coroutine runs on one
+    background event loop that owns the pooled HTTP clients. The synchronous
+    BaseTransport methods block on that loop, so the transport works with the
+    synchronous executor, while the ``a``-prefixed methods can be awaited from
+    any other event loop without blocking it.
+    """
+
+    @abc.abstractmethod
+    async def _astart(self, command: str, args: list[str], cwd: str | None = None) -> None:
+        """Open the connection and perform the MCP handshake."""
+        pass
+
+    @abc.abstractmethod
+    async def _astop(self) -> None:
+        """Close the connection and release pooled resources."""
+        pass
+
+    @abc.abstractmethod
+    async def _aexecute_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Execute a tool and return the parsed result.
+
+        Raises TimeoutError, after cancelling the request on the server, when
+        no result arrives within timeout seconds (the transport default if None).
+        """
+        pass
+
+    @abc.abstractmethod
+    async def _aget_tool_schemas(self) -> list[dict[str, Any]]:
+        """Fetch tool schemas with tools/list."""
+        pass
+
+    async def _aping(self, timeout: float | None = None) -> bool:
+        """Check the server answers an MCP ping; the default only checks is_alive()."""
+        return self.is_alive()
+
+    def _build_request(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Build a JSON-RPC request with a fresh id.
+
+        Ids are only allocated on the transport loop, so no lock is needed.
+        """
+        self._request_id += 1
+        request: dict[str, Any] = {"jsonrpc": "2.0", "method": method, "id": self._request_id}
+        if params is not None:
+            request["params"] = params
+        return request
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop the transport's coroutines run on; the shared transport loop by default."""
+        return get_transport_loop()
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the transport loop and block until it finishes."""
+        loop = self._get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError("Synchronous transport call made from the transport event loop; use the async API")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _await(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Await a coroutine on the transport loop from any event loop."""
+        loop = self._get_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    # Synchronous BaseTransport API
+
+    def start(self, command: str, args: list[str], cwd: str | None = None) -> None:
+        """Open the connection and perform the MCP handshake."""
+        self._run(self._astart(command, args, cwd))
+
+    def stop(self) -> None:
+        """Close the connection."""
+        self._run(self._astop())
+
+    def execute_tool(self, tool_name: str, **kwargs: Any) -> str | dict[str, Any]:
+        """Execute a tool on the MCP server."""
+        return self.call_tool(tool_name, kwargs)
+
+    def call_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Execute a tool, cancelling it on the server when the deadline passes."""
+        return self._run(self._aexecute_tool(tool_name, arguments, timeout))
+
+    def ping(self, timeout: float | None = None) -> bool:
+        """Check the server answers an MCP ping."""
+        return self._run(self._aping(timeout))
+
+    def list_tools(self) -> list[str]:
+        """List available tool names."""
+        return [tool["name"] for tool in self.get_tool_schemas()]
+
+    def get_tool_schemas(self) -> list[dict[str, Any]]:
+        """Get detailed tool information including schemas."""
+        return self._run(self._aget_tool_schemas())
+
+    # Awaitable API
+
+    async def astart(self, command: str, args: list[str], cwd: str | None = None) -> None:
+        """Awaitable counterpart of start()."""
+        await self._await(self._astart(command, args, cwd))
+
+    async def astop(self) -> None:
+        """Awaitable counterpart of stop()."""
+        await self._await(self._astop())
+
+    async def aexecute_tool(self, tool_name: str, **kwargs: Any) -> str | dict[str, Any]:
+        """Awaitable counterpart of execute_tool()."""
+        return await self.acall_tool(tool_name, kwargs)
+
+    async def acall_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Awaitable counterpart of call_tool()."""
+        return await self._await(self._aexecute_tool(tool_name, arguments, timeout))
+
+    async def aping(self, timeout: float | None = None) -> bool:
+        """Awaitable counterpart of ping()."""
+        return await self._await(self._aping(timeout))
+
+    async def alist_tools(self) -> list[str]:
+        """Awaitable counterpart of list_tools()."""
+        return [tool["name"] for tool in await self.aget_tool_schemas()]
+
+    async def aget_tool_schemas(self) -> list[dict[str, Any]]:
+        """Awaitable counterpart of get_tool_schemas()."""
+        return await self._await(self._aget_tool_schemas())
@@ -0,0 +1,226 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+
+from .async_base import AsyncTransport
+
+
+class AsyncHTTPStreamTransport(AsyncTransport):
+    """Asyncio transport for MCP servers using HTTP streaming.
+
+    Uses one pooled ``httpx.AsyncClient`` per server so JSON-RPC messages reuse
+    keep-alive connections, and many tool calls can be in flight at once.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        connect_timeout: float = 10.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            timeout: Per-call timeout in seconds for each HTTP request.
+            connect_timeout: Timeout in seconds for establishing a connection.
+            max_connections: Maximum concurrent connections in the pool.
+            max_keepalive_connections: Maximum idle connections kept alive.
+            keepalive_expiry: Seconds an idle connection is kept before closing.
+        """
+        self._client: httpx.AsyncClient | None = None
+        self._base_url: str | None = None
+        self._timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._request_id: int = 0
+        self._initialized: bool = False
+        self._session_id: str | None = None
+
+    async def _astart(self, command: str, args: list[str], cwd: str | None = None) -> None:
+        """Open the pooled client and perform the MCP handshake."""
+        if not args:
+            raise ValueError("HTTP transport requires server URL in args")
+
+        self._base_url = args[0].rstrip("/")
+        self._client = httpx.AsyncClient(timeout=self._timeout, limits=self._limits)
+
+        await self._initialize()
+
+    async def _initialize(self) -> None:
+        """Perform MCP initialization handshake over HTTP Stream."""
+        init_request = self._build_request(
+            "initialize",
+            {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "ai-agent", "version": "0.1.0"},
+            },
+        )
+
+        result = await self._send_message(init_request)
+        if "error" in result:
+            raise RuntimeError(f"MCP initialization failed: {result['error']}")
+        if not self._session_id:
+            raise RuntimeError("No session ID received from server")
+
+        self._initialized = True
+
+        await self._send_message({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    def _build_message_headers(self) -> dict[str, str]:
+        """Build HTTP headers for sending messages with session ID."""
+        headers = {
+            "Accept": "application/json, text/event-stream",
+            "Content-Type": "application/json",
+        }
+        if self._session_id:
+            headers["mcp-session-id"] = self._session_id
+        return headers
+
+    async def _send_message(self, message: dict[str, Any], timeout: float | None = None) -> dict[str, Any]:
+        """Send a JSON-RPC message via HTTP POST and return the matching response.
+
+        When a request gets no response within the timeout it is cancelled on
+        the server with notifications/cancelled and TimeoutError is raised.
+        """
+        if not self._client or not self._base_url:
+            raise RuntimeError("HTTP transport not connected")
+
+        try:
+            return await asyncio.wait_for(self._exchange(message, timeout), timeout)
+        except (TimeoutError, httpx.TimeoutException):
+            if "id" not in message:
+                return {}
+
+        if timeout is None:
+            timeout = self._timeout.read
+        await self._send_message(self._build_cancel_notification(message["id"], f"Timed out after {timeout}s"))
+        raise TimeoutError(f"Request {message['method']} timed out after {timeout}s")
+
+    async def _exchange(self, message: dict[str, Any], timeout: float | None = None) -> dict[str, Any]:
+        """POST one message and read its response, with the client timeout or a per-call one."""
+        request_timeout = self._timeout if timeout is None else httpx.Timeout(timeout, connect=self._timeout.connect)
+        try:
+            async with self._client.stream(
+                "POST",
+                f"{self._base_url}/mcp",
+                json=message,
+                headers=self._build_message_headers(),
+                timeout=request_timeout,
+            ) as response:
+                if response.is_error:
+                    body = await response.aread()
+                    return {"error": f"HTTP error {response.status_code}: {body.decode('utf-8', 'replace')}"}
+
+                session_id = response.headers.get("mcp-session-id")
+                if session_id:
+                    self._session_id = session_id
+
+                # Notifications have no id and get no JSON-RPC response
+                if "id" not in message:
+                    return {}
+
+                if response.headers.get("content-type", "").startswith("application/json"):
+                    return self._match_response(json.loads(await response.aread()), message["id"])
+
+                return await self._parse_event_stream(response, message["id"])
+
+        except httpx.TimeoutException:
+            raise
+        except httpx.HTTPError as e:
+            return {"error": f"Request failed: {str(e)}"}
+
+    async def _parse_event_stream(self, response: httpx.Response, request_id: int) -> dict[str, Any]:
+        """Read SSE events until the response for request_id arrives."""
+        data_lines: list[str] = []
+        async for line in response.aiter_lines():
+            if line.startswith("data:"):
+                data_lines.append(line[5:].lstrip(" "))
+                continue
+            if line or not data_lines:
+                continue
+
+            # Blank line ends the event
+            try:
+                result = self._match_response(json.loads("\n".join(data_lines)), request_id)
+            except json.JSONDecodeError:
+                result = {}
+            data_lines = []
+            if result:
+                return result
+
+        if data_lines:
+            try:
+                return self._match_response(json.loads("\n".join(data_lines)), request_id)
+            except json.JSONDecodeError:
+                pass
+        return {"error": "No response received from server"}
+
+    def _match_response(self, data: Any, request_id: int) -> dict[str, Any]:
+        """Return the JSON-RPC response for request_id from a message or batch."""
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and "method" not in item and item.get("id") == request_id:
+                return item
+        return {}
+
+    async def _astop(self) -> None:
+        """Terminate the MCP session and close the pooled client."""
+        if self._client:
+            if self._session_id and self._base_url:
+                try:
+                    await self._client.delete(f"{self._base_url}/mcp", headers=self._build_message_headers())
+                except httpx.HTTPError:
+                    pass  # Session termination is best effort
+            await self._client.aclose()
+            self._client = None
+        self._base_url = None
+        self._session_id = None
+        self._initialized = False
+
+    async def _aexecute_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Execute a tool via MCP protocol over HTTP streaming."""
+        if not self.is_alive():
+            raise RuntimeError("HTTP transport is not connected")
+
+        if not self._initialized:
+            raise RuntimeError("MCP server not initialized")
+
+        request = self._build_request("tools/call", {"name": tool_name, "arguments": arguments or {}})
+        response = await self._send_message(request, timeout)
+
+        return self._decode_tool_result(response)
+
+    async def _aping(self, timeout: float | None = None) -> bool:
+        """Check the server answers an MCP ping."""
+        if not self.is_alive() or not self._initialized:
+            return False
+        try:
+            return "error" not in await self._send_message(self._build_request("ping"), timeout)
+        except Exception:
+            return False
+
+    async def _aget_tool_schemas(self) -> list[dict[str, Any]]:
+        """Get detailed tool information including schemas."""
+        if not self.is_alive() or not self._initialized:
+            raise RuntimeError("MCP server not initialized")
+
+        response = await self._send_message(self._build_request("tools/list"))
+
+        if "error" in response:
+            raise RuntimeError(f"Failed to list tools: {response['error']}")
+
+        return response.get("result", {}).get("tools", [])
+
+    def is_alive(self) -> bool:
+        """Check if the HTTP client is open."""
+        return self._client is not None and self._base_url is not None
@@ -0,0 +1,249 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+import httpx
+
+from .async_base import AsyncTransport
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSSETransport(AsyncTransport):
+    """Asyncio transport for MCP servers using Server-Sent Events (SSE).
+
+    A listener task reads the SSE stream and resolves the future registered
+    for each request id, so concurrent calls share one stream and one pooled
+    ``httpx.AsyncClient``.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        connect_timeout: float = 10.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            timeout: Per-call timeout in seconds, covering the POST and the wait for the response event.
+            connect_timeout: Timeout in seconds for establishing a connection.
+            max_connections: Maximum concurrent connections in the pool.
+            max_keepalive_connections: Maximum idle connections kept alive.
+            keepalive_expiry: Seconds an idle connection is kept before closing.
+        """
+        self._client: httpx.AsyncClient | None = None
+        self._base_url: str | None = None
+        self._call_timeout = timeout
+        self._timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._request_id: int = 0
+        self._initialized: bool = False
+        self._message_endpoint: str | None = None
+        self._endpoint_ready: asyncio.Event | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._listener: asyncio.Task | None = None
+
+    async def _astart(self, command: str, args: list[str], cwd: str | None = None) -> None:
+        """Open the SSE stream and perform the MCP handshake."""
+        if not args:
+            raise ValueError("SSE transport requires server URL in args")
+
+        self._base_url = args[0].rstrip("/")
+        self._client = httpx.AsyncClient(timeout=self._timeout, limits=self._limits)
+        self._endpoint_ready = asyncio.Event()
+        self._listener = asyncio.create_task(self._listen_sse(f"{self._base_url}/sse"))
+
+        try:
+            await asyncio.wait_for(self._endpoint_ready.wait(), self._call_timeout)
+        except TimeoutError:
+            pass
+        if not self._message_endpoint:
+            await self._astop()
+            raise RuntimeError("Failed to get message endpoint from SSE")
+
+        await self._initialize()
+
+    async def _initialize(self) -> None:
+        """Perform MCP initialization handshake over SSE."""
+        init_request = self._build_request(
+            "initialize",
+            {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "ai-agent", "version": "0.1.0"},
+            },
+        )
+
+        result = await self._send_request(init_request)
+        if "error" in result:
+            raise RuntimeError(f"MCP initialization failed: {result['error']}")
+
+        self._initialized = True
+
+        await self._send_message({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    def _build_full_endpoint(self, endpoint: str) -> str:
+        """Build full endpoint URL from relative or absolute path."""
+        if endpoint.startswith("http"):
+            return endpoint
+        return f"{self._base_url}{endpoint}"
+
+    async def _listen_sse(self, sse_url: str) -> None:
+        """Read SSE events and dispatch them until the stream closes."""
+        try:
+            # The stream stays open for the life of the transport, so it has no read timeout
+            stream_timeout = httpx.Timeout(None, connect=self._timeout.connect)
+            async with self._client.stream("GET", sse_url, timeout=stream_timeout) as response:
+                response.raise_for_status()
+                event, data_lines = "message", []
+                async for line in response.aiter_lines():
+                    if not line:
+                        if data_lines:
+                            self._dispatch_event(event, "\n".join(data_lines))
+                        event, data_lines = "message", []
+                    elif line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        data_lines.append(line[5:].lstrip(" "))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"SSE listener stopped: {e}")
+        finally:
+            self._fail_pending(RuntimeError("SSE stream closed"))
+            if self._endpoint_ready:
+                self._endpoint_ready.set()
+
+    def _dispatch_event(self, event: str, data: str) -> None:
+        """Handle one SSE event: the endpoint announcement or a JSON-RPC message."""
+        if event == "endpoint" or (self._message_endpoint is None and data.startswith("/")):
+            self._message_endpoint = self._build_full_endpoint(data)
+            self._endpoint_ready.set()
+            return
+
+        try:
+            message = json.loads(data)
+        except json.JSONDecodeError:
+            logger.debug(f"Ignoring non JSON-RPC SSE data: {data[:200]}")
+            return
+
+        for item in message if isinstance(message, list) else [message]:
+            if not isinstance(item, dict) or "method" in item:
+                continue
+            future = self._pending.pop(item.get("id"), None)
+            if future and not future.done():
+                future.set_result(item)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight request with the given error."""
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _post(self, message: dict[str, Any]) -> httpx.Response:
+        """POST a JSON-RPC message to the message endpoint."""
+        if not self._client or not self._message_endpoint:
+            raise RuntimeError("SSE transport not connected")
+        return await self._client.post(self._message_endpoint, json=message)
+
+    async def _send_message(self, message: dict[str, Any]) -> None:
+        """Send a JSON-RPC notification (no response expected)."""
+        try:
+            await self._post(message)
+        except httpx.HTTPError:
+            pass  # Notifications don't wait for response
+
+    async def _send_request(self, message: dict[str, Any], timeout: float | None = None) -> dict[str, Any]:
+        """Send a JSON-RPC request and wait for the response event with its id.
+
+        When no response arrives within the timeout the request is cancelled on
+        the server with notifications/cancelled and TimeoutError is raised.
+        """
+        request_id = message["id"]
+        if timeout is None:
+            timeout = self._call_timeout
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        try:
+            response = await self._post(message)
+            if response.is_error:
+                return {"error": f"HTTP error {response.status_code}: {response.text}"}
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            pass
+        except (httpx.HTTPError, RuntimeError) as e:
+            return {"error": f"Request failed: {str(e)}"}
+        finally:
+            self._pending.pop(request_id, None)
+
+        await self._send_message(self._build_cancel_notification(request_id, f"Timed out after {timeout}s"))
+        raise TimeoutError(f"Request {message['method']} timed out after {timeout}s")
+
+    async def _astop(self) -> None:
+        """Close the SSE stream and the pooled client."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+        self._fail_pending(RuntimeError("SSE transport was stopped"))
+        self._base_url = None
+        self._message_endpoint = None
+        self._initialized = False
+
+    async def _aexecute_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Execute a tool via MCP protocol over SSE."""
+        if not self.is_alive():
+            raise RuntimeError("SSE transport is not connected")
+
+        if not self._initialized:
+            raise RuntimeError("MCP server not initialized")
+
+        request = self._build_request("tools/call", {"name": tool_name, "arguments": arguments or {}})
+        response = await self._send_request(request, timeout)
+
+        return self._decode_tool_result(response)
+
+    async def _aping(self, timeout: float | None = None) -> bool:
+        """Check the server answers an MCP ping."""
+        if not self.is_alive() or not self._initialized:
+            return False
+        try:
+            return "error" not in await self._send_request(self._build_request("ping"), timeout)
+        except Exception:
+            return False
+
+    async def _aget_tool_schemas(self) -> list[dict[str, Any]]:
+        """Get detailed tool information including schemas."""
+        if not self.is_alive() or not self._initialized:
+            raise RuntimeError("MCP server not initialized")
+
+        response = await self._send_request(self._build_request("tools/list"))
+
+        if "error" in response:
+            raise RuntimeError(f"Failed to list tools: {response['error']}")
+
+        return response.get("result", {}).get("tools", [])
+
+    def is_alive(self) -> bool:
+        """Check if the SSE stream is open."""
+        return self._client is not None and self._listener is not None and not self._listener.done()
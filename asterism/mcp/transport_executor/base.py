@@ -1,6 +1,29 @@
 import abc
+import ast
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any
 
+# Tool output longer than this many characters is not tried as a Python literal
+LITERAL_EVAL_MAX_CHARS = 64 * 1024
+
+# Worker threads shared by the deadline calls of transports that cannot cancel a request
+DEADLINE_MAX_WORKERS = 16
+
+_deadline_executor: ThreadPoolExecutor | None = None
+_deadline_executor_lock = threading.Lock()
+
+
+def _get_deadline_executor() -> ThreadPoolExecutor:
+    """Get the worker pool running deadline calls, created on first use."""
+    global _deadline_executor
+    with _deadline_executor_lock:
+        if _deadline_executor is None:
+            _deadline_executor = ThreadPoolExecutor(max_workers=DEADLINE_MAX_WORKERS, thread_name_prefix="mcp-call")
+        return _deadline_executor
+
 
 class BaseTransport(abc.ABC):
     """Abstract base class for MCP server transports."""
@@ -34,6 +57,161 @@ class BaseTransport(abc.ABC):
         """
         pass
 
+    def call_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Execute a tool with a deadline.
+
+        Transports that can cancel a request on the server override this. The
+        default runs execute_tool() on a pool of DEADLINE_MAX_WORKERS threads
+        shared by all transports and stops waiting once the deadline has passed.
+        It does not cancel the work: a call that already started keeps its
+        worker until execute_tool() returns, for example when the transport is
+        stopped. While every worker is busy, new calls queue and time out
+        without running.
+
+        Args:
+            tool_name: Name of the tool to execute
+            arguments: Tool-specific arguments
+            timeout: Seconds to wait for the result, or None for the transport default
+
+        Returns:
+            Dictionary containing the execution result
+
+        Raises:
+            TimeoutError: If the tool did not finish within timeout seconds
+        """
+        if timeout is None:
+            return self.execute_tool(tool_name, **arguments)
+
+        future = _get_deadline_executor().submit(lambda: self.execute_tool(tool_name, **arguments))
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            # Drops the call if it is still queued; a running call cannot be interrupted
+            future.cancel()
+            raise TimeoutError(f"Tool '{tool_name}' timed out after {timeout}s") from None
+
+    def call_tools(self, calls: list[tuple[str, dict[str, Any]]], timeout: float | None = None) -> list[Any]:
+        """Execute several tools at once.
+
+        Transports that support JSON-RPC batches override this to send every
+        call in one message. The default pipelines the calls: each is issued
+        from its own worker thread, so transports that multiplex requests over
+        one connection have all of them in flight together.
+
+        Args:
+            calls: (tool name, arguments) pairs
+            timeout: Seconds to wait for each result, or None for the transport default
+
+        Returns:
+            Results in call order; a call that failed has the exception it raised in place of its result
+        """
+        with ThreadPoolExecutor(max_workers=max(1, len(calls)), thread_name_prefix="mcp-pipeline") as pipeline:
+            futures = [pipeline.submit(self.call_tool, name, arguments, timeout) for name, arguments in calls]
+        return [future.exception() or future.result() for future in futures]
+
+    def _decode_tool_result(self, response: dict[str, Any]) -> Any:
+        """Decode the JSON-RPC response of a tools/call request.
+
+        Every transport returns tool results in this shape: the tool's
+        ``structuredContent`` when it sent one, otherwise its text content
+        parsed as JSON (or a Python literal) when possible and the raw text
+        when not. Non-text blocks (images, audio, resources) are returned as
+        ``{"text": ..., "content": [blocks]}`` so they are not dropped.
+
+        Args:
+            response: The JSON-RPC response
+
+        Returns:
+            The decoded result; an empty dict if the tool returned no content
+
+        Raises:
+            RuntimeError: If the response is a JSON-RPC error or the tool reported an error
+        """
+        if "error" in response:
+            raise RuntimeError(f"Tool execution failed: {response['error']}")
+
+        result = response.get("result") or {}
+        contents = result.get("content") or []
+
+        if result.get("isError"):
+            text = self._extract_text_content(contents)
+            raise RuntimeError(f"Tool reported an error: {text or 'no details'}")
+
+        structured = result.get("structuredContent")
+        if isinstance(structured, dict):
+            # FastMCP wraps outputs that are not objects as {"result": value}
+            if structured.keys() == {"result"} and not isinstance(structured["result"], dict):
+                return structured["result"]
+            return structured
+
+        if not contents:
+            return {}
+
+        text = self._extract_text_content(contents)
+        blocks = [item for item in contents if item.get("type") != "text"]
+        if not blocks:
+            return self._parse_tool_output(text)
+
+        decoded: dict[str, Any] = {"content": blocks}
+        if text:
+            decoded["text"] = text
+        return decoded
+
+    def _extract_text_content(self, contents: list[dict[str, Any]]) -> str:
+        """Join the text of all text content blocks."""
+        return "".join(item.get("text", "") for item in contents if item.get("type") == "text")
+
+    def _parse_tool_output(self, text: str) -> Any:
+        """Parse tool output text as JSON, falling back to a Python literal, then to the text itself."""
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+
+        # Some tools print Python reprs (single quotes); only containers are worth trying, and large
+        # inputs are kept as text because literal_eval is slow and recursive on them
+        stripped = text.strip()
+        if stripped[:1] in ("{", "[", "(") and len(stripped) <= LITERAL_EVAL_MAX_CHARS:
+            try:
+                return ast.literal_eval(stripped)
+            except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+                pass
+        return text
+
+    def _build_cancel_notification(self, request_id: int, reason: str) -> dict[str, Any]:
+        """Build the notification telling the server to abandon a request."""
+        return {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": request_id, "reason": reason},
+        }
+
+    def ping(self, timeout: float | None = None) -> bool:
+        """Check that the server responds.
+
+        Transports speaking JSON-RPC send an MCP ping; the default only checks is_alive().
+
+        Args:
+            timeout: Seconds to wait for the answer (optional)
+
+        Returns:
+            True if the server answered
+        """
+        return self.is_alive()
+
+    def get_stderr(self, max_lines: int | None = None) -> str:
+        """Get recent diagnostic output of the server, for transports that capture it.
+
+        Args:
+            max_lines: Only return the last max_lines lines (optional)
+
+        Returns:
+            The captured output, or an empty string
+        """
+        return ""
+
     @abc.abstractmethod
     def list_tools(self) -> list[str]:
         """List available tools from the MCP server.
@@ -1,23 +1,38 @@
 import json
+import logging
+import threading
 from typing import Any
 
 import requests
+from urllib3.exceptions import ReadTimeoutError
 
 from .base import BaseTransport
 
+logger = logging.getLogger(__name__)
+
 
 class HTTPStreamTransport(BaseTransport):
     """Transport for MCP servers using HTTP streaming."""
 
-    def __init__(self):
+    def __init__(self, batch: bool = False):
+        """
+        Initialize the transport.
+
+        Args:
+            batch: Send concurrent tool calls as one JSON-RPC batch; servers that
+                reject batches are detected and called one request at a time.
+        """
+        self._batch = batch
         self._session: requests.Session | None = None
         self._base_url: str | None = None
         self._timeout: int = 30
         self._request_id: int = 0
+        # Calls are pipelined from several threads, so ids are allocated under a lock
+        self._id_lock = threading.Lock()
         self._initialized: bool = False
         self._session_id: str | None = None
 
-    def start(self, command: str, args: list[str]) -> None:
+    def start(self, command: str, args: list[str], cwd: str | None = None) -> None:
         """Initialize HTTP session with base URL."""
         if not args:
             raise ValueError("HTTP transport requires server URL in args")
@@ -34,8 +49,7 @@ class HTTPStreamTransport(BaseTransport):
         headers = self._build_request_headers()
 
         # Send initialize request
-        self._request_id += 1
-        init_request = self._build_init_request()
+        init_request = self._build_init_request(self._next_request_id())
 
         try:
             response = self._session.post(
@@ -67,7 +81,13 @@ class HTTPStreamTransport(BaseTransport):
         # Send initialized notification
         self._send_initialized_notification()
 
-    def _build_init_request(self) -> dict[str, Any]:
+    def _next_request_id(self) -> int:
+        """Allocate a JSON-RPC request id."""
+        with self._id_lock:
+            self._request_id += 1
+            return self._request_id
+
+    def _build_init_request(self, request_id: int) -> dict[str, Any]:
         """Build the MCP initialize request payload."""
         return {
             "jsonrpc": "2.0",
@@ -77,7 +97,7 @@ class HTTPStreamTransport(BaseTransport):
                 "capabilities": {},
                 "clientInfo": {"name": "ai-agent", "version": "0.1.0"},
             },
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _build_request_headers(self) -> dict[str, str]:
@@ -101,7 +121,12 @@ class HTTPStreamTransport(BaseTransport):
 
     def _parse_stream_response(self, response: requests.Response) -> dict[str, Any]:
         """Parse SSE-formatted streaming response."""
-        result = {}
+        messages = self._parse_stream_messages(response)
+        return messages[-1] if messages else {}
+
+    def _parse_stream_messages(self, response: requests.Response) -> list[dict[str, Any]]:
+        """Parse every JSON-RPC message of a streaming response, flattening batch responses."""
+        messages = []
         for chunk in response.iter_lines():
             if chunk:
                 try:
@@ -115,20 +140,34 @@ class HTTPStreamTransport(BaseTransport):
                     # Try to parse JSON
                     data = json.loads(line)
                     if isinstance(data, dict):
-                        result = data
+                        messages.append(data)
+                    elif isinstance(data, list):
+                        messages.extend(item for item in data if isinstance(item, dict))
                 except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
-        return result
+        return messages
+
+    def _send_message(self, message: dict[str, Any], timeout: float | None = None) -> dict[str, Any]:
+        """Send a JSON-RPC message via HTTP POST with streaming.
 
-    def _send_message(self, message: dict[str, Any]) -> dict[str, Any]:
-        """Send a JSON-RPC message via HTTP POST with streaming."""
+        When a request gets no response within the timeout it is cancelled on
+        the server with notifications/cancelled and TimeoutError is raised.
+        """
         if not self._session or not self._base_url:
             raise RuntimeError("HTTP transport not connected")
 
         url = f"{self._base_url}/mcp"
         headers = self._build_message_headers()
+        if timeout is None:
+            timeout = self._timeout
 
-        return self._post_request(url, headers, message)
+        try:
+            return self._post_request(url, headers, message, timeout)
+        except TimeoutError:
+            if "id" not in message:
+                return {}
+            self._send_message(self._build_cancel_notification(message["id"], f"Timed out after {timeout}s"))
+            raise TimeoutError(f"Request {message['method']} timed out after {timeout}s") from None
 
     def _build_message_headers(self) -> dict[str, str]:
         """Build HTTP headers for sending messages with session ID."""
@@ -138,7 +177,9 @@ class HTTPStreamTransport(BaseTransport):
             "mcp-session-id": self._session_id or "",
         }
 
-    def _post_request(self, url: str, headers: dict[str, str], message: dict[str, Any]) -> dict[str, Any]:
+    def _post_request(
+        self, url: str, headers: dict[str, str], message: dict[str, Any], timeout: float | None = None
+    ) -> dict[str, Any]:
         """Execute HTTP POST request and parse response."""
         try:
             with self._session.post(
@@ -146,16 +187,66 @@ class HTTPStreamTransport(BaseTransport):
                 json=message,
                 headers=headers,
                 stream=True,
-                timeout=self._timeout,
+                timeout=timeout or self._timeout,
             ) as response:
                 if not response.ok:
                     return {"error": f"HTTP error {response.status_code}: {response.text}"}
 
                 return self._parse_stream_response(response)
 
+        except (requests.ReadTimeout, requests.ConnectionError) as e:
+            if self._is_read_timeout(e):
+                raise TimeoutError(str(e)) from e
+            return {"error": f"Request failed: {str(e)}"}
         except requests.RequestException as e:
             return {"error": f"Request failed: {str(e)}"}
 
+    def _post_batch(self, messages: list[dict[str, Any]], timeout: float | None = None) -> list[dict[str, Any]] | None:
+        """POST a JSON-RPC batch and parse the responses.
+
+        Returns:
+            The response messages, or None if the server does not accept batches.
+
+        Raises:
+            TimeoutError: If the responses did not arrive within timeout seconds.
+            RuntimeError: If the request failed.
+        """
+        if not self._session or not self._base_url:
+            raise RuntimeError("HTTP transport not connected")
+
+        try:
+            with self._session.post(
+                f"{self._base_url}/mcp",
+                json=messages,
+                headers=self._build_message_headers(),
+                stream=True,
+                timeout=timeout or self._timeout,
+            ) as response:
+                if 400 <= response.status_code < 500:
+                    return None
+                if not response.ok:
+                    raise RuntimeError(f"HTTP error {response.status_code}: {response.text}")
+                responses = self._parse_stream_messages(response)
+        except (requests.ReadTimeout, requests.ConnectionError) as e:
+            if self._is_read_timeout(e):
+                raise TimeoutError(str(e)) from e
+            raise RuntimeError(f"Request failed: {str(e)}") from e
+        except requests.RequestException as e:
+            raise RuntimeError(f"Request failed: {str(e)}") from e
+
+        # A lone error without an id means the server rejected the batch itself
+        if len(responses) == 1 and responses[0].get("id") is None and "error" in responses[0]:
+            return None
+        return responses
+
+    @staticmethod
+    def _is_read_timeout(error: requests.RequestException) -> bool:
+        """Check whether a requests error is a read timeout."""
+        # requests reports a read timeout while streaming the body as a ConnectionError
+        return isinstance(error, requests.ReadTimeout) or bool(
+            error.args and isinstance(error.args[0], ReadTimeoutError)
+        )
+
     def stop(self) -> None:
         """Close HTTP session."""
         if self._session:
@@ -165,66 +256,96 @@ class HTTPStreamTransport(BaseTransport):
         self._session_id = None
         self._initialized = False
 
-    def execute_tool(self, tool_name: str, **kwargs: Any) -> dict[str, Any]:
+    def execute_tool(self, tool_name: str, **kwargs: Any) -> str | dict[str, Any]:
         """Execute a tool via MCP protocol over HTTP streaming."""
+        return self.call_tool(tool_name, kwargs)
+
+    def call_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Execute a tool, cancelling it on the server when the deadline passes."""
         if not self.is_alive():
             raise RuntimeError("HTTP transport is not connected")
 
         if not self._initialized:
             raise RuntimeError("MCP server not initialized")
 
-        self._request_id += 1
-        request = self._build_tool_request(tool_name, kwargs)
+        request = self._build_tool_request(self._next_request_id(), tool_name, arguments)
 
-        response = self._send_message(request)
+        response = self._send_message(request, timeout)
 
-        if "error" in response:
-            return {"success": False, "error": response["error"]}
+        return self._decode_tool_result(response)
+
+    def call_tools(self, calls: list[tuple[str, dict[str, Any]]], timeout: float | None = None) -> list[Any]:
+        """Execute several tools, as one JSON-RPC batch when batching is enabled.
+
+        A server that rejects the batch is remembered and the calls are
+        pipelined as individual requests instead.
+        """
+        if not self._batch or len(calls) < 2:
+            return super().call_tools(calls, timeout)
+
+        if not self.is_alive():
+            raise RuntimeError("HTTP transport is not connected")
+
+        if not self._initialized:
+            raise RuntimeError("MCP server not initialized")
+
+        requests_batch = []
+        for tool_name, arguments in calls:
+            requests_batch.append(self._build_tool_request(self._next_request_id(), tool_name, arguments))
 
-        return self._parse_tool_result(response)
+        try:
+            responses = self._post_batch(requests_batch, timeout)
+        except TimeoutError:
+            timeout = timeout or self._timeout
+            for request in requests_batch:
+                self._send_message(self._build_cancel_notification(request["id"], f"Timed out after {timeout}s"))
+            return [TimeoutError(f"Request tools/call timed out after {timeout}s") for _ in calls]
+
+        if responses is None:
+            logger.info(f"MCP server at {self._base_url} does not accept JSON-RPC batches, pipelining calls instead")
+            self._batch = False
+            return super().call_tools(calls, timeout)
+
+        by_id = {response.get("id"): response for response in responses}
+        results: list[Any] = []
+        for (tool_name, _), request in zip(calls, requests_batch, strict=True):
+            response = by_id.get(request["id"])
+            if response is None:
+                results.append(RuntimeError(f"No response to batched call of tool '{tool_name}'"))
+            else:
+                try:
+                    results.append(self._decode_tool_result(response))
+                except RuntimeError as e:
+                    results.append(e)
+        return results
 
-    def _build_tool_request(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    def _build_tool_request(self, request_id: int, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Build the JSON-RPC request for tool execution."""
         return {
             "jsonrpc": "2.0",
             "method": "tools/call",
             "params": {"name": tool_name, "arguments": arguments or {}},
-            "id": self._request_id,
+            "id": request_id,
         }
 
-    def _parse_tool_result(self, response: dict[str, Any]) -> dict[str, Any]:
-        """Parse tool execution result from response."""
-        result = response.get("result", {})
-        contents = result.get("content", [])
-
-        if not contents:
-            return {"success": True, "result": {}}
-
-        # Aggregate text from all content blocks
-        text = self._extract_text_content(contents)
-
+    def ping(self, timeout: float | None = None) -> bool:
+        """Check the server answers an MCP ping."""
+        if not self.is_alive() or not self._initialized:
+            return False
+        request = {"jsonrpc": "2.0", "method": "ping", "id": self._next_request_id()}
         try:
-            parsed_result = json.loads(text) if text else {}
-        except json.JSONDecodeError:
-            parsed_result = {"text": text}
-
-        return {"success": True, "result": parsed_result}
-
-    def _extract_text_content(self, contents: list[dict[str, Any]]) -> str:
-        """Extract and aggregate text from content blocks."""
-        text = ""
-        for item in contents:
-            if item.get("type") == "text":
-                text += item.get("text", "")
-        return text
+            return "error" not in self._send_message(request, timeout)
+        except Exception:
+            return False
 
     def list_tools(self) -> list[str]:
         """List available tools via MCP protocol."""
         if not self.is_alive() or not self._initialized:
             return []
 
-        self._request_id += 1
-        request = self._build_list_tools_request()
+        request = self._build_list_tools_request(self._next_request_id())
 
         response = self._send_message(request)
 
@@ -233,12 +354,12 @@ class HTTPStreamTransport(BaseTransport):
 
         return self._parse_tools_response(response)
 
-    def _build_list_tools_request(self) -> dict[str, Any]:
+    def _build_list_tools_request(self, request_id: int) -> dict[str, Any]:
         """Build the JSON-RPC request for listing tools."""
         return {
             "jsonrpc": "2.0",
             "method": "tools/list",
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _parse_tools_response(self, response: dict[str, Any]) -> list[str]:
@@ -252,17 +373,19 @@ class HTTPStreamTransport(BaseTransport):
 
         Returns:
             List of tool schema dictionaries with name, description, and inputSchema.
+
+        Raises:
+            RuntimeError: If the server is not running or the tools/list request failed
         """
         if not self.is_alive() or not self._initialized:
-            return []
+            raise RuntimeError("MCP server not initialized")
 
-        self._request_id += 1
-        request = self._build_list_tools_request()
+        request = self._build_list_tools_request(self._next_request_id())
 
         response = self._send_message(request)
 
         if "error" in response:
-            return []
+            raise RuntimeError(f"Failed to list tools: {response['error']}")
 
         result = response.get("result", {})
         return result.get("tools", [])
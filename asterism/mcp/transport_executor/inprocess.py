@@ -0,0 +1,156 @@
+import asyncio
+import importlib
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+from .async_base import AsyncTransport
+
+# Seconds the session task gets to close the client session before it is cancelled
+SESSION_CLOSE_TIMEOUT = 5.0
+
+
+class InProcessTransport(AsyncTransport):
+    """Transport for Python FastMCP servers imported into this process.
+
+    ``args[0]`` names the server object as ``"module:attribute"`` and ``cwd``
+    is put on ``sys.path`` for the import. Tools are called through fastmcp's
+    in-memory client session, so no process is spawned and no message goes
+    through a pipe. Each transport runs its session on its own event loop
+    thread, so a server whose tools block cannot stall other transports.
+    """
+
+    def __init__(self, timeout: float | None = 30.0):
+        """
+        Initialize the transport.
+
+        Args:
+            timeout: Per-call timeout in seconds; None waits for every call to finish.
+        """
+        self._timeout = timeout
+        self._client: Any = None
+        self._session_task: asyncio.Task | None = None
+        self._closing: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the transport's own event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="mcp-inprocess", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def _stop_loop(self) -> None:
+        """Stop the transport's event loop thread."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    @staticmethod
+    def _load_server(target: str, cwd: str | None = None) -> Any:
+        """Import the server object named by a "module:attribute" reference."""
+        module_name, _, attribute = target.partition(":")
+        if not module_name or not attribute:
+            raise ValueError(f"In-process transport expects 'module:object' in args, got '{target}'")
+
+        if cwd:
+            path = str(Path(cwd).resolve())
+            if path not in sys.path:
+                sys.path.insert(0, path)
+
+        server: Any = importlib.import_module(module_name)
+        for name in attribute.split("."):
+            server = getattr(server, name)
+        return server
+
+    async def _astart(self, command: str, args: list[str], cwd: str | None = None) -> None:
+        """Import the server and open an in-memory client session to it."""
+        if not args:
+            raise ValueError("In-process transport requires the server's 'module:object' in args")
+
+        from fastmcp import Client
+
+        client = Client(self._load_server(args[0], cwd))
+        ready = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._session_task = asyncio.create_task(self._run_session(client, ready))
+        await ready
+        self._client = client
+
+    async def _run_session(self, client: Any, ready: asyncio.Future) -> None:
+        """Hold the client session open until the transport stops.
+
+        The session is entered and exited in this one task, as the cancel
+        scopes of the underlying streams require.
+        """
+        try:
+            async with client:
+                ready.set_result(None)
+                await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+
+    async def _astop(self) -> None:
+        """Close the client session, cancelling its task if it does not finish in time."""
+        if self._closing is not None:
+            self._closing.set()
+        if self._session_task is not None:
+            await asyncio.wait({self._session_task}, timeout=SESSION_CLOSE_TIMEOUT)
+            self._session_task.cancel()
+            await asyncio.gather(self._session_task, return_exceptions=True)
+        self._session_task = None
+        self._closing = None
+        self._client = None
+
+    def _has_loop(self) -> bool:
+        """Check whether the transport's event loop thread was started and not stopped since."""
+        with self._loop_lock:
+            return self._loop is not None
+
+    def stop(self) -> None:
+        """Close the client session and stop the transport's event loop."""
+        # A transport that was never started, or is stopped already, has no loop to start just to stop it
+        if not self._has_loop():
+            return
+        super().stop()
+        self._stop_loop()
+
+    async def astop(self) -> None:
+        """Awaitable counterpart of stop()."""
+        if not self._has_loop():
+            return
+        await super().astop()
+        self._stop_loop()
+
+    async def _aexecute_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Call a tool through the in-memory session, cancelling it when the deadline passes."""
+        if not self.is_alive():
+            raise RuntimeError("In-process MCP server is not running")
+
+        if timeout is None:
+            timeout = self._timeout
+        try:
+            result = await asyncio.wait_for(self._client.call_tool_mcp(tool_name, arguments or {}), timeout)
+        except TimeoutError:
+            raise TimeoutError(f"Request tools/call timed out after {timeout}s") from None
+
+        return self._decode_tool_result({"result": result.model_dump(mode="json", by_alias=True, exclude_none=True)})
+
+    async def _aget_tool_schemas(self) -> list[dict[str, Any]]:
+        """Fetch tool schemas from the in-memory session."""
+        if not self.is_alive():
+            raise RuntimeError("MCP server not initialized")
+        tools = await self._client.list_tools()
+        return [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in tools]
+
+    def is_alive(self) -> bool:
+        """Check the client session is open."""
+        return self._client is not None and self._session_task is not None and not self._session_task.done()
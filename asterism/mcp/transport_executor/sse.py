@@ -1,15 +1,25 @@
 import json
-import queue
+import logging
+import socket
 import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any
 
 import requests
 
 from .base import BaseTransport
 
+logger = logging.getLogger(__name__)
+
 
 class SSETransport(BaseTransport):
-    """Transport for MCP servers using Server-Sent Events (SSE)."""
+    """Transport for MCP servers using Server-Sent Events (SSE).
+
+    A listener thread reads the SSE stream, signals when the message endpoint
+    has been announced, and resolves the future registered for each JSON-RPC
+    request id, so concurrent calls never consume each other's responses.
+    """
 
     def __init__(self):
         self._session: requests.Session | None = None
@@ -18,11 +28,15 @@ class SSETransport(BaseTransport):
         self._request_id: int = 0
         self._initialized: bool = False
         self._message_endpoint: str | None = None
-        self._response_queue: queue.Queue[dict[str, Any]] = queue.Queue()
+        self._endpoint_ready = threading.Event()
+        self._pending: dict[int, Future] = {}
+        self._pending_lock = threading.Lock()
         self._sse_thread: threading.Thread | None = None
+        self._sse_response: requests.Response | None = None
+        self._stream_error: Exception | None = None
         self._stop_event = threading.Event()
 
-    def start(self, command: str, args: list[str]) -> None:
+    def start(self, command: str, args: list[str], cwd: str | None = None) -> None:
         """Initialize SSE connection to server."""
         if not args:
             raise ValueError("SSE transport requires server URL in args")
@@ -35,49 +49,30 @@ class SSETransport(BaseTransport):
 
     def _initialize(self) -> None:
         """Perform MCP initialization handshake over SSE."""
-        # First, connect to SSE endpoint to get the message endpoint
-        sse_url = f"{self._base_url}/sse"
-        try:
-            # Start SSE listener thread first
-            self._stop_event.clear()
-            self._sse_thread = threading.Thread(target=self._listen_sse, args=(sse_url,))
-            self._sse_thread.daemon = True
-            self._sse_thread.start()
-
-            # Wait a bit for the connection to establish and get the endpoint
-            import time
-
-            time.sleep(0.5)
-
-            # The endpoint should have been extracted by the listener
-            if not self._message_endpoint:
-                self._extract_message_endpoint_fallback(sse_url)
-
-            if not self._message_endpoint:
-                raise RuntimeError("Failed to get message endpoint from SSE")
-
-        except requests.RequestException as e:
-            raise RuntimeError(f"SSE connection failed: {str(e)}") from e
+        # Start the SSE listener and wait until it announces the message endpoint
+        self._stop_event.clear()
+        self._endpoint_ready.clear()
+        self._stream_error = None
+        self._sse_thread = threading.Thread(target=self._listen_sse, args=(f"{self._base_url}/sse",))
+        self._sse_thread.daemon = True
+        self._sse_thread.start()
+
+        if not self._endpoint_ready.wait(self._timeout) or not self._message_endpoint:
+            if self._stream_error:
+                raise RuntimeError(f"SSE connection failed: {str(self._stream_error)}") from self._stream_error
+            raise RuntimeError("Failed to get message endpoint from SSE")
 
         # Send initialize request
-        self._request_id += 1
-        init_request = self._build_init_request()
+        init_request = self._build_init_request(self._next_request_id())
 
         result = self._send_request(init_request)
         self._handle_init_response(result)
 
-    def _extract_message_endpoint_fallback(self, sse_url: str) -> None:
-        """Fallback method to extract message endpoint directly."""
-        response = self._session.get(sse_url, stream=True, timeout=self._timeout)
-        if response.ok:
-            for line in response.iter_lines():
-                if line:
-                    line_str = line.decode("utf-8")
-                    if line_str.startswith("data: "):
-                        endpoint = line_str[6:]
-                        self._message_endpoint = self._build_full_endpoint(endpoint)
-                        break
-            response.close()
+    def _next_request_id(self) -> int:
+        """Allocate a JSON-RPC request id."""
+        with self._pending_lock:
+            self._request_id += 1
+            return self._request_id
 
     def _build_full_endpoint(self, endpoint: str) -> str:
         """Build full endpoint URL from relative or absolute path."""
@@ -85,7 +80,7 @@ class SSETransport(BaseTransport):
             return endpoint
         return f"{self._base_url}{endpoint}"
 
-    def _build_init_request(self) -> dict[str, Any]:
+    def _build_init_request(self, request_id: int) -> dict[str, Any]:
         """Build the MCP initialize request payload."""
         return {
             "jsonrpc": "2.0",
@@ -95,7 +90,7 @@ class SSETransport(BaseTransport):
                 "capabilities": {},
                 "clientInfo": {"name": "ai-agent", "version": "0.1.0"},
             },
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _handle_init_response(self, result: dict[str, Any]) -> None:
@@ -113,34 +108,72 @@ class SSETransport(BaseTransport):
         self._send_message(notification)
 
     def _listen_sse(self, sse_url: str) -> None:
-        """Listen for SSE events and put responses in queue."""
+        """Read SSE events and dispatch them until the stream closes."""
         try:
-            with self._session.get(sse_url, stream=True, timeout=self._timeout) as response:
-                for line in response.iter_lines():
+            # The stream stays open for the life of the transport, so it has no read timeout
+            with self._session.get(sse_url, stream=True, timeout=(self._timeout, None)) as response:
+                response.raise_for_status()
+                self._sse_response = response
+                event, data_lines = "message", []
+                for line in response.iter_lines(decode_unicode=True):
                     if self._stop_event.is_set():
                         break
-                    if line:
-                        try:
-                            line_str = line.decode("utf-8")
-                            if line_str.startswith("data: "):
-                                data_str = line_str[6:]
-                                self._process_sse_data(data_str)
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            continue
-        except Exception:
-            # Thread will exit on errors
-            pass
+                    if not line:
+                        if data_lines:
+                            self._process_sse_event(event, "\n".join(data_lines))
+                        event, data_lines = "message", []
+                    elif line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        data_lines.append(line[5:].lstrip(" "))
+        except Exception as e:
+            if not self._stop_event.is_set():
+                logger.debug(f"SSE listener stopped: {e}")
+                self._stream_error = e
+        finally:
+            self._sse_response = None
+            self._fail_pending(RuntimeError("SSE stream closed"))
+            # Wake up a start() still waiting for the endpoint
+            self._endpoint_ready.set()
+
+    def _process_sse_event(self, event: str, data: str) -> None:
+        """Handle one SSE event: the endpoint announcement or a JSON-RPC message."""
+        if event == "endpoint" or (self._message_endpoint is None and data.startswith("/")):
+            self._message_endpoint = self._build_full_endpoint(data)
+            self._endpoint_ready.set()
+            return
 
-    def _process_sse_data(self, data_str: str) -> None:
-        """Process a single SSE data payload."""
-        # Check if this is the endpoint URL
-        if data_str.startswith("/"):
-            # This is the message endpoint
-            self._message_endpoint = f"{self._base_url}{data_str}"
-        else:
-            # This is a JSON response
-            data = json.loads(data_str)
-            self._response_queue.put(data)
+        try:
+            message = json.loads(data)
+        except json.JSONDecodeError:
+            logger.debug(f"Ignoring non JSON-RPC SSE data: {data[:200]}")
+            return
+
+        for item in message if isinstance(message, list) else [message]:
+            if isinstance(item, dict) and "method" not in item:
+                self._resolve_response(item)
+
+    def _resolve_response(self, message: dict[str, Any]) -> None:
+        """Resolve the future waiting for this response's id."""
+        with self._pending_lock:
+            future = self._pending.pop(message.get("id"), None)
+
+        if future is None:
+            logger.debug(f"Dropping response for unknown request id: {message.get('id')}")
+            return
+
+        if not future.done():
+            future.set_result(message)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight request with the given error."""
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
 
     def _send_message(self, message: dict[str, Any]) -> None:
         """Send a JSON-RPC message via HTTP POST (notification - no response expected)."""
@@ -156,117 +189,121 @@ class SSETransport(BaseTransport):
         except requests.RequestException:
             pass  # Notifications don't wait for response
 
-    def _send_request(self, message: dict[str, Any]) -> dict[str, Any]:
-        """Send a JSON-RPC request and wait for response."""
+    def _send_request(self, message: dict[str, Any], timeout: float | None = None) -> dict[str, Any]:
+        """Send a JSON-RPC request and wait for the response event with its id.
+
+        When no response arrives within the timeout the request is cancelled on
+        the server with notifications/cancelled and TimeoutError is raised.
+        """
         if not self._session or not self._message_endpoint:
             raise RuntimeError("SSE transport not connected")
 
-        request_id = message.get("id")
+        request_id = message["id"]
+        if timeout is None:
+            timeout = self._timeout
+
+        # Register before posting: the response can arrive on the stream before the POST returns
+        future: Future = Future()
+        with self._pending_lock:
+            self._pending[request_id] = future
 
         try:
-            # Send the request
             response = self._session.post(
                 self._message_endpoint,
                 json=message,
-                timeout=self._timeout,
+                timeout=timeout,
             )
             if not response.ok:
                 return {"error": f"HTTP error {response.status_code}: {response.text}"}
 
-            # Wait for response with matching ID
-            return self._wait_for_response(request_id)
+            return future.result(timeout=timeout)
 
-        except requests.RequestException as e:
+        except FutureTimeoutError:
+            pass
+        except (requests.RequestException, RuntimeError) as e:
             return {"error": f"Request failed: {str(e)}"}
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
 
-    def _wait_for_response(self, request_id: Any) -> dict[str, Any]:
-        """Wait for a response with the matching request ID."""
-        timeout_count = 0
-        max_timeout = self._timeout * 10  # 0.1s * 300 = 30 seconds
-        while timeout_count < max_timeout:
-            try:
-                result = self._response_queue.get(timeout=0.1)
-                if result.get("id") == request_id:
-                    return result
-                # Not our response, put it back? No, just continue waiting
-            except queue.Empty:
-                timeout_count += 1
-                continue
-
-        return {"error": "Timeout waiting for response"}
+        self._send_message(self._build_cancel_notification(request_id, f"Timed out after {timeout}s"))
+        raise TimeoutError(f"Request {message['method']} timed out after {timeout}s")
 
     def stop(self) -> None:
         """Close SSE connection."""
         self._stop_event.set()
+        self._interrupt_stream()
         if self._sse_thread and self._sse_thread.is_alive():
             self._sse_thread.join(timeout=2)
         if self._session:
             self._session.close()
             self._session = None
+        self._fail_pending(RuntimeError("SSE transport was stopped"))
         self._base_url = None
         self._message_endpoint = None
         self._initialized = False
 
-    def execute_tool(self, tool_name: str, **kwargs: Any) -> dict[str, Any]:
+    def _interrupt_stream(self) -> None:
+        """Shut down the SSE socket so the listener's blocking read returns immediately."""
+        response = self._sse_response
+        if response is None:
+            return
+
+        # Closing the response would wait for the listener's read to finish
+        connection = getattr(response.raw, "connection", None)
+        sock = getattr(connection, "sock", None)
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def execute_tool(self, tool_name: str, **kwargs: Any) -> str | dict[str, Any]:
         """Execute a tool via MCP protocol over SSE."""
+        return self.call_tool(tool_name, kwargs)
+
+    def call_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Execute a tool, cancelling it on the server when the deadline passes."""
         if not self.is_alive():
             raise RuntimeError("SSE transport is not connected")
 
         if not self._initialized:
             raise RuntimeError("MCP server not initialized")
 
-        self._request_id += 1
-        request = self._build_tool_request(tool_name, kwargs)
+        request = self._build_tool_request(self._next_request_id(), tool_name, arguments)
 
-        response = self._send_request(request)
-
-        if "error" in response:
-            return {"success": False, "error": response["error"]}
+        response = self._send_request(request, timeout)
 
-        return self._parse_tool_result(response)
+        return self._decode_tool_result(response)
 
-    def _build_tool_request(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    def _build_tool_request(self, request_id: int, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Build the JSON-RPC request for tool execution."""
         return {
             "jsonrpc": "2.0",
             "method": "tools/call",
             "params": {"name": tool_name, "arguments": arguments or {}},
-            "id": self._request_id,
+            "id": request_id,
         }
 
-    def _parse_tool_result(self, response: dict[str, Any]) -> dict[str, Any]:
-        """Parse tool execution result from response."""
-        result = response.get("result", {})
-        contents = result.get("content", [])
-
-        if not contents:
-            return {"success": True, "result": {}}
-
-        # Aggregate text from all content blocks
-        text = self._extract_text_content(contents)
-
+    def ping(self, timeout: float | None = None) -> bool:
+        """Check the server answers an MCP ping."""
+        if not self.is_alive() or not self._initialized:
+            return False
+        request = {"jsonrpc": "2.0", "method": "ping", "id": self._next_request_id()}
         try:
-            parsed_result = json.loads(text) if text else {}
-        except json.JSONDecodeError:
-            parsed_result = {"text": text}
-
-        return {"success": True, "result": parsed_result}
-
-    def _extract_text_content(self, contents: list[dict[str, Any]]) -> str:
-        """Extract and aggregate text from content blocks."""
-        text = ""
-        for item in contents:
-            if item.get("type") == "text":
-                text += item.get("text", "")
-        return text
+            return "error" not in self._send_request(request, timeout)
+        except Exception:
+            return False
 
     def list_tools(self) -> list[str]:
         """List available tools via MCP protocol."""
         if not self.is_alive() or not self._initialized:
             return []
 
-        self._request_id += 1
-        request = self._build_list_tools_request()
+        request = self._build_list_tools_request(self._next_request_id())
 
         response = self._send_request(request)
 
@@ -275,12 +312,12 @@ class SSETransport(BaseTransport):
 
         return self._parse_tools_response(response)
 
-    def _build_list_tools_request(self) -> dict[str, Any]:
+    def _build_list_tools_request(self, request_id: int) -> dict[str, Any]:
         """Build the JSON-RPC request for listing tools."""
         return {
             "jsonrpc": "2.0",
             "method": "tools/list",
-            "id": self._request_id,
+            "id": request_id,
         }
 
     def _parse_tools_response(self, response: dict[str, Any]) -> list[str]:
@@ -294,17 +331,19 @@ class SSETransport(BaseTransport):
 
         Returns:
             List of tool schema dictionaries with name, description, and inputSchema.
+
+        Raises:
+            RuntimeError: If the server is not running or the tools/list request failed
         """
         if not self.is_alive() or not self._initialized:
-            return []
+            raise RuntimeError("MCP server not initialized")
 
-        self._request_id += 1
-        request = self._build_list_tools_request()
+        request = self._build_list_tools_request(self._next_request_id())
 
         response = self._send_request(request)
 
         if "error" in response:
-            return []
+            raise RuntimeError(f"Failed to list tools: {response['error']}")
 
         result = response.get("result", {})
         return result.get("tools", [])
@@ -1,18 +1,107 @@
-import ast
 import json
+import logging
+import os
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any
 
 from .base import BaseTransport
 
+logger = logging.getLogger(__name__)
+stderr_logger = logging.getLogger(f"{__name__}.stderr")
+
+
+class StderrBuffer:
+    """Thread-safe ring buffer keeping the most recent stderr lines up to a byte budget."""
+
+    def __init__(self, max_bytes: int = 65536):
+        """
+        Initialize the buffer.
+
+        Args:
+            max_bytes: Bytes of the most recent output to keep; 0 keeps nothing.
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        self._lines: deque[str] = deque()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, line: str) -> None:
+        """Add a line, dropping the oldest lines once over budget."""
+        if self.max_bytes == 0:
+            return
+
+        # A single line longer than the budget keeps only its tail
+        size = len(line.encode("utf-8", "replace"))
+        if size > self.max_bytes:
+            line = line.encode("utf-8", "replace")[-self.max_bytes :].decode("utf-8", "ignore")
+            size = len(line.encode("utf-8"))
+
+        with self._lock:
+            self._lines.append(line)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._size -= len(self._lines.popleft().encode("utf-8", "replace"))
+
+    def tail(self, max_lines: int | None = None) -> str:
+        """Get the buffered output, optionally only its last max_lines lines."""
+        with self._lock:
+            lines = list(self._lines)
+        if max_lines is not None:
+            lines = lines[-max_lines:] if max_lines > 0 else []
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """Drop all buffered output."""
+        with self._lock:
+            self._lines.clear()
+            self._size = 0
+
 
 class StdioTransport(BaseTransport):
-    """Transport for MCP servers using stdio communication."""
+    """Transport for MCP servers using stdio communication.
+
+    A background reader thread owns the process stdout and routes every
+    JSON-RPC response to the future registered for its request id, so many
+    requests can be in flight on one server process at once. A second thread
+    drains stderr into a bounded ring buffer, so a chatty server can never
+    block on a full pipe.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        stderr_buffer_bytes: int = 65536,
+        stderr_log_level: str | None = None,
+    ):
+        """
+        Initialize the transport.
 
-    def __init__(self):
+        Args:
+            timeout: Seconds to wait for a response when a call has no deadline of its own; None waits forever.
+            stderr_buffer_bytes: Bytes of the most recent stderr output kept for get_stderr().
+            stderr_log_level: Level name (e.g. "DEBUG") to forward stderr lines to the logger at; None disables.
+        """
+        self._timeout = timeout
+        self._stderr = StderrBuffer(stderr_buffer_bytes)
+        self._stderr_log_level: int | None = None
+        if stderr_log_level:
+            levels = logging.getLevelNamesMapping()
+            if stderr_log_level.upper() not in levels:
+                raise ValueError(f"Unknown stderr_log_level: {stderr_log_level}")
+            self._stderr_log_level = levels[stderr_log_level.upper()]
+        self._stderr_thread: threading.Thread | None = None
+        self._server_label = ""
         self._process = None
         self._request_id = 0
         self._initialized = False
+        self._pending: dict[int, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._reader_thread: threading.Thread | None = None
 
     def start(self, command: str, args: list[str], cwd: str | None = None) -> None:
         """Start the MCP server process."""
@@ -27,19 +116,46 @@ class StdioTransport(BaseTransport):
                 universal_newlines=True,
                 cwd=cwd,
             )
+            self._server_label = f"{os.path.basename(command)}[{self._process.pid}]"
+            self._stderr.clear()
+            self._start_reader()
             # Perform MCP initialization handshake
             self._initialize()
         except Exception as e:
             raise RuntimeError(f"Failed to start MCP server: {str(e)}") from e
 
+    def _start_reader(self) -> None:
+        """Start the background thread that reads responses from stdout."""
+        self._reader_thread = threading.Thread(target=self._read_loop, name="mcp-stdio-reader", daemon=True)
+        self._reader_thread.start()
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, name="mcp-stdio-stderr", daemon=True)
+        self._stderr_thread.start()
+
+    def _drain_stderr(self) -> None:
+        """Read stderr until the stream closes, keeping the tail and optionally logging it."""
+        stderr = self._process.stderr
+        while True:
+            try:
+                line = stderr.readline()
+            except Exception as e:
+                logger.debug(f"Stdio stderr reader stopped: {e}")
+                break
+
+            if not line:
+                break
+
+            line = line.rstrip("\n")
+            self._stderr.append(line)
+            if self._stderr_log_level is not None:
+                stderr_logger.log(self._stderr_log_level, f"{self._server_label}: {line}")
+
+    def get_stderr(self, max_lines: int | None = None) -> str:
+        """Get the most recent stderr output of the server process."""
+        return self._stderr.tail(max_lines)
+
     def _initialize(self) -> None:
         """Perform MCP initialization handshake."""
-        self._request_id += 1
-        request = self._build_init_request()
-
-        self._send_json_request(request)
-        response = self._read_json_response()
-        result = json.loads(response)
+        result = self._send_request("initialize", self._build_init_params())
 
         if "error" in result:
             raise RuntimeError(f"MCP initialization failed: {result['error']}")
@@ -49,27 +165,19 @@ class StdioTransport(BaseTransport):
         # Send initialized notification
         self._send_notification()
 
-    def _build_init_request(self) -> dict[str, Any]:
-        """Build the MCP initialize request payload."""
+    def _build_init_params(self) -> dict[str, Any]:
+        """Build the MCP initialize request params."""
         return {
-            "jsonrpc": "2.0",
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "ai-agent", "version": "0.1.0"},
-            },
-            "id": self._request_id,
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "ai-agent", "version": "0.1.0"},
         }
 
     def _send_json_request(self, request: dict[str, Any]) -> None:
-        """Send a JSON-RPC request to the process stdin."""
-        self._process.stdin.write(json.dumps(request) + "\n")
-        self._process.stdin.flush()
-
-    def _read_json_response(self) -> str:
-        """Read a JSON-RPC response from the process stdout."""
-        return self._process.stdout.readline()
+        """Send a JSON-RPC message to the process stdin."""
+        with self._write_lock:
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
 
     def _send_notification(self) -> None:
         """Send the initialized notification to the server."""
@@ -79,6 +187,84 @@ class StdioTransport(BaseTransport):
         }
         self._send_json_request(notification)
 
+    def _read_loop(self) -> None:
+        """Read JSON-RPC messages from stdout until the stream closes."""
+        stdout = self._process.stdout
+        while True:
+            try:
+                line = stdout.readline()
+            except Exception as e:
+                logger.debug(f"Stdio reader stopped: {e}")
+                break
+
+            if not line:
+                break
+
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug(f"Ignoring non JSON-RPC output from MCP server: {line[:200]}")
+                continue
+
+            for item in message if isinstance(message, list) else [message]:
+                if isinstance(item, dict):
+                    self._dispatch_message(item)
+
+        self._fail_pending(RuntimeError("Server process closed its output stream"))
+
+    def _dispatch_message(self, message: dict[str, Any]) -> None:
+        """Route a single incoming JSON-RPC message."""
+        if "method" in message:
+            self._handle_server_message(message)
+            return
+
+        request_id = message.get("id")
+        with self._pending_lock:
+            future = self._pending.pop(request_id, None)
+
+        if future is None:
+            logger.debug(f"Dropping response for unknown request id: {request_id}")
+            return
+
+        if not future.done():
+            future.set_result(message)
+
+    def _handle_server_message(self, message: dict[str, Any]) -> None:
+        """Handle notifications and requests initiated by the server."""
+        method = message["method"]
+        if "id" not in message:
+            logger.debug(f"MCP server notification: {method}")
+            return
+
+        # Server-to-client request: answer pings, reject anything else
+        if method == "ping":
+            reply: dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+        else:
+            reply = {
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "error": {"code": -32601, "message": f"Method not found: {method}"},
+            }
+
+        try:
+            self._send_json_request(reply)
+        except Exception as e:
+            logger.debug(f"Failed to reply to server request {method}: {e}")
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight request with the given error."""
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
     def stop(self) -> None:
         """Stop the MCP server process."""
         if self._process and self._process.poll() is None:
@@ -88,73 +274,77 @@ class StdioTransport(BaseTransport):
             except subprocess.TimeoutExpired:
                 self._process.kill()
         self._initialized = False
+        self._fail_pending(RuntimeError("Server process was stopped"))
 
-    def _send_request(self, method: str, params: dict | None = None) -> dict[str, Any]:
-        """Send a JSON-RPC request and return the response."""
+    def _send_request(self, method: str, params: dict | None = None, timeout: float | None = None) -> dict[str, Any]:
+        """Send a JSON-RPC request and wait for its response.
+
+        When no response arrives within the timeout the request is cancelled on
+        the server with notifications/cancelled and TimeoutError is raised.
+        """
         if not self.is_alive():
             raise RuntimeError("Server process is not running")
 
-        self._request_id += 1
-        request: dict[str, Any] = {"jsonrpc": "2.0", "method": method, "id": self._request_id}
+        if timeout is None:
+            timeout = self._timeout
+
+        future: Future = Future()
+        with self._pending_lock:
+            self._request_id += 1
+            request_id = self._request_id
+            self._pending[request_id] = future
+
+        request: dict[str, Any] = {"jsonrpc": "2.0", "method": method, "id": request_id}
         if params is not None:
             request["params"] = params
 
         try:
             self._send_json_request(request)
-            response = self._read_json_response()
-            return json.loads(response)
+            return future.result(timeout)
+        except FutureTimeoutError:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            self._cancel_request(request_id, f"Timed out after {timeout}s")
+            raise TimeoutError(f"Request {method} timed out after {timeout}s") from None
         except Exception as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
             raise RuntimeError(f"Request failed: {str(e)}") from e
 
+    def _cancel_request(self, request_id: int, reason: str) -> None:
+        """Tell the server to stop working on a request we no longer wait for."""
+        try:
+            self._send_json_request(self._build_cancel_notification(request_id, reason))
+        except Exception as e:
+            logger.debug(f"Failed to cancel request {request_id}: {e}")
+
     def execute_tool(self, tool_name: str, **kwargs: Any) -> str | dict[str, Any]:
         """Execute a tool via MCP protocol over stdio with robust parsing."""
+        return self.call_tool(tool_name, kwargs)
+
+    def call_tool(
+        self, tool_name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> str | dict[str, Any]:
+        """Execute a tool, cancelling it on the server when the deadline passes."""
         if not self._initialized:
             raise RuntimeError("MCP server not initialized")
 
         response = self._send_request(
             "tools/call",
-            {"name": tool_name, "arguments": kwargs or {}},
+            {"name": tool_name, "arguments": arguments or {}},
+            timeout=timeout,
         )
 
-        if "error" in response:
-            raise RuntimeError(f"Tool execution failed: {response['error']}")
-
-        result = response.get("result", {})
-        contents = result.get("content", [])
-
-        # Handle empty or unexpected content formats
-        if not contents:
-            return {}
+        return self._decode_tool_result(response)
 
-        # Aggregate text from all content blocks
-        text = self._extract_text_content(contents)
-
-        return self._parse_tool_output(text)
-
-    def _extract_text_content(self, contents: list[dict[str, Any]]) -> str:
-        """Extract and aggregate text from content blocks."""
-        text = ""
-        for item in contents:
-            if item.get("type") == "text":
-                text += item.get("text", "")
-        return text
-
-    def _parse_tool_output(self, text: str) -> str | dict[str, Any]:
-        """Parse tool output text into a dictionary."""
+    def ping(self, timeout: float | None = None) -> bool:
+        """Check the server answers an MCP ping."""
+        if not self._initialized:
+            return False
         try:
-            # Try standard JSON first
-            data = json.loads(text)
-        except json.JSONDecodeError:
-            try:
-                # Fallback to Python literal parsing if the tool sent single quotes
-                data = ast.literal_eval(text)
-            except (ValueError, SyntaxError):
-                if isinstance(text, str):
-                    data = text
-                else:
-                    raise RuntimeError(f"Could not parse tool output: {text}")
-
-        return data
+            return "error" not in self._send_request("ping", timeout=timeout)
+        except Exception:
+            return False
 
     def list_tools(self) -> list[str]:
         """List available tools using MCP protocol."""
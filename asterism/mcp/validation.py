@@ -0,0 +1,121 @@
+"""Tool argument validation against MCP input schemas.
+
+Each tool's ``inputSchema`` is compiled into a JSON Schema validator once,
+when the server's schemas are first fetched, so malformed arguments are
+rejected locally instead of costing a round trip to the server.
+"""
+
+import logging
+import threading
+from typing import Any
+
+from jsonschema import SchemaError
+from jsonschema.validators import validator_for
+
+logger = logging.getLogger(__name__)
+
+
+class ToolArgumentValidator:
+    """Compiled validator of one tool's input schema."""
+
+    def __init__(self, schema: dict[str, Any]):
+        """
+        Compile a tool input schema.
+
+        Args:
+            schema: The tool's JSON Schema ``inputSchema``.
+
+        Raises:
+            SchemaError: If the schema itself is invalid.
+        """
+        self.schema = schema
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self._validator = validator_class(schema)
+
+    def validate(self, arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Validate tool arguments.
+
+        Args:
+            arguments: The arguments of a tool call.
+
+        Returns:
+            One entry per violation with its "path" (JSON path of the offending
+            value), "message" and failed "keyword"; empty if the arguments are valid.
+        """
+        errors = sorted(self._validator.iter_errors(arguments), key=lambda error: error.json_path)
+        return [{"path": error.json_path, "message": error.message, "keyword": error.validator} for error in errors]
+
+
+class ToolValidatorCache:
+    """Compiled validators of every discovered tool, keyed by server and tool name."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._validators: dict[tuple[str, str], ToolArgumentValidator] = {}
+        self._lock = threading.Lock()
+
+    def compile(self, server_name: str, schemas: list[dict[str, Any]]) -> None:
+        """Compile the input schemas of a server's tools, replacing its previous validators.
+
+        Validators whose schema did not change are kept. Tools without an input
+        schema, or with one that is not valid JSON Schema, get no validator and
+        their arguments are passed through unchecked.
+
+        Args:
+            server_name: Name of the MCP server.
+            schemas: The server's tool schemas, each with "name" and "inputSchema".
+        """
+        current = {tool: validator for (server, tool), validator in self._validators.items() if server == server_name}
+
+        compiled = {}
+        for tool in schemas:
+            input_schema = tool.get("inputSchema")
+            if not input_schema:
+                continue
+            existing = current.get(tool["name"])
+            if existing is not None and existing.schema == input_schema:
+                compiled[tool["name"]] = existing
+                continue
+            try:
+                compiled[tool["name"]] = ToolArgumentValidator(input_schema)
+            except SchemaError as e:
+                logger.warning(f"Not validating arguments of '{server_name}:{tool['name']}', invalid inputSchema: {e}")
+
+        with self._lock:
+            validators = {key: value for key, value in self._validators.items() if key[0] != server_name}
+            validators.update(((server_name, name), validator) for name, validator in compiled.items())
+            self._validators = validators
+
+    def get(self, server_name: str, tool_name: str) -> ToolArgumentValidator | None:
+        """Get the compiled validator of a tool, or None if it has none."""
+        return self._validators.get((server_name, tool_name))
+
+    def validate(self, server_name: str, tool_name: str, arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Validate tool arguments; tools without a validator always pass.
+
+        Returns:
+            The violations, as returned by ToolArgumentValidator.validate().
+        """
+        validator = self.get(server_name, tool_name)
+        return validator.validate(arguments) if validator is not None else []
+
+    def clear(self) -> None:
+        """Drop every compiled validator."""
+        with self._lock:
+            self._validators = {}
+
+
+def format_validation_errors(server_name: str, tool_name: str, errors: list[dict[str, Any]]) -> str:
+    """Format argument violations as one error message.
+
+    Args:
+        server_name: Name of the MCP server.
+        tool_name: Name of the tool.
+        errors: Violations, as returned by ToolArgumentValidator.validate().
+
+    Returns:
+        Message naming the tool and each violation with its path.
+    """
+    details = "; ".join(f"{error['path']}: {error['message']}" for error in errors)
+    return f"Invalid arguments for tool '{server_name}:{tool_name}': {details}"
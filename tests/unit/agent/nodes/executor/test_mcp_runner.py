@@ -0,0 +1,59 @@
+"""Tests for the MCP task runner."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from asterism.agent.models import SpilledResult, Task
+from asterism.agent.nodes.executor.mcp_runner import MCPRunner
+from asterism.agent.utils.result_store import ResultStore
+
+
+@pytest.fixture
+def mcp_executor():
+    """Create an executor returning a large listing for list_files and a small one otherwise."""
+    executor = MagicMock()
+    executor.execute_tool.side_effect = lambda server, tool, **kwargs: {
+        "success": True,
+        "result": "f\n" * 1000 if tool == "list_files" else "ok",
+        "error": None,
+    }
+    return executor
+
+
+def test_large_results_are_spilled_under_the_session(mcp_executor, tmp_path):
+    """Test a large tool result is kept in the task result as a handle to the session's spill file."""
+    runner = MCPRunner(mcp_executor, ResultStore(tmp_path, threshold=100))
+    task = Task(id="t1", description="list", tool_call="filesystem:list_files", tool_input={})
+
+    with patch("asterism.agent.nodes.executor.mcp_runner.log_mcp_tool_call") as log_call:
+        result = runner.execute(task, {"session_id": "abc"})
+
+    assert isinstance(result.result, SpilledResult)
+    assert result.result.path == str((tmp_path / "abc.spill").resolve())
+    assert result.result.load() == "f\n" * 1000
+    assert log_call.call_args.kwargs["result_preview"] == ("f\n" * 1000)[:500]
+
+
+def test_small_results_and_batches_stay_inline(mcp_executor, tmp_path):
+    """Test small results are not spilled and batched results are spilled per call."""
+    mcp_executor.execute_batch.return_value = [
+        {"success": True, "result": "ok", "error": None},
+        {"success": True, "result": "x" * 500, "error": None},
+    ]
+    runner = MCPRunner(mcp_executor, ResultStore(tmp_path, threshold=100))
+    tasks = [
+        Task(id="t1", description="read", tool_call="filesystem:read_file", tool_input={"path": "a"}),
+        Task(id="t2", description="read", tool_call="filesystem:read_file", tool_input={"path": "b"}),
+    ]
+
+    single = runner.execute(tasks[0], {"session_id": "abc"})
+    batched = runner.execute_batch(tasks, session_id="abc")
+
+    assert single.result == "ok"
+    assert batched[0].result == "ok"
+    assert batched[1].result.load() == "x" * 500
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
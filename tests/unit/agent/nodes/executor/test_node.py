@@ -0,0 +1,80 @@
+"""Test executor node parallel dispatch."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from asterism.agent.models import Plan, Task, TaskResult
+from asterism.agent.nodes.executor.node import executor_node_with_parallel, parallel_execute_task
+from asterism.agent.state import AgentState
+
+
+def _state(tasks: list[Task]) -> AgentState:
+    return {
+        "session_id": "test",
+        "trace_id": "trace_123",
+        "messages": [],
+        "plan": Plan(tasks=tasks, reasoning="test"),
+        "current_task_index": 0,
+        "execution_results": [],
+        "evaluation_result": None,
+        "final_response": None,
+        "error": None,
+        "llm_usage": [],
+    }
+
+
+def test_parallel_executor_batches_tool_calls_to_same_server():
+    """Test independent tool calls to one server are executed as a batch before dispatch."""
+    tasks = [
+        Task(id="t1", description="read a", tool_call="fs:read_file", tool_input={"path": "a"}),
+        Task(id="t2", description="search", tool_call="web:search", tool_input={"q": "x"}),
+        Task(id="t3", description="read b", tool_call="fs:read_file", tool_input={"path": "b"}),
+        Task(id="t4", description="think"),
+    ]
+    mcp_executor = MagicMock()
+    mcp_executor.execute_batch.return_value = [
+        {"success": True, "result": "A", "error": None},
+        {"success": False, "result": None, "error": "missing"},
+    ]
+
+    sends = executor_node_with_parallel(MagicMock(), mcp_executor, _state(tasks))
+
+    mcp_executor.execute_batch.assert_called_once_with(
+        [("fs", "read_file", {"path": "a"}), ("fs", "read_file", {"path": "b"})]
+    )
+    payloads = {send.arg["task"].id: send.arg for send in sends}
+    assert payloads["t1"]["result"].result == "A"
+    assert payloads["t3"]["result"].error == "missing"
+    assert "result" not in payloads["t2"]
+    assert "result" not in payloads["t4"]
+
+
+def test_parallel_executor_skips_batch_without_shared_server():
+    """Test no batch is sent when every server gets a single call."""
+    tasks = [
+        Task(id="t1", description="read", tool_call="fs:read_file"),
+        Task(id="t2", description="search", tool_call="web:search"),
+    ]
+    mcp_executor = MagicMock()
+
+    sends = executor_node_with_parallel(MagicMock(), mcp_executor, _state(tasks))
+
+    assert len(sends) == 2
+    mcp_executor.execute_batch.assert_not_called()
+
+
+def test_parallel_execute_task_uses_batched_result():
+    """Test a task that arrives with its batched result is not executed again."""
+    task = Task(id="t1", description="read", tool_call="fs:read_file")
+    result = TaskResult(task_id="t1", success=True, result="A")
+
+    with patch("asterism.agent.nodes.executor.node.create_task_runner") as create_runner:
+        update = parallel_execute_task(MagicMock(), MagicMock(), {"task": task, "parent_state": {}, "result": result})
+
+    create_runner.assert_not_called()
+    assert update == {"parallel_results": [result]}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
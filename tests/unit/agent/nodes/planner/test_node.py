@@ -0,0 +1,36 @@
+"""Tests for the planner node."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from asterism.agent.models import Plan, Task
+from asterism.agent.nodes.planner.node import planner_node
+from asterism.llm.providers import StructuredLLMResponse
+
+
+@patch("asterism.agent.nodes.planner.node.build_planner_context")
+def test_invalid_tool_calls_fail_planning_without_another_llm_call(mock_context):
+    """Test a plan with invalid tool calls is reported as a planning error listing every problem."""
+    mock_context.return_value.messages = []
+    llm = MagicMock()
+    llm.model = "test-model"
+    llm.invoke_structured.return_value = StructuredLLMResponse(
+        content="{}",
+        parsed=Plan(
+            reasoning="read it",
+            tasks=[Task(id="t1", description="read", tool_call="filesystem:read_fle", tool_input={"path": "a"})],
+        ),
+    )
+    mcp_executor = MagicMock()
+    mcp_executor.validate_tool_call.return_value = False
+
+    state = planner_node(llm, mcp_executor, {"messages": [], "llm_usage": []})
+
+    assert "unknown tool 'filesystem:read_fle'" in state["error"]
+    llm.invoke_structured.assert_called_once()
+    mcp_executor.prefetch.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
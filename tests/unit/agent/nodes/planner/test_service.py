@@ -0,0 +1,57 @@
+"""Tests for planner service helpers."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from asterism.agent.models import Plan, Task
+from asterism.agent.nodes.planner.service import find_invalid_tool_calls, get_plan_servers
+
+
+def test_get_plan_servers_collects_tool_call_servers():
+    """Test servers are collected from tool calls, skipping LLM-only tasks."""
+    plan = Plan(
+        reasoning="test",
+        tasks=[
+            Task(id="t1", description="list", tool_call="filesystem:list_files"),
+            Task(id="t2", description="read", tool_call="filesystem:read_file"),
+            Task(id="t3", description="parse", tool_call="code_parser:parse"),
+            Task(id="t4", description="summarize"),
+            Task(id="t5", description="malformed", tool_call="no_separator"),
+        ],
+    )
+
+    assert get_plan_servers(plan) == {"filesystem", "code_parser"}
+
+
+def test_get_plan_servers_empty_plan():
+    """Test an empty plan references no servers."""
+    assert get_plan_servers(Plan(reasoning="greeting", tasks=[])) == set()
+
+
+def test_find_invalid_tool_calls_checks_tools_and_arguments():
+    """Test unknown tools and schema violations are reported, and dependent task inputs are left alone."""
+    mcp_executor = MagicMock()
+    mcp_executor.validate_tool_call.side_effect = lambda server, tool: tool != "missing"
+    mcp_executor.validate_arguments.side_effect = lambda server, tool, arguments: (
+        [] if "path" in arguments else [{"path": "$", "message": "'path' is a required property"}]
+    )
+    plan = Plan(
+        reasoning="test",
+        tasks=[
+            Task(id="t1", description="read", tool_call="filesystem:read_file", tool_input={"path": "a"}),
+            Task(id="t2", description="read", tool_call="filesystem:read_file", tool_input={}),
+            Task(id="t3", description="gone", tool_call="filesystem:missing"),
+            Task(id="t4", description="later", tool_call="filesystem:read_file", depends_on=["t1"]),
+            Task(id="t5", description="summarize"),
+        ],
+    )
+
+    assert find_invalid_tool_calls(plan, mcp_executor) == [
+        "- Task 't2' (filesystem:read_file): $: 'path' is a required property",
+        "- Task 't3': unknown tool 'filesystem:missing'",
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
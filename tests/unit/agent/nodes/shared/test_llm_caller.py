@@ -0,0 +1,86 @@
+"""Test LLM caller."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages import HumanMessage
+from pydantic import BaseModel
+
+from asterism.agent.nodes.shared.llm_caller import LLMCaller, LLMCallError
+from asterism.llm.provider_router import LLMProviderRouter
+from asterism.llm.providers import LLMResponse, StructuredLLMResponse
+
+
+class Decision(BaseModel):
+    """Schema for structured call tests."""
+
+    done: bool
+
+
+@pytest.fixture
+def llm():
+    """LLM provider mock with async methods."""
+    llm = MagicMock()
+    llm.model = "test-model"
+    llm.ainvoke_structured = AsyncMock()
+    llm.ainvoke_with_usage = AsyncMock()
+    return llm
+
+
+def test_acall_structured_returns_parsed_result_and_usage(llm):
+    """Test acall_structured awaits the provider and records usage."""
+    llm.ainvoke_structured.return_value = StructuredLLMResponse(
+        content='{"done": true}', parsed=Decision(done=True), prompt_tokens=10, completion_tokens=3, total_tokens=13
+    )
+    caller = LLMCaller(llm, "evaluator_node")
+
+    result = asyncio.run(caller.acall_structured([HumanMessage(content="done?")], Decision, "evaluating"))
+
+    assert result.parsed == Decision(done=True)
+    assert result.usage.total_tokens == 13
+    assert result.usage.node_name == "evaluator_node"
+    llm.invoke_structured.assert_not_called()
+
+
+def test_acall_text_returns_content(llm):
+    """Test acall_text awaits ainvoke_with_usage."""
+    llm.ainvoke_with_usage.return_value = LLMResponse(content="hello", total_tokens=4)
+
+    result = asyncio.run(LLMCaller(llm, "finalizer_node").acall_text("hi", "responding"))
+
+    assert result.parsed == "hello"
+    assert result.usage.model == "test-model"
+
+
+def test_acall_structured_wraps_errors(llm):
+    """Test provider errors are raised as LLMCallError naming the action."""
+    llm.ainvoke_structured.side_effect = RuntimeError("all providers failed")
+
+    with pytest.raises(LLMCallError, match="LLM call failed for planning: all providers failed"):
+        asyncio.run(LLMCaller(llm, "planner_node").acall_structured([], Decision, "planning"))
+
+
+def test_call_structured_uses_sync_provider(llm):
+    """Test the sync call path is unchanged."""
+    llm.invoke_structured.return_value = StructuredLLMResponse(content="{}", parsed=Decision(done=False))
+
+    result = LLMCaller(llm, "planner_node").call_structured([HumanMessage(content="plan")], Decision, "planning")
+
+    assert result.parsed == Decision(done=False)
+    llm.ainvoke_structured.assert_not_called()
+
+
+def test_router_calls_name_the_node():
+    """Test calls through the router pass the node name, so the router can hedge them."""
+    router = MagicMock(spec=LLMProviderRouter)
+    router.model = "primary/model-a"
+    router.ainvoke_with_usage = AsyncMock(return_value=LLMResponse(content="plan"))
+
+    asyncio.run(LLMCaller(router, "planner_node").acall_text("hi", "planning"))
+
+    assert router.ainvoke_with_usage.call_args.kwargs == {"node": "planner_node"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
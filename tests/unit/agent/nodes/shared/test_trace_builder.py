@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from asterism.agent.models import TaskResult
+from asterism.agent.models import SpilledResult, TaskResult
 from asterism.agent.nodes.shared.trace_builder import (
     build_execution_trace,
     format_trace_for_display,
@@ -59,6 +59,16 @@ def test_build_execution_trace_with_results():
     assert trace[1]["error"] == "Task failed"
 
 
+def test_build_execution_trace_shows_spilled_result_preview():
+    """Test spilled results appear in the trace as their preview, not their spill file location."""
+    handle = SpilledResult(path="/tmp/s.spill", offset=0, size=5000, encoding="text", preview="abc")
+    state: AgentState = {"execution_results": [TaskResult(task_id="task_1", success=True, result=handle)]}
+
+    trace = build_execution_trace(state)
+
+    assert trace[0]["result"] == "abc... [truncated, 5000 bytes in total]"
+
+
 def test_build_execution_trace_timestamp_formatting():
     """Test that timestamps are properly formatted in trace."""
     now = datetime.now()
@@ -1,5 +1,6 @@
 """Test main Agent class."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -350,6 +351,33 @@ def test_invoke_usage_aggregation(mock_build, mock_llm, mock_mcp_executor):
     assert usage["calls_by_node"]["executor_node"] == 1
 
 
+@patch("asterism.agent.agent.get_result_store")
+@patch.object(Agent, "build")
+def test_invoke_deletes_spilled_results_after_run(mock_build, mock_get_result_store, mock_llm, mock_mcp_executor):
+    """Test the session's spill file is deleted when a run ends, even a failed one."""
+    mock_build.return_value.invoke.side_effect = Exception("Graph execution failed")
+
+    Agent(llm=mock_llm, mcp_executor=mock_mcp_executor).invoke("session_123", create_test_messages())
+
+    mock_get_result_store.return_value.start_run.assert_called_once_with("session_123")
+    mock_get_result_store.return_value.end_run.assert_called_once_with("session_123")
+
+
+@patch("asterism.agent.agent.get_result_store")
+@patch.object(Agent, "build_for_streaming")
+def test_astream_deletes_spilled_results_after_run(mock_build, mock_get_result_store, mock_llm, mock_mcp_executor):
+    """Test the session's spill file is deleted once streaming has finished."""
+    mock_build.return_value.invoke.side_effect = Exception("Graph execution failed")
+    agent = Agent(llm=mock_llm, mcp_executor=mock_mcp_executor)
+
+    async def consume():
+        return [item async for item in agent.astream("session_123", create_test_messages())]
+
+    assert "Graph execution failed" in asyncio.run(consume())[0][0]
+    mock_get_result_store.return_value.start_run.assert_called_once_with("session_123")
+    mock_get_result_store.return_value.end_run.assert_called_once_with("session_123")
+
+
 def test_clear_session_stateless_mode(mock_llm, mock_mcp_executor):
     """Test clearing a session in stateless mode (no db_path)."""
     agent = Agent(llm=mock_llm, mcp_executor=mock_mcp_executor, db_path=None)
@@ -0,0 +1,102 @@
+"""Tests for the task result spill store."""
+
+import pytest
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from asterism.agent.models import SpilledResult, TaskResult
+from asterism.agent.utils.result_store import ResultStore, get_result_store, result_preview, result_text
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store spilling results over 100 bytes."""
+    return ResultStore(tmp_path / "results", threshold=100, preview_chars=10)
+
+
+def test_small_results_are_kept_inline(store, tmp_path):
+    """Test results under the threshold are returned unchanged and nothing is written."""
+    assert store.spill("s1", "short") == "short"
+    assert store.spill("s1", {"items": [1, 2, 3]}) == {"items": [1, 2, 3]}
+    assert store.spill("s1", None) is None
+    assert not (tmp_path / "results").exists()
+
+
+def test_large_text_result_is_spilled_and_read_in_slices(store):
+    """Test a large string becomes a handle with a preview whose slices are read back from the file."""
+    text = "".join(f"line {i}\n" for i in range(100))
+
+    handle = store.spill("s1", text)
+
+    assert isinstance(handle, SpilledResult)
+    assert handle.preview == text[:10]
+    assert handle.size == len(text)
+    assert handle.read(7, 7) == "line 1\n"
+    assert handle.load() == text
+    assert str(handle) == f"{text[:10]}... [truncated, {len(text)} bytes in total]"
+
+
+def test_results_of_a_session_share_one_spill_file(store):
+    """Test later results are appended after earlier ones and both stay readable."""
+    first = store.spill("s1", {"rows": ["a" * 200]})
+    second = store.spill("s1", "b" * 300)
+
+    assert first.path == second.path
+    assert second.offset == first.size
+    assert first.load() == {"rows": ["a" * 200]}
+    assert second.load() == "b" * 300
+
+    store.delete_session("s1")
+    with pytest.raises(FileNotFoundError):
+        first.read()
+
+
+def test_spill_file_outlives_other_runs_of_the_session(store):
+    """Test a run ending does not delete results another run on the session still reads."""
+    store.start_run("s1")
+    store.start_run("s1")
+    handle = store.spill("s1", "a" * 300)
+
+    store.end_run("s1")
+    assert handle.load() == "a" * 300
+
+    store.end_run("s1")
+    with pytest.raises(FileNotFoundError):
+        handle.read()
+
+
+def test_result_text_reads_up_to_limit(store):
+    """Test prompt text of a spilled result is read up to the limit and marked as truncated."""
+    handle = store.spill("s1", "x" * 500)
+
+    assert result_text(handle, limit=20) == "x" * 20 + "... [truncated, 500 bytes in total]"
+    assert result_text(handle, limit=None) == "x" * 500
+    assert result_text({"a": 1}) == "{'a': 1}"
+
+
+def test_result_preview_does_not_read_spilled_payload(store):
+    """Test previews of spilled results come from the handle, not the spill file."""
+    handle = store.spill("s1", "y" * 500)
+    store.delete_session("s1")
+
+    assert result_preview(handle, 5) == "yyyyy"
+    assert result_preview("abcdef", 3) == "abc"
+
+
+def test_spilled_result_survives_checkpoint_serialization(store):
+    """Test a task result holding a handle round-trips through the checkpoint serializer."""
+    result = TaskResult(task_id="t1", success=True, result=store.spill("s1", "z" * 500))
+    serializer = JsonPlusSerializer()
+
+    restored = serializer.loads_typed(serializer.dumps_typed(result))
+
+    assert isinstance(restored.result, SpilledResult)
+    assert restored.result.load() == "z" * 500
+
+
+def test_spilling_is_opt_in():
+    """Test no store is configured until the application sets one."""
+    assert get_result_store() is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,67 @@
+"""Tests for the health check endpoint."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from asterism.api.dependencies import get_config, get_llm_router, get_mcp_executor
+from asterism.api.routes import health
+
+
+def _client(server_status):
+    config = MagicMock()
+    config.data = SimpleNamespace(
+        agent=SimpleNamespace(version="1.0.0"),
+        models=SimpleNamespace(provider=[SimpleNamespace(name="openai")]),
+    )
+    llm_router = MagicMock()
+    llm_router.providers = {"openai": MagicMock()}
+    llm_router.health.status.return_value = {"openai/gpt-4o": {"state": "open", "consecutive_failures": 3}}
+    llm_router.hedger.status.return_value = {"planner_node": {"calls": 40, "hedges": 2}}
+    mcp_executor = MagicMock()
+    mcp_executor.get_server_status.return_value = server_status
+
+    app = FastAPI()
+    app.include_router(health.router, prefix="/v1")
+    app.dependency_overrides[get_config] = lambda: config
+    app.dependency_overrides[get_llm_router] = lambda: llm_router
+    app.dependency_overrides[get_mcp_executor] = lambda: mcp_executor
+    return TestClient(app)
+
+
+def test_health_reports_mcp_server_readiness():
+    """Test ready servers are reported and the API is healthy."""
+    response = _client({"filesystem": "ready", "web": "idle"}).get("/v1/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["ready"] is True
+    assert body["mcp_servers"] == {"filesystem": "ready", "web": "idle"}
+    # An open model circuit is reported but does not make the API unhealthy, fallback models still answer
+    assert body["models"]["openai/gpt-4o"]["state"] == "open"
+    assert body["hedging"]["planner_node"]["hedges"] == 2
+
+
+def test_health_returns_503_while_servers_start():
+    """Test the endpoint is not ready while a server is still warming up."""
+    response = _client({"filesystem": "starting"}).get("/v1/health")
+
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+
+def test_health_is_unhealthy_when_server_failed():
+    """Test a server that failed to start makes the API unhealthy but ready."""
+    response = _client({"filesystem": "ready", "web": "failed"}).get("/v1/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "unhealthy"
+    assert response.json()["ready"] is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
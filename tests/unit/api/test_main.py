@@ -0,0 +1,97 @@
+"""Tests for app-scoped dependencies created in the API lifespan."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from asterism.api.dependencies import get_llm_router, get_mcp_executor
+from asterism.api.main import create_api_app
+
+
+def _build_config():
+    config = MagicMock()
+    config.data = SimpleNamespace(
+        agent=SimpleNamespace(version="1.0.0"),
+        api=SimpleNamespace(debug=False, cors_origins=["*"]),
+        models=SimpleNamespace(default="openrouter/test-model", provider=[]),
+        mcp=SimpleNamespace(
+            schema_cache_file="sessions/mcp_schema_cache.json",
+            schema_cache_ttl=60,
+            timeout=30,
+            health_check_interval=15,
+            failure_threshold=3,
+            circuit_reset_timeout=30,
+            restart_backoff_max=60,
+            warmup=False,
+            warmup_timeout=30,
+            result_spill_dir="sessions/results",
+            result_spill_threshold=65536,
+        ),
+    )
+    config.workspace_path = "."
+    config.get_mcp_servers_file.return_value = "mcp_servers.json"
+    return config
+
+
+@patch("asterism.api.main.set_result_store")
+@patch("asterism.api.main.ResultStore")
+@patch("asterism.api.main.ServerSupervisor")
+@patch("asterism.api.main.ToolSchemaCache")
+@patch("asterism.api.main.MCPConfigLoader")
+@patch("asterism.api.main.MCPExecutor")
+@patch("asterism.api.main.LLMProviderRouter")
+def test_lifespan_creates_shared_dependencies_once(
+    mock_router_class,
+    mock_executor_class,
+    mock_loader,
+    mock_schema_cache_class,
+    mock_supervisor_class,
+    mock_result_store_class,
+    mock_set_result_store,
+):
+    """Router and executor are built once at startup and shut down at exit."""
+    app = create_api_app(_build_config())
+
+    with TestClient(app):
+        request = SimpleNamespace(app=app)
+        assert get_llm_router(request) is mock_router_class.return_value
+        assert get_mcp_executor(request) is mock_executor_class.return_value
+        assert get_mcp_executor(request) is get_mcp_executor(request)
+
+        mock_executor_class.return_value.shutdown.assert_not_called()
+        mock_router_class.return_value.close.assert_not_called()
+
+    mock_router_class.assert_called_once()
+    mock_router_class.return_value.close.assert_called_once()
+    mock_executor_class.assert_called_once_with(
+        mock_loader.load.return_value,
+        schema_cache=mock_schema_cache_class.return_value,
+        default_timeout=30,
+        supervisor=mock_supervisor_class.return_value,
+    )
+    mock_result_store_class.assert_called_once_with("sessions/results", 65536)
+    mock_set_result_store.assert_called_once_with(mock_result_store_class.return_value)
+    mock_supervisor_class.assert_called_once_with(interval=15, failure_threshold=3, reset_timeout=30, backoff_max=60)
+    mock_supervisor_class.return_value.start.assert_called_once()
+    mock_executor_class.return_value.warm_up.assert_not_called()
+    mock_schema_cache_class.assert_called_once_with("sessions/mcp_schema_cache.json", 60)
+    mock_loader.load.assert_called_once_with("mcp_servers.json")
+    mock_executor_class.return_value.shutdown.assert_called_once()
+
+
+@patch("asterism.api.main.ServerSupervisor")
+@patch("asterism.api.main.ToolSchemaCache")
+@patch("asterism.api.main.MCPConfigLoader")
+@patch("asterism.api.main.MCPExecutor")
+@patch("asterism.api.main.LLMProviderRouter")
+def test_lifespan_warms_up_mcp_servers_when_enabled(
+    mock_router_class, mock_executor_class, mock_loader, mock_schema_cache_class, mock_supervisor_class
+):
+    """MCP servers are warmed up before serving when mcp.warmup is set."""
+    config = _build_config()
+    config.data.mcp.warmup = True
+    config.data.mcp.warmup_timeout = 12
+
+    with TestClient(create_api_app(config)):
+        mock_executor_class.return_value.warm_up.assert_called_once_with(12)
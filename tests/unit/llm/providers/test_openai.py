@@ -0,0 +1,207 @@
+"""Test OpenAI provider with a mocked LangChain client."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+
+from asterism.llm.providers import BaseLLMProvider, LLMResponse, OpenAIProvider
+
+
+class Answer(BaseModel):
+    """Schema for structured output tests."""
+
+    answer: str
+
+
+def _message(content: str) -> AIMessage:
+    """Create a client response with usage metadata."""
+    return AIMessage(content=content, usage_metadata={"input_tokens": 5, "output_tokens": 2, "total_tokens": 7})
+
+
+@pytest.fixture
+def provider():
+    """OpenAI provider whose client is mocked."""
+    provider = OpenAIProvider(provider_name="openai", model="gpt-test", api_key="test-key")
+    provider.client = MagicMock()
+    provider.client.ainvoke = AsyncMock()
+    return provider
+
+
+def test_ainvoke_with_usage_uses_async_client(provider):
+    """Test ainvoke_with_usage awaits the async client and reports usage."""
+    provider.client.ainvoke.return_value = _message("hello")
+
+    response = asyncio.run(provider.ainvoke_with_usage("hi"))
+
+    assert response == LLMResponse(content="hello", prompt_tokens=5, completion_tokens=2, total_tokens=7)
+    provider.client.invoke.assert_not_called()
+
+
+def test_ainvoke_wraps_client_errors(provider):
+    """Test client errors are raised as RuntimeError."""
+    provider.client.ainvoke.side_effect = ValueError("bad key")
+
+    with pytest.raises(RuntimeError, match="OpenAI API error: bad key"):
+        asyncio.run(provider.ainvoke("hi"))
+
+
+def test_ainvoke_structured_repairs_output_locally(provider):
+    """Test slightly malformed JSON is repaired without another LLM call."""
+    provider.client.ainvoke.return_value = _message('```json\n{"answer": "4",}\n```')
+
+    response = asyncio.run(provider.ainvoke_structured("2+2?", Answer))
+
+    assert response.parsed == Answer(answer="4")
+    assert response.repaired is True
+    assert response.retries == 0
+    provider.client.ainvoke.assert_awaited_once()
+
+
+def test_ainvoke_structured_asks_to_correct_invalid_output(provider):
+    """Test output that cannot be repaired is sent back with its errors, without a backoff."""
+    provider.client.ainvoke.side_effect = [_message('{"reply": "4"}'), _message('{"answer": "4"}')]
+
+    with patch("asterism.llm.providers.openai.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        response = asyncio.run(provider.ainvoke_structured("2+2?", Answer))
+
+    assert response.parsed == Answer(answer="4")
+    assert response.retries == 1
+    assert response.repaired is False
+    assert response.total_tokens == 14
+    mock_sleep.assert_not_awaited()
+
+    correction = provider.client.ainvoke.call_args.args[0]
+    assert correction[-2].content == '{"reply": "4"}'
+    assert "- answer: Field required" in correction[-1].content
+
+
+def test_ainvoke_structured_backs_off_after_api_errors(provider):
+    """Test API errors are retried after an awaited exponential backoff."""
+    provider.client.ainvoke.side_effect = [ValueError("502"), ValueError("502"), _message('{"answer": "4"}')]
+
+    with patch("asterism.llm.providers.openai.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        response = asyncio.run(provider.ainvoke_structured("2+2?", Answer))
+
+    assert response.retries == 2
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [1, 2]
+
+
+def test_invoke_structured_sync_path_repairs_output(provider):
+    """Test the sync path shares the repair pipeline."""
+    provider.client.invoke.return_value = _message("{'answer': '4'}")
+
+    response = provider.invoke_structured("2+2?", Answer)
+
+    assert response.parsed == Answer(answer="4")
+    assert response.repaired is True
+
+
+def test_invoke_structured_sync_backoff_waits_on_cancel_event(provider):
+    """Test the sync path retries API errors after a backoff waited on the cancel event."""
+    provider.client.invoke.side_effect = [ValueError("502"), _message('{"answer": "4"}')]
+    cancel = MagicMock()
+    cancel.wait.return_value = False
+
+    response = provider.invoke_structured("2+2?", Answer, cancel=cancel)
+
+    assert response.retries == 1
+    cancel.wait.assert_called_once_with(1.0)
+    assert "cancel" not in provider.client.invoke.call_args.kwargs
+
+
+def test_invoke_structured_sync_backoff_is_cut_short_by_cancel(provider):
+    """Test setting the cancel event ends a sync backoff without another call."""
+    provider.client.invoke.side_effect = ValueError("502")
+    cancel = threading.Event()
+    threading.Timer(0.05, cancel.set).start()
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="cancelled during retry backoff"):
+        provider.invoke_structured("2+2?", Answer, cancel=cancel)
+
+    assert time.monotonic() - started < 0.9
+    provider.client.invoke.assert_called_once()
+
+
+def test_ainvoke_structured_reports_raw_output_after_last_attempt(provider):
+    """Test the final error carries the raw LLM output."""
+    provider.client.ainvoke.return_value = _message("still not json")
+
+    with patch("asterism.llm.providers.openai.asyncio.sleep", new_callable=AsyncMock):
+        with pytest.raises(RuntimeError, match="after 2 attempts") as exc_info:
+            asyncio.run(provider.ainvoke_structured("2+2?", Answer, max_retries=2))
+
+    assert "still not json" in str(exc_info.value)
+
+
+def test_invoke_structured_sends_schema_in_json_schema_mode(provider):
+    """Test json_schema mode sends the Pydantic schema as the response format."""
+    provider.structured_output = "json_schema"
+    provider.client.invoke.return_value = _message('{"answer": "4"}')
+
+    response = provider.invoke_structured("2+2?", Answer)
+
+    assert response.retries == 0
+    response_format = provider.client.invoke.call_args.kwargs["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["name"] == "Answer"
+    assert response_format["json_schema"]["schema"]["required"] == ["answer"]
+
+
+def test_ainvoke_structured_adds_schema_instruction_in_json_object_mode(provider):
+    """Test json_object mode enables JSON mode and puts the schema in the prompt."""
+    provider.structured_output = "json_object"
+    provider.client.ainvoke.return_value = _message('{"answer": "4"}')
+
+    asyncio.run(provider.ainvoke_structured("2+2?", Answer))
+
+    messages = provider.client.ainvoke.call_args.args[0]
+    assert provider.client.ainvoke.call_args.kwargs["response_format"] == {"type": "json_object"}
+    assert "JSON schema" in messages[-1].content
+    assert '"answer"' in messages[-1].content
+
+
+def test_invoke_structured_without_native_mode_sends_no_response_format(provider):
+    """Test providers without native support get the plain request."""
+    provider.client.invoke.return_value = _message('{"answer": "4"}')
+
+    provider.invoke_structured("2+2?", Answer)
+
+    assert "response_format" not in provider.client.invoke.call_args.kwargs
+
+
+def test_rejects_unknown_structured_output_mode():
+    """Test an unknown structured output mode is rejected."""
+    with pytest.raises(ValueError, match="Unknown structured output mode"):
+        OpenAIProvider(provider_name="openai", model="gpt-test", api_key="test-key", structured_output="xml")
+
+
+def test_base_provider_async_methods_default_to_sync_ones():
+    """Test providers without native async support run their sync methods in a thread."""
+
+    class SyncOnlyProvider(BaseLLMProvider):
+        name = "sync"
+        model = "sync-model"
+
+        def invoke(self, prompt, **kwargs):
+            return f"echo: {prompt}"
+
+        def invoke_with_usage(self, prompt, **kwargs):
+            return LLMResponse(content=self.invoke(prompt))
+
+        def invoke_structured(self, prompt, schema, **kwargs):
+            raise NotImplementedError
+
+    provider = SyncOnlyProvider()
+
+    assert asyncio.run(provider.ainvoke("hi")) == "echo: hi"
+    assert asyncio.run(provider.ainvoke_with_usage("hi")).content == "echo: hi"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
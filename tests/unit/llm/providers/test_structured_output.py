@@ -0,0 +1,101 @@
+"""Test parsing and repair of structured LLM output."""
+
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from asterism.llm.providers.structured_output import (
+    StructuredOutputError,
+    build_correction_prompt,
+    extract_json_candidates,
+    parse_structured_output,
+    repair_json,
+)
+
+
+class Step(BaseModel):
+    """Nested schema for tests."""
+
+    name: str
+    done: bool = False
+
+
+class Plan(BaseModel):
+    """Schema for tests."""
+
+    reasoning: str
+    steps: list[Step]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('{"a": [1, 2,],}', {"a": [1, 2]}),
+        ("{'a': 'it\\'s', 'b': None, 'c': True}", {"a": "it's", "b": None, "c": True}),
+        ('{"a": "say \\"hi\\", ok"}', {"a": 'say "hi", ok'}),
+        ("{“a”: “b”}", {"a": "b"}),
+        ('{"a": "line\nbreak"}', {"a": "line\nbreak"}),
+        ('{"a": [{"b": "cut', {"a": [{"b": "cut"}]}),
+        ('{"a": "True, None", "b": false}', {"a": "True, None", "b": False}),
+    ],
+)
+def test_repair_json(text, expected):
+    """Test common syntax defects are repaired into valid JSON."""
+    assert json.loads(repair_json(text)) == expected
+
+
+def test_repair_json_keeps_valid_json():
+    """Test valid JSON passes through unchanged."""
+    text = '{"a": [1, 2.5e3, null], "b": "x, ]"}'
+
+    assert repair_json(text) == text
+
+
+def test_extract_json_candidates_prefers_fenced_block():
+    """Test fenced blocks and bracket spans are offered after the raw text."""
+    text = 'Here you go:\n```json\n{"a": 1}\n```\nDone.'
+
+    candidates = extract_json_candidates(text)
+
+    assert candidates[1] == '{"a": 1}'
+
+
+def test_parse_structured_output_direct():
+    """Test valid output parses without repair."""
+    parsed, content, repaired = parse_structured_output('{"reasoning": "r", "steps": []}', Plan)
+
+    assert parsed == Plan(reasoning="r", steps=[])
+    assert content == '{"reasoning": "r", "steps": []}'
+    assert repaired is False
+
+
+def test_parse_structured_output_repairs_prose_wrapped_json():
+    """Test JSON inside prose with a trailing comma is found and repaired."""
+    text = 'Sure! {"reasoning": "r", "steps": [{"name": "a", "done": True},],} Hope this helps.'
+
+    parsed, _, repaired = parse_structured_output(text, Plan)
+
+    assert parsed.steps == [Step(name="a", done=True)]
+    assert repaired is True
+
+
+def test_parse_structured_output_reports_schema_errors_with_location():
+    """Test the errors of valid JSON that misses the schema name the failing field."""
+    with pytest.raises(StructuredOutputError) as exc_info:
+        parse_structured_output('Plan: {"reasoning": "r", "steps": [{"done": "maybe"}]}', Plan)
+
+    errors = exc_info.value.errors
+    assert "steps.0.name: Field required" in errors
+    assert any(error.startswith("steps.0.done:") for error in errors)
+    assert "- steps.0.name: Field required" in build_correction_prompt(exc_info.value)
+
+
+def test_parse_structured_output_reports_syntax_errors():
+    """Test output without any JSON reports a syntax error."""
+    with pytest.raises(StructuredOutputError, match="Invalid JSON"):
+        parse_structured_output("I cannot help with that.", Plan)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
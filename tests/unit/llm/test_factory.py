@@ -0,0 +1,32 @@
+"""Test LLM provider factory."""
+
+import pytest
+
+from asterism.config import ModelProvider
+from asterism.llm.factory import LLMProviderFactory
+from asterism.llm.providers import OpenAIProvider
+
+
+def test_create_provider_passes_structured_output_mode():
+    """Test the provider's structured output capability comes from its config."""
+    provider = LLMProviderFactory.create_provider(
+        ModelProvider(type="openai-compatible", name="openai", api_key="test-key", structured_output="json_schema")
+    )
+
+    assert isinstance(provider, OpenAIProvider)
+    assert provider.structured_output == "json_schema"
+
+
+def test_structured_output_defaults_to_none():
+    """Test providers without the setting use no native structured output."""
+    assert ModelProvider(type="openai-compatible", name="openai").structured_output == "none"
+
+
+def test_create_provider_requires_api_key():
+    """Test providers without an API key are rejected."""
+    with pytest.raises(ValueError, match="API key is required"):
+        LLMProviderFactory.create_provider(ModelProvider(type="openai-compatible", name="openai"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+"""Test the hedging budget and accounting."""
+
+import pytest
+
+from asterism.llm.hedging import RequestHedger, response_tokens
+from asterism.llm.providers import LLMResponse
+
+
+def test_only_configured_nodes_are_hedged():
+    """Test hedging is opt-in per node and off with a zero hedge rate."""
+    hedger = RequestHedger(nodes=["planner_node"])
+
+    assert hedger.enabled("planner_node")
+    assert not hedger.enabled("finalizer_node")
+    assert not hedger.enabled(None)
+    assert not RequestHedger(nodes=["planner_node"], max_hedge_rate=0).enabled("planner_node")
+
+
+def test_try_hedge_respects_max_hedge_rate():
+    """Test at most max_hedge_rate of the recent calls are hedged."""
+    hedger = RequestHedger(nodes=["planner_node"], max_hedge_rate=0.25, window=8)
+
+    hedged = []
+    for _ in range(8):
+        hedged.append(hedger.try_hedge("planner_node", hedger.start_call("planner_node")))
+
+    assert hedged.count(True) == 2
+    assert hedger.status()["planner_node"]["calls"] == 8
+
+
+def test_try_hedge_once_per_call():
+    """Test a call cannot take a second hedge from the budget."""
+    hedger = RequestHedger(nodes=["planner_node"], max_hedge_rate=1.0)
+    sample = hedger.start_call("planner_node")
+
+    assert hedger.try_hedge("planner_node", sample)
+    assert not hedger.try_hedge("planner_node", sample)
+
+
+def test_try_hedge_marks_the_calling_call():
+    """Test a hedge is counted for the call that took it, not the most recent one."""
+    hedger = RequestHedger(nodes=["planner_node"], max_hedge_rate=1.0)
+    first = hedger.start_call("planner_node")
+    second = hedger.start_call("planner_node")
+
+    assert hedger.try_hedge("planner_node", first)
+
+    assert first.hedged and not second.hedged
+    assert hedger.try_hedge("planner_node", second)
+
+
+def test_record_outcome_accumulates():
+    """Test wins and extra tokens add up per node."""
+    hedger = RequestHedger(nodes=["planner_node"])
+    hedger.record_outcome("planner_node", hedge_won=True, extra_tokens=30)
+    hedger.record_outcome("planner_node", hedge_won=False, extra_tokens=12)
+
+    assert hedger.status()["planner_node"]["hedge_wins"] == 1
+    assert hedger.status()["planner_node"]["extra_tokens"] == 42
+
+
+def test_response_tokens():
+    """Test token counts are read from responses and default to 0 for text."""
+    assert response_tokens(LLMResponse(content="hi", total_tokens=5)) == 5
+    assert response_tokens("hi") == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
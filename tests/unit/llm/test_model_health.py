@@ -0,0 +1,104 @@
+"""Test model health tracking and circuit breaking."""
+
+from unittest.mock import patch
+
+import pytest
+
+from asterism.llm.health import CircuitState, ModelHealthTracker
+
+
+@pytest.fixture
+def tracker():
+    """Tracker that opens a circuit after two failures."""
+    return ModelHealthTracker(failure_threshold=2, reset_timeout=10.0)
+
+
+def test_circuit_opens_after_threshold(tracker):
+    """Test consecutive failures open the circuit and block calls."""
+    tracker.record_failure("a/m", "down")
+    assert tracker.allow("a/m")
+
+    tracker.record_failure("a/m", "down")
+
+    assert not tracker.allow("a/m")
+    assert tracker.status()["a/m"]["state"] == CircuitState.OPEN
+    assert tracker.status()["a/m"]["last_error"] == "down"
+
+
+def test_success_resets_consecutive_failures(tracker):
+    """Test a success in between keeps the circuit closed."""
+    tracker.record_failure("a/m", "down")
+    tracker.record_success("a/m", 0.2)
+    tracker.record_failure("a/m", "down")
+
+    assert tracker.allow("a/m")
+    assert tracker.status()["a/m"]["consecutive_failures"] == 1
+    assert tracker.status()["a/m"]["latency_ms"] == 200.0
+
+
+@patch("asterism.llm.health.time.monotonic")
+def test_half_open_allows_single_probe(monotonic, tracker):
+    """Test one probe goes through after the reset timeout and its success closes the circuit."""
+    monotonic.return_value = 100.0
+    tracker.record_failure("a/m", "down")
+    tracker.record_failure("a/m", "down")
+
+    monotonic.return_value = 111.0
+    assert tracker.allow("a/m")
+    assert not tracker.allow("a/m")
+
+    tracker.record_success("a/m", 0.1)
+
+    assert tracker.allow("a/m")
+    assert tracker.status()["a/m"]["state"] == CircuitState.CLOSED
+
+
+@patch("asterism.llm.health.time.monotonic")
+def test_failed_probe_reopens_circuit(monotonic, tracker):
+    """Test a failing probe opens the circuit for another reset timeout."""
+    monotonic.return_value = 100.0
+    tracker.record_failure("a/m", "down")
+    tracker.record_failure("a/m", "down")
+    monotonic.return_value = 111.0
+    tracker.allow("a/m")
+
+    tracker.record_failure("a/m", "still down")
+
+    assert not tracker.allow("a/m")
+
+
+@patch("asterism.llm.health.time.monotonic")
+def test_release_frees_probe_slot(monotonic, tracker):
+    """Test a cancelled probe lets the next call probe instead."""
+    monotonic.return_value = 100.0
+    tracker.record_failure("a/m", "down")
+    tracker.record_failure("a/m", "down")
+    monotonic.return_value = 111.0
+    tracker.allow("a/m")
+
+    tracker.release("a/m")
+
+    assert tracker.allow("a/m")
+
+
+def test_order_puts_degraded_models_last(tracker):
+    """Test healthy models keep their order ahead of degraded ones."""
+    tracker.record_failure("a/m", "down")
+    tracker.record_success("b/m", 0.1)
+
+    assert tracker.order(["a/m", "b/m", "c/m"]) == ["b/m", "c/m", "a/m"]
+
+
+def test_latency_percentile(tracker):
+    """Test the nearest-rank percentile needs min_samples latencies."""
+    for latency in (0.4, 0.1, 0.3, 0.2):
+        tracker.record_success("a/m", latency)
+
+    assert tracker.latency_percentile("a/m", 50) == 0.2
+    assert tracker.latency_percentile("a/m", 95) == 0.4
+    assert tracker.latency_percentile("a/m", 95, min_samples=5) is None
+    assert tracker.latency_percentile("b/m", 95) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,267 @@
+"""Test LLM provider router fallback."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from asterism.llm.exceptions import AllProvidersFailedError
+from asterism.llm.provider_router import LLMProviderRouter
+from asterism.llm.providers import LLMResponse, StructuredLLMResponse
+
+
+def _mock_provider(name: str) -> MagicMock:
+    """Create a provider mock with async methods."""
+    provider = MagicMock()
+    provider.name = name
+    provider.ainvoke = AsyncMock()
+    provider.ainvoke_with_usage = AsyncMock()
+    provider.ainvoke_structured = AsyncMock()
+    return provider
+
+
+@pytest.fixture
+def providers():
+    """Primary and fallback provider mocks."""
+    return {"primary": _mock_provider("primary"), "backup": _mock_provider("backup")}
+
+
+@pytest.fixture
+def router(providers):
+    """Router over the provider mocks with one fallback model."""
+    config = MagicMock()
+    config.data.models = SimpleNamespace(
+        provider=[SimpleNamespace(name="primary"), SimpleNamespace(name="backup")],
+        default="primary/model-a",
+        fallback=["backup/model-b"],
+        failure_threshold=2,
+        circuit_reset_timeout=30.0,
+        hedging=SimpleNamespace(nodes=["planner_node"], percentile=95.0, min_samples=2, max_hedge_rate=0.5),
+    )
+    with patch(
+        "asterism.llm.provider_router.LLMProviderFactory.create_provider",
+        side_effect=lambda provider_config: providers[provider_config.name],
+    ):
+        return LLMProviderRouter(config)
+
+
+def test_invoke_falls_back_to_next_model(router, providers):
+    """Test a failing primary model falls back to the next model in the chain."""
+    providers["primary"].invoke.side_effect = RuntimeError("down")
+    providers["backup"].invoke.return_value = "answer"
+
+    assert router.invoke("hi") == "answer"
+    assert providers["backup"].invoke.call_args.kwargs["model"] == "model-b"
+
+
+def test_ainvoke_uses_primary_model(router, providers):
+    """Test ainvoke awaits the primary provider and skips the fallback."""
+    providers["primary"].ainvoke.return_value = "answer"
+
+    assert asyncio.run(router.ainvoke("hi")) == "answer"
+    assert providers["primary"].ainvoke.call_args.kwargs["model"] == "model-a"
+    providers["backup"].ainvoke.assert_not_called()
+
+
+def test_ainvoke_with_usage_falls_back(router, providers):
+    """Test the async fallback moves on to the next model when one fails."""
+    providers["primary"].ainvoke_with_usage.side_effect = RuntimeError("rate limited")
+    providers["backup"].ainvoke_with_usage.return_value = LLMResponse(content="ok", total_tokens=3)
+
+    response = asyncio.run(router.ainvoke_with_usage("hi"))
+
+    assert response.content == "ok"
+    providers["primary"].invoke_with_usage.assert_not_called()
+
+
+def test_ainvoke_structured_raises_when_all_models_fail(router, providers):
+    """Test AllProvidersFailedError lists the chain and keeps the last error."""
+    providers["primary"].ainvoke_structured.side_effect = RuntimeError("down")
+    providers["backup"].ainvoke_structured.side_effect = RuntimeError("also down")
+
+    with pytest.raises(AllProvidersFailedError) as exc_info:
+        asyncio.run(router.ainvoke_structured("hi", dict))
+
+    assert exc_info.value.provider_chain == ["primary/model-a", "backup/model-b"]
+    assert str(exc_info.value.last_error) == "also down"
+
+
+def test_ainvoke_structured_passes_schema(router, providers):
+    """Test the schema reaches the provider unchanged."""
+    providers["primary"].ainvoke_structured.return_value = StructuredLLMResponse(content="{}", parsed={})
+
+    asyncio.run(router.ainvoke_structured("hi", dict, model="primary/model-c"))
+
+    args, kwargs = providers["primary"].ainvoke_structured.call_args
+    assert args == ("hi", dict)
+    assert kwargs["model"] == "model-c"
+
+
+def test_open_circuit_skips_model(router, providers):
+    """Test a model is skipped once failure_threshold calls in a row have failed."""
+    providers["primary"].invoke.side_effect = RuntimeError("down")
+    providers["backup"].invoke.side_effect = [RuntimeError("blip"), "answer", RuntimeError("blip")]
+
+    with pytest.raises(AllProvidersFailedError):
+        router.invoke("hi")
+    assert router.invoke("hi") == "answer"
+    with pytest.raises(AllProvidersFailedError):
+        router.invoke("hi")
+
+    assert providers["primary"].invoke.call_count == 2
+    assert router.health.status()["primary/model-a"]["state"] == "open"
+
+
+def test_failed_model_moves_behind_healthy_one(router, providers):
+    """Test a model with a recent failure is tried after healthy models."""
+    providers["primary"].invoke.side_effect = [RuntimeError("blip"), "primary answer"]
+    providers["backup"].invoke.return_value = "backup answer"
+
+    assert router.invoke("hi") == "backup answer"
+    assert router.invoke("hi") == "backup answer"
+    assert providers["primary"].invoke.call_count == 1
+
+
+def test_all_circuits_open_fails_fast(router, providers):
+    """Test no provider is called while every model's circuit is open."""
+    for provider in providers.values():
+        provider.ainvoke.side_effect = RuntimeError("down")
+    for _ in range(2):
+        with pytest.raises(AllProvidersFailedError):
+            asyncio.run(router.ainvoke("hi"))
+    for provider in providers.values():
+        provider.ainvoke.reset_mock()
+
+    with pytest.raises(AllProvidersFailedError, match="circuit open"):
+        asyncio.run(router.ainvoke("hi"))
+
+    providers["primary"].ainvoke.assert_not_called()
+    providers["backup"].ainvoke.assert_not_called()
+
+
+def _prime_latency(router, key: str = "primary/model-a", latency: float = 0.01) -> None:
+    """Record enough successful calls for a model's calls to be hedged."""
+    for _ in range(2):
+        router.health.record_success(key, latency)
+
+
+def _slow(response, delay: float):
+    """Side effect of a provider call that answers after a delay."""
+
+    async def call(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return response
+
+    return call
+
+
+def test_slow_model_is_hedged_with_next_model(router, providers):
+    """Test a call slower than the model's latency percentile is raced against the next model."""
+    _prime_latency(router)
+    providers["primary"].ainvoke_with_usage.side_effect = _slow(LLMResponse(content="slow"), 5.0)
+    providers["backup"].ainvoke_with_usage.return_value = LLMResponse(
+        content="fast", prompt_tokens=7, completion_tokens=3, total_tokens=10
+    )
+
+    response = asyncio.run(router.ainvoke_with_usage("hi", node="planner_node"))
+
+    assert response.content == "fast"
+    assert "node" not in providers["backup"].ainvoke_with_usage.call_args.kwargs
+    # The cancelled primary call is accounted at the winner's prompt tokens
+    assert router.hedger.status()["planner_node"] == {"calls": 1, "hedges": 1, "hedge_wins": 1, "extra_tokens": 7}
+
+
+def test_calls_of_other_nodes_are_not_hedged(router, providers):
+    """Test hedging is opt-in per node."""
+    _prime_latency(router)
+    providers["primary"].ainvoke_with_usage.side_effect = _slow(LLMResponse(content="slow"), 0.1)
+
+    response = asyncio.run(router.ainvoke_with_usage("hi", node="finalizer_node"))
+
+    assert response.content == "slow"
+    providers["backup"].ainvoke_with_usage.assert_not_called()
+
+
+def test_hedge_budget_limits_hedges(router, providers):
+    """Test no more than max_hedge_rate of a node's calls are hedged."""
+    _prime_latency(router)
+    providers["primary"].ainvoke_with_usage.side_effect = _slow(LLMResponse(content="slow"), 0.1)
+    providers["backup"].ainvoke_with_usage.return_value = LLMResponse(content="fast")
+
+    first = asyncio.run(router.ainvoke_with_usage("hi", node="planner_node"))
+    second = asyncio.run(router.ainvoke_with_usage("hi", node="planner_node"))
+
+    assert (first.content, second.content) == ("fast", "slow")
+    assert router.hedger.status()["planner_node"]["hedges"] == 1
+
+
+def test_model_without_latency_samples_is_not_hedged(router, providers):
+    """Test calls are not hedged until the model has min_samples latencies."""
+    providers["primary"].ainvoke_with_usage.side_effect = _slow(LLMResponse(content="slow"), 0.1)
+
+    response = asyncio.run(router.ainvoke_with_usage("hi", node="planner_node"))
+
+    assert response.content == "slow"
+    providers["backup"].ainvoke_with_usage.assert_not_called()
+
+
+def test_hedged_call_falls_back_when_hedge_fails(router, providers):
+    """Test a failing hedge leaves the slow model to answer."""
+    _prime_latency(router)
+    providers["primary"].ainvoke_with_usage.side_effect = _slow(LLMResponse(content="slow"), 0.1)
+    providers["backup"].ainvoke_with_usage.side_effect = RuntimeError("down")
+
+    response = asyncio.run(router.ainvoke_with_usage("hi", node="planner_node"))
+
+    assert response.content == "slow"
+    assert router.hedger.status()["planner_node"]["hedge_wins"] == 0
+
+
+def test_sync_slow_model_is_hedged(router, providers):
+    """Test sync calls are hedged too and the discarded answer's tokens are accounted when it arrives."""
+    _prime_latency(router)
+
+    def slow_call(*args, **kwargs):
+        time.sleep(0.3)
+        return StructuredLLMResponse(content="{}", parsed={"slow": True}, total_tokens=12)
+
+    providers["primary"].invoke_structured.side_effect = slow_call
+    providers["backup"].invoke_structured.return_value = StructuredLLMResponse(content="{}", parsed={"fast": True})
+
+    response = router.invoke_structured("hi", dict, node="planner_node")
+    hedge_executor = router._hedge_executor
+    router.close()
+    hedge_executor.shutdown(wait=True)
+
+    assert response.parsed == {"fast": True}
+    assert router.hedger.status()["planner_node"]["extra_tokens"] == 12
+    assert router._hedge_executor is None
+    # The losing call's retries are cancelled once the router has its answer
+    assert providers["primary"].invoke_structured.call_args.kwargs["cancel"].is_set()
+
+
+def test_concurrent_first_hedged_calls_share_one_worker_pool(router):
+    """Test concurrent first calls create a single hedge worker pool, which close() then shuts down."""
+    barrier = threading.Barrier(8)
+    executors = []
+
+    def first_call():
+        barrier.wait()
+        executors.append(router._get_hedge_executor())
+
+    threads = [threading.Thread(target=first_call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(executor) for executor in executors}) == 1
+    router.close()
+    assert executors[0]._shutdown
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
-from asterism.mcp.config import MCPConfig
+from asterism.mcp.config import SERVER_SETTING_DEFAULTS, TOOL_SETTING_DEFAULTS, MCPConfig
 
 
 @patch("asterism.mcp.config.MCPConfig.load_config")
@@ -82,5 +82,59 @@ def test_get_enabled_servers(mock_load):
     assert "code_parser" not in enabled_servers
 
 
+@patch("asterism.mcp.config.MCPConfig.load_config")
+def test_get_server_settings(mock_load):
+    """Test runtime settings fall back to defaults."""
+    mock_config = {"mcpServers": {"filesystem": {"replicas": 4, "timeout": 10}, "code_parser": {}}}
+    mock_load.return_value = mock_config
+
+    config = MCPConfig()
+
+    settings = config.get_server_settings("filesystem")
+    assert settings["replicas"] == 4
+    assert settings["timeout"] == 10
+    assert settings["max_concurrency"] == 1
+    assert settings["restart_on_timeout"] is False
+    assert config.get_server_settings("code_parser") == SERVER_SETTING_DEFAULTS
+
+
+@patch("asterism.mcp.config.MCPConfig.load_config")
+def test_get_tool_settings(mock_load):
+    """Test per-tool settings fall back to defaults."""
+    mock_load.return_value = {
+        "mcpServers": {"localtime": {"tool_settings": {"get_current_time": {"cacheable": True, "ttl_seconds": 1}}}}
+    }
+
+    config = MCPConfig()
+
+    settings = config.get_tool_settings("localtime", "get_current_time")
+    assert settings["cacheable"] is True
+    assert settings["ttl_seconds"] == 1
+    assert settings["max_entries"] == TOOL_SETTING_DEFAULTS["max_entries"]
+    assert config.get_tool_settings("localtime", "other") == TOOL_SETTING_DEFAULTS
+    assert config.get_tool_settings("missing", "tool") == TOOL_SETTING_DEFAULTS
+
+
+@patch("asterism.mcp.config.MCPConfig.load_config")
+def test_get_tool_manifest(mock_load):
+    """Test full tool manifests are returned and manifests without schemas fall back to discovery."""
+    mock_config = {
+        "mcpServers": {
+            "filesystem": {"tools": [{"name": "write_file", "inputSchema": {"type": "object"}}]},
+            "web": {"tools": ["search", {"name": "fetch", "inputSchema": {"type": "object"}}]},
+            "code_parser": {},
+        }
+    }
+    mock_load.return_value = mock_config
+
+    config = MCPConfig()
+
+    assert config.get_tool_manifest("filesystem") == [{"name": "write_file", "inputSchema": {"type": "object"}}]
+    # Plain tool names give the planner no description and the validator no schema
+    assert config.get_tool_manifest("web") is None
+    assert config.get_tool_manifest("code_parser") is None
+    assert config.get_tool_manifest("missing") is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
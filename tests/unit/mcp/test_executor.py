@@ -1,10 +1,17 @@
 """Test MCP executor system."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from asterism.mcp.config import SERVER_SETTING_DEFAULTS, TOOL_SETTING_DEFAULTS
 from asterism.mcp.executor import MCPExecutor, execute_mcp_tool, get_mcp_executor
+from asterism.mcp.schema_cache import ToolSchemaCache
+from asterism.mcp.supervisor import ServerSupervisor
+from asterism.mcp.transport_executor.async_base import AsyncTransport
 
 
 @pytest.fixture
@@ -18,6 +25,9 @@ def mock_config():
     }
     config.is_server_enabled.return_value = True
     config.get_enabled_servers.return_value = ["filesystem", "code_parser"]
+    config.get_server_settings.return_value = dict(SERVER_SETTING_DEFAULTS)
+    config.get_tool_manifest.return_value = None
+    config.get_tool_settings.return_value = dict(TOOL_SETTING_DEFAULTS)
     return config
 
 
@@ -26,7 +36,16 @@ def mock_transport():
     """Create a mock transport."""
     transport = MagicMock()
     transport.list_tools.return_value = ["list_files", "read_file", "write_file", "get_file_info"]
+    transport.get_tool_schemas.return_value = [
+        {"name": name, "description": f"{name} tool", "inputSchema": {"type": "object"}}
+        for name in transport.list_tools.return_value
+    ]
     transport.execute_tool.return_value = {"success": True, "data": "test_result"}
+    # Like BaseTransport.call_tool, the deadline-aware call delegates to execute_tool
+    transport.call_tool.side_effect = lambda tool_name, arguments, timeout=None: transport.execute_tool(
+        tool_name, **arguments
+    )
+    transport.get_stderr.return_value = ""
     transport.is_alive.return_value = True
     return transport
 
@@ -71,7 +90,9 @@ class TestMCPExecutor:
                 assert result["tool_call"] == "filesystem:list_files"
                 assert result["error"] is None
                 mock_transport.start.assert_called_once_with("test_command", ["arg1", "arg2"])
-                mock_transport.list_tools.assert_called_once()
+                # One tools/list round trip fills both the tool names and schemas
+                mock_transport.get_tool_schemas.assert_called_once()
+                mock_transport.list_tools.assert_not_called()
                 mock_transport.execute_tool.assert_called_once_with("list_files")
 
     def test_execute_tool_invalid_server(self, mock_config):
@@ -197,6 +218,338 @@ class TestMCPExecutor:
                 assert "error" in result
                 assert "Connection lost" in result["error"]
 
+    def test_execute_tool_failure_includes_server_stderr(self, mock_config, mock_transport):
+        """Test a failed call carries the tail of the server's stderr."""
+        mock_transport.execute_tool.side_effect = RuntimeError("Tool execution failed")
+        mock_transport.get_stderr.return_value = "Traceback (most recent call last):\nKeyError: 'path'"
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                result = executor.execute_tool("filesystem", "list_files")
+
+                assert result["success"] is False
+                assert result["error"].startswith("Error executing tool: Tool execution failed\nServer stderr")
+                assert "KeyError: 'path'" in result["error"]
+                mock_transport.get_stderr.assert_called_with(20)
+                assert executor.get_server_stderr("filesystem") == mock_transport.get_stderr.return_value
+                assert executor.get_server_stderr("unknown") == ""
+
+    def test_execute_tool_passes_transport_options(self, mock_config, mock_transport):
+        """Test that transport_options from the server settings reach the transport factory."""
+        mock_config.get_server_settings.return_value = {
+            **SERVER_SETTING_DEFAULTS,
+            "transport_options": {"timeout": 5.0, "max_connections": 4},
+        }
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport) as mock_create:
+                executor = MCPExecutor()
+                executor.execute_tool("filesystem", "list_files")
+
+                mock_create.assert_called_once_with("stdio", timeout=5.0, max_connections=4)
+
+    def test_aexecute_tool_sync_transport(self, mock_config, mock_transport):
+        """Test that aexecute_tool runs synchronous transports in a worker thread."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                result = asyncio.run(executor.aexecute_tool("filesystem", "list_files", pattern="*.py"))
+
+                assert result["success"] is True
+                assert result["result"] == {"success": True, "data": "test_result"}
+                mock_transport.execute_tool.assert_called_once_with("list_files", pattern="*.py")
+
+    def test_aexecute_tool_awaits_async_transport(self, mock_config):
+        """Test that aexecute_tool awaits async transports instead of blocking."""
+        transport = MagicMock(spec=AsyncTransport)
+        transport.get_tool_schemas.return_value = [{"name": "list_files"}]
+        transport.acall_tool = AsyncMock(return_value={"success": True, "result": {"files": []}})
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=transport):
+                executor = MCPExecutor()
+
+                result = asyncio.run(executor.aexecute_tool("filesystem", "list_files"))
+
+                assert result["success"] is True
+                assert result["tool"] == "filesystem:list_files"
+                transport.acall_tool.assert_awaited_once_with("list_files", {}, timeout=None)
+                transport.execute_tool.assert_not_called()
+                transport.call_tool.assert_not_called()
+
+    def test_aexecute_tool_invalid_tool(self, mock_config, mock_transport):
+        """Test that aexecute_tool validates tools like execute_tool."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                result = asyncio.run(executor.aexecute_tool("filesystem", "invalid_tool"))
+
+                assert result["success"] is False
+                assert "not found" in result["error"]
+                assert result["result"] is None
+
+    def test_get_tool_schemas_served_from_persistent_cache(self, mock_config, mock_transport, tmp_path):
+        """Test tool schemas come from the persistent cache without starting servers."""
+        mock_config.get_enabled_servers.return_value = ["filesystem"]
+        cache = ToolSchemaCache(tmp_path / "schemas.json")
+        fingerprint = ToolSchemaCache.fingerprint(mock_config.get_server_metadata.return_value)
+        cache.put("filesystem", fingerprint, [{"name": "list_files"}])
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport) as mock_create:
+                executor = MCPExecutor(schema_cache=cache)
+
+                schemas = executor.get_tool_schemas()
+
+                assert schemas == {"filesystem": [{"name": "list_files"}]}
+                assert executor.validate_tool_call("filesystem", "list_files") is True
+                mock_create.assert_not_called()
+
+    def test_get_tool_schemas_cache_miss_fetches_and_persists(self, mock_config, mock_transport, tmp_path):
+        """Test a cache miss starts the server, fetches schemas from it and writes them to the cache."""
+        mock_config.get_enabled_servers.return_value = ["filesystem"]
+        cache = ToolSchemaCache(tmp_path / "schemas.json")
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor(schema_cache=cache)
+
+                schemas = executor.get_tool_schemas()
+
+                assert schemas["filesystem"] == mock_transport.get_tool_schemas.return_value
+                mock_transport.get_tool_schemas.assert_called_once()
+                # The server started for discovery serves the first tool call, no second cold start
+                mock_transport.stop.assert_not_called()
+                assert executor.execute_tool("filesystem", "list_files")["success"] is True
+                mock_transport.start.assert_called_once()
+
+        fingerprint = ToolSchemaCache.fingerprint(mock_config.get_server_metadata.return_value)
+        assert ToolSchemaCache(tmp_path / "schemas.json").get("filesystem", fingerprint).tools == schemas["filesystem"]
+
+    def test_stale_cached_schemas_revalidated_in_background(self, mock_config, mock_transport, tmp_path):
+        """Test stale schemas are served immediately and refreshed by a temporary server."""
+        mock_config.get_enabled_servers.return_value = ["filesystem"]
+        cache = ToolSchemaCache(tmp_path / "schemas.json", ttl_seconds=0)
+        fingerprint = ToolSchemaCache.fingerprint(mock_config.get_server_metadata.return_value)
+        cache.put("filesystem", fingerprint, [{"name": "old_tool"}])
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor(schema_cache=cache)
+
+                assert executor.get_tool_schemas() == {"filesystem": [{"name": "old_tool"}]}
+
+                deadline = time.monotonic() + 2
+                while executor.tool_cache["filesystem"] == ["old_tool"] and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                assert "list_files" in executor.tool_cache["filesystem"]
+                assert executor.tool_schema_cache["filesystem"] == mock_transport.get_tool_schemas.return_value
+                # The temporary server is stopped and no pool is kept
+                mock_transport.stop.assert_called_once()
+                assert executor.pools == {}
+
+    def test_get_tool_schemas_from_manifest_without_starting_server(self, mock_config, mock_transport):
+        """Test a server's tool manifest is used for discovery."""
+        mock_config.get_enabled_servers.return_value = ["filesystem"]
+        mock_config.get_tool_manifest.return_value = [{"name": "list_files"}]
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport) as mock_create:
+                executor = MCPExecutor()
+
+                assert executor.get_tool_schemas() == {"filesystem": [{"name": "list_files"}]}
+                mock_create.assert_not_called()
+
+    def test_server_activated_on_first_execute_tool(self, mock_config, mock_transport):
+        """Test discovery leaves servers stopped and the first tool call starts them."""
+        mock_config.get_enabled_servers.return_value = ["filesystem"]
+        mock_config.get_tool_manifest.return_value = [{"name": "list_files"}]
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                executor.get_tool_schemas()
+                assert executor.pools == {}
+
+                result = executor.execute_tool("filesystem", "list_files")
+
+                assert result["success"] is True
+                assert "filesystem" in executor.pools
+                mock_transport.start.assert_called_once()
+
+    def test_prefetch_starts_servers_in_background(self, mock_config, mock_transport):
+        """Test prefetch activates named servers without blocking the caller."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                executor.prefetch(["filesystem"])
+
+                deadline = time.monotonic() + 2
+                while "filesystem" not in executor.pools and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                assert "filesystem" in executor.pools
+                mock_transport.start.assert_called_once()
+
+    def test_prefetch_skips_disabled_and_opted_out_servers(self, mock_config, mock_transport):
+        """Test prefetch respects server enablement and the prefetch setting."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "prefetch": False}
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport) as mock_create:
+                executor = MCPExecutor()
+                executor.prefetch(["filesystem"])
+
+                mock_config.is_server_enabled.return_value = False
+                mock_config.get_server_settings.return_value = dict(SERVER_SETTING_DEFAULTS)
+                executor.prefetch(["code_parser"])
+
+                time.sleep(0.05)
+                mock_create.assert_not_called()
+
+    def test_warm_up_starts_servers_in_parallel(self, mock_config, mock_transport):
+        """Test warm-up starts every enabled server concurrently and reports them ready."""
+        started = threading.Barrier(2, timeout=2)
+
+        def start(*args):
+            # Both servers must be starting at the same time to pass the barrier
+            started.wait()
+
+        mock_transport.start.side_effect = start
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                assert executor.get_server_status() == {"filesystem": "idle", "code_parser": "idle"}
+                status = executor.warm_up(timeout=5)
+
+                assert status == {"filesystem": "ready", "code_parser": "ready"}
+                assert mock_transport.start.call_count == 2
+
+    def test_warm_up_deadline_leaves_slow_servers_starting(self, mock_config, mock_transport):
+        """Test warm-up returns at its deadline while slow servers keep starting."""
+        release = threading.Event()
+        mock_transport.start.side_effect = lambda *args: release.wait(5)
+        mock_config.get_enabled_servers.return_value = ["filesystem"]
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                start_time = time.monotonic()
+                status = executor.warm_up(timeout=0.1)
+
+                assert time.monotonic() - start_time < 1
+                assert status == {"filesystem": "starting"}
+
+                release.set()
+                deadline = time.monotonic() + 2
+                while executor.get_server_status()["filesystem"] != "ready" and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert executor.get_server_status() == {"filesystem": "ready"}
+
+    def test_prefetch_does_not_report_server_starting(self, mock_config, mock_transport):
+        """Test a plan prefetch in progress leaves readiness alone, only warm-up counts as starting."""
+        release = threading.Event()
+        mock_transport.start.side_effect = lambda *args: release.wait(5)
+        mock_config.get_enabled_servers.return_value = ["filesystem"]
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                executor.prefetch(["filesystem"])
+                time.sleep(0.05)
+
+                assert executor.get_server_status() == {"filesystem": "idle"}
+                release.set()
+
+    def test_warm_up_reports_failed_servers_and_skips_lazy_ones(self, mock_config, mock_transport):
+        """Test servers that fail to start are reported and prefetch=False servers stay idle."""
+        mock_config.get_server_settings.side_effect = lambda name: {
+            **SERVER_SETTING_DEFAULTS,
+            "prefetch": name == "filesystem",
+        }
+        mock_transport.start.side_effect = RuntimeError("command not found")
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                status = executor.warm_up(timeout=2)
+
+                assert status == {"filesystem": "failed", "code_parser": "idle"}
+                assert mock_transport.start.call_count == 1
+
+    def test_execute_tool_caches_results_of_cacheable_tools(self, mock_config, mock_transport):
+        """Test repeated calls with identical arguments are served from the result cache."""
+        mock_config.get_tool_settings.return_value = {**TOOL_SETTING_DEFAULTS, "cacheable": True}
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                first = executor.execute_tool("filesystem", "list_files", path=".", recursive=False)
+                second = executor.execute_tool("filesystem", "list_files", recursive=False, path=".")
+                other = executor.execute_tool("filesystem", "list_files", path="src")
+
+                assert first == second
+                assert other["success"] is True
+                assert mock_transport.execute_tool.call_count == 2
+                assert executor.result_cache.stats()["hits"] == 1
+
+    def test_execute_tool_does_not_cache_by_default(self, mock_config, mock_transport):
+        """Test tools are not cached unless marked cacheable."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                executor.execute_tool("filesystem", "list_files", path=".")
+                executor.execute_tool("filesystem", "list_files", path=".")
+
+                assert mock_transport.execute_tool.call_count == 2
+                assert executor.result_cache.stats()["tools"] == {}
+
+    def test_execute_tool_does_not_cache_failures(self, mock_config, mock_transport):
+        """Test failed calls, including errors reported by the tool, are not cached."""
+        mock_config.get_tool_settings.return_value = {**TOOL_SETTING_DEFAULTS, "cacheable": True}
+        mock_transport.execute_tool.side_effect = [
+            Exception("Connection lost"),
+            RuntimeError("Tool reported an error: disk full"),
+            {"files": []},
+        ]
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                assert executor.execute_tool("filesystem", "list_files")["success"] is False
+                executor.execute_tool("filesystem", "list_files")
+                assert executor.execute_tool("filesystem", "list_files")["result"] == {"files": []}
+
+                assert mock_transport.execute_tool.call_count == 3
+
+    def test_aexecute_tool_uses_result_cache(self, mock_config, mock_transport):
+        """Test the async path shares the result cache."""
+        mock_config.get_tool_settings.return_value = {**TOOL_SETTING_DEFAULTS, "cacheable": True}
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+
+                executor.execute_tool("filesystem", "list_files", path=".")
+                result = asyncio.run(executor.aexecute_tool("filesystem", "list_files", path="."))
+
+                assert result["success"] is True
+                mock_transport.execute_tool.assert_called_once()
+
 
 class TestGlobalFunctions:
     """Test cases for global executor functions."""
@@ -234,5 +587,579 @@ class TestGlobalFunctions:
                 assert result["tool"] == "filesystem:list_files"
 
 
+class TestToolTimeouts:
+    """Test per-call deadlines and timeout handling."""
+
+    def test_timeout_resolution_prefers_tool_then_server_then_default(self, mock_config, mock_transport):
+        """Test the tool timeout wins over the server timeout, which wins over the executor default."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor(default_timeout=30)
+
+                executor.execute_tool("filesystem", "list_files")
+                assert mock_transport.call_tool.call_args.kwargs["timeout"] == 30
+
+                mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "timeout": 10}
+                executor.reload_config()
+                executor.execute_tool("filesystem", "list_files")
+                assert mock_transport.call_tool.call_args.kwargs["timeout"] == 10
+
+                mock_config.get_tool_settings.return_value = {**TOOL_SETTING_DEFAULTS, "timeout": 2}
+                executor.reload_config()
+                executor.execute_tool("filesystem", "list_files", path="/tmp")
+                mock_transport.call_tool.assert_called_with("list_files", {"path": "/tmp"}, timeout=2)
+
+    def test_timed_out_call_returns_failed_result(self, mock_config, mock_transport):
+        """Test a timed out call becomes a failed result without restarting the server by default."""
+        mock_transport.call_tool.side_effect = TimeoutError("Request tools/call timed out after 5s")
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport) as create:
+                executor = MCPExecutor(default_timeout=5)
+
+                result = executor.execute_tool("filesystem", "list_files")
+
+                assert result["success"] is False
+                assert result["result"] is None
+                assert result["error"] == "Tool call timed out after 5s"
+                assert executor.pools["filesystem"].stats()["restarts"] == 0
+                assert create.call_count == 1
+                mock_transport.stop.assert_not_called()
+
+    def test_restart_on_timeout_replaces_replica(self, mock_config, mock_transport):
+        """Test a timed out call restarts the replica when restart_on_timeout is set."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "restart_on_timeout": True}
+        mock_transport.call_tool.side_effect = TimeoutError("timed out")
+        fresh_transport = MagicMock()
+        fresh_transport.execute_tool.return_value = {"success": True}
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", side_effect=[mock_transport, fresh_transport]):
+                executor = MCPExecutor(default_timeout=1)
+
+                result = asyncio.run(executor.aexecute_tool("filesystem", "list_files"))
+
+                assert result["success"] is False
+                assert "timed out" in result["error"]
+
+                pool = executor.pools["filesystem"]
+                deadline = time.monotonic() + 2
+                while pool.primary is not fresh_transport and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert pool.primary is fresh_transport
+                assert pool.stats()["restarts"] == 1
+
+
+class TestSupervision:
+    """Test circuit breaking and restarts driven by the supervisor."""
+
+    def test_open_circuit_fails_fast_and_hides_tools(self, mock_config, mock_transport):
+        """Test calls to an open-circuited server fail without reaching it and its tools are hidden."""
+        supervisor = ServerSupervisor(failure_threshold=1, reset_timeout=60)
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport) as create:
+                executor = MCPExecutor(supervisor=supervisor)
+                supervisor.record_failure("filesystem", "crashed")
+
+                result = executor.execute_tool("filesystem", "list_files")
+
+                assert result["success"] is False
+                assert result["error"] == "MCP server 'filesystem' is unavailable (circuit open)"
+                create.assert_not_called()
+
+                executor.tool_schema_cache = {"filesystem": [{"name": "list_files"}], "code_parser": []}
+                assert list(executor.get_tool_schemas(available_only=True)) == ["code_parser"]
+                assert list(executor.get_tool_schemas()) == ["filesystem", "code_parser"]
+
+    def test_dead_transport_is_restarted(self, mock_config, mock_transport):
+        """Test a call that finds its server dead restarts the replica."""
+        mock_transport.execute_tool.side_effect = RuntimeError("Server process is not running")
+        mock_transport.is_alive.return_value = False
+        fresh_transport = MagicMock()
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", side_effect=[mock_transport, fresh_transport]):
+                executor = MCPExecutor()
+
+                result = executor.execute_tool("filesystem", "list_files")
+
+                assert result["success"] is False
+                pool = executor.pools["filesystem"]
+                deadline = time.monotonic() + 2
+                while pool.primary is not fresh_transport and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert pool.primary is fresh_transport
+                assert executor.supervisor.status()["filesystem"]["restarts"] == 1
+
+    def test_successful_call_closes_half_open_circuit(self, mock_config, mock_transport):
+        """Test a successful call through a half-open circuit closes it."""
+        supervisor = ServerSupervisor(failure_threshold=1, reset_timeout=0)
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor(supervisor=supervisor)
+                supervisor.record_failure("filesystem", "crashed")
+
+                result = executor.execute_tool("filesystem", "list_files")
+
+                assert result["success"] is True
+                assert supervisor.status()["filesystem"]["state"] == "closed"
+
+
+class TestIdleReaper:
+    """Test stopping idle servers and restarting them on demand."""
+
+    def test_idle_server_is_stopped_and_restarted_on_next_call(self, mock_config, mock_transport):
+        """Test an idle server is stopped with its schemas kept and restarts transparently."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "idle_timeout": 300}
+        fresh_transport = MagicMock()
+        fresh_transport.get_tool_schemas.return_value = mock_transport.get_tool_schemas.return_value
+        fresh_transport.call_tool.return_value = {"data": "fresh"}
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", side_effect=[mock_transport, fresh_transport]):
+                executor = MCPExecutor()
+                executor.execute_tool("filesystem", "list_files")
+
+                assert executor.reap_idle_servers() == []
+                with patch("asterism.mcp.pool.time.monotonic", return_value=time.monotonic() + 301):
+                    assert executor.reap_idle_servers() == ["filesystem"]
+
+                mock_transport.stop.assert_called_once()
+                assert "filesystem" not in executor.pools
+                assert "filesystem" not in executor._pool_specs
+                assert executor.get_server_status()["filesystem"] == "idle"
+                assert "list_files" in executor.tool_cache["filesystem"]
+
+                result = executor.execute_tool("filesystem", "list_files")
+
+                assert result["success"] is True
+                assert result["result"] == {"data": "fresh"}
+                assert executor.pools["filesystem"].primary is fresh_transport
+                assert "filesystem" in executor._pool_specs
+                executor.shutdown()
+
+    def test_servers_without_idle_timeout_are_kept(self, mock_config, mock_transport):
+        """Test servers without idle_timeout are never stopped and no reaper thread is started."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                executor.execute_tool("filesystem", "list_files")
+
+                with patch("asterism.mcp.pool.time.monotonic", return_value=time.monotonic() + 86400):
+                    assert executor.reap_idle_servers() == []
+
+                assert executor._reaper is None
+                mock_transport.stop.assert_not_called()
+
+    def test_reaper_thread_stops_idle_servers(self, mock_config, mock_transport):
+        """Test the background reaper stops servers once their idle_timeout passes."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "idle_timeout": 0.05}
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                executor.idle_check_interval = 0.01
+                executor.execute_tool("filesystem", "list_files")
+
+                deadline = time.monotonic() + 2
+                while "filesystem" in executor.pools and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                assert "filesystem" not in executor.pools
+                mock_transport.stop.assert_called_once()
+                executor.shutdown()
+
+    def test_reaper_scales_down_idle_replicas_without_idle_timeout(self, mock_config, mock_transport):
+        """Test servers with extra replicas get a reaper that retires them without waiting for a call."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "replicas": 2}
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                executor.execute_tool("filesystem", "list_files")
+                pool = executor.pools["filesystem"]
+
+                assert executor._reaper is not None
+                with patch.object(pool, "scale_down") as scale_down:
+                    assert executor.reap_idle_servers() == []
+                scale_down.assert_called_once_with()
+                assert executor.pools["filesystem"] is pool
+                executor.shutdown()
+
+
+class TestConcurrencyLimits:
+    """Test per-server and per-tool concurrency limits."""
+
+    def _blocking_transport(self, mock_transport):
+        """Make calls on the transport block until the returned event is set."""
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def call_tool(tool_name, arguments, timeout=None):
+            started.release()
+            release.wait(2)
+            return {"tool": tool_name}
+
+        mock_transport.call_tool.side_effect = call_tool
+        return release, started
+
+    def test_server_limit_times_out_waiting_calls(self, mock_config, mock_transport):
+        """Test a call over the server limit waits up to queue_timeout and is then rejected."""
+        mock_config.get_server_settings.return_value = {
+            **SERVER_SETTING_DEFAULTS,
+            "concurrency_limit": 1,
+            "queue_timeout": 0.05,
+        }
+        release, started = self._blocking_transport(mock_transport)
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                first = threading.Thread(target=executor.execute_tool, args=("filesystem", "list_files"))
+                first.start()
+                assert started.acquire(timeout=2)
+
+                result = executor.execute_tool("filesystem", "read_file")
+
+                assert result["success"] is False
+                assert "waiting for a free slot on 'filesystem'" in result["error"]
+                stats = executor.get_concurrency_stats()["filesystem"]
+                assert stats["in_flight"] == 1
+                assert stats["rejected"] == 1
+                assert stats["replicas"] == 1
+
+                release.set()
+                first.join()
+                assert executor.get_concurrency_stats()["filesystem"]["in_flight"] == 0
+
+    def test_tool_limit_rejects_when_queue_full(self, mock_config, mock_transport):
+        """Test a tool limit only applies to that tool and a full queue rejects immediately."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "queue_size": 0}
+        mock_config.get_tool_settings.side_effect = lambda server, tool: {
+            **TOOL_SETTING_DEFAULTS,
+            "concurrency_limit": 1 if tool == "list_files" else None,
+        }
+        release, started = self._blocking_transport(mock_transport)
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                first = threading.Thread(target=executor.execute_tool, args=("filesystem", "list_files"))
+                first.start()
+                assert started.acquire(timeout=2)
+
+                rejected = executor.execute_tool("filesystem", "list_files")
+                other = threading.Thread(target=executor.execute_tool, args=("filesystem", "read_file"))
+                other.start()
+                assert started.acquire(timeout=2)
+
+                assert rejected["success"] is False
+                assert "queue is full" in rejected["error"]
+                stats = executor.get_concurrency_stats()["filesystem"]
+                assert stats["in_flight"] == 2
+                assert stats["tools"]["list_files"]["rejected"] == 1
+
+                release.set()
+                first.join()
+                other.join()
+
+    def test_aexecute_tool_respects_server_limit(self, mock_config, mock_transport):
+        """Test concurrent async calls never exceed the server limit."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "concurrency_limit": 2}
+        active = []
+        peak = []
+
+        def call_tool(tool_name, arguments, timeout=None):
+            active.append(tool_name)
+            peak.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+            return {}
+
+        mock_transport.call_tool.side_effect = call_tool
+
+        async def run():
+            return await asyncio.gather(*(executor.aexecute_tool("filesystem", "list_files") for _ in range(6)))
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                results = asyncio.run(run())
+
+        assert all(result["success"] for result in results)
+        assert max(peak) <= 2
+
+
+class TestBatchExecution:
+    """Test batched execution of independent tool calls."""
+
+    def test_execute_batch_groups_calls_per_server(self, mock_config, mock_transport):
+        """Test calls are sent as one batch per server and results come back in call order."""
+        mock_transport.call_tools.side_effect = lambda calls, timeout=None: [
+            {"tool": name, **arguments} for name, arguments in calls
+        ]
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                results = executor.execute_batch(
+                    [
+                        ("filesystem", "read_file", {"path": "a"}),
+                        ("code_parser", "list_files", {}),
+                        ("filesystem", "read_file", {"path": "b"}),
+                        ("filesystem", "missing_tool", {}),
+                    ]
+                )
+
+        assert [result["tool"] for result in results] == [
+            "filesystem:read_file",
+            "code_parser:list_files",
+            "filesystem:read_file",
+            "filesystem:missing_tool",
+        ]
+        assert results[0]["result"] == {"tool": "read_file", "path": "a"}
+        assert results[2]["result"] == {"tool": "read_file", "path": "b"}
+        assert results[3]["error"] == "Tool 'missing_tool' not found on server 'filesystem'"
+        # The lone code_parser call goes through call_tool; filesystem's two calls share one batch
+        mock_transport.call_tools.assert_called_once_with(
+            [("read_file", {"path": "a"}), ("read_file", {"path": "b"})], timeout=None
+        )
+        assert results[1]["result"] == {"success": True, "data": "test_result"}
+
+    def test_execute_batch_reports_failures_per_call(self, mock_config, mock_transport):
+        """Test a failed or timed out call in a batch only fails that call."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "timeout": 3}
+        mock_transport.call_tools.return_value = [{"ok": 1}, RuntimeError("boom"), TimeoutError("late")]
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                results = executor.execute_batch([("filesystem", "read_file", {})] * 3)
+
+        assert results[0]["success"] is True
+        assert results[1]["error"] == "Error executing tool: boom"
+        assert results[2]["error"] == "Tool call timed out after 3s"
+        assert mock_transport.call_tools.call_args.kwargs["timeout"] == 3
+
+    def test_execute_batch_runs_calls_over_limit_individually(self, mock_config, mock_transport):
+        """Test calls the concurrency limit does not admit wait and run on their own."""
+        mock_config.get_server_settings.return_value = {**SERVER_SETTING_DEFAULTS, "concurrency_limit": 2}
+        mock_transport.call_tools.side_effect = lambda calls, timeout=None: [{"batched": True}] * len(calls)
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                results = executor.execute_batch([("filesystem", "read_file", {"n": n}) for n in range(3)])
+
+                assert executor.get_concurrency_stats()["filesystem"]["in_flight"] == 0
+
+        assert [result["result"] for result in results[:2]] == [{"batched": True}] * 2
+        assert results[2]["result"] == {"success": True, "data": "test_result"}
+        assert len(mock_transport.call_tools.call_args.args[0]) == 2
+
+    def test_execute_batch_reports_closed_pool_per_call(self, mock_config, mock_transport):
+        """Test a pool closed before the batch runs fails each call instead of raising."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                try_limit = executor._try_limit
+
+                def close_then_limit(route):
+                    route.pool.stop()
+                    return try_limit(route)
+
+                with patch.object(executor, "_try_limit", side_effect=close_then_limit):
+                    results = executor.execute_batch([("filesystem", "read_file", {"path": p}) for p in "ab"])
+
+        assert [result["success"] for result in results] == [False, False]
+        assert results[0]["error"] == "Error executing tool: MCP server 'filesystem' has been stopped"
+        mock_transport.call_tools.assert_not_called()
+
+    def test_execute_batch_reports_unexpected_errors_per_call(self, mock_config, mock_transport):
+        """Test an error outside any single call fails the calls of its server only."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                with patch.object(executor, "_run_batch", side_effect=RuntimeError("boom")):
+                    results = executor.execute_batch(
+                        [("filesystem", "read_file", {}), ("filesystem", "list_files", {}), ("code_parser", "x", {})]
+                    )
+
+        assert results[0]["error"] == "Error executing tool: boom"
+        assert results[1]["tool"] == "filesystem:list_files"
+        assert results[1]["error"] == "Error executing tool: boom"
+        assert results[2]["tool"] == "code_parser:x"
+
+
+class TestRouting:
+    """Test tool calls resolved through the routing index."""
+
+    def test_hot_path_does_not_read_server_config(self, mock_config, mock_transport):
+        """Test calls to a running server use its route instead of re-reading the configuration."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                executor.execute_tool("filesystem", "list_files")
+                route = executor.routes.get("filesystem", "list_files")
+                assert route.pool is executor.pools["filesystem"]
+                assert route.schema["name"] == "list_files"
+
+                mock_config.reset_mock(return_value=False)
+                result = executor.execute_tool("filesystem", "read_file", path="/tmp/a")
+                async_result = asyncio.run(executor.aexecute_tool("filesystem", "read_file", path="/tmp/b"))
+
+        assert result["success"] is True
+        assert async_result["success"] is True
+        mock_config.is_server_enabled.assert_not_called()
+        mock_config.get_server_config.assert_not_called()
+        mock_config.get_server_settings.assert_not_called()
+        mock_config.get_tool_settings.assert_not_called()
+
+    def test_reload_config_rebuilds_routes_and_stops_disabled_servers(self, mock_config, mock_transport):
+        """Test reloading swaps in routes with the new settings and stops servers no longer enabled."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                executor.execute_tool("filesystem", "list_files")
+                executor.execute_tool("code_parser", "list_files")
+                old_route = executor.routes.get("filesystem", "list_files")
+
+                mock_config.get_enabled_servers.return_value = ["filesystem"]
+                mock_config.get_tool_settings.return_value = {**TOOL_SETTING_DEFAULTS, "timeout": 7}
+                stopped = executor.reload_config()
+
+                mock_config.load_config.assert_called_once()
+                assert stopped == ["code_parser"]
+                assert "code_parser" not in executor.pools
+                assert executor.routes.servers() == {"filesystem"}
+                new_route = executor.routes.get("filesystem", "list_files")
+                assert new_route is not old_route
+                assert new_route.timeout == 7
+                assert new_route.pool is old_route.pool
+
+                mock_config.is_server_enabled.side_effect = lambda name: name == "filesystem"
+                result = executor.execute_tool("code_parser", "list_files")
+
+        assert result["error"] == "MCP server 'code_parser' is not enabled"
+
+    def test_reload_config_restarts_servers_whose_command_changed(self, mock_config, mock_transport):
+        """Test a server whose command changed is stopped and restarts on its next call."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport) as create:
+                executor = MCPExecutor()
+                executor.execute_tool("filesystem", "list_files")
+
+                mock_config.get_server_metadata.return_value = {
+                    "command": "new_command",
+                    "args": [],
+                    "transport": "stdio",
+                }
+                assert executor.reload_config() == ["filesystem"]
+                assert executor.routes.get("filesystem", "list_files") is None
+
+                result = executor.execute_tool("filesystem", "list_files")
+
+        assert result["success"] is True
+        assert create.call_count == 2
+        mock_transport.start.assert_called_with("new_command", [])
+
+    def test_validate_tool_call_uses_routes(self, mock_config, mock_transport):
+        """Test validation of running servers comes from the index, other servers from discovered tools."""
+        mock_config.get_tool_manifest.side_effect = lambda name: (
+            [{"name": "parse", "inputSchema": {"type": "object"}}] if name == "code_parser" else None
+        )
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=mock_transport):
+                executor = MCPExecutor()
+                executor.execute_tool("filesystem", "list_files")
+                executor.tool_cache["filesystem"] = []
+                executor.get_tool_schemas()
+
+                assert executor.validate_tool_call("filesystem", "read_file") is True
+                assert executor.validate_tool_call("filesystem", "missing") is False
+                assert executor.validate_tool_call("code_parser", "parse") is True
+                assert "code_parser" not in executor.pools
+
+
+class TestArgumentValidation:
+    """Test tool arguments checked against compiled input schemas before dispatch."""
+
+    @pytest.fixture
+    def strict_transport(self, mock_transport):
+        """Give read_file a schema requiring a string path."""
+        schemas = mock_transport.get_tool_schemas.return_value
+        schemas[1]["inputSchema"] = {
+            "type": "object",
+            "properties": {"path": {"type": "string"}},
+            "required": ["path"],
+        }
+        return mock_transport
+
+    def test_invalid_arguments_rejected_without_calling_server(self, mock_config, strict_transport):
+        """Test arguments failing the schema become a structured error and never reach the transport."""
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=strict_transport):
+                executor = MCPExecutor()
+                assert executor.execute_tool("filesystem", "read_file", path="/tmp/a")["success"] is True
+                strict_transport.call_tool.reset_mock()
+
+                result = executor.execute_tool("filesystem", "read_file", path=3)
+                async_result = asyncio.run(executor.aexecute_tool("filesystem", "read_file"))
+
+        assert result["success"] is False
+        assert result["error"] == "Invalid arguments for tool 'filesystem:read_file': $.path: 3 is not of type 'string'"
+        assert result["validation_errors"] == [
+            {"path": "$.path", "message": "3 is not of type 'string'", "keyword": "type"}
+        ]
+        assert async_result["validation_errors"][0]["keyword"] == "required"
+        strict_transport.call_tool.assert_not_called()
+
+    def test_invalid_arguments_rejected_before_server_starts(self, mock_config, strict_transport, tmp_path):
+        """Test schemas discovered from the cache validate calls without starting the server."""
+        mock_config.get_enabled_servers.return_value = ["filesystem"]
+        schema_cache = ToolSchemaCache(tmp_path / "schemas.json")
+        schema_cache.put(
+            "filesystem",
+            ToolSchemaCache.fingerprint(mock_config.get_server_metadata.return_value),
+            strict_transport.get_tool_schemas.return_value,
+        )
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=strict_transport) as create:
+                executor = MCPExecutor(schema_cache=schema_cache)
+                executor.get_tool_schemas()
+
+                assert executor.validate_arguments("filesystem", "read_file", {"path": "/tmp"}) == []
+                assert executor.validate_arguments("filesystem", "read_file", {})[0]["keyword"] == "required"
+                result = executor.execute_tool("filesystem", "read_file")
+
+        assert result["validation_errors"][0]["keyword"] == "required"
+        create.assert_not_called()
+
+    def test_execute_batch_rejects_invalid_calls_individually(self, mock_config, strict_transport):
+        """Test an invalid call in a batch fails alone while the valid calls are sent."""
+        strict_transport.call_tools.side_effect = lambda calls, timeout=None: [{"ok": True}] * len(calls)
+
+        with patch("asterism.mcp.executor.get_mcp_config", return_value=mock_config):
+            with patch("asterism.mcp.executor.create_transport", return_value=strict_transport):
+                executor = MCPExecutor()
+                results = executor.execute_batch(
+                    [
+                        ("filesystem", "read_file", {"path": "a"}),
+                        ("filesystem", "read_file", {}),
+                        ("filesystem", "read_file", {"path": "b"}),
+                    ]
+                )
+
+        assert [result["success"] for result in results] == [True, False, True]
+        assert results[1]["validation_errors"][0]["keyword"] == "required"
+        strict_transport.call_tools.assert_called_once_with(
+            [("read_file", {"path": "a"}), ("read_file", {"path": "b"})], timeout=None
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
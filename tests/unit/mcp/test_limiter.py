@@ -0,0 +1,86 @@
+"""Test MCP call concurrency limiter."""
+
+import asyncio
+import threading
+
+import pytest
+
+from asterism.mcp.limiter import ConcurrencyLimiter, ConcurrencyLimitError
+
+
+def test_limiter_without_limit_only_counts():
+    """Test an unlimited limiter admits every call and counts it."""
+    limiter = ConcurrencyLimiter("fs")
+
+    for _ in range(5):
+        limiter.acquire(timeout=0)
+
+    assert limiter.stats() == {"limit": None, "in_flight": 5, "queued": 0, "rejected": 0, "timed_out": 0}
+
+
+def test_limiter_queued_call_waits_for_release():
+    """Test a call over the limit waits until a slot is released."""
+    limiter = ConcurrencyLimiter("fs", limit=1)
+    limiter.acquire()
+    admitted = threading.Event()
+
+    def waiter():
+        limiter.acquire(timeout=2)
+        admitted.set()
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    assert not admitted.wait(0.05)
+    assert limiter.stats()["queued"] == 1
+
+    limiter.release()
+    thread.join()
+
+    assert admitted.is_set()
+    assert limiter.stats()["in_flight"] == 1
+    assert limiter.stats()["queued"] == 0
+
+
+def test_limiter_wait_timeout_rejects_call():
+    """Test a call that cannot get a slot in time is rejected."""
+    limiter = ConcurrencyLimiter("fs", limit=1)
+    limiter.acquire()
+
+    with pytest.raises(ConcurrencyLimitError, match="Timed out after 0.01s"):
+        limiter.acquire(timeout=0.01)
+
+    assert limiter.stats()["rejected"] == 1
+    assert limiter.stats()["timed_out"] == 1
+
+
+def test_limiter_full_queue_rejects_immediately():
+    """Test calls beyond the queue size are rejected without waiting."""
+    limiter = ConcurrencyLimiter("fs", limit=1, max_queue=0)
+    limiter.acquire()
+
+    with pytest.raises(ConcurrencyLimitError, match="queue is full"):
+        limiter.acquire()
+
+    assert limiter.stats()["rejected"] == 1
+    assert limiter.stats()["timed_out"] == 0
+
+
+def test_limiter_aacquire_waits_without_blocking_loop():
+    """Test aacquire waits for a slot released by another coroutine."""
+    limiter = ConcurrencyLimiter("fs", limit=1)
+
+    async def scenario():
+        await limiter.aacquire()
+        waiter = asyncio.create_task(limiter.aacquire(timeout=2))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        limiter.release()
+        await waiter
+
+    asyncio.run(scenario())
+
+    assert limiter.stats()["in_flight"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,180 @@
+"""Test MCP transport replica pool."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from asterism.mcp.pool import TransportPool
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_pool_starts_primary_replica():
+    """Test pool starts exactly one replica on creation."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=3)
+
+    assert factory.call_count == 1
+    assert pool.stats()["replicas"] == 1
+    assert pool.primary is pool.replicas[0].transport
+
+
+def test_pool_single_replica_never_scales():
+    """Test a pool with one replica reuses it for concurrent calls."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=1)
+
+    with pool.acquire() as first, pool.acquire() as second:
+        assert first is second
+        assert pool.stats()["in_flight"] == 2
+
+    assert factory.call_count == 1
+    assert pool.stats()["in_flight"] == 0
+
+
+def test_pool_scales_up_when_saturated_and_dispatches_least_loaded():
+    """Test a saturated pool starts a replica and routes new calls to it."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=2, max_concurrency=1)
+
+    with pool.acquire() as first:
+        assert _wait_for(lambda: pool.stats()["replicas"] == 2)
+
+        with pool.acquire() as second:
+            assert second is not first
+            assert pool.stats()["in_flight_per_replica"] == [1, 1]
+
+    assert factory.call_count == 2
+
+
+def test_pool_scales_down_idle_extra_replicas():
+    """Test extra replicas are stopped after being idle, but the primary is kept."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=2, max_concurrency=1, scale_down_after=0.0)
+
+    with pool.acquire():
+        assert _wait_for(lambda: pool.stats()["replicas"] == 2)
+        extra = pool.replicas[1].transport
+
+    with pool.acquire():
+        pass
+
+    assert pool.stats()["replicas"] == 1
+    extra.stop.assert_called_once()
+    pool.primary.stop.assert_not_called()
+
+
+def test_pool_scale_down_without_further_calls():
+    """Test scale_down stops idle extra replicas of a pool that gets no more calls."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=2, max_concurrency=1, scale_down_after=60.0)
+
+    with pool.acquire():
+        assert _wait_for(lambda: pool.stats()["replicas"] == 2)
+        extra = pool.replicas[1].transport
+
+    assert pool.scale_down() == 0
+    pool.replicas[1].last_used -= 61
+
+    assert pool.scale_down() == 1
+    assert pool.stats()["replicas"] == 1
+    extra.stop.assert_called_once()
+    pool.primary.stop.assert_not_called()
+
+
+def test_pool_failed_scale_up_keeps_serving():
+    """Test a replica that fails to start does not break the pool."""
+    primary = MagicMock()
+    factory = MagicMock(side_effect=[primary, RuntimeError("spawn failed")])
+    pool = TransportPool(factory, max_replicas=2, max_concurrency=1)
+
+    with pool.acquire() as transport:
+        assert transport is primary
+        assert _wait_for(lambda: factory.call_count == 2)
+
+    assert _wait_for(lambda: pool._spawning == 0)
+    assert pool.stats()["replicas"] == 1
+
+
+def test_pool_stop_stops_all_replicas():
+    """Test stop stops every replica."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=2, max_concurrency=1)
+
+    with pool.acquire():
+        assert _wait_for(lambda: pool.stats()["replicas"] == 2)
+
+    replicas = pool.replicas
+    pool.stop()
+
+    for replica in replicas:
+        replica.transport.stop.assert_called_once()
+
+
+def test_pool_restart_replaces_replica_transport():
+    """Test restart swaps in a new transport and stops the old one."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=1)
+    old = pool.primary
+
+    pool.restart(old)
+
+    assert _wait_for(lambda: pool.primary is not old)
+    assert _wait_for(lambda: old.stop.called)
+    assert factory.call_count == 2
+    assert pool.stats()["restarts"] == 1
+    assert pool.stats()["replicas"] == 1
+
+
+def test_pool_restart_failure_keeps_old_transport():
+    """Test a failed restart leaves the replica in place."""
+    factory = MagicMock(side_effect=[MagicMock(), RuntimeError("boom")])
+    pool = TransportPool(factory, max_replicas=1)
+    old = pool.primary
+
+    pool.restart(old)
+
+    assert _wait_for(lambda: not pool.replicas[0].restarting)
+    assert pool.primary is old
+    old.stop.assert_not_called()
+    assert pool.stats()["restarts"] == 0
+
+
+def test_pool_close_if_idle_stops_unused_pool():
+    """Test an idle pool is stopped and refuses further calls."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=1)
+    primary = pool.primary
+
+    assert not pool.close_if_idle(60.0)
+    assert pool.close_if_idle(0.0)
+
+    assert pool.closed
+    primary.stop.assert_called_once()
+    with pytest.raises(RuntimeError, match="has been stopped"):
+        with pool.acquire():
+            pass
+
+
+def test_pool_close_if_idle_keeps_busy_pool():
+    """Test a pool with a call in flight is never closed as idle."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = TransportPool(factory, max_replicas=1)
+
+    with pool.acquire():
+        assert not pool.close_if_idle(0.0)
+
+    assert not pool.closed
+    pool.primary.stop.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,108 @@
+"""Test MCP tool result cache."""
+
+import threading
+import time
+
+import pytest
+
+from asterism.mcp.result_cache import ToolResultCache
+
+LIMITS = {"ttl_seconds": 60, "max_entries": 2, "max_result_bytes": 1024}
+
+
+def test_make_key_is_canonical():
+    """Test argument order does not change the cache key."""
+    assert ToolResultCache.make_key({"b": 1, "a": [1, 2]}) == ToolResultCache.make_key({"a": [1, 2], "b": 1})
+    assert ToolResultCache.make_key({"a": 1}) != ToolResultCache.make_key({"a": 2})
+
+
+def test_make_key_rejects_unserializable_arguments():
+    """Test arguments that are not JSON serializable are not cacheable."""
+    assert ToolResultCache.make_key({"value": object()}) is None
+
+
+def test_get_put_counts_hits_and_misses():
+    """Test hits and misses are counted per tool."""
+    cache = ToolResultCache()
+    key = ToolResultCache.make_key({"path": "."})
+
+    assert cache.get("fs", "list", key) == (False, None)
+    assert cache.put("fs", "list", key, {"files": ["a"]}, **LIMITS) is True
+    assert cache.get("fs", "list", key) == (True, {"files": ["a"]})
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["tools"]["fs:list"]["entries"] == 1
+
+
+def test_get_returns_copy():
+    """Test callers cannot mutate the cached result."""
+    cache = ToolResultCache()
+    cache.put("fs", "list", "k", {"files": ["a"]}, **LIMITS)
+
+    _, result = cache.get("fs", "list", "k")
+    result["files"].append("b")
+
+    assert cache.get("fs", "list", "k") == (True, {"files": ["a"]})
+
+
+def test_entries_expire_after_ttl():
+    """Test expired entries are misses."""
+    cache = ToolResultCache()
+    cache.put("fs", "list", "k", "result", ttl_seconds=0.05, max_entries=2, max_result_bytes=1024)
+
+    time.sleep(0.1)
+
+    assert cache.get("fs", "list", "k") == (False, None)
+    assert cache.stats()["tools"]["fs:list"]["entries"] == 0
+
+
+def test_lru_eviction_per_tool():
+    """Test the least recently used entry is evicted when a tool exceeds max_entries."""
+    cache = ToolResultCache()
+    cache.put("fs", "list", "a", 1, **LIMITS)
+    cache.put("fs", "list", "b", 2, **LIMITS)
+    cache.get("fs", "list", "a")
+    cache.put("fs", "list", "c", 3, **LIMITS)
+    cache.put("fs", "read", "x", 4, **LIMITS)
+
+    assert cache.get("fs", "list", "b") == (False, None)
+    assert cache.get("fs", "list", "a") == (True, 1)
+    assert cache.get("fs", "list", "c") == (True, 3)
+    assert cache.get("fs", "read", "x") == (True, 4)
+    assert cache.stats()["tools"]["fs:list"]["evictions"] == 1
+
+
+def test_large_results_are_not_cached():
+    """Test results above max_result_bytes are skipped."""
+    cache = ToolResultCache()
+
+    assert cache.put("fs", "read", "k", "x" * 2048, **LIMITS) is False
+    assert cache.get("fs", "read", "k") == (False, None)
+    assert cache.stats()["tools"]["fs:read"]["skipped"] == 1
+
+
+def test_concurrent_access():
+    """Test concurrent puts and gets keep consistent counters."""
+    cache = ToolResultCache()
+
+    def worker(n):
+        for i in range(200):
+            key = str(i % 5)
+            if not cache.get("fs", "list", key)[0]:
+                cache.put("fs", "list", key, {"n": n, "i": i}, ttl_seconds=60, max_entries=3, max_result_bytes=1024)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 8 * 200
+    assert stats["entries"] <= 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
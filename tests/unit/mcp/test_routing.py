@@ -0,0 +1,66 @@
+"""Test MCP tool routing index."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from asterism.mcp.routing import ToolRoute, ToolRouteIndex
+
+
+def make_route(server_name: str, tool_name: str, pool=None) -> ToolRoute:
+    """Build a route with placeholder settings."""
+    return ToolRoute(
+        server_name=server_name,
+        tool_name=tool_name,
+        pool=pool or MagicMock(),
+        schema={"name": tool_name},
+        server_settings={},
+        tool_settings={},
+        validator=None,
+        timeout=None,
+        limiters=(),
+    )
+
+
+def test_index_looks_up_routes_by_server_and_tool():
+    """Test routes are found by server and tool name, and by "server:tool" key."""
+    index = ToolRouteIndex()
+    route = make_route("fs", "read")
+    index.set_server("fs", [route])
+
+    assert index.get("fs", "read") is route
+    assert index.get("fs", "write") is None
+    assert "fs:read" in index
+    assert route.key == "fs:read"
+    assert len(index) == 1
+
+
+def test_set_server_replaces_only_that_server():
+    """Test re-indexing a server drops its old routes and keeps other servers."""
+    index = ToolRouteIndex()
+    index.set_server("fs", [make_route("fs", "read"), make_route("fs", "write")])
+    index.set_server("git", [make_route("git", "log")])
+
+    index.set_server("fs", [make_route("fs", "stat")])
+
+    assert index.get("fs", "read") is None
+    assert index.get("fs", "stat") is not None
+    assert index.get("git", "log") is not None
+    assert index.servers() == {"fs", "git"}
+
+
+def test_replace_swaps_whole_table():
+    """Test replace() publishes a new table without touching the one readers already hold."""
+    index = ToolRouteIndex()
+    index.set_server("fs", [make_route("fs", "read")])
+    old_table = index._routes
+
+    index.replace([make_route("git", "log")])
+
+    assert index.get("fs", "read") is None
+    assert index.get("git", "log") is not None
+    assert "fs:read" in old_table
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,68 @@
+"""Test persistent MCP tool schema cache."""
+
+import json
+
+import pytest
+
+from asterism.mcp.schema_cache import ToolSchemaCache
+
+METADATA = {"command": "npx", "args": ["server"], "transport": "stdio", "cwd": "."}
+TOOLS = [{"name": "read_file", "description": "Read a file", "inputSchema": {"type": "object"}}]
+
+
+def test_schema_cache_round_trip_across_instances(tmp_path):
+    """Test schemas written by one cache instance are read by another."""
+    path = tmp_path / "cache" / "schemas.json"
+    fingerprint = ToolSchemaCache.fingerprint(METADATA)
+
+    ToolSchemaCache(path).put("filesystem", fingerprint, TOOLS)
+    cached = ToolSchemaCache(path).get("filesystem", fingerprint)
+
+    assert cached is not None
+    assert cached.tools == TOOLS
+    assert cached.stale is False
+
+
+def test_schema_cache_miss_for_unknown_server(tmp_path):
+    """Test missing servers and missing files return None."""
+    cache = ToolSchemaCache(tmp_path / "schemas.json")
+
+    assert cache.get("filesystem", ToolSchemaCache.fingerprint(METADATA)) is None
+
+
+def test_schema_cache_invalidated_by_changed_launch_settings(tmp_path):
+    """Test a changed command, args or cwd does not match the cached entry."""
+    cache = ToolSchemaCache(tmp_path / "schemas.json")
+    cache.put("filesystem", ToolSchemaCache.fingerprint(METADATA), TOOLS)
+
+    for change in ({"command": "uvx"}, {"args": ["other"]}, {"cwd": "/srv"}):
+        assert cache.get("filesystem", ToolSchemaCache.fingerprint({**METADATA, **change})) is None
+
+
+def test_schema_cache_marks_old_entries_stale(tmp_path):
+    """Test entries older than the TTL are returned as stale."""
+    cache = ToolSchemaCache(tmp_path / "schemas.json", ttl_seconds=0)
+    fingerprint = ToolSchemaCache.fingerprint(METADATA)
+    cache.put("filesystem", fingerprint, TOOLS)
+
+    cached = cache.get("filesystem", fingerprint)
+
+    assert cached.tools == TOOLS
+    assert cached.stale is True
+
+
+def test_schema_cache_ignores_corrupt_file(tmp_path):
+    """Test a corrupt cache file behaves like an empty cache and is rewritten."""
+    path = tmp_path / "schemas.json"
+    path.write_text("{not json")
+    cache = ToolSchemaCache(path)
+    fingerprint = ToolSchemaCache.fingerprint(METADATA)
+
+    assert cache.get("filesystem", fingerprint) is None
+
+    cache.put("filesystem", fingerprint, TOOLS)
+    assert json.loads(path.read_text())["filesystem"]["tools"] == TOOLS
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,142 @@
+"""Test MCP server supervisor."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from asterism.mcp.supervisor import CircuitState, ServerSupervisor
+
+
+def _pool(*transports):
+    """Create a mock pool whose replicas wrap the given transports."""
+    pool = MagicMock()
+    pool.replicas = [MagicMock(transport=transport, restarting=False) for transport in transports]
+    return pool
+
+
+def _transport(alive=True, answers_ping=True):
+    transport = MagicMock()
+    transport.is_alive.return_value = alive
+    transport.ping.return_value = answers_ping
+    return transport
+
+
+def test_circuit_opens_after_failure_threshold():
+    """Test repeated failures open the circuit and calls fail fast."""
+    supervisor = ServerSupervisor(failure_threshold=3)
+
+    for _ in range(2):
+        supervisor.record_failure("fs", "boom")
+    assert supervisor.allow("fs")
+
+    supervisor.record_failure("fs", "boom")
+
+    assert not supervisor.allow("fs")
+    assert not supervisor.is_available("fs")
+    assert supervisor.status()["fs"]["state"] == CircuitState.OPEN
+    assert supervisor.status()["fs"]["last_error"] == "boom"
+
+
+def test_failures_outside_window_are_forgotten():
+    """Test only failures inside the window count towards the threshold."""
+    supervisor = ServerSupervisor(failure_threshold=2, failure_window=10)
+
+    with patch("asterism.mcp.supervisor.time.monotonic", side_effect=[0.0, 20.0, 20.0]):
+        supervisor.record_failure("fs", "boom")
+        supervisor.record_failure("fs", "boom")
+        assert supervisor.allow("fs")
+
+
+def test_half_open_probe_success_closes_circuit():
+    """Test an open circuit lets a probe through after reset_timeout and closes on success."""
+    supervisor = ServerSupervisor(failure_threshold=1, reset_timeout=30)
+
+    with patch("asterism.mcp.supervisor.time.monotonic", return_value=100.0):
+        supervisor.record_failure("fs", "boom")
+    with patch("asterism.mcp.supervisor.time.monotonic", return_value=110.0):
+        assert not supervisor.allow("fs")
+    with patch("asterism.mcp.supervisor.time.monotonic", return_value=131.0):
+        assert supervisor.is_available("fs")
+        assert supervisor.allow("fs")
+
+    assert supervisor.status()["fs"]["state"] == CircuitState.HALF_OPEN
+    supervisor.record_success("fs")
+    assert supervisor.status()["fs"]["state"] == CircuitState.CLOSED
+    assert supervisor.status()["fs"]["recent_failures"] == 0
+
+
+def test_half_open_probe_failure_reopens_circuit():
+    """Test a failed probe opens the circuit again."""
+    supervisor = ServerSupervisor(failure_threshold=1, reset_timeout=0)
+    supervisor.record_failure("fs", "boom")
+    assert supervisor.allow("fs")
+
+    supervisor.record_failure("fs", "still broken")
+
+    assert supervisor.status()["fs"]["state"] == CircuitState.OPEN
+
+
+def test_restarts_back_off_exponentially():
+    """Test restarts of a server are spaced by a doubling delay."""
+    supervisor = ServerSupervisor(failure_threshold=100, backoff_base=1, backoff_max=3)
+    pool = MagicMock()
+    transport = MagicMock()
+
+    for now, restarted in [(0.0, True), (0.5, False), (1.0, True), (2.5, False), (3.0, True), (6.0, True)]:
+        pool.restart.reset_mock()
+        with patch("asterism.mcp.supervisor.time.monotonic", return_value=now):
+            supervisor.handle_unhealthy("fs", pool, transport, "dead")
+        assert pool.restart.called is restarted, now
+
+    assert supervisor.status()["fs"]["restarts"] == 4
+
+
+def test_success_resets_restart_backoff():
+    """Test a healthy server restarts immediately the next time it dies."""
+    supervisor = ServerSupervisor(failure_threshold=100, backoff_base=10)
+    pool = MagicMock()
+
+    supervisor.handle_unhealthy("fs", pool, MagicMock(), "dead")
+    supervisor.record_success("fs")
+    supervisor.handle_unhealthy("fs", pool, MagicMock(), "dead")
+
+    assert pool.restart.call_count == 2
+
+
+def test_check_now_restarts_dead_and_unresponsive_replicas():
+    """Test a health check restarts replicas that died or do not answer pings."""
+    healthy, dead, hung = _transport(), _transport(alive=False), _transport(answers_ping=False)
+    pool = _pool(healthy, dead, hung)
+    supervisor = ServerSupervisor(failure_threshold=100, backoff_base=0, ping_timeout=2)
+    supervisor.bind(lambda: {"fs": pool})
+
+    supervisor.check_now()
+
+    assert [call.args[0] for call in pool.restart.call_args_list] == [dead, hung]
+    healthy.ping.assert_called_once_with(2)
+    dead.ping.assert_not_called()
+    assert supervisor.status()["fs"]["last_error"] == "Server did not answer ping"
+
+
+def test_check_now_skips_open_circuits():
+    """Test servers behind an open circuit are not pinged until they may be probed."""
+    transport = _transport()
+    supervisor = ServerSupervisor(failure_threshold=1, reset_timeout=60)
+    supervisor.bind(lambda: {"fs": _pool(transport)})
+    supervisor.record_failure("fs", "boom")
+
+    supervisor.check_now()
+
+    transport.ping.assert_not_called()
+
+
+def test_start_is_noop_when_disabled():
+    """Test a zero interval disables the background thread."""
+    supervisor = ServerSupervisor(interval=0)
+    supervisor.start()
+    assert supervisor._thread is None
+    supervisor.stop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
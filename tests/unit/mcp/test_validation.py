@@ -0,0 +1,75 @@
+"""Test MCP tool argument validation."""
+
+import pytest
+from jsonschema import SchemaError
+
+from asterism.mcp.validation import ToolArgumentValidator, ToolValidatorCache, format_validation_errors
+
+READ_SCHEMA = {
+    "type": "object",
+    "properties": {"path": {"type": "string"}, "limit": {"type": "integer", "minimum": 1}},
+    "required": ["path"],
+}
+
+
+def test_validator_accepts_valid_arguments():
+    """Test arguments matching the schema produce no errors."""
+    assert ToolArgumentValidator(READ_SCHEMA).validate({"path": "/tmp", "limit": 5}) == []
+
+
+def test_validator_reports_every_violation():
+    """Test each violation is reported with its path, message and keyword."""
+    errors = ToolArgumentValidator(READ_SCHEMA).validate({"limit": 0})
+
+    assert [(error["path"], error["keyword"]) for error in errors] == [("$", "required"), ("$.limit", "minimum")]
+    assert "'path' is a required property" in errors[0]["message"]
+
+
+def test_validator_rejects_invalid_schema():
+    """Test a schema that is not valid JSON Schema cannot be compiled."""
+    with pytest.raises(SchemaError):
+        ToolArgumentValidator({"type": "no-such-type"})
+
+
+def test_cache_compiles_server_schemas_and_skips_unusable_ones():
+    """Test tools with a valid schema get validators, others pass through unchecked."""
+    cache = ToolValidatorCache()
+    cache.compile(
+        "fs",
+        [
+            {"name": "read", "inputSchema": READ_SCHEMA},
+            {"name": "ping"},
+            {"name": "broken", "inputSchema": {"type": 42}},
+        ],
+    )
+
+    assert cache.get("fs", "read") is not None
+    assert cache.get("fs", "ping") is None
+    assert cache.get("fs", "broken") is None
+    assert cache.validate("fs", "broken", {"anything": True}) == []
+    assert cache.validate("fs", "read", {})[0]["keyword"] == "required"
+
+
+def test_cache_keeps_validators_of_unchanged_schemas():
+    """Test recompiling a server reuses validators whose schema did not change and drops removed tools."""
+    cache = ToolValidatorCache()
+    cache.compile("fs", [{"name": "read", "inputSchema": READ_SCHEMA}, {"name": "stat", "inputSchema": READ_SCHEMA}])
+    validator = cache.get("fs", "read")
+
+    cache.compile("fs", [{"name": "read", "inputSchema": dict(READ_SCHEMA)}])
+
+    assert cache.get("fs", "read") is validator
+    assert cache.get("fs", "stat") is None
+
+
+def test_format_validation_errors():
+    """Test violations are formatted into one message naming the tool."""
+    errors = [{"path": "$.limit", "message": "0 is less than the minimum of 1", "keyword": "minimum"}]
+
+    assert format_validation_errors("fs", "read", errors) == (
+        "Invalid arguments for tool 'fs:read': $.limit: 0 is less than the minimum of 1"
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
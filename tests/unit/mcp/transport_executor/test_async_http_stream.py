@@ -0,0 +1,153 @@
+"""Test async HTTP stream transport."""
+
+import asyncio
+import json
+from functools import partial
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from asterism.mcp.transport_executor.async_http_stream import AsyncHTTPStreamTransport
+
+
+class FakeMCPServer:
+    """Minimal streamable HTTP MCP server driven by httpx.MockTransport."""
+
+    def __init__(self, sse: bool = False):
+        self.sse = sse
+        self.requests: list[dict] = []
+        self.deleted = False
+        self.fail_calls = False
+        self.slow_calls = False
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            self.deleted = True
+            return httpx.Response(200)
+
+        message = json.loads(request.content)
+        self.requests.append({"message": message, "session": request.headers.get("mcp-session-id")})
+        if "id" not in message:
+            return httpx.Response(202)
+        if self.fail_calls and message["method"] == "tools/call":
+            return httpx.Response(500, text="boom")
+        if self.slow_calls and message["method"] == "tools/call":
+            await asyncio.sleep(5)
+
+        if message["method"] == "initialize":
+            result = {"protocolVersion": "2024-11-05"}
+        elif message["method"] == "tools/list":
+            result = {"tools": [{"name": "echo", "inputSchema": {"type": "object"}}]}
+        else:
+            text = json.dumps(message["params"]["arguments"])
+            result = {"content": [{"type": "text", "text": text}]}
+
+        body = {"jsonrpc": "2.0", "id": message["id"], "result": result}
+        headers = {"mcp-session-id": "session-1"}
+        if self.sse:
+            # A progress notification precedes the response on the stream
+            notification = {"jsonrpc": "2.0", "method": "notifications/progress", "params": {}}
+            content = "".join(f"event: message\ndata: {json.dumps(m)}\n\n" for m in (notification, body))
+            headers["content-type"] = "text/event-stream"
+            return httpx.Response(200, content=content.encode(), headers=headers)
+        return httpx.Response(200, json=body, headers=headers)
+
+
+def _patched_client(server: FakeMCPServer):
+    """Patch httpx.AsyncClient so the transport talks to the fake server."""
+    client_class = partial(httpx.AsyncClient, transport=httpx.MockTransport(server.handle))
+    return patch("asterism.mcp.transport_executor.async_http_stream.httpx.AsyncClient", client_class)
+
+
+def test_async_http_stream_transport_init():
+    """Test timeouts and pool limits are configurable."""
+    transport = AsyncHTTPStreamTransport(timeout=5.0, connect_timeout=2.0, max_keepalive_connections=3)
+
+    assert transport._timeout.read == 5.0
+    assert transport._timeout.connect == 2.0
+    assert transport._limits.max_keepalive_connections == 3
+    assert transport.is_alive() is False
+
+
+def test_async_http_stream_start_without_args_raises():
+    """Test start raises ValueError without a server URL."""
+    with pytest.raises(ValueError, match="requires server URL"):
+        AsyncHTTPStreamTransport().start("", [])
+
+
+@pytest.mark.parametrize("sse", [False, True])
+def test_async_http_stream_execute_tool_sync_api(sse):
+    """Test the synchronous API with JSON and event-stream responses."""
+    server = FakeMCPServer(sse=sse)
+    with _patched_client(server):
+        transport = AsyncHTTPStreamTransport()
+        transport.start("", ["http://mcp.test/"])
+
+        assert transport.is_alive() is True
+        assert transport.list_tools() == ["echo"]
+        assert transport.execute_tool("echo", value=1) == {"value": 1}
+
+        transport.stop()
+
+    assert transport.is_alive() is False
+    assert server.deleted is True
+    # Every message after initialize carries the session id
+    assert all(r["session"] == "session-1" for r in server.requests[1:])
+
+
+def test_async_http_stream_concurrent_awaitable_calls():
+    """Test many awaitable calls share one transport and get their own results."""
+    server = FakeMCPServer()
+
+    async def run():
+        transport = AsyncHTTPStreamTransport()
+        await transport.astart("", ["http://mcp.test"])
+        results = await asyncio.gather(*(transport.aexecute_tool("echo", value=i) for i in range(10)))
+        await transport.astop()
+        return results
+
+    with _patched_client(server):
+        results = asyncio.run(run())
+
+    assert [r["value"] for r in results] == list(range(10))
+
+
+def test_async_http_stream_http_error_raises():
+    """Test HTTP errors are raised like JSON-RPC errors."""
+    server = FakeMCPServer()
+    server.fail_calls = True
+
+    with _patched_client(server):
+        transport = AsyncHTTPStreamTransport()
+        transport.start("", ["http://mcp.test"])
+        with pytest.raises(RuntimeError, match="HTTP error 500"):
+            transport.execute_tool("echo")
+        transport.stop()
+
+
+def test_async_http_stream_call_timeout_cancels_request():
+    """Test a call past its deadline raises TimeoutError and is cancelled on the server."""
+    server = FakeMCPServer()
+    server.slow_calls = True
+
+    async def run():
+        with _patched_client(server):
+            transport = AsyncHTTPStreamTransport()
+            await transport.astart("", ["http://mcp.test"])
+            try:
+                with pytest.raises(TimeoutError, match="tools/call timed out after 0.1s"):
+                    await transport.acall_tool("echo", {"value": 1}, timeout=0.1)
+            finally:
+                await transport.astop()
+
+    asyncio.run(run())
+
+    request, cancel = (r["message"] for r in server.requests[-2:])
+    assert request["method"] == "tools/call"
+    assert cancel["method"] == "notifications/cancelled"
+    assert cancel["params"]["requestId"] == request["id"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
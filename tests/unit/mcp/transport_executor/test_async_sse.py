@@ -0,0 +1,140 @@
+"""Test async SSE transport."""
+
+import asyncio
+import json
+from functools import partial
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from asterism.mcp.transport_executor.async_sse import AsyncSSETransport
+
+
+class FakeSSEServer:
+    """Minimal SSE MCP server driven by httpx.MockTransport.
+
+    Responses to posted requests are pushed on the open SSE stream; when
+    ``reverse`` is set, tools/call responses are held back and sent in
+    reverse order to check routing by id.
+    """
+
+    def __init__(self, reverse_after: int = 0):
+        self.reverse_after = reverse_after
+        self.events: asyncio.Queue | None = None
+        self.held: list[dict] = []
+        self.posted: list[dict] = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.events is None:
+            self.events = asyncio.Queue()
+
+        if request.method == "GET":
+            return httpx.Response(200, content=self._stream(), headers={"content-type": "text/event-stream"})
+
+        message = json.loads(request.content)
+        self.posted.append(message)
+        if "id" in message:
+            if message["method"] == "tools/call":
+                text = json.dumps(message["params"]["arguments"])
+                result = {"content": [{"type": "text", "text": text}]}
+            elif message["method"] == "tools/list":
+                result = {"tools": [{"name": "echo"}]}
+            else:
+                result = {}
+            response = {"jsonrpc": "2.0", "id": message["id"], "result": result}
+
+            if message["method"] == "tools/call" and self.reverse_after:
+                self.held.append(response)
+                if len(self.held) == self.reverse_after:
+                    for held in reversed(self.held):
+                        await self.events.put(f"event: message\ndata: {json.dumps(held)}\n\n")
+            else:
+                await self.events.put(f"event: message\ndata: {json.dumps(response)}\n\n")
+        return httpx.Response(202)
+
+    async def _stream(self):
+        yield b"event: endpoint\ndata: /messages/?session_id=abc\n\n"
+        while True:
+            yield (await self.events.get()).encode()
+
+
+def _patched_client(server: FakeSSEServer):
+    """Patch httpx.AsyncClient so the transport talks to the fake server."""
+    client_class = partial(httpx.AsyncClient, transport=httpx.MockTransport(server.handle))
+    return patch("asterism.mcp.transport_executor.async_sse.httpx.AsyncClient", client_class)
+
+
+def test_async_sse_transport_init():
+    """Test the transport starts disconnected."""
+    transport = AsyncSSETransport(timeout=5.0)
+
+    assert transport._call_timeout == 5.0
+    assert transport._message_endpoint is None
+    assert transport.is_alive() is False
+
+
+def test_async_sse_start_without_args_raises():
+    """Test start raises ValueError without a server URL."""
+    with pytest.raises(ValueError, match="requires server URL"):
+        AsyncSSETransport().start("", [])
+
+
+def test_async_sse_get_tool_schemas_not_started_raises():
+    """Test get_tool_schemas raises instead of reporting a server without tools."""
+    with pytest.raises(RuntimeError, match="MCP server not initialized"):
+        AsyncSSETransport().get_tool_schemas()
+
+
+def test_async_sse_execute_tool_sync_api():
+    """Test the synchronous API over the endpoint event and SSE responses."""
+    server = FakeSSEServer()
+    with _patched_client(server):
+        transport = AsyncSSETransport()
+        transport.start("", ["http://mcp.test"])
+
+        assert transport._message_endpoint == "http://mcp.test/messages/?session_id=abc"
+        assert transport.list_tools() == ["echo"]
+        assert transport.execute_tool("echo", value=1) == {"value": 1}
+
+        transport.stop()
+
+    assert transport.is_alive() is False
+
+
+def test_async_sse_routes_out_of_order_responses_by_id():
+    """Test concurrent calls get their own results when responses arrive reversed."""
+    server = FakeSSEServer(reverse_after=5)
+
+    async def run():
+        transport = AsyncSSETransport()
+        await transport.astart("", ["http://mcp.test"])
+        results = await asyncio.gather(*(transport.aexecute_tool("echo", value=i) for i in range(5)))
+        await transport.astop()
+        return results
+
+    with _patched_client(server):
+        results = asyncio.run(run())
+
+    assert [r["value"] for r in results] == list(range(5))
+
+
+def test_async_sse_call_timeout_cancels_request():
+    """Test a call without a response times out and is cancelled on the server."""
+    server = FakeSSEServer(reverse_after=2)
+    with _patched_client(server):
+        transport = AsyncSSETransport()
+        transport.start("", ["http://mcp.test"])
+
+        with pytest.raises(TimeoutError, match="timed out after 0.2s"):
+            transport.call_tool("echo", {"value": 1}, timeout=0.2)
+        transport.stop()
+
+    request, cancel = server.posted[-2:]
+    assert cancel["method"] == "notifications/cancelled"
+    assert cancel["params"]["requestId"] == request["id"]
+    assert transport._pending == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,11 +1,12 @@
 """Test MCP base transport abstract class."""
 
+import threading
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 
-from asterism.mcp.transport_executor.base import BaseTransport
+from asterism.mcp.transport_executor.base import DEADLINE_MAX_WORKERS, LITERAL_EVAL_MAX_CHARS, BaseTransport
 
 
 def test_base_transport_cannot_be_instantiated():
@@ -103,5 +104,124 @@ def test_concrete_transport_implementation():
     assert not transport.is_alive()
 
 
+def test_default_call_tool_passes_arguments():
+    """Test the default call_tool runs execute_tool with the argument dict."""
+    transport = ConcreteTransport()
+
+    assert transport.call_tool("test_tool", {"timeout": 5}) == {"success": True, "result": "Executed test_tool"}
+    assert transport.call_tool("test_tool", {}, timeout=1) == {"success": True, "result": "Executed test_tool"}
+
+
+def test_default_call_tool_enforces_deadline():
+    """Test the default call_tool stops waiting for a tool that outlives its deadline."""
+    release = threading.Event()
+
+    class HangingTransport(ConcreteTransport):
+        def execute_tool(self, tool_name: str, **kwargs):
+            release.wait(5)
+            return {}
+
+    with pytest.raises(TimeoutError, match="Tool 'slow' timed out after 0.05s"):
+        HangingTransport().call_tool("slow", {}, timeout=0.05)
+    release.set()
+
+
+def test_default_call_tool_runs_on_bounded_shared_pool():
+    """Test calls that outlive their deadline occupy at most DEADLINE_MAX_WORKERS shared threads."""
+    release = threading.Event()
+    threads = set()
+
+    class HangingTransport(ConcreteTransport):
+        def execute_tool(self, tool_name: str, **kwargs):
+            threads.add(threading.current_thread().name)
+            release.wait(5)
+            return {}
+
+    try:
+        for _ in range(DEADLINE_MAX_WORKERS + 4):
+            with pytest.raises(TimeoutError):
+                HangingTransport().call_tool("slow", {}, timeout=0.01)
+        running = [thread for thread in threading.enumerate() if thread.name.startswith("mcp-call")]
+        assert len(running) <= DEADLINE_MAX_WORKERS
+        assert all(name.startswith("mcp-call") for name in threads)
+    finally:
+        release.set()
+
+
+def test_default_call_tools_pipelines_calls_in_order():
+    """Test the default call_tools runs calls concurrently and keeps their order and errors."""
+    barrier = threading.Barrier(3, timeout=2)
+
+    class PipelinedTransport(ConcreteTransport):
+        def execute_tool(self, tool_name: str, **kwargs):
+            barrier.wait()
+            if tool_name == "broken":
+                raise RuntimeError("boom")
+            return {"tool": tool_name, **kwargs}
+
+    results = PipelinedTransport().call_tools([("a", {"x": 1}), ("broken", {}), ("b", {})])
+
+    assert results[0] == {"tool": "a", "x": 1}
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == {"tool": "b"}
+
+
+def _tool_response(**result: Any) -> dict[str, Any]:
+    """Build a tools/call JSON-RPC response."""
+    return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+def test_decode_tool_result_prefers_structured_content():
+    """Test structuredContent is returned without parsing the text content."""
+    transport = ConcreteTransport()
+    response = _tool_response(content=[{"type": "text", "text": "not json"}], structuredContent={"files": ["a"]})
+
+    assert transport._decode_tool_result(response) == {"files": ["a"]}
+    # FastMCP wraps outputs that are not objects
+    assert transport._decode_tool_result(_tool_response(structuredContent={"result": "done"})) == "done"
+
+
+def test_decode_tool_result_parses_joined_text():
+    """Test text blocks are joined, then parsed as JSON, a Python literal or kept as text."""
+    transport = ConcreteTransport()
+
+    def decode(*texts: str) -> Any:
+        return transport._decode_tool_result(_tool_response(content=[{"type": "text", "text": t} for t in texts]))
+
+    assert decode('{"a": ', "1}") == {"a": 1}
+    assert decode("{'a': 1}") == {"a": 1}
+    assert decode("plain text") == "plain text"
+    assert transport._decode_tool_result(_tool_response(content=[])) == {}
+
+
+def test_decode_tool_result_skips_literal_eval_for_large_text():
+    """Test text over the size limit is not evaluated as a Python literal."""
+    text = "[" + "'x', " * (LITERAL_EVAL_MAX_CHARS // 5) + "]"
+
+    with patch("asterism.mcp.transport_executor.base.ast.literal_eval") as mock_literal_eval:
+        result = ConcreteTransport()._decode_tool_result(_tool_response(content=[{"type": "text", "text": text}]))
+
+    assert result == text
+    mock_literal_eval.assert_not_called()
+
+
+def test_decode_tool_result_keeps_non_text_blocks():
+    """Test image and resource blocks are returned next to the text."""
+    image = {"type": "image", "data": "aGk=", "mimeType": "image/png"}
+    response = _tool_response(content=[{"type": "text", "text": "chart:"}, image])
+
+    assert ConcreteTransport()._decode_tool_result(response) == {"content": [image], "text": "chart:"}
+
+
+def test_decode_tool_result_raises_on_errors():
+    """Test JSON-RPC errors and tool errors raise instead of returning a result."""
+    transport = ConcreteTransport()
+
+    with pytest.raises(RuntimeError, match="Tool execution failed"):
+        transport._decode_tool_result({"jsonrpc": "2.0", "id": 1, "error": {"code": -32602}})
+    with pytest.raises(RuntimeError, match="Tool reported an error: kaput"):
+        transport._decode_tool_result(_tool_response(content=[{"type": "text", "text": "kaput"}], isError=True))
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -3,7 +3,10 @@
 import pytest
 
 from asterism.mcp.transport_executor import create_transport
+from asterism.mcp.transport_executor.async_http_stream import AsyncHTTPStreamTransport
+from asterism.mcp.transport_executor.async_sse import AsyncSSETransport
 from asterism.mcp.transport_executor.http_stream import HTTPStreamTransport
+from asterism.mcp.transport_executor.inprocess import InProcessTransport
 from asterism.mcp.transport_executor.sse import SSETransport
 from asterism.mcp.transport_executor.stdio import StdioTransport
 
@@ -26,6 +29,27 @@ def test_create_transport_http_stream():
     assert isinstance(transport, HTTPStreamTransport)
 
 
+def test_create_transport_async_http_stream():
+    """Test creating async HTTP stream transport with options."""
+    transport = create_transport("async_http_stream", timeout=5.0, max_connections=4)
+    assert isinstance(transport, AsyncHTTPStreamTransport)
+    assert transport._timeout.read == 5.0
+    assert transport._limits.max_connections == 4
+
+
+def test_create_transport_inprocess():
+    """Test creating in-process transport with options."""
+    transport = create_transport("inprocess", timeout=5.0)
+    assert isinstance(transport, InProcessTransport)
+    assert transport._timeout == 5.0
+
+
+def test_create_transport_async_sse():
+    """Test creating async SSE transport."""
+    transport = create_transport("async_sse")
+    assert isinstance(transport, AsyncSSETransport)
+
+
 def test_create_transport_invalid_type():
     """Test creating transport with invalid type raises error."""
     with pytest.raises(ValueError, match="Unsupported transport type: invalid"):
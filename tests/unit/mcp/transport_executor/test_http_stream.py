@@ -1,8 +1,12 @@
 """Unit tests for HTTPStreamTransport."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+from urllib3.exceptions import ReadTimeoutError
 
 from asterism.mcp.transport_executor.http_stream import HTTPStreamTransport
 
@@ -18,6 +22,16 @@ def test_http_stream_transport_init():
     assert transport._session_id is None
 
 
+def test_request_ids_are_unique_across_threads():
+    """Test ids allocated by concurrently pipelined calls never repeat."""
+    transport = HTTPStreamTransport()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(lambda _: transport._next_request_id(), range(1000)))
+
+    assert sorted(ids) == list(range(1, 1001))
+
+
 @patch("asterism.mcp.transport_executor.http_stream.requests.Session")
 def test_http_stream_start_success(mock_session_class):
     """Test successful start and initialization."""
@@ -91,8 +105,7 @@ def test_http_stream_execute_tool_success(mock_session_class):
 
     result = transport.execute_tool("test_tool", param1="value1")
 
-    assert result["success"] is True
-    assert result["result"] == {"result": "success"}
+    assert result == {"result": "success"}
 
 
 @patch("asterism.mcp.transport_executor.http_stream.requests.Session")
@@ -229,8 +242,7 @@ def test_http_stream_execute_tool_non_json_response(mock_session_class):
 
     result = transport.execute_tool("test_tool")
 
-    assert result["success"] is True
-    assert result["result"] == {"text": "plain text result"}
+    assert result == "plain text result"
 
 
 @patch("asterism.mcp.transport_executor.http_stream.requests.Session")
@@ -268,8 +280,7 @@ def test_http_stream_execute_tool_empty_content(mock_session_class):
 
     result = transport.execute_tool("test_tool")
 
-    assert result["success"] is True
-    assert result["result"] == {}
+    assert result == {}
 
 
 @patch("asterism.mcp.transport_executor.http_stream.requests.Session")
@@ -297,5 +308,130 @@ def test_http_stream_list_tools_not_initialized_returns_empty(mock_session_class
     assert tools == []
 
 
+def test_http_stream_get_tool_schemas_not_initialized_raises():
+    """Test get_tool_schemas raises instead of reporting a server without tools."""
+    transport = HTTPStreamTransport()
+
+    with pytest.raises(RuntimeError, match="MCP server not initialized"):
+        transport.get_tool_schemas()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.ReadTimeout("Read timed out"),
+        # Raised by requests when the read times out while streaming the body
+        requests.ConnectionError(ReadTimeoutError(None, "http://localhost:3000/mcp", "Read timed out")),
+    ],
+)
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_call_tool_timeout_cancels_request(mock_session_class, error):
+    """Test a timed out tool call raises TimeoutError and is cancelled on the server."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+
+    cancel_response = MagicMock()
+    cancel_response.ok = True
+    cancel_response.iter_lines.return_value = []
+    cancel_response.__enter__ = MagicMock(return_value=cancel_response)
+    cancel_response.__exit__ = MagicMock(return_value=False)
+    mock_session.post.side_effect = [error, cancel_response]
+
+    transport = HTTPStreamTransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._initialized = True
+
+    with pytest.raises(TimeoutError, match="tools/call timed out after 5s"):
+        transport.call_tool("slow_tool", {"seconds": 60}, timeout=5)
+
+    tool_call, cancel = mock_session.post.call_args_list
+    assert tool_call.kwargs["timeout"] == 5
+    assert cancel.kwargs["json"]["method"] == "notifications/cancelled"
+    assert cancel.kwargs["json"]["params"]["requestId"] == tool_call.kwargs["json"]["id"]
+
+
+def _stream_response(lines, status_code=200):
+    response = MagicMock()
+    response.ok = status_code < 400
+    response.status_code = status_code
+    response.iter_lines.return_value = lines
+    response.__enter__ = MagicMock(return_value=response)
+    response.__exit__ = MagicMock(return_value=False)
+    return response
+
+
+def _connected_transport(mock_session, batch=True):
+    transport = HTTPStreamTransport(batch=batch)
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._initialized = True
+    return transport
+
+
+def _tool_response(request_id, text):
+    return {"jsonrpc": "2.0", "id": request_id, "result": {"content": [{"type": "text", "text": text}]}}
+
+
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_call_tools_sends_json_rpc_batch(mock_session_class):
+    """Test batched calls go out in one POST and responses are matched back by id."""
+    mock_session = MagicMock()
+    # Responses arrive out of order, as separate SSE events
+    mock_session.post.return_value = _stream_response(
+        [
+            b"data: " + json.dumps(_tool_response(2, '{"b": 2}')).encode(),
+            b"data: " + json.dumps({"jsonrpc": "2.0", "id": 3, "error": {"code": -32602}}).encode(),
+            b"data: " + json.dumps(_tool_response(1, '{"a": 1}')).encode(),
+        ]
+    )
+    transport = _connected_transport(mock_session)
+
+    results = transport.call_tools([("a", {}), ("b", {}), ("c", {})], timeout=5)
+
+    mock_session.post.assert_called_once()
+    batch = mock_session.post.call_args.kwargs["json"]
+    assert [message["id"] for message in batch] == [1, 2, 3]
+    assert [message["params"]["name"] for message in batch] == ["a", "b", "c"]
+    assert results[:2] == [{"a": 1}, {"b": 2}]
+    assert isinstance(results[2], RuntimeError)
+    assert "-32602" in str(results[2])
+
+
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_call_tools_falls_back_when_batch_rejected(mock_session_class):
+    """Test a server rejecting batches gets individual requests, now and for later calls."""
+    mock_session = MagicMock()
+
+    def post(url, **kwargs):
+        message = kwargs["json"]
+        if isinstance(message, list):
+            return _stream_response([], status_code=400)
+        return _stream_response([b"data: " + json.dumps(_tool_response(message["id"], "ok")).encode()])
+
+    mock_session.post.side_effect = post
+    transport = _connected_transport(mock_session)
+
+    results = transport.call_tools([("a", {}), ("b", {})])
+
+    assert results == ["ok", "ok"]
+    assert transport._batch is False
+    assert mock_session.post.call_count == 3
+
+
+@patch("asterism.mcp.transport_executor.http_stream.requests.Session")
+def test_http_stream_call_tools_without_batch_pipelines(mock_session_class):
+    """Test batching is opt-in."""
+    mock_session = MagicMock()
+    mock_session.post.side_effect = lambda url, **kwargs: _stream_response(
+        [b"data: " + json.dumps(_tool_response(kwargs["json"]["id"], "ok")).encode()]
+    )
+    transport = _connected_transport(mock_session, batch=False)
+
+    transport.call_tools([("a", {}), ("b", {})])
+
+    assert all(isinstance(call.kwargs["json"], dict) for call in mock_session.post.call_args_list)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,151 @@
+"""Test in-process FastMCP transport."""
+
+import asyncio
+import sys
+import textwrap
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from asterism.mcp.transport_executor.async_base import get_transport_loop
+from asterism.mcp.transport_executor.inprocess import InProcessTransport
+
+SERVER_SOURCE = """
+import asyncio
+import time
+
+from fastmcp import FastMCP
+
+mcp = FastMCP("inprocess-test")
+
+
+@mcp.tool()
+def add(a: int, b: int) -> dict:
+    \"\"\"Add two numbers.\"\"\"
+    return {"sum": a + b}
+
+
+@mcp.tool()
+async def wait(seconds: float) -> str:
+    \"\"\"Sleep for a while.\"\"\"
+    await asyncio.sleep(seconds)
+    return "done"
+"""
+
+
+@pytest.fixture
+def server_dir(tmp_path, request):
+    """Write a FastMCP server module under a unique name and return (directory, module name)."""
+    module_name = f"inprocess_server_{request.node.name}"
+    (tmp_path / f"{module_name}.py").write_text(textwrap.dedent(SERVER_SOURCE))
+    yield str(tmp_path), module_name
+    sys.modules.pop(module_name, None)
+
+
+def test_inprocess_lists_and_calls_tools(server_dir):
+    """Test tools are listed and called through the in-memory session."""
+    cwd, module_name = server_dir
+    transport = InProcessTransport()
+    transport.start("", [f"{module_name}:mcp"], cwd)
+    try:
+        assert transport.is_alive()
+        assert sorted(transport.list_tools()) == ["add", "wait"]
+        schema = next(tool for tool in transport.get_tool_schemas() if tool["name"] == "add")
+        assert schema["inputSchema"]["required"] == ["a", "b"]
+
+        assert transport.call_tool("add", {"a": 2, "b": 3}) == {"sum": 5}
+        assert asyncio.run(transport.acall_tool("add", {"a": 1, "b": 1})) == {"sum": 2}
+    finally:
+        transport.stop()
+
+    assert not transport.is_alive()
+
+
+def test_inprocess_call_timeout(server_dir):
+    """Test a call over its deadline is cancelled and raises TimeoutError."""
+    cwd, module_name = server_dir
+    transport = InProcessTransport()
+    transport.start("", [f"{module_name}:mcp"], cwd)
+    try:
+        with pytest.raises(TimeoutError, match="tools/call timed out after 0.05s"):
+            transport.call_tool("wait", {"seconds": 5}, timeout=0.05)
+        assert transport.call_tool("wait", {"seconds": 0}) == "done"
+    finally:
+        transport.stop()
+
+
+def test_inprocess_runs_on_its_own_loop(server_dir):
+    """Test the session does not run on the loop shared by the other async transports."""
+    cwd, module_name = server_dir
+    transport = InProcessTransport()
+    transport.start("", [f"{module_name}:mcp"], cwd)
+    loop = transport._get_loop()
+    try:
+        assert loop is not get_transport_loop()
+    finally:
+        transport.stop()
+
+    assert transport._loop is None
+    deadline = time.monotonic() + 2
+    while loop.is_running() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not loop.is_running()
+
+
+def test_inprocess_schemas_require_running_session():
+    """Test fetching schemas before start raises instead of reporting no tools."""
+    transport = InProcessTransport()
+    try:
+        with pytest.raises(RuntimeError, match="MCP server not initialized"):
+            transport.get_tool_schemas()
+    finally:
+        transport.stop()
+
+
+def test_inprocess_stop_without_start_does_not_start_loop():
+    """Test stopping a transport that was never started does not start a loop thread."""
+    transport = InProcessTransport()
+    loop_threads = len([thread for thread in threading.enumerate() if thread.name == "mcp-inprocess"])
+
+    transport.stop()
+    asyncio.run(transport.astop())
+
+    assert transport._loop is None
+    assert len([thread for thread in threading.enumerate() if thread.name == "mcp-inprocess"]) == loop_threads
+
+
+@patch("asterism.mcp.transport_executor.inprocess.SESSION_CLOSE_TIMEOUT", 0.05)
+def test_inprocess_stop_cancels_session_task(server_dir):
+    """Test stop cancels a session task that does not close on its own."""
+    cwd, module_name = server_dir
+    transport = InProcessTransport()
+    transport.start("", [f"{module_name}:mcp"], cwd)
+    session_task = transport._session_task
+    # Without the closing event, the session never exits by itself
+    transport._closing = None
+
+    transport.stop()
+
+    assert session_task.cancelled()
+    assert not transport.is_alive()
+
+
+@pytest.mark.parametrize("target", ["no_colon", ":mcp", "module:"])
+def test_inprocess_rejects_bad_target(target):
+    """Test the server reference must be 'module:object'."""
+    with pytest.raises(ValueError, match="module:object"):
+        InProcessTransport._load_server(target)
+
+
+def test_inprocess_requires_args():
+    """Test start fails without a server reference."""
+    transport = InProcessTransport()
+    with pytest.raises(ValueError, match="requires the server's 'module:object'"):
+        transport.start("", [])
+    transport.stop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,6 +1,8 @@
 """Unit tests for SSETransport."""
 
 import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,6 +10,20 @@ import pytest
 from asterism.mcp.transport_executor.sse import SSETransport
 
 
+def _respond_on_post(transport, mock_session, *responses):
+    """Make each POST of a request push the next response onto the SSE stream."""
+    pending = list(responses)
+
+    def post(url, **kwargs):
+        if "id" in kwargs["json"] and pending:
+            transport._process_sse_event("message", json.dumps(pending.pop(0)))
+        response = MagicMock()
+        response.ok = True
+        return response
+
+    mock_session.post.side_effect = post
+
+
 def test_sse_transport_init():
     """Test SSETransport initialization."""
     transport = SSETransport()
@@ -32,22 +48,15 @@ def test_sse_start_success(mock_thread_class, mock_session_class):
     mock_thread_class.return_value = mock_thread
 
     transport = SSETransport()
-    # Set message endpoint manually (normally set by SSE listener)
-    transport._message_endpoint = "http://localhost:3000/message"
+    # The listener announces the message endpoint as soon as it starts
+    mock_thread.start.side_effect = lambda: transport._process_sse_event("endpoint", "/message")
+    _respond_on_post(transport, mock_session, {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}})
 
-    # Pre-populate response queue with init response
-    transport._response_queue.put(
-        {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "result": {"protocolVersion": "2024-11-05"},
-        }
-    )
-
-    # Mock time.sleep to avoid actual sleep
-    with patch("time.sleep"):
-        transport.start("http", ["http://localhost:3000"])
+    start_time = time.monotonic()
+    transport.start("http", ["http://localhost:3000"])
 
+    assert time.monotonic() - start_time < 0.5
+    assert transport._message_endpoint == "http://localhost:3000/message"
     assert transport._base_url == "http://localhost:3000"
     assert transport._session is not None
     assert transport._initialized is True
@@ -81,18 +90,17 @@ def test_sse_execute_tool_success(mock_session_class):
     transport._initialized = True
     transport._request_id = 1
 
-    # Put response in queue
+    # Server pushes the response on the SSE stream
     response_data = {
         "jsonrpc": "2.0",
         "id": 2,
         "result": {"content": [{"type": "text", "text": json.dumps({"result": "success"})}]},
     }
-    transport._response_queue.put(response_data)
+    _respond_on_post(transport, mock_session, response_data)
 
     result = transport.execute_tool("test_tool", param1="value1")
 
-    assert result["success"] is True
-    assert result["result"] == {"result": "success"}
+    assert result == {"result": "success"}
 
 
 @patch("asterism.mcp.transport_executor.sse.requests.Session")
@@ -114,13 +122,13 @@ def test_sse_list_tools_success(mock_session_class):
     transport._initialized = True
     transport._request_id = 1
 
-    # Put response in queue
+    # Server pushes the response on the SSE stream
     response_data = {
         "jsonrpc": "2.0",
         "id": 2,
         "result": {"tools": [{"name": "tool1"}, {"name": "tool2"}]},
     }
-    transport._response_queue.put(response_data)
+    _respond_on_post(transport, mock_session, response_data)
 
     tools = transport.list_tools()
 
@@ -186,18 +194,17 @@ def test_sse_execute_tool_non_json_response(mock_session_class):
     transport._initialized = True
     transport._request_id = 1
 
-    # Put response with non-JSON text in queue
+    # Server pushes a non-JSON text response on the SSE stream
     response_data = {
         "jsonrpc": "2.0",
         "id": 2,
         "result": {"content": [{"type": "text", "text": "plain text result"}]},
     }
-    transport._response_queue.put(response_data)
+    _respond_on_post(transport, mock_session, response_data)
 
     result = transport.execute_tool("test_tool")
 
-    assert result["success"] is True
-    assert result["result"] == {"text": "plain text result"}
+    assert result == "plain text result"
 
 
 @patch("asterism.mcp.transport_executor.sse.requests.Session")
@@ -217,18 +224,17 @@ def test_sse_execute_tool_empty_content(mock_session_class):
     transport._initialized = True
     transport._request_id = 1
 
-    # Put response with empty content in queue
+    # Server pushes an empty content response on the SSE stream
     response_data = {
         "jsonrpc": "2.0",
         "id": 2,
         "result": {"content": []},
     }
-    transport._response_queue.put(response_data)
+    _respond_on_post(transport, mock_session, response_data)
 
     result = transport.execute_tool("test_tool")
 
-    assert result["success"] is True
-    assert result["result"] == {}
+    assert result == {}
 
 
 @patch("asterism.mcp.transport_executor.sse.requests.Session")
@@ -250,5 +256,143 @@ def test_sse_list_tools_not_initialized_returns_empty(mock_thread_class, mock_se
     assert tools == []
 
 
+def test_sse_get_tool_schemas_not_initialized_raises():
+    """Test get_tool_schemas raises instead of reporting a server without tools."""
+    transport = SSETransport()
+
+    with pytest.raises(RuntimeError, match="MCP server not initialized"):
+        transport.get_tool_schemas()
+
+
+@patch("asterism.mcp.transport_executor.sse.requests.Session")
+def test_sse_routes_concurrent_responses_by_id(mock_session_class):
+    """Test concurrent calls each get their own response when responses arrive reversed."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._message_endpoint = "http://localhost:3000/message"
+    transport._initialized = True
+
+    posted = []
+    both_posted = threading.Event()
+
+    def post(url, **kwargs):
+        posted.append(kwargs["json"])
+        if len(posted) == 2:
+            both_posted.set()
+            for request in reversed(posted):
+                text = json.dumps({"tag": request["params"]["arguments"]["tag"]})
+                message = {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "result": {"content": [{"type": "text", "text": text}]},
+                }
+                transport._process_sse_event("message", json.dumps(message))
+        response = MagicMock()
+        response.ok = True
+        return response
+
+    mock_session.post.side_effect = post
+
+    results = {}
+    threads = [
+        threading.Thread(target=lambda tag=tag: results.__setitem__(tag, transport.execute_tool("echo", tag=tag)))
+        for tag in ("a", "b")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert both_posted.is_set()
+    assert results["a"] == {"tag": "a"}
+    assert results["b"] == {"tag": "b"}
+    assert transport._pending == {}
+
+
+@patch("asterism.mcp.transport_executor.sse.requests.Session")
+def test_sse_request_timeout_cancels_request(mock_session_class):
+    """Test a request without a response event times out and is cancelled on the server."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.post.return_value = MagicMock(ok=True)
+
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._message_endpoint = "http://localhost:3000/message"
+    transport._initialized = True
+    transport._timeout = 0.1
+
+    with pytest.raises(TimeoutError, match="timed out after 0.1s"):
+        transport.execute_tool("test_tool")
+
+    request, cancel = (call.kwargs["json"] for call in mock_session.post.call_args_list)
+    assert cancel["method"] == "notifications/cancelled"
+    assert cancel["params"]["requestId"] == request["id"]
+    assert transport._pending == {}
+
+
+@patch("asterism.mcp.transport_executor.sse.requests.Session")
+def test_sse_call_tool_uses_call_deadline(mock_session_class):
+    """Test call_tool waits for its own deadline instead of the transport timeout."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.post.return_value = MagicMock(ok=True)
+
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._message_endpoint = "http://localhost:3000/message"
+    transport._initialized = True
+
+    start_time = time.monotonic()
+    with pytest.raises(TimeoutError):
+        transport.call_tool("test_tool", {}, timeout=0.05)
+
+    assert time.monotonic() - start_time < 1
+    assert mock_session.post.call_args_list[0].kwargs["timeout"] == 0.05
+
+
+@patch("asterism.mcp.transport_executor.sse.requests.Session")
+def test_sse_start_fails_fast_when_stream_fails(mock_session_class):
+    """Test start raises as soon as the SSE stream fails, without waiting for the timeout."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = ConnectionError("refused")
+
+    transport = SSETransport()
+    start_time = time.monotonic()
+    with pytest.raises(RuntimeError, match="SSE connection failed: refused"):
+        transport.start("http", ["http://localhost:3000"])
+
+    assert time.monotonic() - start_time < 1
+
+
+@patch("asterism.mcp.transport_executor.sse.requests.Session")
+def test_sse_stream_close_fails_pending_requests(mock_session_class):
+    """Test in-flight requests fail when the SSE stream closes."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+
+    transport = SSETransport()
+    transport._base_url = "http://localhost:3000"
+    transport._session = mock_session
+    transport._message_endpoint = "http://localhost:3000/message"
+    transport._initialized = True
+
+    def post(url, **kwargs):
+        transport._fail_pending(RuntimeError("SSE stream closed"))
+        return MagicMock(ok=True)
+
+    mock_session.post.side_effect = post
+
+    with pytest.raises(RuntimeError, match="SSE stream closed"):
+        transport.execute_tool("test_tool")
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
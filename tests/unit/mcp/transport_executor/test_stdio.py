@@ -1,12 +1,52 @@
 """Unit tests for StdioTransport."""
 
 import json
+import logging
+import queue
 import subprocess
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from asterism.mcp.transport_executor.stdio import StdioTransport
+from asterism.mcp.transport_executor.stdio import StderrBuffer, StdioTransport
+
+INIT_RESPONSE = {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
+
+
+def _mock_process(*responses, stderr=()):
+    """Create a mock process whose stdout answers each request written to stdin, in order.
+
+    Lines only become readable after the matching request is written, like a real
+    server. Terminating the process closes stdout and stderr so the reader threads exit.
+    """
+    stdout_lines: queue.Queue[str] = queue.Queue()
+    stderr_lines: queue.Queue[str] = queue.Queue()
+    for line in stderr:
+        stderr_lines.put(line + "\n")
+    replies = iter(responses)
+
+    def write(line):
+        message = json.loads(line)
+        if "id" in message and "method" in message:
+            reply = next(replies, None)
+            if reply is not None:
+                stdout_lines.put(json.dumps(reply) + "\n")
+
+    process = MagicMock()
+    process.poll.return_value = None
+    process.stdin.write.side_effect = write
+    process.stdout.readline.side_effect = stdout_lines.get
+    process.stderr.readline.side_effect = stderr_lines.get
+
+    def close():
+        stdout_lines.put("")
+        stderr_lines.put("")
+
+    process.terminate.side_effect = close
+    process.kill.side_effect = close
+    return process
 
 
 def test_stdio_transport_init():
@@ -20,12 +60,7 @@ def test_stdio_transport_init():
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
 def test_stdio_start_success(mock_popen_class):
     """Test successful start and initialization."""
-    # Setup mock process
-    mock_process = MagicMock()
-    mock_process.stdout.readline.return_value = json.dumps(
-        {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
-    )
-    mock_process.poll.return_value = None
+    mock_process = _mock_process(INIT_RESPONSE)
     mock_popen_class.return_value = mock_process
 
     transport = StdioTransport()
@@ -43,26 +78,21 @@ def test_stdio_start_success(mock_popen_class):
     )
     assert transport._initialized is True
     assert transport._process is not None
+    transport.stop()
 
 
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
 def test_stdio_execute_tool_success(mock_popen_class):
     """Test successful tool execution."""
-    # Setup mock process
-    mock_process = MagicMock()
-    mock_process.poll.return_value = None
-
-    # First call for initialization, second for tool execution
-    mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "result": {"content": [{"type": "text", "text": json.dumps({"result": "success"})}]},
-            }
-        ),
-    ]
+    # First reply for initialization, second for tool execution
+    mock_process = _mock_process(
+        INIT_RESPONSE,
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {"content": [{"type": "text", "text": json.dumps({"result": "success"})}]},
+        },
+    )
     mock_popen_class.return_value = mock_process
 
     transport = StdioTransport()
@@ -71,26 +101,21 @@ def test_stdio_execute_tool_success(mock_popen_class):
     result = transport.execute_tool("test_tool", param1="value1")
 
     assert result == {"result": "success"}
+    transport.stop()
 
 
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
 def test_stdio_list_tools_success(mock_popen_class):
     """Test successful tools listing."""
-    # Setup mock process
-    mock_process = MagicMock()
-    mock_process.poll.return_value = None
-
-    # First call for initialization, second for list_tools
-    mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "result": {"tools": [{"name": "tool1"}, {"name": "tool2"}]},
-            }
-        ),
-    ]
+    # First reply for initialization, second for list_tools
+    mock_process = _mock_process(
+        INIT_RESPONSE,
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {"tools": [{"name": "tool1"}, {"name": "tool2"}]},
+        },
+    )
     mock_popen_class.return_value = mock_process
 
     transport = StdioTransport()
@@ -100,6 +125,7 @@ def test_stdio_list_tools_success(mock_popen_class):
 
     assert "tool1" in tools
     assert "tool2" in tools
+    transport.stop()
 
 
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
@@ -108,12 +134,7 @@ def test_stdio_is_alive(mock_popen_class):
     transport = StdioTransport()
     assert not transport.is_alive()
 
-    # Setup mock process
-    mock_process = MagicMock()
-    mock_process.stdout.readline.return_value = json.dumps(
-        {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
-    )
-    mock_process.poll.return_value = None
+    mock_process = _mock_process(INIT_RESPONSE)
     mock_popen_class.return_value = mock_process
 
     transport.start("python", ["-m", "test_server"])
@@ -126,11 +147,7 @@ def test_stdio_is_alive(mock_popen_class):
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
 def test_stdio_stop_terminates_process(mock_popen_class):
     """Test stop terminates the process."""
-    mock_process = MagicMock()
-    mock_process.stdout.readline.return_value = json.dumps(
-        {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
-    )
-    mock_process.poll.return_value = None
+    mock_process = _mock_process(INIT_RESPONSE)
     mock_popen_class.return_value = mock_process
 
     transport = StdioTransport()
@@ -145,11 +162,7 @@ def test_stdio_stop_terminates_process(mock_popen_class):
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
 def test_stdio_stop_kills_process_if_needed(mock_popen_class):
     """Test stop kills process if terminate times out."""
-    mock_process = MagicMock()
-    mock_process.stdout.readline.return_value = json.dumps(
-        {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
-    )
-    mock_process.poll.return_value = None
+    mock_process = _mock_process(INIT_RESPONSE)
     mock_process.wait.side_effect = [subprocess.TimeoutExpired(cmd="test", timeout=5), None]
     mock_popen_class.return_value = mock_process
 
@@ -164,20 +177,15 @@ def test_stdio_stop_kills_process_if_needed(mock_popen_class):
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
 def test_stdio_execute_tool_python_literal_parsing(mock_popen_class):
     """Test tool execution with Python literal fallback parsing."""
-    mock_process = MagicMock()
-    mock_process.poll.return_value = None
-
-    # First call for initialization, second for tool execution with Python literal
-    mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "result": {"content": [{"type": "text", "text": "{'key': 'value'}"}]},
-            }
-        ),
-    ]
+    # First reply for initialization, second for tool execution with Python literal
+    mock_process = _mock_process(
+        INIT_RESPONSE,
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {"content": [{"type": "text", "text": "{'key': 'value'}"}]},
+        },
+    )
     mock_popen_class.return_value = mock_process
 
     transport = StdioTransport()
@@ -186,24 +194,20 @@ def test_stdio_execute_tool_python_literal_parsing(mock_popen_class):
     result = transport.execute_tool("test_tool")
 
     assert result == {"key": "value"}
+    transport.stop()
 
 
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
 def test_stdio_execute_tool_empty_content(mock_popen_class):
     """Test tool execution with empty content returns empty dict."""
-    mock_process = MagicMock()
-    mock_process.poll.return_value = None
-
-    mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "result": {"content": []},
-            }
-        ),
-    ]
+    mock_process = _mock_process(
+        INIT_RESPONSE,
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {"content": []},
+        },
+    )
     mock_popen_class.return_value = mock_process
 
     transport = StdioTransport()
@@ -212,29 +216,25 @@ def test_stdio_execute_tool_empty_content(mock_popen_class):
     result = transport.execute_tool("test_tool")
 
     assert result == {}
+    transport.stop()
 
 
 @patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
 def test_stdio_list_tools_returns_tool_names(mock_popen_class):
     """Test list_tools returns list of tool names."""
-    mock_process = MagicMock()
-    mock_process.poll.return_value = None
-
-    mock_process.stdout.readline.side_effect = [
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}),
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "result": {
-                    "tools": [
-                        {"name": "get_time", "description": "Get current time"},
-                        {"name": "get_date", "description": "Get current date"},
-                    ]
-                },
-            }
-        ),
-    ]
+    mock_process = _mock_process(
+        INIT_RESPONSE,
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {
+                "tools": [
+                    {"name": "get_time", "description": "Get current time"},
+                    {"name": "get_date", "description": "Get current date"},
+                ]
+            },
+        },
+    )
     mock_popen_class.return_value = mock_process
 
     transport = StdioTransport()
@@ -245,6 +245,156 @@ def test_stdio_list_tools_returns_tool_names(mock_popen_class):
     assert len(tools) == 2
     assert "get_time" in tools
     assert "get_date" in tools
+    transport.stop()
+
+
+@patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
+def test_stdio_routes_out_of_order_responses_by_id(mock_popen_class):
+    """Test concurrent requests each receive their own response when replies arrive out of order."""
+    stdout_lines: queue.Queue[str] = queue.Queue()
+    requests: queue.Queue[dict] = queue.Queue()
+
+    def write(line):
+        message = json.loads(line)
+        if message.get("method") == "initialize":
+            stdout_lines.put(json.dumps(INIT_RESPONSE))
+        elif message.get("method") == "tools/call":
+            requests.put(message)
+
+    mock_process = MagicMock()
+    mock_process.poll.return_value = None
+    mock_process.stdin.write.side_effect = write
+    mock_process.stdout.readline.side_effect = stdout_lines.get
+    mock_process.stderr.readline.return_value = ""
+    mock_process.terminate.side_effect = lambda: stdout_lines.put("")
+    mock_popen_class.return_value = mock_process
+
+    transport = StdioTransport()
+    transport.start("python", ["-m", "test_server"])
+
+    results: dict[str, object] = {}
+
+    def call(name):
+        results[name] = transport.execute_tool("echo", value=name)
+
+    threads = [threading.Thread(target=call, args=(name,)) for name in ("first", "second")]
+    for thread in threads:
+        thread.start()
+
+    received = [requests.get(timeout=5), requests.get(timeout=5)]
+
+    # A notification and an unknown id are interleaved with the replies
+    stdout_lines.put(json.dumps({"jsonrpc": "2.0", "method": "notifications/message", "params": {}}))
+    stdout_lines.put(json.dumps({"jsonrpc": "2.0", "id": 999, "result": {}}))
+    for request in reversed(received):
+        value = request["params"]["arguments"]["value"]
+        content = [{"type": "text", "text": json.dumps({"echo": value})}]
+        stdout_lines.put(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {"content": content}}))
+
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == {"first": {"echo": "first"}, "second": {"echo": "second"}}
+    transport.stop()
+
+
+@patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
+def test_stdio_pending_request_fails_when_output_closes(mock_popen_class):
+    """Test in-flight requests fail instead of hanging when the server closes stdout."""
+    mock_process = _mock_process(INIT_RESPONSE)
+    mock_popen_class.return_value = mock_process
+
+    transport = StdioTransport()
+    transport.start("python", ["-m", "test_server"])
+
+    mock_process.stdin.write.side_effect = lambda line: mock_process.terminate()
+
+    with pytest.raises(RuntimeError, match="closed its output stream"):
+        transport.execute_tool("test_tool")
+
+
+@patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
+def test_stdio_call_tool_timeout_cancels_request(mock_popen_class):
+    """Test a call past its deadline raises TimeoutError and sends notifications/cancelled."""
+    mock_process = _mock_process(INIT_RESPONSE)
+    mock_popen_class.return_value = mock_process
+
+    transport = StdioTransport()
+    transport.start("python", ["-m", "test_server"])
+
+    with pytest.raises(TimeoutError, match="timed out after 0.05s"):
+        transport.call_tool("slow_tool", {"seconds": 10}, timeout=0.05)
+
+    written = [json.loads(call.args[0]) for call in mock_process.stdin.write.call_args_list]
+    assert written[-2]["method"] == "tools/call"
+    assert written[-1]["method"] == "notifications/cancelled"
+    assert written[-1]["params"]["requestId"] == written[-2]["id"]
+    assert transport._pending == {}
+    transport.stop()
+
+
+@patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
+def test_stdio_ping(mock_popen_class):
+    """Test ping sends an MCP ping and reports whether it was answered."""
+    mock_process = _mock_process(INIT_RESPONSE, {"jsonrpc": "2.0", "id": 2, "result": {}})
+    mock_popen_class.return_value = mock_process
+
+    transport = StdioTransport()
+    assert transport.ping() is False
+
+    transport.start("python", ["-m", "test_server"])
+    assert transport.ping(timeout=1) is True
+    assert json.loads(mock_process.stdin.write.call_args_list[-1].args[0])["method"] == "ping"
+
+    # No answer to the next ping
+    assert transport.ping(timeout=0.05) is False
+    transport.stop()
+
+
+def test_stderr_buffer_keeps_most_recent_bytes():
+    """Test the stderr ring buffer drops the oldest lines once over its byte budget."""
+    buffer = StderrBuffer(max_bytes=10)
+    for line in ("aaaa", "bbbb", "cccc"):
+        buffer.append(line)
+
+    assert buffer.tail() == "bbbb\ncccc"
+    assert buffer.tail(max_lines=1) == "cccc"
+
+    buffer.append("x" * 25)
+    assert buffer.tail() == "x" * 10
+
+
+def test_stderr_buffer_disabled():
+    """Test a zero budget keeps nothing."""
+    buffer = StderrBuffer(max_bytes=0)
+    buffer.append("line")
+    assert buffer.tail() == ""
+
+
+@patch("asterism.mcp.transport_executor.stdio.stderr_logger")
+@patch("asterism.mcp.transport_executor.stdio.subprocess.Popen")
+def test_stdio_drains_stderr_into_buffer_and_logger(mock_popen_class, mock_stderr_logger):
+    """Test stderr is drained in the background, kept in the buffer and forwarded to the logger."""
+    mock_process = _mock_process(INIT_RESPONSE, stderr=["starting", "warning: disk slow"])
+    mock_process.pid = 42
+    mock_popen_class.return_value = mock_process
+
+    transport = StdioTransport(stderr_log_level="warning")
+    transport.start("/usr/bin/python", ["-m", "test_server"])
+    deadline = time.monotonic() + 2
+    while mock_stderr_logger.log.call_count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert transport.get_stderr() == "starting\nwarning: disk slow"
+    assert transport.get_stderr(max_lines=1) == "warning: disk slow"
+    mock_stderr_logger.log.assert_called_with(logging.WARNING, "python[42]: warning: disk slow")
+    transport.stop()
+
+
+def test_stdio_rejects_unknown_stderr_log_level():
+    """Test an invalid log level fails when the transport is created."""
+    with pytest.raises(ValueError, match="Unknown stderr_log_level"):
+        StdioTransport(stderr_log_level="chatty")
 
 
 if __name__ == "__main__":